@@ -0,0 +1,102 @@
+"""
+Throughput of batched generation in Seq2SeqSummarizationWorker.
+
+Runs the worker's batch path in-process (no API, no IPC) and reports requests/sec for each batch size.
+
+Usage:
+    PYTHONPATH=src python benchmarks/batching_throughput.py --batch-sizes 1 2 4 8 --requests 32
+"""
+
+import argparse
+import multiprocessing
+import time
+from typing import Any, List
+
+from core.logger.logger import Logger
+from data.workers.seq2seq_summarization_worker import (
+    Seq2SeqSummarizationConfig,
+    Seq2SeqSummarizationWorker,
+)
+
+SAMPLE_TEXT = (
+    "The tower is 324 metres (1,063 ft) tall, about the same height as an 81-storey building, and the tallest "
+    "structure in Paris. Its base is square, measuring 125 metres (410 ft) on each side. During its construction, "
+    "the Eiffel Tower surpassed the Washington Monument to become the tallest man-made structure in the world, "
+    "a title it held for 41 years until the Chrysler Building in New York City was finished in 1930."
+)
+
+
+class CollectingPipe:
+    def __init__(self) -> None:
+        self.replies: List[Any] = []
+
+    def send(self, obj: Any) -> None:
+        self.replies.append(obj)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="facebook/bart-large-cnn")
+    parser.add_argument("--download-path", default="downloaded_summarization_models")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--requests", type=int, default=32)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--max-length", type=int, default=60)
+    args = parser.parse_args()
+
+    config = Seq2SeqSummarizationConfig(
+        device=args.device,
+        model_name=args.model,
+        model_download_path=args.download_path,
+        log_level="WARNING",
+        # Each call to handle_batch below is one batch, so the worker must not split it.
+        batch_max_size=max(args.batch_sizes),
+    )
+    worker = Seq2SeqSummarizationWorker(config, Logger())
+    shared_object = worker.initialize_shared_object(config)
+    is_processing = multiprocessing.Value("b", False)
+    processing_lock = multiprocessing.Lock()
+    generation_parameters = {"max_length": args.max_length, "num_beams": 1}
+
+    # Warm-up so the first measured batch size does not pay for lazy allocations.
+    worker.handle_batch(
+        [(0, "summarize", (SAMPLE_TEXT, generation_parameters))],
+        shared_object,
+        config,
+        CollectingPipe(),  # type: ignore
+        is_processing,
+        processing_lock,
+    )
+
+    print(f"{'batch size':>10} | {'requests':>8} | {'seconds':>8} | {'requests/sec':>12}")
+
+    for batch_size in args.batch_sizes:
+        pipe = CollectingPipe()
+        # Commands carry the request id that the worker tags its replies with.
+        commands = [
+            (index, "summarize", (f"{index} {SAMPLE_TEXT}", generation_parameters)) for index in range(args.requests)
+        ]
+        start_time = time.perf_counter()
+
+        for offset in range(0, len(commands), batch_size):
+            end = offset + batch_size
+            worker.handle_batch(
+                commands[offset:end],
+                shared_object,
+                config,
+                pipe,  # type: ignore
+                is_processing,
+                processing_lock,
+            )
+
+        elapsed = time.perf_counter() - start_time
+        errors = [reply[1] for reply in pipe.replies if isinstance(reply[1], Exception)]
+
+        if errors:
+            raise errors[0]
+
+        print(f"{batch_size:>10} | {args.requests:>8} | {elapsed:>8.2f} | {args.requests / elapsed:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Cost of a log call in the calling thread.
+
+Logs messages from a function a few frames deep, like a use case called by a router, once through the former logger,
+which inspected the whole stack on every call and wrote records synchronously, and once through the current logger,
+which checks the level first, finds its caller through stacklevel and hands records to a listener thread. Measures a
+disabled DEBUG call, an enabled INFO call and an INFO call with a 1MB text, and reports the median time per call.
+Records are written to the null device, so their formatting is measured but not the terminal.
+
+Usage:
+    PYTHONPATH=src python benchmarks/logger_overhead.py --calls 2000 --rounds 5
+"""
+
+import argparse
+import inspect
+import logging
+import logging.handlers
+import os
+import statistics
+import time
+from typing import Callable, Dict, List, TextIO
+
+from core.logger.logger import TEXT_FORMAT, Logger
+
+
+# The logger this benchmark compares against, as it was before it was reworked.
+class LegacyLogger:
+    def __init__(self, stream: TextIO) -> None:
+        self.logger = logging.getLogger("summarization-api-legacy")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+        self.logger.addHandler(handler)
+
+    def _log(self, level: int, message: str) -> None:
+        caller = inspect.stack()[2]
+        module = inspect.getmodule(caller[0])
+        module_name = module.__name__ if module else "unknown_module"
+        log_message = f"{module_name}.{caller.function} - {message}"
+        self.logger.log(level, log_message)
+
+    def info(self, message: str) -> None:
+        self._log(logging.INFO, message)
+
+    def debug(self, message: str) -> None:
+        self._log(logging.DEBUG, message)
+
+
+def call_nested(depth: int, call: Callable[[], None]) -> None:
+    # Log calls in the service are made from within routers, use cases and repositories, not from the top level.
+    if depth > 0:
+        call_nested(depth - 1, call)
+    else:
+        call()
+
+
+def measure(call: Callable[[], None], calls: int, wait_until_written: Callable[[], None]) -> float:
+    start = time.perf_counter()
+
+    for _ in range(calls):
+        call_nested(10, call)
+
+    elapsed = time.perf_counter() - start
+    # Records still queued are written before the next measurement, so they never slow it down.
+    wait_until_written()
+
+    return elapsed / calls * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000, help="Log calls per round")
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per logger and call")
+    args = parser.parse_args()
+
+    large_text = "x" * 1024 * 1024
+
+    with open(os.devnull, "w") as devnull:
+        legacy_logger = LegacyLogger(devnull)
+        logger = Logger()
+        logger._output_handler.setStream(devnull)
+        logger._output_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+        queue_handler = logger.logger.handlers[0]
+        assert isinstance(queue_handler, logging.handlers.QueueHandler)
+
+        def wait_until_queue_is_empty() -> None:
+            while not queue_handler.queue.empty():  # type: ignore
+                time.sleep(0.001)
+
+        calls: Dict[str, Dict[str, Callable[[], None]]] = {
+            "debug (disabled)": {
+                "legacy": lambda: legacy_logger.debug("Summary served from cache"),
+                "current": lambda: logger.debug("Summary served from cache"),
+            },
+            "info": {
+                "legacy": lambda: legacy_logger.info("Returning summarization result"),
+                "current": lambda: logger.info("Returning summarization result"),
+            },
+            "info (1MB text)": {
+                "legacy": lambda: legacy_logger.info(f"Executing summarization for text '{large_text}'"),
+                "current": lambda: logger.info(f"Executing summarization for text '{large_text}'"),
+            },
+        }
+
+        print(f"{'call':>18} {'legacy us':>12} {'current us':>12} {'speedup':>8}")
+
+        for name, loggers in calls.items():
+            timings: Dict[str, List[float]] = {logger_name: [] for logger_name in loggers}
+
+            # Rounds alternate between the loggers, so drifting machine load affects both alike.
+            for _ in range(args.rounds):
+                for logger_name, call in loggers.items():
+                    timings[logger_name].append(measure(call, args.calls, wait_until_queue_is_empty))
+
+            legacy = statistics.median(timings["legacy"])
+            current = statistics.median(timings["current"])
+            print(f"{name:>18} {legacy:>12.2f} {current:>12.2f} {legacy / current:>7.1f}x")
+
+        logger.shutdown()
+
+
+if __name__ == "__main__":
+    main()
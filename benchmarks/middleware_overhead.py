@@ -0,0 +1,142 @@
+"""
+Per-request overhead of the timing middleware.
+
+Calls a FastAPI app with a trivial endpoint directly through ASGI, so neither the network nor a server loop is
+measured, once without middleware, once with the former BaseHTTPMiddleware-based process time middleware and once
+with the plain ASGI server timing middleware, and reports the median time per request. Log records are written to
+the null device, so their formatting is measured but not the terminal.
+
+Usage:
+    PYTHONPATH=src python benchmarks/middleware_overhead.py --requests 5000 --rounds 5
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import Message
+
+from api.middlewares.server_timing_middleware import ServerTimingMiddleware
+from core.logger.logger import Logger
+
+
+# The middleware this benchmark compares against, as it was before the server timing middleware replaced it.
+class LegacyProcessTimeMiddleware(BaseHTTPMiddleware):
+    def __init__(
+        self,
+        app: Any,
+        logger: Logger,
+    ) -> None:
+        super().__init__(app)
+        self.logger = logger
+
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: Callable[[Request], Awaitable[Response]],
+    ) -> Response:
+        request_id = str(uuid.uuid4())
+        self.logger.info(f"Request {request_id} started: {request.method} {request.url}")
+        start_time = time.time()
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        response.headers["X-Process-Time"] = str(process_time)
+        self.logger.info(
+            f"Request {request_id} completed: {request.method} {request.url} processed in {process_time:.4f} seconds.",
+        )
+        return response
+
+
+def create_app(middleware: Optional[Any], logger: Logger) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/healthcheck")
+    async def health_check() -> Dict[str, str]:
+        return {"status": "ok"}
+
+    if middleware is not None:
+        app.add_middleware(middleware, logger=logger)
+
+    return app
+
+
+async def measure(app: FastAPI, requests: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/healthcheck",
+        "raw_path": b"/healthcheck",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("localhost", 8000),
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        pass
+
+    start = time.perf_counter()
+
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+async def run(requests: int, rounds: int) -> None:
+    logger = Logger()
+
+    # Records are still formatted, as they would be for a terminal, but writing them does not block the benchmark.
+    with open(os.devnull, "w") as devnull:
+        logger._output_handler.setStream(devnull)
+
+        apps = {
+            "none": create_app(None, logger),
+            "legacy": create_app(LegacyProcessTimeMiddleware, logger),
+            "server-timing": create_app(ServerTimingMiddleware, logger),
+        }
+
+        for app in apps.values():
+            await measure(app, requests // 10)
+
+        timings: Dict[str, List[float]] = {name: [] for name in apps}
+
+        # Rounds alternate between the apps, so drifting machine load affects all of them alike.
+        for _ in range(rounds):
+            for name, app in apps.items():
+                timings[name].append(await measure(app, requests))
+
+    baseline = statistics.median(timings["none"])
+    print(f"{'middleware':>14} {'us/request':>12} {'overhead us':>12}")
+
+    for name, app_timings in timings.items():
+        median = statistics.median(app_timings)
+        print(f"{name:>14} {median:>12.1f} {median - baseline:>12.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000, help="Requests per round")
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per middleware")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.requests, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
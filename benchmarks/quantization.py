@@ -0,0 +1,136 @@
+"""
+Latency, memory and summary agreement of int8 dynamic quantization against the fp32 baseline.
+
+Summarizes a fixed corpus with a worker process per mode and reports the median latency per document, the unique
+memory of the worker after the corpus and how closely the int8 summaries match the fp32 ones: the share of identical
+summaries and the mean unigram F1 between the two summaries of each document.
+
+Usage:
+    PYTHONPATH=src python benchmarks/quantization.py --rounds 3
+    PYTHONPATH=src python benchmarks/quantization.py --corpus articles.txt  # documents separated by blank lines
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+from typing import List, Tuple
+
+from core.logger.logger import Logger
+from data.workers.seq2seq_summarization_worker import (
+    Seq2SeqSummarizationConfig,
+    Seq2SeqSummarizationWorker,
+)
+
+CORPUS = [
+    "The tower is 324 metres (1,063 ft) tall, about the same height as an 81-storey building, and the tallest "
+    "structure in Paris. Its base is square, measuring 125 metres (410 ft) on each side. During its construction, "
+    "the Eiffel Tower surpassed the Washington Monument to become the tallest man-made structure in the world, a "
+    "title it held for 41 years until the Chrysler Building in New York City was finished in 1930.",
+    "The city council approved a new budget on Tuesday after months of debate over funding for public transport, "
+    "schools and road repairs. Officials said the plan raises spending by four percent while keeping property taxes "
+    "unchanged. Critics warned that the projected revenue from tourism may prove too optimistic, and two members "
+    "voted against the proposal, citing concerns about the cost of a new light rail line.",
+    "Researchers at a university hospital reported that a new screening programme detected lung cancer earlier in "
+    "more than a thousand patients over three years. The programme used low-dose scans for long-term smokers and "
+    "found that most tumours were identified at a stage when surgery was still possible. The team now hopes to "
+    "extend the trial to regional clinics, although funding for the next phase has not yet been secured.",
+    "Heavy rain caused flooding across several towns in the north of the country on Sunday, forcing hundreds of "
+    "residents to leave their homes. Emergency services rescued people trapped in cars and the national weather "
+    "agency issued its highest warning level for the region. Train services were suspended on two main lines and "
+    "officials said it could take days before water levels return to normal.",
+    "A local football club announced that it will build a new stadium with room for 30,000 spectators on the site "
+    "of a former factory. The club said the project will be financed by private investors and is expected to be "
+    "completed within four years. Residents welcomed the plan to regenerate the area but asked for guarantees "
+    "about traffic, parking and noise on match days.",
+    "The central bank kept interest rates unchanged for the third meeting in a row, saying inflation was slowing "
+    "but remained above its target. Policymakers noted that wage growth was still strong and that energy prices "
+    "could rise again in the winter. Most economists expect the first cut in the middle of next year, although "
+    "some warned that a weaker labour market could bring it forward.",
+]
+
+
+def unigram_f1(reference: str, candidate: str) -> float:
+    reference_counts = Counter(reference.lower().split())
+    candidate_counts = Counter(candidate.lower().split())
+    overlap = sum((reference_counts & candidate_counts).values())
+
+    if reference_counts == candidate_counts:
+        return 1.0
+
+    if overlap == 0:
+        return 0.0
+
+    precision = overlap / sum(candidate_counts.values())
+    recall = overlap / sum(reference_counts.values())
+
+    return 2 * precision * recall / (precision + recall)
+
+
+async def run(config: Seq2SeqSummarizationConfig, corpus: List[str], rounds: int) -> Tuple[List[str], float, int]:
+    worker = Seq2SeqSummarizationWorker(config, Logger())
+    worker.start()
+    summaries: List[str] = []
+    timings: List[float] = []
+
+    try:
+        # The first summary loads the model, so it is not measured.
+        await worker.summarize_async(corpus[0], {})
+
+        for _ in range(rounds):
+            summaries = []
+
+            for text in corpus:
+                start_time = time.perf_counter()
+                summaries.append(await worker.summarize_async(text, {}))
+                timings.append(time.perf_counter() - start_time)
+
+        memory_usage = worker.get_memory_usage()
+
+    finally:
+        worker.stop()
+
+    return summaries, statistics.median(timings), memory_usage.unique_bytes if memory_usage else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="facebook/bart-large-cnn")
+    parser.add_argument("--download-path", default="downloaded_summarization_models")
+    parser.add_argument("--corpus", help="Text file with documents separated by blank lines")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = CORPUS
+
+    if args.corpus:
+        with open(args.corpus, encoding="utf-8") as file:
+            corpus = [document.strip() for document in file.read().split("\n\n") if document.strip()]
+
+    results = {}
+
+    for quantization in ("", "int8-dynamic"):
+        config = Seq2SeqSummarizationConfig(
+            device="cpu",
+            model_name=args.model,
+            model_download_path=args.download_path,
+            log_level="WARNING",
+            quantization=quantization,
+        )
+        results[quantization or "fp32"] = asyncio.run(run(config, corpus, args.rounds))
+
+    baseline_summaries = results["fp32"][0]
+    print(f"{'mode':>12} {'median s':>10} {'unique MB':>10} {'identical':>10} {'unigram F1':>11}")
+
+    for mode, (summaries, median_latency, unique_bytes) in results.items():
+        identical = sum(summary == baseline for summary, baseline in zip(summaries, baseline_summaries))
+        f1 = statistics.mean(unigram_f1(baseline, summary) for summary, baseline in zip(summaries, baseline_summaries))
+        print(
+            f"{mode:>12} {median_latency:>10.3f} {unique_bytes / 1024 / 1024:>10.0f} "
+            f"{identical:>4}/{len(corpus):<5} {f1:>11.3f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
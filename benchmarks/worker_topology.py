@@ -0,0 +1,132 @@
+"""
+Throughput of a worker pool for different splits of the CPU cores into workers and threads per worker.
+
+Starts a pool of workers for each split (e.g. 1x8, 2x4 and 4x2 on eight cores), keeps every worker busy with the same
+concurrent requests and reports the requests per second and the median and 95th percentile latency. With `--affinity`
+each worker is pinned to its own cores, as with SUMMARIZATION_WORKER_CPU_AFFINITY. The `oversubscribed` row runs the
+widest pool with every worker using all cores, which is what happens when the thread budget is not set.
+
+Usage:
+    PYTHONPATH=src python benchmarks/worker_topology.py --requests 32
+    PYTHONPATH=src python benchmarks/worker_topology.py --splits 1x8 2x4 4x2 --affinity
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from typing import List, Tuple
+
+from core.logger.logger import Logger
+from data.workers.seq2seq_summarization_worker import (
+    Seq2SeqSummarizationConfig,
+    Seq2SeqSummarizationWorker,
+)
+
+TEXT = (
+    "The central bank kept interest rates unchanged for the third meeting in a row, saying inflation was slowing "
+    "but remained above its target. Policymakers noted that wage growth was still strong and that energy prices "
+    "could rise again in the winter. Most economists expect the first cut in the middle of next year, although "
+    "some warned that a weaker labour market could bring it forward."
+)
+
+
+def get_available_cpu_cores() -> List[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+
+    return list(range(os.cpu_count() or 1))
+
+
+def get_default_splits(cpu_core_count: int) -> List[Tuple[int, int]]:
+    splits: List[Tuple[int, int]] = []
+    workers = 1
+
+    while workers <= cpu_core_count:
+        splits.append((workers, cpu_core_count // workers))
+        workers *= 2
+
+    return splits
+
+
+async def run(
+    args: argparse.Namespace,
+    workers: int,
+    threads: int,
+    affinity: bool,
+) -> Tuple[float, float, float]:
+    available_cpu_cores = get_available_cpu_cores()
+    pool: List[Seq2SeqSummarizationWorker] = []
+
+    for index in range(workers):
+        start = index * threads
+        end = start + threads
+        pool.append(
+            Seq2SeqSummarizationWorker(
+                Seq2SeqSummarizationConfig(
+                    device="cpu",
+                    model_name=args.model,
+                    model_download_path=args.download_path,
+                    log_level="WARNING",
+                    num_threads=threads,
+                    cpu_cores=available_cpu_cores[start:end] if affinity else [],
+                ),
+                Logger(),
+            ),
+        )
+
+    latencies: List[float] = []
+
+    async def summarize(worker: Seq2SeqSummarizationWorker) -> None:
+        start_time = time.perf_counter()
+        await worker.summarize_async(TEXT, {})
+        latencies.append(time.perf_counter() - start_time)
+
+    try:
+        for worker in pool:
+            worker.start()
+
+        # The first summary of each worker loads the model, so it is not measured.
+        await asyncio.gather(*(worker.summarize_async(TEXT, {}) for worker in pool))
+
+        start_time = time.perf_counter()
+        await asyncio.gather(*(summarize(pool[index % workers]) for index in range(args.requests)))
+        elapsed = time.perf_counter() - start_time
+
+    finally:
+        for worker in pool:
+            worker.stop()
+
+    return args.requests / elapsed, statistics.median(latencies), statistics.quantiles(latencies, n=20)[-1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="facebook/bart-large-cnn")
+    parser.add_argument("--download-path", default="downloaded_summarization_models")
+    parser.add_argument("--splits", nargs="+", help="Workers x threads per worker, e.g. 2x4")
+    parser.add_argument("--requests", type=int, default=32)
+    parser.add_argument("--affinity", action="store_true")
+    args = parser.parse_args()
+
+    cpu_core_count = len(get_available_cpu_cores())
+    splits = (
+        [(int(workers), int(threads)) for workers, threads in (split.split("x") for split in args.splits)]
+        if args.splits
+        else get_default_splits(cpu_core_count)
+    )
+    print(f"{cpu_core_count} CPU cores, {args.requests} requests, affinity: {args.affinity}")
+    print(f"{'split':>16} {'req/s':>8} {'median s':>10} {'p95 s':>8}")
+
+    for workers, threads in splits:
+        throughput, median_latency, p95_latency = asyncio.run(run(args, workers, threads, args.affinity))
+        print(f"{f'{workers}x{threads}':>16} {throughput:>8.2f} {median_latency:>10.3f} {p95_latency:>8.3f}")
+
+    workers = max(workers for workers, _ in splits)
+    throughput, median_latency, p95_latency = asyncio.run(run(args, workers, cpu_core_count, affinity=False))
+    print(f"{'oversubscribed':>16} {throughput:>8.2f} {median_latency:>10.3f} {p95_latency:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
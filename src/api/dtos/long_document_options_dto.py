@@ -0,0 +1,30 @@
+from pydantic import BaseModel, Field, model_validator
+
+from domain.exceptions.invalid_chunk_overlap_error import InvalidChunkOverlapError
+
+
+class LongDocumentOptionsDTO(BaseModel):
+    """
+    DTO for long-document (map-reduce) summarization options.
+
+    Attributes:
+        chunk_size (int): Maximum number of tokens in a single chunk. Must fit the model input window. Default is 1000.
+        chunk_overlap (int): Number of tokens shared by consecutive chunks. Must be smaller than chunk_size.
+            Default is 100.
+        max_reduce_depth (int): Maximum number of rounds in which chunk summaries are summarized again until the
+            result fits a single chunk. Default is 3.
+    """
+
+    chunk_size: int = Field(
+        default=1000,
+        gt=0,
+    )
+    chunk_overlap: int = Field(default=100, ge=0)
+    max_reduce_depth: int = Field(default=3, ge=0)
+
+    @model_validator(mode="after")
+    def check_chunk_overlap(self) -> "LongDocumentOptionsDTO":
+        if self.chunk_overlap >= self.chunk_size:
+            raise InvalidChunkOverlapError()
+
+        return self
@@ -0,0 +1,50 @@
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class WorkerStatusDTO(BaseModel):
+    index: int
+    pid: Optional[int]
+    is_alive: bool
+    is_busy: bool
+    queue_depth: int
+    resident_memory_bytes: Optional[int] = None
+    proportional_memory_bytes: Optional[int] = None
+    unique_memory_bytes: Optional[int] = None
+    model_name: Optional[str] = None
+    restarts: int = 0
+    load_seconds: Optional[float] = None
+
+
+class ModelStatusDTO(BaseModel):
+    name: str
+    is_default: bool
+    is_loaded: bool
+    memory_bytes: Optional[int]
+    requests: int
+    mean_latency_seconds: Optional[float]
+    loads: int
+    evictions: int
+    queue_depth: int = 0
+    rejected_requests: int = 0
+    cancelled_requests: int = 0
+    deadline_exceeded_requests: int = 0
+    mean_queue_wait_seconds: Dict[str, Optional[float]] = {}
+
+
+class CacheStatusDTO(BaseModel):
+    entries: int
+    size_bytes: int
+    max_size_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+
+class StatusResultDTO(BaseModel):
+    workers: List[WorkerStatusDTO]
+    models: List[ModelStatusDTO] = []
+    cache: Optional[CacheStatusDTO] = None
+    coalesced_requests: int
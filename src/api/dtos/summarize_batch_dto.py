@@ -0,0 +1,24 @@
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, Field
+
+from api.dtos.summarize_dto import SummarizeDTO
+from domain.models.summarization_priority import SummarizationPriority
+
+
+class SummarizeBatchDTO(BaseModel):
+    """
+    DTO for batch summarization request.
+
+    Attributes:
+        items (List[SummarizeDTO]): The texts to be summarized. Each item accepts the same fields as a single
+            summarization request.
+        generation_parameters (Dict[str, Any]): Parameters shared by all items. Parameters set on an item take
+            precedence over the shared ones. Default is empty.
+        priority (SummarizationPriority): The scheduling class of items without their own priority. Default is "bulk",
+            so batches never delay interactive requests.
+    """
+
+    items: List[SummarizeDTO] = Field(..., min_length=1)
+    generation_parameters: Dict[str, Any] = {}
+    priority: SummarizationPriority = SummarizationPriority.BULK
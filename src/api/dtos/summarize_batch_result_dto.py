@@ -0,0 +1,15 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from api.dtos.error_response_dto import ErrorResponseDto
+from api.dtos.summarize_result_dto import SummarizeResultDTO
+
+
+class SummarizeBatchItemResultDTO(BaseModel):
+    result: Optional[SummarizeResultDTO] = None
+    error: Optional[ErrorResponseDto] = None
+
+
+class SummarizeBatchResultDTO(BaseModel):
+    results: List[SummarizeBatchItemResultDTO]
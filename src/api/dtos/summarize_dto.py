@@ -1,7 +1,10 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel
 
+from api.dtos.long_document_options_dto import LongDocumentOptionsDTO
+from domain.models.summarization_priority import SummarizationPriority
+
 
 class SummarizeDTO(BaseModel):
     """
@@ -41,7 +44,22 @@ class SummarizeDTO(BaseModel):
               Default is True.
             - model_specific_kwargs (dict, optional): Additional model-specific kwargs forwarded to the model's
               forward function.
+
+        long_document_options (LongDocumentOptionsDTO, optional): Enables long-document mode. The text is split into
+            overlapping token chunks which are summarized in parallel, and the joined chunk summaries are summarized
+            again until the result fits the model input window. Default is None.
+        bypass_cache (bool): If set to True, a fresh summary is generated instead of a cached one and replaces it in the
+            cache. Default is False.
+        model (str, optional): The model to summarize with, one of SUMMARIZATION_MODELS. Default is None, which uses
+            SUMMARIZATION_MODEL_NAME.
+        priority (SummarizationPriority, optional): The scheduling class of the request, either "interactive" or
+            "bulk". Interactive requests are dispatched to the workers ahead of waiting bulk requests. Default is None,
+            which uses "interactive" for single and streaming requests and the batch priority for batch items.
     """
 
     text_to_summarize: str
     generation_parameters: Dict[str, Any] = {}
+    long_document_options: Optional[LongDocumentOptionsDTO] = None
+    bypass_cache: bool = False
+    model: Optional[str] = None
+    priority: Optional[SummarizationPriority] = None
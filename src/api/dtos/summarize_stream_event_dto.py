@@ -0,0 +1,13 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class SummarizeStreamTokenDTO(BaseModel):
+    text: str
+
+
+class SummarizeStreamResultDTO(BaseModel):
+    summary: str
+    time_to_first_token: Optional[float] = None
+    total_time: Optional[float] = None
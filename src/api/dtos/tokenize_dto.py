@@ -0,0 +1,22 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from api.dtos.long_document_options_dto import LongDocumentOptionsDTO
+
+
+class TokenizeDTO(BaseModel):
+    """
+    DTO for tokenization request.
+
+    Attributes:
+        text_to_summarize (str): The text that would be summarized.
+        long_document_options (LongDocumentOptionsDTO, optional): The long-document options that would be used. When
+            set, the response reports the number of chunks the text is split into. Default is None.
+        model (str, optional): The model whose tokenizer counts the tokens, one of SUMMARIZATION_MODELS. Default is
+            None, which uses SUMMARIZATION_MODEL_NAME.
+    """
+
+    text_to_summarize: str
+    long_document_options: Optional[LongDocumentOptionsDTO] = None
+    model: Optional[str] = None
@@ -0,0 +1,10 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class TokenizeResultDTO(BaseModel):
+    token_count: int
+    max_input_tokens: int
+    is_truncated: bool
+    chunk_count: Optional[int] = None
@@ -5,6 +5,9 @@ from fastapi.responses import JSONResponse
 
 from api.dtos.error_response_dto import ErrorResponseDto
 from core.logger.logger import Logger
+from domain.exceptions.deadline_exceeded_error import DeadlineExceededError
+from domain.exceptions.queue_full_error import QueueFullError
+from domain.exceptions.request_cancelled_error import RequestCancelledError
 
 
 class GlobalExceptionHandler:
@@ -30,6 +33,54 @@ class GlobalExceptionHandler:
                 content=content,
             )
 
+        @self.app.exception_handler(QueueFullError)
+        async def handle_queue_full_error(request: Request, exc: QueueFullError) -> JSONResponse:
+            content = ErrorResponseDto(
+                status_code=429,
+                message="Too many requests",
+                details={"error_type": exc.__class__.__name__, "error_message": str(exc)},
+            ).model_dump(exclude_none=True)
+
+            # Shedding load is expected under bursts, so it is not logged as an error.
+            self.logger.warning(f"QueueFullError occurred: {str(content)}")
+
+            return JSONResponse(
+                status_code=429,
+                content=content,
+                headers={"Retry-After": str(exc.retry_after)},
+            )
+
+        @self.app.exception_handler(DeadlineExceededError)
+        async def handle_deadline_exceeded_error(request: Request, exc: DeadlineExceededError) -> JSONResponse:
+            content = ErrorResponseDto(
+                status_code=504,
+                message="Deadline exceeded",
+                details={"error_type": exc.__class__.__name__, "error_message": str(exc)},
+            ).model_dump(exclude_none=True)
+
+            self.logger.warning(f"DeadlineExceededError occurred: {str(content)}")
+
+            return JSONResponse(
+                status_code=504,
+                content=content,
+            )
+
+        @self.app.exception_handler(RequestCancelledError)
+        async def handle_request_cancelled_error(request: Request, exc: RequestCancelledError) -> JSONResponse:
+            content = ErrorResponseDto(
+                status_code=499,
+                message="Request cancelled",
+                details={"error_type": exc.__class__.__name__, "error_message": str(exc)},
+            ).model_dump(exclude_none=True)
+
+            # The client has already gone, so the response is never read; the log is all that is left of it.
+            self.logger.info(f"RequestCancelledError occurred: {str(content)}")
+
+            return JSONResponse(
+                status_code=499,
+                content=content,
+            )
+
         @self.app.exception_handler(Exception)
         async def handle_exception(request: Request, exc: Exception) -> JSONResponse:
             content = ErrorResponseDto(
@@ -0,0 +1,74 @@
+import itertools
+import secrets
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.logger.logger import Logger
+from core.metrics.request_timings import RequestTimings, current_request_timings
+
+_REQUEST_ID_HEADER = b"x-request-id"
+_MAX_REQUEST_ID_LENGTH = 128
+
+
+class ServerTimingMiddleware:
+    # A plain ASGI middleware: unlike BaseHTTPMiddleware, it neither wraps the response in a new task and stream nor
+    # builds a Request, so its cost per request is a few header appends.
+    def __init__(
+        self,
+        app: ASGIApp,
+        logger: Logger,
+    ) -> None:
+        self.app = app
+        self.logger = logger
+        # A random prefix keeps generated ids unique across processes and restarts without a UUID per request.
+        self._request_id_prefix = secrets.token_hex(4)
+        self._request_counter = itertools.count(1)
+
+    def _get_request_id(self, scope: Scope) -> bytes:
+        for name, value in scope["headers"]:
+            if name == _REQUEST_ID_HEADER:
+                # Ids of clients are echoed in a response header, so only short printable ASCII ids are trusted.
+                if 0 < len(value) <= _MAX_REQUEST_ID_LENGTH and all(32 < byte < 127 for byte in value):
+                    return bytes(value)
+
+                break
+
+        return f"{self._request_id_prefix}-{next(self._request_counter)}".encode()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_timings = RequestTimings(time.perf_counter())
+        request_id = self._get_request_id(scope)
+        status_code = 0
+
+        async def send_with_timings(message: Message) -> None:
+            nonlocal status_code
+
+            # Headers leave with the start of the response, so streamed responses only report the stages before it.
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                process_time = time.perf_counter() - request_timings.start_time
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", request_timings.format_server_timing(process_time).encode()))
+                headers.append((b"x-request-id", request_id))
+                headers.append((b"x-process-time", str(process_time).encode()))
+                message = {**message, "headers": headers}
+
+            await send(message)
+
+        token = current_request_timings.set(request_timings)
+
+        try:
+            await self.app(scope, receive, send_with_timings)
+
+        finally:
+            current_request_timings.reset(token)
+            process_time = time.perf_counter() - request_timings.start_time
+            self.logger.debug(
+                f"Request {request_id.decode()} {scope['method']} {scope['path']} "
+                f"completed with status {status_code} in {process_time:.4f} seconds",
+            )
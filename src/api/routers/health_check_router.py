@@ -1,12 +1,29 @@
-from fastapi import APIRouter
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Response
 
 from api.dtos.health_check_result_dto import HealthCheckResultDto
+from application.usecases.get_readiness_usecase import GetReadinessUseCase
 
 
 class HealthCheckRouter:
     def __init__(self) -> None:
         self.router = APIRouter()
         self.router.get("/healthcheck")(self.healthcheck)
+        self.router.get("/readiness", responses={503: {"model": HealthCheckResultDto}})(self.readiness)
 
     async def healthcheck(self) -> HealthCheckResultDto:
         return HealthCheckResultDto(status="OK")
+
+    async def readiness(
+        self,
+        get_readiness_usecase: Annotated[GetReadinessUseCase, Depends()],
+        response: Response,
+    ) -> HealthCheckResultDto:
+        if await get_readiness_usecase.execute():
+            return HealthCheckResultDto(status="READY")
+
+        # Load balancers keep traffic away until the preloaded workers are warm.
+        response.status_code = 503
+
+        return HealthCheckResultDto(status="WARMING_UP")
@@ -0,0 +1,191 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Response
+
+from application.usecases.get_metrics_usecase import GetMetricsUseCase
+from core.metrics.prometheus_text_writer import CONTENT_TYPE, PrometheusTextWriter
+from domain.models.service_metrics import ServiceMetrics
+
+
+class MetricsRouter:
+    def __init__(self) -> None:
+        self.router = APIRouter()
+        self.router.get("/metrics", response_class=Response)(self.metrics)
+
+    def _write_models(self, writer: PrometheusTextWriter, service_metrics: ServiceMetrics) -> None:
+        for model_status in service_metrics.status.models:
+            labels = {"model": model_status.name}
+            writer.add_gauge(
+                "summarization_model_loaded",
+                "Whether the model is loaded.",
+                model_status.is_loaded,
+                labels,
+            )
+            writer.add_gauge(
+                "summarization_model_memory_bytes",
+                "Proportional memory of the workers of the model.",
+                model_status.memory_bytes,
+                labels,
+            )
+            writer.add_counter("summarization_model_loads_total", "Loads of the model.", model_status.loads, labels)
+            writer.add_counter(
+                "summarization_model_evictions_total",
+                "Unloads of the model to stay within the memory budget.",
+                model_status.evictions,
+                labels,
+            )
+            writer.add_counter(
+                "summarization_requests_total",
+                "Requests served by the workers of the model.",
+                model_status.requests,
+                labels,
+            )
+            writer.add_gauge(
+                "summarization_queue_depth",
+                "Texts dispatched to or waiting for the workers of the model.",
+                model_status.queue_depth,
+                labels,
+            )
+            writer.add_counter(
+                "summarization_rejected_requests_total",
+                "Requests rejected because the queue was full.",
+                model_status.rejected_requests,
+                labels,
+            )
+            writer.add_counter(
+                "summarization_cancelled_requests_total",
+                "Requests cancelled because their client disconnected.",
+                model_status.cancelled_requests,
+                labels,
+            )
+            writer.add_counter(
+                "summarization_deadline_exceeded_requests_total",
+                "Requests that exceeded their deadline.",
+                model_status.deadline_exceeded_requests,
+                labels,
+            )
+
+        for model_metrics in service_metrics.models:
+            labels = {"model": model_metrics.name}
+
+            for priority, histogram in model_metrics.queue_wait_seconds.items():
+                writer.add_histogram(
+                    "summarization_queue_wait_seconds",
+                    "Time requests waited in the queue for a worker.",
+                    histogram,
+                    {**labels, "priority": priority},
+                )
+
+            for stage, histogram in model_metrics.stage_seconds.items():
+                writer.add_histogram(
+                    "summarization_stage_duration_seconds",
+                    "Time spent in each stage of a generation; tokenize runs in the API process.",
+                    histogram,
+                    {**labels, "stage": stage},
+                )
+
+            writer.add_histogram(
+                "summarization_input_tokens",
+                "Input tokens per summarized text.",
+                model_metrics.input_tokens,
+                labels,
+            )
+            writer.add_histogram(
+                "summarization_output_tokens",
+                "Output tokens per summarized text.",
+                model_metrics.output_tokens,
+                labels,
+            )
+            writer.add_histogram(
+                "summarization_generation_tokens_per_second",
+                "Output tokens per second of generation.",
+                model_metrics.tokens_per_second,
+                labels,
+            )
+            writer.add_histogram(
+                "summarization_time_to_first_token_seconds",
+                "Time until the first partial summary of a streamed summary.",
+                model_metrics.time_to_first_token_seconds,
+                labels,
+            )
+
+    def _write_workers(self, writer: PrometheusTextWriter, service_metrics: ServiceMetrics) -> None:
+        for worker_status in service_metrics.status.workers:
+            labels = {"model": worker_status.model_name or "", "worker": str(worker_status.index)}
+            writer.add_gauge(
+                "summarization_worker_alive",
+                "Whether the worker process runs.",
+                worker_status.is_alive,
+                labels,
+            )
+            writer.add_gauge(
+                "summarization_worker_busy",
+                "Whether the worker has texts dispatched or in generation.",
+                worker_status.is_busy,
+                labels,
+            )
+            writer.add_counter(
+                "summarization_worker_restarts_total",
+                "Restarts of a worker process that exited on its own.",
+                worker_status.restarts,
+                labels,
+            )
+            writer.add_gauge(
+                "summarization_worker_load_seconds",
+                "Time the worker process needed to load its model.",
+                worker_status.load_seconds,
+                labels,
+            )
+            writer.add_gauge(
+                "summarization_worker_resident_memory_bytes",
+                "Resident memory of the worker process.",
+                worker_status.resident_memory_bytes,
+                labels,
+            )
+
+    def _write_cache(self, writer: PrometheusTextWriter, service_metrics: ServiceMetrics) -> None:
+        writer.add_counter(
+            "summarization_coalesced_requests_total",
+            "Requests that joined an identical request in flight.",
+            service_metrics.status.coalesced_requests,
+        )
+        cache_status = service_metrics.status.cache
+
+        if cache_status is None:
+            return
+
+        writer.add_gauge("summarization_cache_entries", "Summaries in the cache.", cache_status.entries)
+        writer.add_gauge("summarization_cache_size_bytes", "Size of the cached summaries.", cache_status.size_bytes)
+        writer.add_gauge(
+            "summarization_cache_max_size_bytes",
+            "Size limit of the cached summaries.",
+            cache_status.max_size_bytes,
+        )
+        writer.add_counter("summarization_cache_hits_total", "Cache lookups that found a summary.", cache_status.hits)
+        writer.add_counter(
+            "summarization_cache_misses_total",
+            "Cache lookups that found no summary.",
+            cache_status.misses,
+        )
+        writer.add_counter(
+            "summarization_cache_evictions_total",
+            "Summaries evicted to stay within the size limit.",
+            cache_status.evictions,
+        )
+        writer.add_counter(
+            "summarization_cache_expirations_total",
+            "Summaries dropped after their time to live.",
+            cache_status.expirations,
+        )
+
+    async def metrics(
+        self,
+        get_metrics_usecase: Annotated[GetMetricsUseCase, Depends()],
+    ) -> Response:
+        service_metrics = await get_metrics_usecase.execute()
+        writer = PrometheusTextWriter()
+        self._write_models(writer, service_metrics)
+        self._write_workers(writer, service_metrics)
+        self._write_cache(writer, service_metrics)
+
+        return Response(content=writer.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,31 @@
+from dataclasses import asdict
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from api.dtos.status_result_dto import (
+    CacheStatusDTO,
+    ModelStatusDTO,
+    StatusResultDTO,
+    WorkerStatusDTO,
+)
+from application.usecases.get_status_usecase import GetStatusUseCase
+
+
+class StatusRouter:
+    def __init__(self) -> None:
+        self.router = APIRouter()
+        self.router.get("/status")(self.status)
+
+    async def status(
+        self,
+        get_status_usecase: Annotated[GetStatusUseCase, Depends()],
+    ) -> StatusResultDTO:
+        service_status = await get_status_usecase.execute()
+
+        return StatusResultDTO(
+            workers=[WorkerStatusDTO(**asdict(worker_status)) for worker_status in service_status.workers],
+            models=[ModelStatusDTO(**asdict(model_status)) for model_status in service_status.models],
+            cache=CacheStatusDTO(**asdict(service_status.cache)) if service_status.cache else None,
+            coalesced_requests=service_status.coalesced_requests,
+        )
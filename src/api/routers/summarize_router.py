@@ -1,25 +1,228 @@
-from typing import Annotated
+import asyncio
+import time
+from typing import Annotated, AsyncIterator, Awaitable, Optional, TypeVar
 
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, Header, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 
+from api.dtos.error_response_dto import ErrorResponseDto
+from api.dtos.summarize_batch_dto import SummarizeBatchDTO
+from api.dtos.summarize_batch_result_dto import (
+    SummarizeBatchItemResultDTO,
+    SummarizeBatchResultDTO,
+)
 from api.dtos.summarize_dto import SummarizeDTO
 from api.dtos.summarize_result_dto import SummarizeResultDTO
+from api.dtos.summarize_stream_event_dto import (
+    SummarizeStreamResultDTO,
+    SummarizeStreamTokenDTO,
+)
+from application.usecases.summarize_text_batch_usecase import SummarizeTextBatchUseCase
+from application.usecases.summarize_text_stream_usecase import (
+    SummarizeTextStreamUseCase,
+)
 from application.usecases.summarize_text_usecase import SummarizeTextUseCase
+from core.logger.logger import Logger
+from core.metrics.request_timings import record_request_stage_since_start
+from domain.exceptions.deadline_exceeded_error import DeadlineExceededError
+from domain.exceptions.queue_full_error import QueueFullError
+from domain.exceptions.request_cancelled_error import RequestCancelledError
+from domain.exceptions.unsupported_streaming_option_error import (
+    UnsupportedStreamingOptionError,
+)
+from domain.models.chunking_options import ChunkingOptions
+from domain.models.summarization_priority import SummarizationPriority
+from domain.models.summarization_request import SummarizationRequest
+from domain.models.summary_stream_event import SummaryStreamEvent
+
+ResultType = TypeVar("ResultType")
+
+_DISCONNECT_POLL_INTERVAL = 0.1
+
+RequestTimeout = Annotated[
+    Optional[float],
+    Header(
+        alias="X-Request-Timeout",
+        gt=0,
+        description="Seconds after which the summary is no longer needed and its generation is stopped",
+    ),
+]
 
 
 class SummarizeRouter:
     def __init__(self) -> None:
         self.router = APIRouter()
         self.router.post("/summarize")(self.summarize)
+        self.router.post("/summarize/batch", response_model_exclude_none=True)(self.summarize_batch)
+        self.router.post(
+            "/summarize/stream",
+            response_class=StreamingResponse,
+            responses={200: {"content": {"text/event-stream": {}}}},
+        )(self.summarize_stream)
+
+    def _get_deadline(self, request_timeout: Optional[float]) -> Optional[float]:
+        return time.monotonic() + request_timeout if request_timeout is not None else None
+
+    async def _run_until_disconnected(self, request: Request, operation: Awaitable[ResultType]) -> ResultType:
+        task = asyncio.ensure_future(operation)
+
+        try:
+            while not task.done():
+                await asyncio.wait({task}, timeout=_DISCONNECT_POLL_INTERVAL)
+
+                if not task.done() and await request.is_disconnected():
+                    raise RequestCancelledError()
+
+            return task.result()
+
+        finally:
+            # Cancelling stops the generation in the worker, so the next request does not wait behind dead work.
+            if not task.done():
+                task.cancel()
+                await asyncio.wait({task})
 
     async def summarize(
         self,
+        request: Request,
         summarize_text_usecase: Annotated[SummarizeTextUseCase, Depends()],
         summarize_dto: SummarizeDTO = Body(...),
+        request_timeout: RequestTimeout = None,
     ) -> SummarizeResultDTO:
-        summary = await summarize_text_usecase.execute(
+        record_request_stage_since_start("validate")
+        chunking_options = (
+            ChunkingOptions(**summarize_dto.long_document_options.model_dump())
+            if summarize_dto.long_document_options
+            else None
+        )
+
+        summary = await self._run_until_disconnected(
+            request,
+            summarize_text_usecase.execute(
+                summarize_dto.text_to_summarize,
+                summarize_dto.generation_parameters,
+                chunking_options,
+                summarize_dto.bypass_cache,
+                summarize_dto.model,
+                summarize_dto.priority or SummarizationPriority.INTERACTIVE,
+                self._get_deadline(request_timeout),
+            ),
+        )
+
+        return SummarizeResultDTO(summary=summary)
+
+    def _to_error_response(self, error: Exception) -> ErrorResponseDto:
+        if isinstance(error, QueueFullError):
+            status_code, message = 429, "Too many requests"
+        elif isinstance(error, DeadlineExceededError):
+            status_code, message = 504, "Deadline exceeded"
+        elif isinstance(error, RequestCancelledError):
+            status_code, message = 499, "Request cancelled"
+        elif isinstance(error, ValueError):
+            status_code, message = 422, "Value error"
+        else:
+            status_code, message = 500, "Internal server error"
+
+        return ErrorResponseDto(
+            status_code=status_code,
+            message=message,
+            details={"error_type": error.__class__.__name__, "error_message": str(error)},
+        )
+
+    async def summarize_batch(
+        self,
+        request: Request,
+        summarize_text_batch_usecase: Annotated[SummarizeTextBatchUseCase, Depends()],
+        summarize_batch_dto: SummarizeBatchDTO = Body(...),
+        request_timeout: RequestTimeout = None,
+    ) -> SummarizeBatchResultDTO:
+        record_request_stage_since_start("validate")
+        deadline = self._get_deadline(request_timeout)
+        requests = [
+            SummarizationRequest(
+                text_to_summarize=item.text_to_summarize,
+                generation_parameters={**summarize_batch_dto.generation_parameters, **item.generation_parameters},
+                chunking_options=(
+                    ChunkingOptions(**item.long_document_options.model_dump()) if item.long_document_options else None
+                ),
+                bypass_cache=item.bypass_cache,
+                model_name=item.model,
+                priority=item.priority or summarize_batch_dto.priority,
+                deadline=deadline,
+            )
+            for item in summarize_batch_dto.items
+        ]
+
+        results = await self._run_until_disconnected(request, summarize_text_batch_usecase.execute(requests))
+
+        return SummarizeBatchResultDTO(
+            results=[
+                (
+                    SummarizeBatchItemResultDTO(error=self._to_error_response(result.error))
+                    if result.error is not None
+                    else SummarizeBatchItemResultDTO(result=SummarizeResultDTO(summary=result.summary))
+                )
+                for result in results
+            ],
+        )
+
+    def _format_event(self, event: str, data: BaseModel) -> str:
+        return f"event: {event}\ndata: {data.model_dump_json(exclude_none=True)}\n\n"
+
+    async def _stream_events(
+        self,
+        events: AsyncIterator[SummaryStreamEvent],
+        logger: Logger,
+    ) -> AsyncIterator[str]:
+        try:
+            async for event in events:
+                if event.is_final:
+                    yield self._format_event(
+                        "done",
+                        SummarizeStreamResultDTO(
+                            summary=event.text,
+                            time_to_first_token=event.time_to_first_token,
+                            total_time=event.total_time,
+                        ),
+                    )
+                else:
+                    yield self._format_event("token", SummarizeStreamTokenDTO(text=event.text))
+
+        except Exception as e:
+            # The response status is already sent once streaming starts, so failures are reported in-band.
+            content = self._to_error_response(e)
+
+            logger.exception(f"Streaming summarization failed: {content.model_dump(exclude_none=True)}")
+
+            yield self._format_event("error", content)
+
+    async def summarize_stream(
+        self,
+        summarize_text_stream_usecase: Annotated[SummarizeTextStreamUseCase, Depends()],
+        logger: Annotated[Logger, Depends()],
+        summarize_dto: SummarizeDTO = Body(...),
+        request_timeout: RequestTimeout = None,
+    ) -> StreamingResponse:
+        record_request_stage_since_start("validate")
+
+        if summarize_dto.long_document_options is not None:
+            raise UnsupportedStreamingOptionError("long_document_options")
+
+        # A streamer follows a single sequence, which beam search does not have until generation ends.
+        if (num_beams := summarize_dto.generation_parameters.get("num_beams", 1)) != 1:
+            raise UnsupportedStreamingOptionError("num_beams", num_beams)
+
+        events = summarize_text_stream_usecase.execute(
             summarize_dto.text_to_summarize,
             summarize_dto.generation_parameters,
+            summarize_dto.model,
+            summarize_dto.priority or SummarizationPriority.INTERACTIVE,
+            self._get_deadline(request_timeout),
         )
 
-        return SummarizeResultDTO(summary=summary)
+        # Streaming responses are cancelled when their client disconnects, which also stops the generation.
+        return StreamingResponse(
+            self._stream_events(events, logger),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
@@ -0,0 +1,40 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Body, Depends
+
+from api.dtos.tokenize_dto import TokenizeDTO
+from api.dtos.tokenize_result_dto import TokenizeResultDTO
+from application.usecases.tokenize_text_usecase import TokenizeTextUseCase
+from core.metrics.request_timings import record_request_stage_since_start
+from domain.models.chunking_options import ChunkingOptions
+
+
+class TokenizeRouter:
+    def __init__(self) -> None:
+        self.router = APIRouter()
+        self.router.post("/tokenize", response_model_exclude_none=True)(self.tokenize)
+
+    async def tokenize(
+        self,
+        tokenize_text_usecase: Annotated[TokenizeTextUseCase, Depends()],
+        tokenize_dto: TokenizeDTO = Body(...),
+    ) -> TokenizeResultDTO:
+        record_request_stage_since_start("validate")
+        chunking_options = (
+            ChunkingOptions(**tokenize_dto.long_document_options.model_dump())
+            if tokenize_dto.long_document_options
+            else None
+        )
+
+        result = await tokenize_text_usecase.execute(
+            tokenize_dto.text_to_summarize,
+            chunking_options,
+            tokenize_dto.model,
+        )
+
+        return TokenizeResultDTO(
+            token_count=result.token_count,
+            max_input_tokens=result.max_input_tokens,
+            is_truncated=result.is_truncated,
+            chunk_count=result.chunk_count,
+        )
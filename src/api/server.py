@@ -1,15 +1,116 @@
+import asyncio
+import contextlib
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
 import uvicorn
 from fastapi import FastAPI
 
 from api.handlers.global_exception_handler import GlobalExceptionHandler
-from api.middlewares.process_time_middleware import ProcessTimeMiddleware
+from api.middlewares.server_timing_middleware import ServerTimingMiddleware
 from api.routers.health_check_router import HealthCheckRouter
+from api.routers.metrics_router import MetricsRouter
+from api.routers.status_router import StatusRouter
 from api.routers.summarize_router import SummarizeRouter
+from api.routers.tokenize_router import TokenizeRouter
+from application.usecases.preload_model_usecase import PreloadModelUseCase
+from application.usecases.stop_model_usecase import StopModelUseCase
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
+from data.factories.summarization_worker_factory import SummarizationWorkerFactory
+from data.repositories.directory_repository_impl import DirectoryRepositoryImpl
+from data.repositories.summarization_model_repository_impl import (
+    SummarizationModelRepositoryImpl,
+)
+from data.repositories.summarization_tokenizer_repository_impl import (
+    SummarizationTokenizerRepositoryImpl,
+)
+from domain.services.summarization_service import SummarizationService
 
 
 class APIServer:
+
+    def _create_summarization_service(self) -> SummarizationService:
+        # Startup and shutdown run outside of any request, so the dependencies FastAPI would inject are created here.
+        summarization_model_repository = SummarizationModelRepositoryImpl(
+            self.config,
+            DirectoryRepositoryImpl(self.logger),
+            self.logger,
+            SummarizationWorkerFactory(self.config, self.logger),
+            SummarizationTokenizerRepositoryImpl(self.config, self.logger),
+        )
+
+        return SummarizationService(self.config, summarization_model_repository, self.logger)
+
+    def _create_preload_model_usecase(self) -> PreloadModelUseCase:
+        override = self.app.dependency_overrides.get(PreloadModelUseCase)
+
+        if override is not None:
+            preload_model_usecase: PreloadModelUseCase = override()
+
+            return preload_model_usecase
+
+        return PreloadModelUseCase(self.logger, self._create_summarization_service())
+
+    def _create_stop_model_usecase(self) -> Optional[StopModelUseCase]:
+        override = self.app.dependency_overrides.get(StopModelUseCase)
+
+        if override is not None:
+            stop_model_usecase: StopModelUseCase = override()
+
+            return stop_model_usecase
+
+        summarization_model_repository = SummarizationModelRepositoryImpl._instance
+
+        # Workers and the summary store only exist once a request or the preload created the repository, which is not
+        # created here just to be stopped again.
+        if summarization_model_repository is None:
+            return None
+
+        return StopModelUseCase(
+            self.logger,
+            SummarizationService(self.config, summarization_model_repository, self.logger),
+        )
+
+    async def _preload_model(self) -> None:
+        try:
+            await self._create_preload_model_usecase().execute()
+
+        except Exception:
+            # The server keeps running, but /readiness never reports ready, so the failure stays visible.
+            self.logger.exception("Model preload failed")
+
+    async def _stop_model(self) -> None:
+        try:
+            stop_model_usecase = self._create_stop_model_usecase()
+
+            if stop_model_usecase is not None:
+                await stop_model_usecase.execute()
+
+        except Exception:
+            # Shutdown goes on regardless; the log tells which workers or store writes may have been left behind.
+            self.logger.exception("Model stop failed")
+
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI) -> AsyncIterator[None]:
+        preload_task: Optional[asyncio.Task[None]] = None
+
+        if self.config.model_preload:
+            # Preloading runs in the background, so health checks are answered while the workers warm up.
+            preload_task = asyncio.create_task(self._preload_model())
+
+        yield
+
+        if preload_task is not None:
+            preload_task.cancel()
+
+            # Waited for, so a preload that is still loading does not start workers while they are being stopped.
+            with contextlib.suppress(asyncio.CancelledError):
+                await preload_task
+
+        # Workers, their shared memory rings and the summary store writer outlive the event loop unless stopped here.
+        await self._stop_model()
+
     def __init__(
         self,
         config: AppConfig,
@@ -17,11 +118,14 @@ class APIServer:
     ) -> None:
         self.config = config
         self.logger = logger
-        self.app = FastAPI()
+        self.app = FastAPI(lifespan=self._lifespan)
         self.exception_handler = GlobalExceptionHandler(self.app, logger)
-        self.app.add_middleware(ProcessTimeMiddleware, logger=logger)
+        self.app.add_middleware(ServerTimingMiddleware, logger=logger)
         self.app.include_router(SummarizeRouter().router, tags=["Summarize"])
+        self.app.include_router(TokenizeRouter().router, tags=["Tokenize"])
         self.app.include_router(HealthCheckRouter().router, tags=["HealthCheck"])
+        self.app.include_router(StatusRouter().router, tags=["Status"])
+        self.app.include_router(MetricsRouter().router, tags=["Metrics"])
 
     def start(self) -> None:
         self.logger.info("Starting FastAPI server...")
@@ -0,0 +1,32 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from core.logger.logger import Logger
+from domain.models.service_metrics import ServiceMetrics
+from domain.models.service_status import ServiceStatus
+from domain.services.summarization_service import SummarizationService
+
+
+class GetMetricsUseCase:
+    def __init__(
+        self,
+        logger: Annotated[Logger, Depends()],
+        summarization_service: Annotated[SummarizationService, Depends()],
+    ) -> None:
+        self.logger = logger
+        self.summarization_service = summarization_service
+
+    async def execute(self) -> ServiceMetrics:
+        self.logger.debug("Collecting summarization metrics")
+        workers_status, models_status = await self.summarization_service.get_statuses()
+
+        return ServiceMetrics(
+            status=ServiceStatus(
+                workers=workers_status,
+                models=models_status,
+                cache=self.summarization_service.get_cache_status(),
+                coalesced_requests=self.summarization_service.get_coalesced_requests_count(),
+            ),
+            models=self.summarization_service.get_models_metrics(),
+        )
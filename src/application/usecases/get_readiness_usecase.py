@@ -0,0 +1,23 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from core.logger.logger import Logger
+from domain.services.summarization_service import SummarizationService
+
+
+class GetReadinessUseCase:
+    def __init__(
+        self,
+        logger: Annotated[Logger, Depends()],
+        summarization_service: Annotated[SummarizationService, Depends()],
+    ) -> None:
+        self.logger = logger
+        self.summarization_service = summarization_service
+
+    async def execute(self) -> bool:
+        self.logger.debug("Checking summarization model readiness")
+
+        is_ready: bool = self.summarization_service.is_model_ready()
+
+        return is_ready
@@ -0,0 +1,28 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from core.logger.logger import Logger
+from domain.models.service_status import ServiceStatus
+from domain.services.summarization_service import SummarizationService
+
+
+class GetStatusUseCase:
+    def __init__(
+        self,
+        logger: Annotated[Logger, Depends()],
+        summarization_service: Annotated[SummarizationService, Depends()],
+    ) -> None:
+        self.logger = logger
+        self.summarization_service = summarization_service
+
+    async def execute(self) -> ServiceStatus:
+        self.logger.debug("Collecting summarization models, workers and cache status")
+        workers_status, models_status = await self.summarization_service.get_statuses()
+
+        return ServiceStatus(
+            workers=workers_status,
+            models=models_status,
+            cache=self.summarization_service.get_cache_status(),
+            coalesced_requests=self.summarization_service.get_coalesced_requests_count(),
+        )
@@ -0,0 +1,23 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from core.logger.logger import Logger
+from domain.services.summarization_service import SummarizationService
+
+
+class StopModelUseCase:
+    def __init__(
+        self,
+        logger: Annotated[Logger, Depends()],
+        summarization_service: Annotated[SummarizationService, Depends()],
+    ) -> None:
+        self.logger = logger
+        self.summarization_service = summarization_service
+
+    async def execute(self) -> None:
+        self.logger.info("Executing model stop")
+
+        await self.summarization_service.stop_model()
+
+        self.logger.info("Model stop completed")
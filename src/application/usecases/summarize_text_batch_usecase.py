@@ -0,0 +1,34 @@
+from typing import Annotated, List
+
+from fastapi import Depends
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.models.summarization_request import SummarizationRequest
+from domain.models.summarization_result import SummarizationResult
+from domain.services.summarization_service import SummarizationService
+
+
+class SummarizeTextBatchUseCase:
+    def __init__(
+        self,
+        config: Annotated[AppConfig, Depends()],
+        logger: Annotated[Logger, Depends()],
+        summarization_service: Annotated[SummarizationService, Depends()],
+    ) -> None:
+        self.config = config
+        self.logger = logger
+        self.summarization_service = summarization_service
+
+    async def execute(
+        self,
+        requests: List[SummarizationRequest],
+    ) -> List[SummarizationResult]:
+        self.logger.info(f"Executing batch summarization for {len(requests)} texts")
+
+        results: List[SummarizationResult] = await self.summarization_service.summarize_texts(requests)
+
+        failed_count = sum(result.error is not None for result in results)
+        self.logger.info(f"Returning batch summarization results ({failed_count} of {len(results)} failed)")
+
+        return results
@@ -0,0 +1,62 @@
+import time
+from typing import Annotated, Any, AsyncIterator, Dict, List, Optional
+
+from fastapi import Depends
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.models.summarization_priority import SummarizationPriority
+from domain.models.summary_stream_event import SummaryStreamEvent
+from domain.services.summarization_service import SummarizationService
+
+
+class SummarizeTextStreamUseCase:
+    def __init__(
+        self,
+        config: Annotated[AppConfig, Depends()],
+        logger: Annotated[Logger, Depends()],
+        summarization_service: Annotated[SummarizationService, Depends()],
+    ) -> None:
+        self.config = config
+        self.logger = logger
+        self.summarization_service = summarization_service
+
+    async def execute(
+        self,
+        text_to_summarize: str,
+        generation_parameters: Dict[str, Any],
+        model_name: Optional[str] = None,
+        priority: SummarizationPriority = SummarizationPriority.INTERACTIVE,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[SummaryStreamEvent]:
+        self.logger.info("Executing streaming summarization")
+
+        start_time = time.perf_counter()
+        time_to_first_token: Optional[float] = None
+        partial_summaries: List[str] = []
+
+        async for partial_summary in self.summarization_service.summarize_text_stream(
+            text_to_summarize,
+            generation_parameters,
+            model_name,
+            priority,
+            deadline,
+        ):
+            if time_to_first_token is None:
+                time_to_first_token = time.perf_counter() - start_time
+                self.logger.info(f"Time to first token: {time_to_first_token:.3f}s")
+
+            partial_summaries.append(partial_summary)
+
+            yield SummaryStreamEvent(text=partial_summary)
+
+        total_time = time.perf_counter() - start_time
+
+        self.logger.info(f"Returning streaming summarization result after {total_time:.3f}s")
+
+        yield SummaryStreamEvent(
+            text="".join(partial_summaries),
+            is_final=True,
+            time_to_first_token=time_to_first_token,
+            total_time=total_time,
+        )
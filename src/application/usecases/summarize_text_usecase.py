@@ -1,9 +1,11 @@
-from typing import Annotated, Any, Dict
+from typing import Annotated, Any, Dict, Optional
 
 from fastapi import Depends
 
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
+from domain.models.chunking_options import ChunkingOptions
+from domain.models.summarization_priority import SummarizationPriority
 from domain.services.summarization_service import SummarizationService
 
 
@@ -22,12 +24,22 @@ class SummarizeTextUseCase:
         self,
         text_to_summarize: str,
         generation_parameters: Dict[str, Any],
+        chunking_options: Optional[ChunkingOptions] = None,
+        bypass_cache: bool = False,
+        model_name: Optional[str] = None,
+        priority: SummarizationPriority = SummarizationPriority.INTERACTIVE,
+        deadline: Optional[float] = None,
     ) -> str:
-        self.logger.info(f"Executing summarization for text '{text_to_summarize}'")
+        self.logger.info(f"Executing summarization for text of {len(text_to_summarize)} characters")
 
-        summary: str = self.summarization_service.summarize_text(
+        summary: str = await self.summarization_service.summarize_text(
             text_to_summarize,
             generation_parameters,
+            chunking_options,
+            bypass_cache,
+            model_name,
+            priority,
+            deadline,
         )
 
         self.logger.info("Returning summarization result")
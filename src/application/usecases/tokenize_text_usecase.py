@@ -0,0 +1,39 @@
+from typing import Annotated, Optional
+
+from fastapi import Depends
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.models.chunking_options import ChunkingOptions
+from domain.models.tokenization_result import TokenizationResult
+from domain.services.summarization_service import SummarizationService
+
+
+class TokenizeTextUseCase:
+    def __init__(
+        self,
+        config: Annotated[AppConfig, Depends()],
+        logger: Annotated[Logger, Depends()],
+        summarization_service: Annotated[SummarizationService, Depends()],
+    ) -> None:
+        self.config = config
+        self.logger = logger
+        self.summarization_service = summarization_service
+
+    async def execute(
+        self,
+        text_to_summarize: str,
+        chunking_options: Optional[ChunkingOptions] = None,
+        model_name: Optional[str] = None,
+    ) -> TokenizationResult:
+        self.logger.info(f"Executing tokenization for text of {len(text_to_summarize)} characters")
+
+        result: TokenizationResult = await self.summarization_service.tokenize_text(
+            text_to_summarize,
+            chunking_options,
+            model_name,
+        )
+
+        self.logger.info("Returning tokenization result")
+
+        return result
@@ -0,0 +1,81 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from domain.models.cache_status import CacheStatus
+
+
+class LruCache:
+    def __init__(
+        self,
+        max_size_bytes: int,
+        ttl: float,
+    ) -> None:
+        self.max_size_bytes = max_size_bytes
+        self.ttl = ttl
+        # Entries are kept in access order, least recently used first.
+        self._entries: OrderedDict[str, Tuple[str, float, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._lock = threading.Lock()
+
+    def _remove(self, key: str) -> None:
+        _, _, size_bytes = self._entries.pop(key)
+        self._size_bytes -= size_bytes
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            value, expires_at, _ = entry
+
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        size_bytes = sys.getsizeof(key) + sys.getsizeof(value)
+
+        if size_bytes > self.max_size_bytes:
+            return
+
+        expires_at = time.monotonic() + self.ttl if self.ttl > 0 else float("inf")
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            while self._entries and self._size_bytes + size_bytes > self.max_size_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+            self._entries[key] = (value, expires_at, size_bytes)
+            self._size_bytes += size_bytes
+
+    def get_status(self) -> CacheStatus:
+        # Each counter is read atomically, so reporting the status never waits for the lock of cache lookups.
+        return CacheStatus(
+            entries=len(self._entries),
+            size_bytes=self._size_bytes,
+            max_size_bytes=self.max_size_bytes,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+        )
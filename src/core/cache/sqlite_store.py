@@ -0,0 +1,209 @@
+import queue
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from core.logger.logger import Logger
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+# Value of PRAGMA auto_vacuum for incremental vacuum.
+_AUTO_VACUUM_INCREMENTAL = 2
+
+
+class SqliteStore:
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        # Incremental vacuum only takes effect on a new database if it is set before its first write, and switching to
+        # WAL is a write.
+        connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        # WAL lets readers in every process run concurrently with the single writer.
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+    def _get_connection(self) -> sqlite3.Connection:
+        connection: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+
+        if connection is None:
+            connection = self._connect()
+            self._local.connection = connection
+
+        return connection
+
+    def _get_size_bytes(self) -> int:
+        row = self._get_connection().execute("SELECT COALESCE(SUM(size_bytes), 0) FROM entries").fetchone()
+        size_bytes: int = row[0]
+
+        return size_bytes
+
+    def _apply_writes(self, writes: List[Tuple[str, str, Optional[str], float]]) -> None:
+        connection = self._get_connection()
+        connection.execute("BEGIN IMMEDIATE")
+
+        try:
+            for operation, key, value, timestamp in writes:
+                if operation == "put" and value is not None:
+                    size_bytes = len(key) + len(value.encode("utf-8"))
+                    # A replaced entry no longer counts, or the tracked size would drift up and evict too early.
+                    row = connection.execute("SELECT size_bytes FROM entries WHERE key = ?", (key,)).fetchone()
+
+                    if row is not None:
+                        self._size_bytes -= row[0]
+
+                    connection.execute(
+                        "INSERT OR REPLACE INTO entries (key, value, size_bytes, created_at, accessed_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (key, value, size_bytes, timestamp, timestamp),
+                    )
+                    self._size_bytes += size_bytes
+                else:
+                    connection.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (timestamp, key))
+
+            connection.execute("COMMIT")
+
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+    def _write_entries(self) -> None:
+        while True:
+            write = self._writes.get()
+
+            if write is None:
+                return
+
+            writes = [write]
+
+            while not self._writes.empty() and len(writes) < 256:
+                next_write = self._writes.get()
+
+                if next_write is None:
+                    self._writes.put(None)
+                    break
+
+                writes.append(next_write)
+
+            try:
+                self._apply_writes(writes)
+
+                # Other processes may write to the same file, so the size is re-read before evicting anything.
+                if self._size_bytes > self.max_size_bytes:
+                    self.compact()
+
+            except sqlite3.Error:
+                self.logger.exception("Summary store write failed")
+
+    def __init__(
+        self,
+        path: str,
+        max_size_bytes: int,
+        ttl: float,
+        logger: Logger,
+    ) -> None:
+        self.path = path
+        self.max_size_bytes = max_size_bytes
+        self.ttl = ttl
+        self.logger = logger
+        self._local = threading.local()
+        self._writes: queue.Queue[Optional[Tuple[str, str, Optional[str], float]]] = queue.Queue()
+
+        connection = self._get_connection()
+
+        # Files created without incremental vacuum never shrink, so they are converted once.
+        if connection.execute("PRAGMA auto_vacuum").fetchone()[0] != _AUTO_VACUUM_INCREMENTAL:
+            connection.execute("VACUUM")
+
+        connection.executescript(_SCHEMA)
+
+        self._size_bytes = self._get_size_bytes()
+        self._writer_thread = threading.Thread(target=self._write_entries, name="sqlite-store-writer", daemon=True)
+        self._writer_thread.start()
+
+    def _min_created_at(self) -> float:
+        return time.time() - self.ttl if self.ttl > 0 else 0.0
+
+    def get(self, key: str) -> Optional[str]:
+        row = (
+            self._get_connection()
+            .execute("SELECT value FROM entries WHERE key = ? AND created_at >= ?", (key, self._min_created_at()))
+            .fetchone()
+        )
+
+        if row is None:
+            return None
+
+        self._writes.put(("touch", key, None, time.time()))
+        value: str = row[0]
+
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        # Writes are applied in the background so callers never wait for the database lock.
+        self._writes.put(("put", key, value, time.time()))
+
+    def load_recent(self, max_size_bytes: int) -> List[Tuple[str, str]]:
+        entries: List[Tuple[str, str]] = []
+        loaded_size_bytes = 0
+        cursor = self._get_connection().execute(
+            "SELECT key, value, size_bytes FROM entries WHERE created_at >= ? ORDER BY accessed_at DESC",
+            (self._min_created_at(),),
+        )
+
+        for key, value, size_bytes in cursor:
+            if loaded_size_bytes + size_bytes > max_size_bytes:
+                break
+
+            entries.append((key, value))
+            loaded_size_bytes += size_bytes
+
+        return entries
+
+    def compact(self) -> None:
+        connection = self._get_connection()
+        connection.execute("BEGIN IMMEDIATE")
+
+        try:
+            connection.execute("DELETE FROM entries WHERE created_at < ?", (self._min_created_at(),))
+            self._size_bytes = self._get_size_bytes()
+            evicted_keys: List[Tuple[str]] = []
+
+            if self._size_bytes > self.max_size_bytes:
+                # Shrink below the bound so compaction does not run again on every following write.
+                target_size_bytes = int(self.max_size_bytes * 0.9)
+                cursor = connection.execute("SELECT key, size_bytes FROM entries ORDER BY accessed_at")
+
+                for key, size_bytes in cursor:
+                    if self._size_bytes <= target_size_bytes:
+                        break
+
+                    evicted_keys.append((key,))
+                    self._size_bytes -= size_bytes
+
+                cursor.close()
+
+            connection.executemany("DELETE FROM entries WHERE key = ?", evicted_keys)
+            connection.execute("COMMIT")
+
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+        # Each step of the pragma frees a single page, and only executescript steps it to completion.
+        connection.executescript("PRAGMA incremental_vacuum")
+        self.logger.debug(f"Summary store compacted to {self._size_bytes} bytes ({len(evicted_keys)} evicted)")
+
+    def close(self) -> None:
+        self._writes.put(None)
+        self._writer_thread.join()
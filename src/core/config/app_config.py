@@ -1,5 +1,5 @@
 import os
-from typing import Optional
+from typing import List, Optional
 
 from dotenv import load_dotenv
 
@@ -10,12 +10,36 @@ class AppConfig:
     _instance: Optional["AppConfig"] = None
 
     log_level: Optional[str]
+    log_format: Optional[str]
+    log_max_message_length: Optional[int]
     device: Optional[str]
     fastapi_host: Optional[str]
     fastapi_port: Optional[int]
     summarization_model_name: Optional[str]
+    summarization_models: Optional[List[str]]
     summarization_model_download_path: Optional[str]
+    summarization_model_snapshot: Optional[bool]
+    summarization_shared_weights: Optional[bool]
     model_idle_timeout: Optional[int]
+    model_preload: Optional[bool]
+    model_warmup_token_lengths: Optional[List[int]]
+    model_quantization: Optional[str]
+    model_memory_budget_mb: Optional[int]
+    summarization_batch_max_size: Optional[int]
+    summarization_batch_max_wait_ms: Optional[int]
+    summarization_worker_pool_size: Optional[int]
+    summarization_worker_threads: Optional[int]
+    summarization_worker_cpu_affinity: Optional[bool]
+    summarization_shared_memory_size_mb: Optional[int]
+    summarization_shared_memory_threshold_kb: Optional[int]
+    summarization_queue_max_size: Optional[int]
+    summarization_queue_max_wait: Optional[int]
+    summarization_bulk_max_wait: Optional[int]
+    summary_cache_max_size_mb: Optional[int]
+    summary_cache_ttl: Optional[int]
+    summary_cache_include_sampling: Optional[bool]
+    summary_store_path: Optional[str]
+    summary_store_max_size_mb: Optional[int]
 
     def __new__(cls) -> "AppConfig":
         if cls._instance is None:
@@ -25,14 +49,54 @@ class AppConfig:
 
     def _load_env_variables(self) -> None:
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
+        self.log_format = os.getenv("LOG_FORMAT", "text").lower()
+        self.log_max_message_length = int(os.getenv("LOG_MAX_MESSAGE_LENGTH", "4096"))
         self.device = os.getenv("DEVICE", "cpu")
         self.fastapi_host = os.getenv("FASTAPI_HOST", "127.0.0.1")
         self.model_idle_timeout = int(os.getenv("MODEL_IDLE_TIMEOUT", "60"))
+        self.model_preload = os.getenv("MODEL_PRELOAD", "false").lower() == "true"
+        self.model_warmup_token_lengths = [
+            int(length)
+            for length in os.getenv("MODEL_WARMUP_TOKEN_LENGTHS", "64,512,1024").split(",")
+            if length.strip()
+        ]
+        self.model_quantization = os.getenv("MODEL_QUANTIZATION", "").lower()
+        self.model_memory_budget_mb = int(os.getenv("MODEL_MEMORY_BUDGET_MB", "0"))
         self.summarization_model_name = os.getenv("SUMMARIZATION_MODEL_NAME", "facebook/bart-large-cnn")
+        # The default model is always available; the others can be selected per request.
+        self.summarization_models = list(
+            dict.fromkeys(
+                [
+                    self.summarization_model_name,
+                    *(name.strip() for name in os.getenv("SUMMARIZATION_MODELS", "").split(",") if name.strip()),
+                ],
+            ),
+        )
         self.summarization_model_download_path = os.getenv(
             "SUMMARIZATION_MODEL_DOWNLOAD_PATH",
             "downloaded_summarization_models",
         )
+        self.summarization_model_snapshot = os.getenv("SUMMARIZATION_MODEL_SNAPSHOT", "true").lower() == "true"
+        self.summarization_shared_weights = os.getenv("SUMMARIZATION_SHARED_WEIGHTS", "true").lower() == "true"
+        self.summarization_batch_max_size = int(os.getenv("SUMMARIZATION_BATCH_MAX_SIZE", "8"))
+        self.summarization_batch_max_wait_ms = int(os.getenv("SUMMARIZATION_BATCH_MAX_WAIT_MS", "10"))
+        self.summarization_worker_pool_size = int(os.getenv("SUMMARIZATION_WORKER_POOL_SIZE", "1"))
+        self.summarization_worker_threads = int(os.getenv("SUMMARIZATION_WORKER_THREADS", "0"))
+        self.summarization_worker_cpu_affinity = (
+            os.getenv("SUMMARIZATION_WORKER_CPU_AFFINITY", "false").lower() == "true"
+        )
+        self.summarization_shared_memory_size_mb = int(os.getenv("SUMMARIZATION_SHARED_MEMORY_SIZE_MB", "0"))
+        self.summarization_shared_memory_threshold_kb = int(
+            os.getenv("SUMMARIZATION_SHARED_MEMORY_THRESHOLD_KB", "64"),
+        )
+        self.summarization_queue_max_size = int(os.getenv("SUMMARIZATION_QUEUE_MAX_SIZE", "64"))
+        self.summarization_queue_max_wait = int(os.getenv("SUMMARIZATION_QUEUE_MAX_WAIT", "30"))
+        self.summarization_bulk_max_wait = int(os.getenv("SUMMARIZATION_BULK_MAX_WAIT", "10"))
+        self.summary_cache_max_size_mb = int(os.getenv("SUMMARY_CACHE_MAX_SIZE_MB", "64"))
+        self.summary_cache_ttl = int(os.getenv("SUMMARY_CACHE_TTL", "3600"))
+        self.summary_cache_include_sampling = os.getenv("SUMMARY_CACHE_INCLUDE_SAMPLING", "false").lower() == "true"
+        self.summary_store_path = os.getenv("SUMMARY_STORE_PATH", "")
+        self.summary_store_max_size_mb = int(os.getenv("SUMMARY_STORE_MAX_SIZE_MB", "512"))
         try:
             self.fastapi_port = int(os.getenv("FASTAPI_PORT", "8000"))
         except ValueError:
@@ -48,12 +112,36 @@ class AppConfig:
         config_message = (
             f"Configuration loaded:\n"
             f"LOG_LEVEL: {self.log_level}\n"
+            f"LOG_FORMAT: {self.log_format}\n"
+            f"LOG_MAX_MESSAGE_LENGTH: {self.log_max_message_length}\n"
             f"DEVICE: {self.device}\n"
             f"FASTAPI_HOST: {self.fastapi_host}\n"
             f"FASTAPI_PORT: {self.fastapi_port}\n"
             f"SUMMARIZATION_MODEL_NAME: {self.summarization_model_name}\n"
+            f"SUMMARIZATION_MODELS: {self.summarization_models}\n"
             f"SUMMARIZATION_MODEL_DOWNLOAD_PATH: {self.summarization_model_download_path}\n"
-            f"MODEL_IDLE_TIMEOUT: {self.model_idle_timeout}"
+            f"SUMMARIZATION_MODEL_SNAPSHOT: {self.summarization_model_snapshot}\n"
+            f"SUMMARIZATION_SHARED_WEIGHTS: {self.summarization_shared_weights}\n"
+            f"MODEL_IDLE_TIMEOUT: {self.model_idle_timeout}\n"
+            f"MODEL_PRELOAD: {self.model_preload}\n"
+            f"MODEL_WARMUP_TOKEN_LENGTHS: {self.model_warmup_token_lengths}\n"
+            f"MODEL_QUANTIZATION: {self.model_quantization}\n"
+            f"MODEL_MEMORY_BUDGET_MB: {self.model_memory_budget_mb}\n"
+            f"SUMMARIZATION_BATCH_MAX_SIZE: {self.summarization_batch_max_size}\n"
+            f"SUMMARIZATION_BATCH_MAX_WAIT_MS: {self.summarization_batch_max_wait_ms}\n"
+            f"SUMMARIZATION_WORKER_POOL_SIZE: {self.summarization_worker_pool_size}\n"
+            f"SUMMARIZATION_WORKER_THREADS: {self.summarization_worker_threads}\n"
+            f"SUMMARIZATION_WORKER_CPU_AFFINITY: {self.summarization_worker_cpu_affinity}\n"
+            f"SUMMARIZATION_SHARED_MEMORY_SIZE_MB: {self.summarization_shared_memory_size_mb}\n"
+            f"SUMMARIZATION_SHARED_MEMORY_THRESHOLD_KB: {self.summarization_shared_memory_threshold_kb}\n"
+            f"SUMMARIZATION_QUEUE_MAX_SIZE: {self.summarization_queue_max_size}\n"
+            f"SUMMARIZATION_QUEUE_MAX_WAIT: {self.summarization_queue_max_wait}\n"
+            f"SUMMARIZATION_BULK_MAX_WAIT: {self.summarization_bulk_max_wait}\n"
+            f"SUMMARY_CACHE_MAX_SIZE_MB: {self.summary_cache_max_size_mb}\n"
+            f"SUMMARY_CACHE_TTL: {self.summary_cache_ttl}\n"
+            f"SUMMARY_CACHE_INCLUDE_SAMPLING: {self.summary_cache_include_sampling}\n"
+            f"SUMMARY_STORE_PATH: {self.summary_store_path}\n"
+            f"SUMMARY_STORE_MAX_SIZE_MB: {self.summary_store_max_size_mb}"
         )
         logger.info(config_message)
         logger.info("Configuration initialized successfully.")
@@ -0,0 +1,16 @@
+import copy
+import logging
+import logging.handlers
+
+
+class ExceptionQueueHandler(logging.handlers.QueueHandler):
+    # The stock handler formats the traceback into the message on the calling thread and drops exc_info, so the
+    # formatter of the listener, such as the JSON one, never sees the exception of a record.
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        # Merged on the calling thread, as the arguments may change once the caller goes on; the traceback is formatted
+        # on the listener thread, where the exception stays alive with the record.
+        record.msg = record.getMessage()
+        record.args = None
+
+        return record
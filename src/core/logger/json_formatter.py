@@ -0,0 +1,23 @@
+import json
+import logging
+from typing import Any, Dict
+
+
+class JsonFormatter(logging.Formatter):
+    # One JSON object per line, so log collectors can index the fields without parsing the message.
+    def format(self, record: logging.LogRecord) -> str:
+        fields: Dict[str, Any] = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "process": record.process,
+            "message": record.getMessage(),
+        }
+
+        if record.exc_info:
+            fields["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(fields, ensure_ascii=False)
@@ -1,6 +1,25 @@
-import inspect
+import atexit
 import logging
-from typing import Optional
+import logging.handlers
+import os
+import queue
+from typing import Any, Optional, Tuple
+
+from core.logger.exception_queue_handler import ExceptionQueueHandler
+from core.logger.json_formatter import JsonFormatter
+from domain.exceptions.unsupported_log_format_error import UnsupportedLogFormatError
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(module)s.%(funcName)s - %(message)s"
+DEFAULT_MAX_MESSAGE_LENGTH = 4096
+
+
+def _restore_logger(log_level: int, log_format: str, max_message_length: int) -> "Logger":
+    logger = Logger()
+    logger.logger.setLevel(log_level)
+    logger.set_format(log_format)
+    logger.set_max_message_length(max_message_length)
+
+    return logger
 
 
 class Logger:
@@ -28,20 +47,41 @@ class Logger:
             uvicorn_logger.addHandler(handler)
             uvicorn_access_logger.addHandler(handler)
 
+    def _start_listener(self) -> None:
+        # Callers only enqueue records; formatting and writing them happens on the listener thread.
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        self._listener: Optional[logging.handlers.QueueListener] = logging.handlers.QueueListener(
+            log_queue,
+            self._output_handler,
+            respect_handler_level=True,
+        )
+        self._listener.start()
+        self.logger.handlers = [ExceptionQueueHandler(log_queue)]
+        self._configure_uvicorn_loggers()
+
     def _initialize(self) -> None:
         self.logger = logging.getLogger("summarization-api")
         self.logger.setLevel(logging.INFO)
-        handler = logging.StreamHandler()
-        handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
-        self.logger.addHandler(handler)
-        self._configure_uvicorn_loggers()
-
-    def _log(self, level: int, message: str) -> None:
-        caller = inspect.stack()[2]
-        module = inspect.getmodule(caller[0])
-        module_name = module.__name__ if module else "unknown_module"
-        log_message = f"{module_name}.{caller.function} - {message}"
-        self.logger.log(level, log_message)
+        self.log_format = "text"
+        self.max_message_length = DEFAULT_MAX_MESSAGE_LENGTH
+        self._output_handler = logging.StreamHandler()
+        self._output_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+        self._start_listener()
+        # A forked worker process inherits the queue but not the thread that drains it, so it starts its own.
+        os.register_at_fork(after_in_child=self._start_listener)
+        atexit.register(self.shutdown)
+
+    def _log(self, level: int, message: str, **kwargs: Any) -> None:
+        # Checked before anything else, so disabled records cost neither truncation nor a caller lookup.
+        if not self.logger.isEnabledFor(level):
+            return
+
+        if 0 < self.max_message_length < len(message):
+            end = self.max_message_length
+            message = f"{message[:end]}... ({len(message) - end} characters truncated)"
+
+        # The caller is found by skipping this method and the level method, without inspecting the whole stack.
+        self.logger.log(level, message, stacklevel=3, **kwargs)
 
     def info(self, message: str) -> None:
         self._log(logging.INFO, message)
@@ -49,6 +89,10 @@ class Logger:
     def error(self, message: str) -> None:
         self._log(logging.ERROR, message)
 
+    def exception(self, message: str) -> None:
+        # Called from an except block; the traceback of the exception being handled is logged with the message.
+        self._log(logging.ERROR, message, exc_info=True)
+
     def debug(self, message: str) -> None:
         self._log(logging.DEBUG, message)
 
@@ -59,6 +103,7 @@ class Logger:
         self.info(f"Setting log level to {log_level}")
 
         self.logger.setLevel(log_level)
+        self._output_handler.setLevel(log_level)
 
         for handler in self.logger.handlers:
             handler.setLevel(log_level)
@@ -66,3 +111,28 @@ class Logger:
         self._configure_uvicorn_loggers()
 
         self.info("Log level set successfully.")
+
+    def set_format(self, log_format: str) -> None:
+        if log_format not in ("text", "json"):
+            raise UnsupportedLogFormatError(log_format)
+
+        self.log_format = log_format
+        self._output_handler.setFormatter(JsonFormatter() if log_format == "json" else logging.Formatter(TEXT_FORMAT))
+
+    def set_max_message_length(self, max_message_length: int) -> None:
+        self.max_message_length = max_message_length
+
+    def shutdown(self) -> None:
+        # Writes the records still queued; records logged afterwards are written directly.
+        if self._listener is None:
+            return
+
+        self._listener.stop()
+        self._listener = None
+        self.logger.handlers = [self._output_handler]
+        self._configure_uvicorn_loggers()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Spawned worker processes build their own logger with the same settings instead of unpickling the queue and
+        # listener thread of this one.
+        return (_restore_logger, (self.logger.level, self.log_format, self.max_message_length))
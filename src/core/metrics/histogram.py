@@ -0,0 +1,51 @@
+import bisect
+import itertools
+from typing import Sequence
+
+from domain.models.histogram_snapshot import HistogramSnapshot
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+TOKEN_COUNT_BUCKETS = (8, 16, 32, 64, 128, 256, 512, 1024, 2048)
+TOKEN_RATE_BUCKETS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+class Histogram:
+    # Observations of one histogram never run concurrently: each is recorded by a single thread or under a lock its
+    # caller already holds. Snapshots take no lock, so reading metrics never delays a request.
+    def __init__(
+        self,
+        bucket_bounds: Sequence[float],
+    ) -> None:
+        self.bucket_bounds = list(bucket_bounds)
+        # Counts per bucket, not cumulative, so an observation updates a single slot.
+        self._bucket_counts = [0] * (len(self.bucket_bounds) + 1)
+        self.sum = 0.0
+
+    @property
+    def count(self) -> int:
+        return sum(self._bucket_counts)
+
+    def observe(self, value: float) -> None:
+        self._bucket_counts[bisect.bisect_left(self.bucket_bounds, value)] += 1
+        self.sum += value
+
+    @staticmethod
+    def merge(bucket_bounds: Sequence[float], histograms: Sequence["Histogram"]) -> HistogramSnapshot:
+        bucket_counts = [0] * (len(bucket_bounds) + 1)
+        total = 0.0
+
+        for histogram in histograms:
+            # Copying the list is a single operation, so the counts are never torn by a concurrent observation.
+            for index, bucket_count in enumerate(list(histogram._bucket_counts)):
+                bucket_counts[index] += bucket_count
+
+            total += histogram.sum
+
+        return HistogramSnapshot(
+            bucket_bounds=list(bucket_bounds),
+            bucket_counts=list(itertools.accumulate(bucket_counts)),
+            sum=total,
+        )
+
+    def snapshot(self) -> HistogramSnapshot:
+        return Histogram.merge(self.bucket_bounds, [self])
@@ -0,0 +1,72 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from domain.models.histogram_snapshot import HistogramSnapshot
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Dict[str, str]
+
+
+@dataclass
+class _MetricFamily:
+    metric_type: str
+    description: str
+    samples: List[str] = field(default_factory=list)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_sample(name: str, labels: Labels, value: float) -> str:
+    formatted_labels = ",".join(f'{label}="{_escape_label_value(value)}"' for label, value in labels.items())
+    formatted_value = "+Inf" if value == float("inf") else repr(value) if isinstance(value, float) else str(int(value))
+
+    return f"{name}{{{formatted_labels}}} {formatted_value}" if labels else f"{name} {formatted_value}"
+
+
+class PrometheusTextWriter:
+    def __init__(self) -> None:
+        # The format requires the samples of a family to be contiguous, so they are grouped until rendered.
+        self._families: Dict[str, _MetricFamily] = {}
+
+    def _get_family(self, name: str, metric_type: str, description: str) -> _MetricFamily:
+        return self._families.setdefault(name, _MetricFamily(metric_type, description))
+
+    def add_gauge(self, name: str, description: str, value: Optional[float], labels: Optional[Labels] = None) -> None:
+        family = self._get_family(name, "gauge", description)
+
+        # Unknown values, such as the memory of a stopped worker, are left out rather than reported as zero.
+        if value is not None:
+            family.samples.append(_format_sample(name, labels or {}, value))
+
+    def add_counter(self, name: str, description: str, value: float, labels: Optional[Labels] = None) -> None:
+        self._get_family(name, "counter", description).samples.append(_format_sample(name, labels or {}, value))
+
+    def add_histogram(
+        self,
+        name: str,
+        description: str,
+        histogram: HistogramSnapshot,
+        labels: Optional[Labels] = None,
+    ) -> None:
+        family = self._get_family(name, "histogram", description)
+        labels = labels or {}
+
+        for bound, bucket_count in zip(histogram.bucket_bounds, histogram.bucket_counts):
+            family.samples.append(_format_sample(f"{name}_bucket", {**labels, "le": repr(float(bound))}, bucket_count))
+
+        family.samples.append(_format_sample(f"{name}_bucket", {**labels, "le": "+Inf"}, histogram.bucket_counts[-1]))
+        family.samples.append(_format_sample(f"{name}_sum", labels, histogram.sum))
+        family.samples.append(_format_sample(f"{name}_count", labels, histogram.bucket_counts[-1]))
+
+    def render(self) -> str:
+        lines: List[str] = []
+
+        for name, family in self._families.items():
+            lines.append(f"# HELP {name} {family.description}")
+            lines.append(f"# TYPE {name} {family.metric_type}")
+            lines.extend(family.samples)
+
+        return "\n".join(lines) + "\n"
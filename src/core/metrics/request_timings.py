@@ -0,0 +1,59 @@
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+
+class RequestTimings:
+    # Texts of a request may record the same stage concurrently, from the event loop or from the reply dispatcher
+    # threads of several workers, so each stage keeps the time of the slowest text rather than a sum of overlaps.
+    def __init__(
+        self,
+        start_time: float,
+    ) -> None:
+        self.start_time = start_time
+        self.durations: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            if seconds > self.durations.get(stage, -1.0):
+                self.durations[stage] = seconds
+
+    def record_since_start(self, stage: str) -> None:
+        self.record(stage, time.perf_counter() - self.start_time)
+
+    def merge(self, other: "RequestTimings") -> None:
+        with other._lock:
+            durations = list(other.durations.items())
+
+        for stage, seconds in durations:
+            self.record(stage, seconds)
+
+    def format_server_timing(self, total_seconds: float) -> str:
+        with self._lock:
+            durations = list(self.durations.items())
+
+        metrics = [f"{stage};dur={seconds * 1000:.3f}" for stage, seconds in durations]
+        metrics.append(f"total;dur={total_seconds * 1000:.3f}")
+
+        return ", ".join(metrics)
+
+
+# Set by the server timing middleware for the duration of each HTTP request; tasks and threads started for the request
+# copy the context, so they record into the same timings.
+current_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar("current_request_timings", default=None)
+
+
+def record_request_stage(stage: str, seconds: float) -> None:
+    request_timings = current_request_timings.get()
+
+    if request_timings is not None:
+        request_timings.record(stage, seconds)
+
+
+def record_request_stage_since_start(stage: str) -> None:
+    request_timings = current_request_timings.get()
+
+    if request_timings is not None:
+        request_timings.record_since_start(stage)
@@ -1,16 +1,20 @@
-from typing import Annotated
+import os
+from typing import Annotated, List, Optional, Tuple
 
 from fastapi import Depends
 
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
-from data.workers.bart_large_cnn_summarization_worker import (
-    BartLargeCnnSummarizationConfig,
-    BartLargeCnnSummarizationWorker,
+from data.workers.seq2seq_summarization_worker import (
+    Seq2SeqSummarizationConfig,
+    Seq2SeqSummarizationWorker,
 )
 from domain.exceptions.unsupported_model_configuration_error import (
     UnsupportedModelConfigurationError,
 )
+from domain.exceptions.unsupported_quantization_error import (
+    UnsupportedQuantizationError,
+)
 
 
 class SummarizationWorkerFactory:
@@ -22,16 +26,69 @@ class SummarizationWorkerFactory:
         self.config = config
         self.logger = logger
 
-    def create(self) -> BartLargeCnnSummarizationWorker:
-        if self.config.summarization_model_name == "facebook/bart-large-cnn":
-            return BartLargeCnnSummarizationWorker(
-                BartLargeCnnSummarizationConfig(
+    def _get_available_cpu_cores(self) -> List[int]:
+        # The affinity mask honours container CPU sets, while the CPU count includes every core of the host.
+        if hasattr(os, "sched_getaffinity"):
+            return sorted(os.sched_getaffinity(0))
+
+        return list(range(os.cpu_count() or 1))
+
+    def _get_cpu_topology(self, index: int) -> Tuple[int, List[int]]:
+        available_cpu_cores = self._get_available_cpu_cores()
+        num_threads = self.config.summarization_worker_threads or max(
+            len(available_cpu_cores) // self.config.summarization_worker_pool_size,
+            1,
+        )
+
+        if not self.config.summarization_worker_cpu_affinity:
+            return num_threads, []
+
+        # Each worker gets the next disjoint slice of cores; once they run out, slices wrap around and are shared.
+        start = index * num_threads
+        cpu_cores = [
+            available_cpu_cores[(start + offset) % len(available_cpu_cores)]
+            for offset in range(min(num_threads, len(available_cpu_cores)))
+        ]
+
+        return num_threads, cpu_cores
+
+    def create(self, index: int = 0, model_name: Optional[str] = None) -> Seq2SeqSummarizationWorker:
+        model_name = model_name or self.config.summarization_model_name
+
+        # Dynamic quantization only has CPU kernels.
+        if self.config.model_quantization not in ("", "int8-dynamic") or (
+            self.config.model_quantization and self.config.device != "cpu"
+        ):
+            raise UnsupportedQuantizationError(self.config.model_quantization, self.config.device)
+
+        if model_name in self.config.summarization_models:
+            num_threads, cpu_cores = self._get_cpu_topology(index)
+
+            return Seq2SeqSummarizationWorker(
+                Seq2SeqSummarizationConfig(
                     device=self.config.device,
-                    model_name=self.config.summarization_model_name,
+                    model_name=model_name,
                     model_download_path=self.config.summarization_model_download_path,
                     log_level=self.config.log_level,
+                    batch_max_size=self.config.summarization_batch_max_size,
+                    batch_max_wait_ms=self.config.summarization_batch_max_wait_ms,
+                    shared_memory_size_mb=self.config.summarization_shared_memory_size_mb,
+                    shared_memory_threshold_kb=self.config.summarization_shared_memory_threshold_kb,
+                    model_snapshot_path=(
+                        os.path.join(
+                            self.config.summarization_model_download_path,
+                            "snapshots",
+                            model_name.replace("/", "--"),
+                        )
+                        if self.config.summarization_model_snapshot
+                        else ""
+                    ),
+                    shared_weights=self.config.summarization_shared_weights,
+                    quantization=self.config.model_quantization,
+                    num_threads=num_threads,
+                    cpu_cores=cpu_cores,
                 ),
                 logger=self.logger,
             )
         else:
-            raise UnsupportedModelConfigurationError(self.config.summarization_model_name)
+            raise UnsupportedModelConfigurationError(model_name)
@@ -1,18 +1,90 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import hashlib
+import json
+import os
 import threading
 import time
-from typing import Annotated, Any, Dict, Optional
+import unicodedata
+from array import array
+from dataclasses import dataclass, field
+from typing import (
+    Annotated,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from fastapi import Depends
 
+from core.cache.lru_cache import LruCache
+from core.cache.sqlite_store import SqliteStore
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
-from core.timer.timer import TimerFactory
+from core.metrics.request_timings import (
+    RequestTimings,
+    current_request_timings,
+    record_request_stage,
+)
 from data.factories.summarization_worker_factory import SummarizationWorkerFactory
 from data.repositories.directory_repository_impl import DirectoryRepositoryImpl
+from data.repositories.summarization_tokenizer_repository_impl import (
+    SummarizationTokenizerRepositoryImpl,
+)
+from data.workers.summarization_model_registry import SummarizationModelRegistry
+from data.workers.summarization_worker_pool import SummarizationWorkerPool
+from domain.exceptions.deadline_exceeded_error import DeadlineExceededError
+from domain.exceptions.unsupported_model_configuration_error import (
+    UnsupportedModelConfigurationError,
+)
+from domain.models.cache_status import CacheStatus
+from domain.models.model_metrics import ModelMetrics
+from domain.models.model_status import ModelStatus
+from domain.models.summarization_priority import SummarizationPriority
+from domain.models.worker_status import WorkerStatus
 from domain.repositories.directory_repository import DirectoryRepository
 from domain.repositories.summarization_model_repository import (
     SummarizationModelRepository,
 )
+from domain.repositories.summarization_tokenizer_repository import (
+    SummarizationTokenizerRepository,
+)
+
+# News-like prose, so warm-up generations exercise the same code paths and output lengths as real requests.
+_WARMUP_TEXT = (
+    "The city council approved a new budget on Tuesday after months of debate over funding for public transport, "
+    "schools and road repairs. Officials said the plan raises spending by four percent while keeping property taxes "
+    "unchanged, and critics warned that the projected revenue from tourism may prove too optimistic. "
+)
+
+ResultType = TypeVar("ResultType")
+
+
+# Work shared by identical requests, which runs as its own task so that it outlives the request that started it, and
+# is cancelled once none of the requests waiting for it is left. Its stages are recorded into timings of its own,
+# which every request waiting for it copies.
+@dataclass(eq=False)
+class SharedSummarization:
+    priority: SummarizationPriority = SummarizationPriority.INTERACTIVE
+    waiters: int = 0
+    task: Optional["asyncio.Task[Any]"] = None
+    timings: RequestTimings = field(default_factory=lambda: RequestTimings(time.perf_counter()))
+
+
+# A summary in flight for one request key; its future resolves to the summary or to the error of the shared work.
+@dataclass(eq=False)
+class InFlightSummarization:
+    shared: SharedSummarization
+    future: "concurrent.futures.Future[str]" = field(default_factory=concurrent.futures.Future)
 
 
 class SummarizationModelRepositoryImpl(SummarizationModelRepository):  # type: ignore
@@ -23,66 +95,735 @@ class SummarizationModelRepositoryImpl(SummarizationModelRepository):  # type: i
         cls,
         config: Annotated[AppConfig, Depends()],
         directory_repository: Annotated[DirectoryRepository, Depends(DirectoryRepositoryImpl)],
-        timer_factory: Annotated[TimerFactory, Depends()],
         logger: Annotated[Logger, Depends()],
         worker_factory: Annotated[SummarizationWorkerFactory, Depends()],
+        tokenizer_repository: Annotated[
+            SummarizationTokenizerRepository,
+            Depends(SummarizationTokenizerRepositoryImpl),
+        ],
     ) -> "SummarizationModelRepositoryImpl":
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
                     cls._instance = super(SummarizationModelRepositoryImpl, cls).__new__(cls)
-                    cls._instance._initialize(config, directory_repository, timer_factory, logger, worker_factory)
+                    cls._instance._initialize(
+                        config,
+                        directory_repository,
+                        logger,
+                        worker_factory,
+                        tokenizer_repository,
+                    )
 
         return cls._instance
 
+    def _warm_load_summary_cache(self) -> None:
+        if self.summary_cache is None or self.summary_store is None:
+            return
+
+        entries = self.summary_store.load_recent(self.summary_cache.max_size_bytes)
+
+        # Least recently used first, so the most recent summaries end up at the hot end of the cache.
+        for cache_key, summary in reversed(entries):
+            self.summary_cache.put(cache_key, summary)
+
+        self.logger.info(f"Warm-loaded {len(entries)} summaries from the summary store")
+
     def _initialize(
         self,
         config: AppConfig,
         directory_repository: DirectoryRepository,
-        timer_factory: TimerFactory,
         logger: Logger,
         worker_factory: SummarizationWorkerFactory,
+        tokenizer_repository: SummarizationTokenizerRepository,
     ) -> None:
         directory_repository.create_directory(config.summarization_model_download_path)
         self.config = config
-        self.timer = timer_factory.create()
         self.logger = logger
-        self.worker = worker_factory.create()
+        self.tokenizer_repository = tokenizer_repository
+        self.model_registry = SummarizationModelRegistry(
+            pools={
+                model_name: SummarizationWorkerPool(
+                    workers=[
+                        worker_factory.create(index, model_name)
+                        for index in range(config.summarization_worker_pool_size)
+                    ],
+                    idle_timeout=config.model_idle_timeout,
+                    logger=logger,
+                    # Only the default model is preloaded; the others load on demand and may be unloaded again.
+                    keep_alive=config.model_preload and model_name == config.summarization_model_name,
+                    max_queue_size=config.summarization_queue_max_size,
+                    max_queue_wait=config.summarization_queue_max_wait,
+                    # One batch per worker keeps it busy; the rest waits in the pool, where it can be prioritized.
+                    worker_capacity=config.summarization_batch_max_size,
+                    bulk_max_wait=config.summarization_bulk_max_wait,
+                )
+                for model_name in config.summarization_models or [config.summarization_model_name]
+            },
+            default_model_name=config.summarization_model_name,
+            memory_budget_bytes=config.model_memory_budget_mb * 1024 * 1024,
+            model_download_path=config.summarization_model_download_path,
+            logger=logger,
+        )
+        self.summary_cache: Optional[LruCache] = (
+            LruCache(max_size_bytes=config.summary_cache_max_size_mb * 1024 * 1024, ttl=config.summary_cache_ttl)
+            if config.summary_cache_max_size_mb > 0
+            else None
+        )
+        self.summary_store: Optional[SqliteStore] = None
+
+        if config.summary_store_path:
+            directory_repository.create_directory(config.summary_store_path)
+            self.summary_store = SqliteStore(
+                path=os.path.join(config.summary_store_path, "summaries.sqlite3"),
+                max_size_bytes=config.summary_store_max_size_mb * 1024 * 1024,
+                ttl=config.summary_cache_ttl,
+                logger=logger,
+            )
+            self._warm_load_summary_cache()
+
+        self._in_flight: Dict[str, InFlightSummarization] = {}
+        self._in_flight_lock = threading.Lock()
+        self.coalesced_requests = 0
         self.last_access_time = 0.0
+        # Without preloading, workers start on demand and the service is ready right away.
+        self._is_ready = not config.model_preload
 
-    def _check_idle_timeout(self) -> None:
-        self.logger.debug("Checking summarization model idle timeout")
+    def is_ready(self) -> bool:
+        return self._is_ready
 
-        if self.worker.is_alive() and not self.worker.is_processing():
-            with self._lock:
-                self.worker.stop()
-                self.timer.cancel()
-                self.logger.info("Summarization model stopped due to idle timeout")
+    def _create_warmup_inputs(self) -> List["array[int]"]:
+        max_input_tokens = self.tokenizer_repository.get_max_input_tokens()
+        token_ids = self.tokenizer_repository.tokenize(_WARMUP_TEXT * max_input_tokens)
+        warmup_inputs: List[array[int]] = []
 
-    def summarize(
+        # A generation is the only way to know that a worker has loaded the model, so at least one always runs.
+        for token_count in self.config.model_warmup_token_lengths or [16]:
+            end = min(max(token_count, 2), len(token_ids)) - 1
+            # The truncated ids keep their end-of-sequence token, as a real input of that length would.
+            warmup_inputs.append(token_ids[:end] + token_ids[-1:])
+
+        return warmup_inputs
+
+    async def preload_async(self) -> None:
+        self.logger.info("Preloading summarization workers")
+        start_time = time.perf_counter()
+        warmup_inputs = await asyncio.to_thread(self._create_warmup_inputs)
+        worker_pool = await asyncio.to_thread(self.model_registry.get_pool)
+        await worker_pool.warm_up_async(warmup_inputs, {})
+        self._is_ready = True
+
+        self.logger.info(f"Summarization workers preloaded and ready in {time.perf_counter() - start_time:.2f}s")
+
+    async def stop_async(self) -> None:
+        self.logger.info("Stopping summarization workers")
+        # Stopping joins every worker process and the store writer thread, so it runs off the event loop.
+        await asyncio.to_thread(self.model_registry.stop)
+
+        if self.summary_store is not None:
+            await asyncio.to_thread(self.summary_store.close)
+
+        self.logger.info("Summarization workers stopped")
+
+    async def get_statuses_async(self) -> Tuple[List[WorkerStatus], List[ModelStatus]]:
+        # Reading the memory of the workers parses a file per process, so it is kept off the event loop.
+        statuses: Tuple[List[WorkerStatus], List[ModelStatus]] = await asyncio.to_thread(
+            self.model_registry.get_statuses
+        )
+
+        return statuses
+
+    def get_models_metrics(self) -> List[ModelMetrics]:
+        models_metrics: List[ModelMetrics] = self.model_registry.get_model_metrics()
+
+        return models_metrics
+
+    def get_cache_status(self) -> Optional[CacheStatus]:
+        return self.summary_cache.get_status() if self.summary_cache else None
+
+    def get_coalesced_requests_count(self) -> int:
+        return self.coalesced_requests
+
+    def _get_request_key(
         self,
         text_to_summarize: str,
         generation_parameters: Dict[str, Any],
-    ) -> str:
-        with self._lock:
-            if not self.worker.is_alive():
-                self.logger.info("Starting summarization worker")
-                self.worker.start()
+        model_name: Optional[str] = None,
+    ) -> Optional[str]:
+        if generation_parameters.get("do_sample") and not self.config.summary_cache_include_sampling:
+            return None
+
+        # Copies of the same article often differ only in Unicode composition and whitespace.
+        normalized_text = " ".join(unicodedata.normalize("NFC", text_to_summarize).split())
+        key_source = json.dumps(
+            {
+                "model_name": model_name or self.config.summarization_model_name,
+                "text": normalized_text,
+                "generation_parameters": generation_parameters,
+            },
+            sort_keys=True,
+            default=str,
+        )
+
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    def _get_cache_key(
+        self,
+        request_key: Optional[str],
+    ) -> Optional[str]:
+        return request_key if self.summary_cache is not None or self.summary_store is not None else None
+
+    def _get_memory_cached_summary(
+        self,
+        cache_key: Optional[str],
+        bypass_cache: bool,
+    ) -> Optional[str]:
+        if cache_key is None or bypass_cache or self.summary_cache is None:
+            return None
+
+        summary: Optional[str] = self.summary_cache.get(cache_key)
+
+        if summary is not None:
+            self.logger.debug("Summary served from cache")
+
+        return summary
+
+    def _get_stored_summaries(
+        self,
+        cache_keys: List[Optional[str]],
+    ) -> List[Optional[str]]:
+        # Queries the SQLite store, which may read from disk, so async callers run it in a thread.
+        summaries: List[Optional[str]] = []
+
+        for cache_key in cache_keys:
+            summary = self.summary_store.get(cache_key) if self.summary_store and cache_key is not None else None
+
+            if summary is not None and cache_key is not None:
+                self.logger.debug("Summary served from summary store")
+
+                if self.summary_cache is not None:
+                    self.summary_cache.put(cache_key, summary)
+
+            summaries.append(summary)
+
+        return summaries
+
+    def _needs_store_lookup(
+        self,
+        cache_key: Optional[str],
+        bypass_cache: bool,
+    ) -> bool:
+        return cache_key is not None and not bypass_cache and self.summary_store is not None
+
+    def _get_cached_summary(
+        self,
+        cache_key: Optional[str],
+        bypass_cache: bool,
+    ) -> Optional[str]:
+        summary = self._get_memory_cached_summary(cache_key, bypass_cache)
+
+        if summary is None and self._needs_store_lookup(cache_key, bypass_cache):
+            (summary,) = self._get_stored_summaries([cache_key])
+
+        return summary
+
+    async def _get_cached_summary_async(
+        self,
+        cache_key: Optional[str],
+        bypass_cache: bool,
+    ) -> Optional[str]:
+        # The in-memory cache is looked up inline, as a hit must not pay for a thread switch.
+        summary = self._get_memory_cached_summary(cache_key, bypass_cache)
+
+        if summary is None and self._needs_store_lookup(cache_key, bypass_cache):
+            (summary,) = await asyncio.to_thread(self._get_stored_summaries, [cache_key])
+
+        return summary
+
+    def _cache_summary(
+        self,
+        cache_key: Optional[str],
+        summary: str,
+    ) -> None:
+        if cache_key is None:
+            return
+
+        # Bypassed requests still refresh the cached summary.
+        if self.summary_cache is not None:
+            self.summary_cache.put(cache_key, summary)
+
+        if self.summary_store is not None:
+            self.summary_store.put(cache_key, summary)
+
+    def _tokenize(
+        self,
+        worker_pool: SummarizationWorkerPool,
+        text: str,
+        model_name: Optional[str],
+    ) -> "array[int]":
+        # Timed in the thread it runs in, so the measurement leaves out the wait for that thread. The thread copies the
+        # context of the request, so the duration also reaches its Server-Timing header.
+        start_time = time.perf_counter()
+        token_ids: array[int] = self.tokenizer_repository.tokenize(text, model_name)
+        seconds = time.perf_counter() - start_time
+        worker_pool.observe_tokenize(seconds)
+        record_request_stage("tokenize", seconds)
+
+        return token_ids
+
+    def _tokenize_batch(
+        self,
+        worker_pool: SummarizationWorkerPool,
+        texts: List[str],
+        model_name: Optional[str],
+    ) -> List["array[int]"]:
+        start_time = time.perf_counter()
+        token_ids: List[array[int]] = self.tokenizer_repository.tokenize_batch(texts, model_name)
+        seconds = time.perf_counter() - start_time
+        worker_pool.observe_tokenize(seconds, len(texts))
+        record_request_stage("tokenize", seconds)
+
+        return token_ids
+
+    def _join_in_flight(
+        self,
+        request_key: Optional[str],
+        shared: SharedSummarization,
+    ) -> Tuple[InFlightSummarization, bool]:
+        # Every request that joins counts as a waiter until it leaves, whether it started the shared work or not.
+        with self._in_flight_lock:
+            in_flight = self._in_flight.get(request_key) if request_key is not None else None
+
+            # Work that every waiter has left is being cancelled, so a new request starts it again instead. Work queued
+            # at bulk priority would hold an interactive request back, so that request starts its own, which the
+            # requests arriving after it join instead.
+            if (
+                in_flight is not None
+                and in_flight.shared.waiters > 0
+                and shared.priority in (in_flight.shared.priority, SummarizationPriority.BULK)
+            ):
+                in_flight.shared.waiters += 1
+                self.coalesced_requests += 1
+                self.logger.debug("Summarization coalesced with an identical in-flight request")
+
+                return in_flight, False
+
+            in_flight = InFlightSummarization(shared)
+            shared.waiters += 1
+
+            if request_key is not None:
+                self._in_flight[request_key] = in_flight
+
+        return in_flight, True
+
+    def _create_shared_context(
+        self,
+        shared: SharedSummarization,
+    ) -> contextvars.Context:
+        context = contextvars.copy_context()
+        context.run(current_request_timings.set, shared.timings)
+
+        return context
+
+    def _record_shared_stages(
+        self,
+        in_flights: List[InFlightSummarization],
+    ) -> None:
+        # A request that joined identical work reports the stages of that work, such as its queue and generate time,
+        # as if it had run the work itself.
+        request_timings = current_request_timings.get()
+
+        if request_timings is not None:
+            for shared in {in_flight.shared for in_flight in in_flights}:
+                request_timings.merge(shared.timings)
+
+    def _leave_in_flight(
+        self,
+        in_flights: List[InFlightSummarization],
+    ) -> None:
+        abandoned: Set[SharedSummarization] = set()
+
+        with self._in_flight_lock:
+            for in_flight in in_flights:
+                in_flight.shared.waiters -= 1
+
+                if in_flight.shared.waiters == 0:
+                    abandoned.add(in_flight.shared)
+
+        for shared in abandoned:
+            # Cancelling the task cancels its request in the worker pool; it may be left from another thread.
+            if shared.task is not None and not shared.task.done():
+                self.logger.debug("Shared summarization cancelled as no request waits for it anymore")
+                shared.task.get_loop().call_soon_threadsafe(shared.task.cancel)
 
+    def _complete_in_flight(
+        self,
+        request_key: Optional[str],
+        in_flight: InFlightSummarization,
+        result: Union[str, BaseException],
+    ) -> None:
+        if request_key is not None:
+            with self._in_flight_lock:
+                # A request may already have started the work again after every waiter had left this one.
+                if self._in_flight.get(request_key) is in_flight:
+                    del self._in_flight[request_key]
+
+        if isinstance(result, Exception):
+            in_flight.future.set_exception(result)
+        elif isinstance(result, BaseException):
+            # Only reached once no request waits anymore, but a cancellation is never shared as is.
+            in_flight.future.set_exception(RuntimeError("Coalesced summarization request was cancelled"))
+        else:
+            in_flight.future.set_result(result)
+
+    async def _wait_in_flight_async(
+        self,
+        awaitable: Awaitable[ResultType],
+        model_name: Optional[str],
+        deadline: Optional[float] = None,
+    ) -> ResultType:
+        timeout = asyncio.timeout_at(deadline)
+
+        try:
+            async with timeout:
+                # Shielded so that a cancelled request does not cancel the work shared with the other requests.
+                result: ResultType = await asyncio.shield(awaitable)
+
+        except TimeoutError as e:
+            if not timeout.expired():
+                raise
+
+            # The shared work has no deadline, so the pool only learns from here that a request exceeded its own.
+            worker_pool = self.model_registry.pools.get(model_name or self.model_registry.default_model_name)
+
+            if worker_pool is not None:
+                worker_pool.record_deadline_exceeded()
+
+            raise DeadlineExceededError() from e
+
+        return result
+
+    async def _summarize_shared_async(
+        self,
+        request_key: Optional[str],
+        cache_key: Optional[str],
+        in_flight: InFlightSummarization,
+        text_to_summarize: str,
+        generation_parameters: Dict[str, Any],
+        model_name: Optional[str],
+        priority: SummarizationPriority,
+    ) -> None:
         self.logger.debug("Summarization started")
 
-        result: str = self.worker.summarize(
-            text_to_summarize,
+        try:
+            # Loading a model can stop and start worker processes, and tokenizing here overlaps with generation of
+            # other requests in the worker, so both run off the event loop.
+            worker_pool = await asyncio.to_thread(self.model_registry.get_pool, model_name)
+            token_ids = await asyncio.to_thread(self._tokenize, worker_pool, text_to_summarize, model_name)
+            # The work has no deadline of its own: each waiter stops waiting at its own deadline, and the work is
+            # cancelled once the last of them has left.
+            result: str = await worker_pool.summarize_async(token_ids, generation_parameters, priority)
+
+        except Exception as e:
+            self._complete_in_flight(request_key, in_flight, e)
+            return
+
+        except BaseException as e:
+            self._complete_in_flight(request_key, in_flight, e)
+            raise
+
+        self.last_access_time = time.time()
+        self._cache_summary(cache_key, result)
+        self._complete_in_flight(request_key, in_flight, result)
+
+        self.logger.debug("Summarization completed")
+
+    async def _summarize_batch_shared_async(
+        self,
+        request_keys: List[Optional[str]],
+        cache_keys: List[Optional[str]],
+        in_flights: List[InFlightSummarization],
+        texts_to_summarize: List[str],
+        generation_parameters: List[Dict[str, Any]],
+        model_name: Optional[str],
+        priority: SummarizationPriority,
+    ) -> List[Union[str, Exception]]:
+        self.logger.debug(f"Batch summarization of {len(texts_to_summarize)} texts started")
+
+        try:
+            worker_pool = await asyncio.to_thread(self.model_registry.get_pool, model_name)
+            token_ids = await asyncio.to_thread(self._tokenize_batch, worker_pool, texts_to_summarize, model_name)
+            results: List[Union[str, Exception]] = await worker_pool.summarize_batch_async(
+                token_ids,
+                generation_parameters,
+                priority,
+            )
+
+        except BaseException as e:
+            for request_key, in_flight in zip(request_keys, in_flights):
+                self._complete_in_flight(request_key, in_flight, e)
+
+            raise
+
+        self.last_access_time = time.time()
+
+        for request_key, cache_key, in_flight, result in zip(request_keys, cache_keys, in_flights, results):
+            if isinstance(result, str):
+                self._cache_summary(cache_key, result)
+
+            self._complete_in_flight(request_key, in_flight, result)
+
+        self.logger.debug("Batch summarization completed")
+
+        return results
+
+    async def summarize_async(
+        self,
+        text_to_summarize: str,
+        generation_parameters: Dict[str, Any],
+        bypass_cache: bool = False,
+        model_name: Optional[str] = None,
+        priority: SummarizationPriority = SummarizationPriority.INTERACTIVE,
+        deadline: Optional[float] = None,
+    ) -> str:
+        request_key = self._get_request_key(text_to_summarize, generation_parameters, model_name)
+        cache_key = self._get_cache_key(request_key)
+        cached_summary = await self._get_cached_summary_async(cache_key, bypass_cache)
+
+        if cached_summary is not None:
+            return cached_summary
+
+        in_flight, is_owner = self._join_in_flight(request_key, SharedSummarization(priority))
+
+        try:
+            if is_owner:
+                in_flight.shared.task = asyncio.create_task(
+                    self._summarize_shared_async(
+                        request_key,
+                        cache_key,
+                        in_flight,
+                        text_to_summarize,
+                        generation_parameters,
+                        model_name,
+                        priority,
+                    ),
+                    context=self._create_shared_context(in_flight.shared),
+                )
+
+            return await self._wait_in_flight_async(
+                asyncio.wrap_future(in_flight.future),
+                model_name,
+                deadline,
+            )
+
+        finally:
+            self._record_shared_stages([in_flight])
+            self._leave_in_flight([in_flight])
+
+    async def summarize_batch_async(
+        self,
+        texts_to_summarize: List[str],
+        generation_parameters: List[Dict[str, Any]],
+        bypass_cache: Optional[List[bool]] = None,
+        model_name: Optional[str] = None,
+        priority: SummarizationPriority = SummarizationPriority.INTERACTIVE,
+        deadline: Optional[float] = None,
+    ) -> List[Union[str, Exception]]:
+        request_keys = [
+            self._get_request_key(text, parameters, model_name)
+            for text, parameters in zip(texts_to_summarize, generation_parameters)
+        ]
+        cache_keys = [self._get_cache_key(request_key) for request_key in request_keys]
+        bypass_cache = bypass_cache or [False] * len(texts_to_summarize)
+        results: List[Optional[Union[str, Exception]]] = [
+            self._get_memory_cached_summary(cache_key, bypass_cache[index])
+            for index, cache_key in enumerate(cache_keys)
+        ]
+        store_indices = [
+            index
+            for index, result in enumerate(results)
+            if result is None and self._needs_store_lookup(cache_keys[index], bypass_cache[index])
+        ]
+
+        # All misses of the batch are looked up in a single thread switch.
+        if store_indices:
+            stored_summaries = await asyncio.to_thread(
+                self._get_stored_summaries,
+                [cache_keys[index] for index in store_indices],
+            )
+
+            for index, stored_summary in zip(store_indices, stored_summaries):
+                results[index] = stored_summary
+
+        shared = SharedSummarization(priority)
+        in_flights: Dict[int, InFlightSummarization] = {}
+        owned_indices: List[int] = []
+
+        # Duplicates within the batch coalesce too, since the first of them is already in flight.
+        for index, result in enumerate(results):
+            if result is None:
+                in_flights[index], is_owner = self._join_in_flight(request_keys[index], shared)
+
+                if is_owner:
+                    owned_indices.append(index)
+
+        try:
+            if owned_indices:
+                shared.task = asyncio.create_task(
+                    self._summarize_batch_shared_async(
+                        [request_keys[index] for index in owned_indices],
+                        [cache_keys[index] for index in owned_indices],
+                        [in_flights[index] for index in owned_indices],
+                        [texts_to_summarize[index] for index in owned_indices],
+                        [generation_parameters[index] for index in owned_indices],
+                        model_name,
+                        priority,
+                    ),
+                    context=self._create_shared_context(shared),
+                )
+                owned_results = await self._wait_in_flight_async(shared.task, model_name, deadline)
+
+                for index, owned_result in zip(owned_indices, owned_results):
+                    results[index] = owned_result
+
+            for index, in_flight in in_flights.items():
+                if results[index] is not None:
+                    continue
+
+                try:
+                    summary: str = await self._wait_in_flight_async(
+                        asyncio.wrap_future(in_flight.future),
+                        model_name,
+                        deadline,
+                    )
+                    results[index] = summary
+
+                except Exception as e:
+                    results[index] = e
+
+        finally:
+            self._record_shared_stages(list(in_flights.values()))
+            self._leave_in_flight(list(in_flights.values()))
+
+        # Every text got a cached summary, a result of the shared work, or the result of the request it joined.
+        return cast(List[Union[str, Exception]], results)
+
+    async def summarize_stream_async(
+        self,
+        text_to_summarize: str,
+        generation_parameters: Dict[str, Any],
+        model_name: Optional[str] = None,
+        priority: SummarizationPriority = SummarizationPriority.INTERACTIVE,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        self.logger.debug("Streaming summarization started")
+
+        start_time = time.perf_counter()
+        is_first_partial_summary = True
+        worker_pool = await asyncio.to_thread(self.model_registry.get_pool, model_name)
+        token_ids = await asyncio.to_thread(self._tokenize, worker_pool, text_to_summarize, model_name)
+
+        async for partial_summary in worker_pool.summarize_stream_async(
+            token_ids,
             generation_parameters,
-        )
+            priority,
+            deadline,
+        ):
+            if is_first_partial_summary:
+                is_first_partial_summary = False
+                worker_pool.observe_time_to_first_token(time.perf_counter() - start_time)
 
-        self.timer.start(
-            self.config.model_idle_timeout,
-            self._check_idle_timeout,
-        )
+            yield partial_summary
 
         self.last_access_time = time.time()
 
+        self.logger.debug("Streaming summarization completed")
+
+    def _check_model_name(
+        self,
+        model_name: Optional[str],
+    ) -> None:
+        # Tokenizers are loaded by name, so only the configured models are accepted, as when summarizing.
+        if model_name is not None and model_name not in self.model_registry.pools:
+            raise UnsupportedModelConfigurationError(model_name)
+
+    async def split_text_async(
+        self,
+        text: str,
+        chunk_size: int,
+        chunk_overlap: int,
+        model_name: Optional[str] = None,
+    ) -> List[str]:
+        self._check_model_name(model_name)
+        chunks: List[str] = await asyncio.to_thread(
+            self.tokenizer_repository.split_text, text, chunk_size, chunk_overlap, model_name
+        )
+
+        return chunks
+
+    async def count_tokens_async(
+        self,
+        text: str,
+        model_name: Optional[str] = None,
+    ) -> int:
+        self._check_model_name(model_name)
+        token_count: int = await asyncio.to_thread(self.tokenizer_repository.count_tokens, text, model_name)
+
+        return token_count
+
+    def get_max_input_tokens(
+        self,
+        model_name: Optional[str] = None,
+    ) -> int:
+        self._check_model_name(model_name)
+        max_input_tokens: int = self.tokenizer_repository.get_max_input_tokens(model_name)
+
+        return max_input_tokens
+
+    def summarize(
+        self,
+        text_to_summarize: str,
+        generation_parameters: Dict[str, Any],
+        bypass_cache: bool = False,
+        model_name: Optional[str] = None,
+        priority: SummarizationPriority = SummarizationPriority.INTERACTIVE,
+    ) -> str:
+        request_key = self._get_request_key(text_to_summarize, generation_parameters, model_name)
+        cache_key = self._get_cache_key(request_key)
+        cached_summary = self._get_cached_summary(cache_key, bypass_cache)
+
+        if cached_summary is not None:
+            return cached_summary
+
+        in_flight, is_owner = self._join_in_flight(request_key, SharedSummarization(priority))
+
+        try:
+            if not is_owner:
+                return in_flight.future.result()
+
+            self.logger.debug("Summarization started")
+
+            try:
+                worker_pool = self.model_registry.get_pool(model_name)
+                result: str = self._create_shared_context(in_flight.shared).run(
+                    lambda: worker_pool.summarize(
+                        self._tokenize(worker_pool, text_to_summarize, model_name),
+                        generation_parameters,
+                        priority,
+                    ),
+                )
+
+            except BaseException as e:
+                self._complete_in_flight(request_key, in_flight, e)
+                raise
+
+            self.last_access_time = time.time()
+            self._cache_summary(cache_key, result)
+            self._complete_in_flight(request_key, in_flight, result)
+
+        finally:
+            self._record_shared_stages([in_flight])
+            self._leave_in_flight([in_flight])
+
         self.logger.debug("Summarization completed")
 
         return result
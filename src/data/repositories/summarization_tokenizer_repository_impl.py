@@ -0,0 +1,144 @@
+import threading
+from array import array
+from typing import Annotated, Any, Dict, List, Optional
+
+from fastapi import Depends
+from transformers import AutoConfig, AutoTokenizer
+from transformers.tokenization_utils_base import VERY_LARGE_INTEGER
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.exceptions.chunk_size_too_large_error import ChunkSizeTooLargeError
+from domain.repositories.summarization_tokenizer_repository import (
+    SummarizationTokenizerRepository,
+)
+
+
+class SummarizationTokenizerRepositoryImpl(SummarizationTokenizerRepository):  # type: ignore
+    _instance: Optional["SummarizationTokenizerRepositoryImpl"] = None
+    _lock = threading.Lock()
+
+    default_max_input_tokens = 1024
+
+    def __new__(
+        cls,
+        config: Annotated[AppConfig, Depends()],
+        logger: Annotated[Logger, Depends()],
+    ) -> "SummarizationTokenizerRepositoryImpl":
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(SummarizationTokenizerRepositoryImpl, cls).__new__(cls)
+                    cls._instance._initialize(config, logger)
+
+        return cls._instance
+
+    def _initialize(
+        self,
+        config: AppConfig,
+        logger: Logger,
+    ) -> None:
+        self.config = config
+        self.logger = logger
+        self._tokenizers: Dict[str, Any] = {}
+        self._tokenizer_lock = threading.Lock()
+
+    def _get_tokenizer(
+        self,
+        model_name: Optional[str] = None,
+    ) -> Any:
+        model_name = model_name or self.config.summarization_model_name
+        tokenizer = self._tokenizers.get(model_name)
+
+        # Only the tokenizer files are loaded, so this stays cheap compared to starting a model worker.
+        if tokenizer is None:
+            with self._tokenizer_lock:
+                tokenizer = self._tokenizers.get(model_name)
+
+                if tokenizer is None:
+                    self.logger.info(f"Loading tokenizer of {model_name}")
+                    tokenizer = AutoTokenizer.from_pretrained(
+                        model_name,
+                        cache_dir=self.config.summarization_model_download_path,
+                    )
+
+                    # Some tokenizers do not know the input window of their model, so it is read from the model config.
+                    if tokenizer.model_max_length >= VERY_LARGE_INTEGER:
+                        model_config = AutoConfig.from_pretrained(
+                            model_name,
+                            cache_dir=self.config.summarization_model_download_path,
+                        )
+                        tokenizer.model_max_length = getattr(
+                            model_config, "max_position_embeddings", self.default_max_input_tokens
+                        )
+
+                    self._tokenizers[model_name] = tokenizer
+
+        return tokenizer
+
+    def tokenize(
+        self,
+        text: str,
+        model_name: Optional[str] = None,
+    ) -> "array[int]":
+        tokenizer = self._get_tokenizer(model_name)
+        token_ids = tokenizer(text, max_length=tokenizer.model_max_length, truncation=True)["input_ids"]
+
+        return array("i", token_ids)
+
+    def tokenize_batch(
+        self,
+        texts: List[str],
+        model_name: Optional[str] = None,
+    ) -> List["array[int]"]:
+        tokenizer = self._get_tokenizer(model_name)
+        batch_token_ids = tokenizer(texts, max_length=tokenizer.model_max_length, truncation=True)["input_ids"]
+
+        return [array("i", token_ids) for token_ids in batch_token_ids]
+
+    def count_tokens(
+        self,
+        text: str,
+        model_name: Optional[str] = None,
+    ) -> int:
+        return len(self._get_tokenizer(model_name)(text)["input_ids"])
+
+    def split_text(
+        self,
+        text: str,
+        chunk_size: int,
+        chunk_overlap: int,
+        model_name: Optional[str] = None,
+    ) -> List[str]:
+        tokenizer = self._get_tokenizer(model_name)
+        # Chunks are summarized on their own, so each one also needs room for the special tokens of the model input.
+        max_chunk_size = tokenizer.model_max_length - tokenizer.num_special_tokens_to_add()
+
+        if chunk_size > max_chunk_size:
+            raise ChunkSizeTooLargeError(chunk_size, max_chunk_size)
+
+        token_ids = tokenizer(text, add_special_tokens=False)["input_ids"]
+
+        if len(token_ids) <= chunk_size:
+            return [text]
+
+        chunks: List[List[int]] = []
+
+        for start in range(0, len(token_ids) - chunk_overlap, chunk_size - chunk_overlap):
+            end = start + chunk_size
+            chunks.append(token_ids[start:end])
+
+        return [
+            str(chunk)
+            for chunk in tokenizer.batch_decode(
+                chunks,
+                skip_special_tokens=True,
+                clean_up_tokenization_spaces=False,
+            )
+        ]
+
+    def get_max_input_tokens(
+        self,
+        model_name: Optional[str] = None,
+    ) -> int:
+        return int(self._get_tokenizer(model_name).model_max_length)
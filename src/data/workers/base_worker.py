@@ -1,11 +1,23 @@
+import asyncio
+import itertools
 import multiprocessing
 import multiprocessing.connection
 import multiprocessing.synchronize
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from dataclasses import dataclass
 from multiprocessing.sharedctypes import Synchronized
-from typing import Generic, Optional, TypeVar
+from typing import Any, Callable, Dict, Generic, List, Optional, Set, Tuple, TypeVar
 
 from core.logger.logger import Logger
+from data.workers.shared_memory_transport import (
+    SharedMemoryConnection,
+    SharedMemoryRing,
+)
+from domain.exceptions.worker_not_running_error import WorkerNotRunningError
 
 InputType = TypeVar("InputType")
 OutputType = TypeVar("OutputType")
@@ -13,6 +25,20 @@ ConfigType = TypeVar("ConfigType")
 SharedObjectType = TypeVar("SharedObjectType")
 
 
+# Intermediate reply for a request that is still running; the request stays pending until its final reply.
+@dataclass
+class PartialResult:
+    payload: Any
+
+
+# Memory of a worker process; unique memory excludes pages shared with other processes, such as mapped model weights.
+@dataclass
+class ProcessMemoryUsage:
+    resident_bytes: int
+    proportional_bytes: int
+    unique_bytes: int
+
+
 class BaseWorker(
     ABC,
     Generic[
@@ -31,9 +57,27 @@ class BaseWorker(
         self._logger = logger
         self._process: Optional[multiprocessing.Process] = None
         self._is_processing: Synchronized = multiprocessing.Value("b", False)  # type: ignore
+        # Written once by the worker process and only read here, so it needs no lock.
+        self._load_seconds = multiprocessing.RawValue("d", 0.0)
+        self.restarts = 0
         self._processing_lock: multiprocessing.synchronize.Lock = multiprocessing.Lock()
         self._pipe_parent, self._pipe_child = multiprocessing.Pipe()
+        self._connection = SharedMemoryConnection(self._pipe_parent)
+        # Cancellations bypass the request pipe, which the worker only reads between batches, so that a generation
+        # in progress can poll them at every decoding step.
+        self._cancel_pipe_child, self._cancel_pipe_parent = multiprocessing.Pipe(duplex=False)
+        self._cancelled_request_ids: Set[int] = set()
+        self._shared_memory_rings: List[SharedMemoryRing] = []
         self._stop_event = multiprocessing.Event()
+        self._request_ids = itertools.count()
+        self._pending_requests: Dict[int, Future[Any]] = {}
+        self._partial_callbacks: Dict[int, Callable[[Any], None]] = {}
+        self._metrics_callbacks: Dict[int, Callable[[Any], None]] = {}
+        self._pending_requests_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._cancel_lock = threading.Lock()
+        self._dispatcher_thread: Optional[threading.Thread] = None
+        self._dispatcher_stop_event = threading.Event()
 
     @abstractmethod
     def initialize_shared_object(
@@ -45,11 +89,12 @@ class BaseWorker(
     @abstractmethod
     def handle_command(
         self,
+        request_id: int,
         command: str,
         args: InputType,
         shared_object: SharedObjectType,
         config: ConfigType,
-        pipe: multiprocessing.connection.Connection,
+        pipe: SharedMemoryConnection,
         is_processing: Synchronized,  # type: ignore
         processing_lock: multiprocessing.synchronize.Lock,
     ) -> None:
@@ -59,10 +104,55 @@ class BaseWorker(
     def get_worker_name(self) -> str:
         pass
 
+    def configure_process(
+        self,
+        config: ConfigType,
+    ) -> None:
+        cpu_cores: List[int] = getattr(config, "cpu_cores", [])
+
+        # Only Linux supports pinning; a pinned worker keeps its caches and never runs on the cores of other workers.
+        if not cpu_cores or not hasattr(os, "sched_setaffinity"):
+            return
+
+        try:
+            os.sched_setaffinity(0, cpu_cores)
+
+        except OSError as e:
+            self._logger.warning(f"{self.get_worker_name()} could not be pinned to CPU cores {cpu_cores}: {e}")
+
+    def handle_batch(
+        self,
+        commands: List[Tuple[int, str, InputType]],
+        shared_object: SharedObjectType,
+        config: ConfigType,
+        pipe: SharedMemoryConnection,
+        is_processing: Synchronized,  # type: ignore
+        processing_lock: multiprocessing.synchronize.Lock,
+    ) -> None:
+        for request_id, command, args in commands:
+            self.handle_command(request_id, command, args, shared_object, config, pipe, is_processing, processing_lock)
+
+    def _receive_batch(
+        self,
+        config: ConfigType,
+        pipe: SharedMemoryConnection,
+    ) -> List[Tuple[int, str, InputType]]:
+        batch: List[Tuple[int, str, InputType]] = [pipe.recv()]
+        batch_max_size = getattr(config, "batch_max_size", 1)
+        deadline = time.monotonic() + getattr(config, "batch_max_wait_ms", 0) / 1000
+
+        while len(batch) < batch_max_size:
+            if not pipe.poll(timeout=max(deadline - time.monotonic(), 0)):
+                break
+
+            batch.append(pipe.recv())
+
+        return batch
+
     def _run_process(
         self,
         config: ConfigType,
-        pipe: multiprocessing.connection.Connection,
+        pipe: SharedMemoryConnection,
         stop_event: multiprocessing.synchronize.Event,
         is_processing: Synchronized,  # type: ignore
         processing_lock: multiprocessing.synchronize.Lock,
@@ -70,28 +160,253 @@ class BaseWorker(
         try:
             self._logger.set_level(config.log_level)  # type: ignore
             self._logger.info(f"{self.get_worker_name()} started with PID: {multiprocessing.current_process().pid}")
+            self.configure_process(config)
+            start_time = time.perf_counter()
             shared_object = self.initialize_shared_object(config)
+            self._load_seconds.value = time.perf_counter() - start_time
 
             while not stop_event.is_set():
                 if pipe.poll(timeout=1):
-                    command, args = pipe.recv()
-                    self._logger.debug(f"{self.get_worker_name()} received command: {command} with args: {args}")
-                    self.handle_command(command, args, shared_object, config, pipe, is_processing, processing_lock)
-                    self._logger.debug(f"{self.get_worker_name()} command: {command} processed")
+                    commands = self._receive_batch(config, pipe)
+
+                    # Arguments are not logged, as they may hold multi-megabyte documents.
+                    for request_id, command, _ in commands:
+                        self._logger.debug(f"{self.get_worker_name()} received command: {command} ({request_id})")
+
+                    self.handle_batch(commands, shared_object, config, pipe, is_processing, processing_lock)
+                    self._logger.debug(f"{self.get_worker_name()} batch of {len(commands)} command(s) processed")
+                    # Requests are sent in id order, so no cancellation can target a request up to the last one again.
+                    last_request_id = max(request_id for request_id, _, _ in commands)
+                    self._cancelled_request_ids = {
+                        request_id for request_id in self._cancelled_request_ids if request_id > last_request_id
+                    }
 
         finally:
             del shared_object
             pipe.close()
             self._logger.info(f"{self.get_worker_name()} stopped with PID: {multiprocessing.current_process().pid}")
+            # Worker processes exit without running exit handlers, so queued log records are written here.
+            self._logger.shutdown()
+
+    def is_request_cancelled(self, request_id: int) -> bool:
+        # Called in the worker process; polling is a single system call, cheap enough for every decoding step.
+        while self._cancel_pipe_child.poll():
+            self._cancelled_request_ids.add(self._cancel_pipe_child.recv())
+
+        return request_id in self._cancelled_request_ids
+
+    def _fail_pending_requests(self, error: Exception) -> None:
+        with self._pending_requests_lock:
+            pending_requests = list(self._pending_requests.values())
+            self._pending_requests.clear()
+            self._partial_callbacks.clear()
+            self._metrics_callbacks.clear()
+
+        for future in pending_requests:
+            future.set_exception(error)
+
+    def _dispatch_partial_result(self, request_id: int, partial_result: PartialResult) -> None:
+        with self._pending_requests_lock:
+            callback = self._partial_callbacks.get(request_id)
+
+        if callback is None:
+            self._logger.debug(f"{self.get_worker_name()} dropped partial reply for request {request_id}")
+            return
+
+        try:
+            callback(partial_result.payload)
+
+        except Exception as e:
+            # A failing consumer (e.g. a disconnected client) must never take the dispatcher down with it.
+            self._logger.debug(f"{self.get_worker_name()} partial reply callback for request {request_id} failed: {e}")
+
+    def _dispatch_metrics(self, request_id: int, callback: Callable[[Any], None], metrics: Any) -> None:
+        try:
+            callback(metrics)
+
+        except Exception as e:
+            self._logger.debug(f"{self.get_worker_name()} metrics callback for request {request_id} failed: {e}")
+
+    def _dispatch_replies(self) -> None:
+        while not self._dispatcher_stop_event.is_set():
+            try:
+                if not self._connection.poll(timeout=0.1):
+                    if not self.is_alive():
+                        self._fail_pending_requests(WorkerNotRunningError())
+
+                    continue
+
+                message = self._connection.recv()
+
+            except (EOFError, OSError):
+                self._fail_pending_requests(WorkerNotRunningError())
+                break
+
+            request_id, result = message[0], message[1]
+
+            if isinstance(result, PartialResult):
+                self._dispatch_partial_result(request_id, result)
+                continue
+
+            with self._pending_requests_lock:
+                future = self._pending_requests.pop(request_id, None)
+                self._partial_callbacks.pop(request_id, None)
+                metrics_callback = self._metrics_callbacks.pop(request_id, None)
+
+            # Final replies may carry measurements of the worker process, which are recorded before the caller resumes.
+            if len(message) > 2:
+                self.record_metrics(message[2])
+
+                if metrics_callback is not None:
+                    self._dispatch_metrics(request_id, metrics_callback, message[2])
+
+            if future is None:
+                self._logger.debug(f"{self.get_worker_name()} dropped reply for unknown request {request_id}")
+            elif isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def record_metrics(self, metrics: Any) -> None:
+        # Called by the dispatcher thread only, so implementations can record metrics without a lock.
+        pass
+
+    def _start_dispatcher(self) -> None:
+        if self._dispatcher_thread is None or not self._dispatcher_thread.is_alive():
+            self._dispatcher_stop_event.clear()
+            self._dispatcher_thread = threading.Thread(
+                target=self._dispatch_replies,
+                name=f"{self.get_worker_name()}-dispatcher",
+                daemon=True,
+            )
+            self._dispatcher_thread.start()
+
+    def _stop_dispatcher(self) -> None:
+        self._dispatcher_stop_event.set()
+
+        if self._dispatcher_thread is not None:
+            self._dispatcher_thread.join(timeout=1)
+            self._dispatcher_thread = None
+
+    def _send_request(
+        self,
+        command: str,
+        args: InputType,
+        on_partial_result: Optional[Callable[[Any], None]] = None,
+        on_metrics: Optional[Callable[[Any], None]] = None,
+    ) -> Future[Any]:
+        if not self.is_alive():
+            raise WorkerNotRunningError()
+
+        future: Future[Any] = Future()
+        # Only the dispatcher resolves request futures, so they are never cancellable by callers.
+        future.set_running_or_notify_cancel()
+
+        with self._send_lock:
+            # Ids are taken in sending order, so the worker knows that every lower id has already arrived.
+            request_id = next(self._request_ids)
+
+            with self._pending_requests_lock:
+                self._pending_requests[request_id] = future
+
+                if on_partial_result is not None:
+                    self._partial_callbacks[request_id] = on_partial_result
+
+                if on_metrics is not None:
+                    self._metrics_callbacks[request_id] = on_metrics
+
+            try:
+                self._connection.send((request_id, command, args))
+
+            except Exception:
+                with self._pending_requests_lock:
+                    self._pending_requests.pop(request_id, None)
+                    self._partial_callbacks.pop(request_id, None)
+                    self._metrics_callbacks.pop(request_id, None)
+
+                raise
+
+        return future
+
+    def cancel_request(self, future: Future[Any]) -> None:
+        with self._pending_requests_lock:
+            request_id = next(
+                (
+                    request_id
+                    for request_id, pending_future in self._pending_requests.items()
+                    if pending_future is future
+                ),
+                None,
+            )
+
+        # A request that has already been answered has nothing left to stop.
+        if request_id is None:
+            return
+
+        try:
+            with self._cancel_lock:
+                self._cancel_pipe_parent.send(request_id)
+
+        except OSError as e:
+            self._logger.debug(f"{self.get_worker_name()} could not cancel request {request_id}: {e}")
+
+    async def _wait_async(self, future: Future[Any]) -> Any:
+        try:
+            return await asyncio.wrap_future(future)
+
+        except asyncio.CancelledError:
+            # Nobody waits for the reply anymore, so the worker stops generating it at its next decoding step.
+            self.cancel_request(future)
+            raise
+
+    def _close_shared_memory(self) -> None:
+        with self._send_lock:
+            self._connection = SharedMemoryConnection(self._pipe_parent)
+
+            for ring in self._shared_memory_rings:
+                ring.unlink()
+
+            self._shared_memory_rings = []
+
+    def _open_connections(self) -> SharedMemoryConnection:
+        # Messages left over from a previous process may reference shared memory that no longer exists.
+        for pipe in (self._pipe_parent, self._pipe_child, self._cancel_pipe_child):
+            while pipe.poll():
+                pipe.recv()
+
+        self._close_shared_memory()
+        shared_memory_size = getattr(self._config, "shared_memory_size_mb", 0) * 1024 * 1024
+
+        if shared_memory_size <= 0:
+            return SharedMemoryConnection(self._pipe_child)
+
+        threshold_bytes = getattr(self._config, "shared_memory_threshold_kb", 0) * 1024
+        request_ring = SharedMemoryRing(shared_memory_size)
+        reply_ring = SharedMemoryRing(shared_memory_size)
+        self._shared_memory_rings = [request_ring, reply_ring]
+
+        with self._send_lock:
+            self._connection = SharedMemoryConnection(self._pipe_parent, request_ring, reply_ring, threshold_bytes)
+
+        return SharedMemoryConnection(self._pipe_child, reply_ring, request_ring, threshold_bytes)
 
     def start(self) -> None:
         if self._process is None or not self._process.is_alive():
+            # Replies of a previous process must not be read while its shared memory is being replaced.
+            self._stop_dispatcher()
+            self._fail_pending_requests(WorkerNotRunningError())
             self._stop_event.clear()
+
+            # Stopping forgets the process, so only a process that exited on its own counts as restarted.
+            if self._process is not None:
+                self.restarts += 1
+
+            self._load_seconds.value = 0.0
             self._process = multiprocessing.Process(
                 target=self._run_process,
                 args=(
                     self._config,
-                    self._pipe_child,
+                    self._open_connections(),
                     self._stop_event,
                     self._is_processing,
                     self._processing_lock,
@@ -99,6 +414,8 @@ class BaseWorker(
             )
             self._process.start()
 
+        self._start_dispatcher()
+
     def stop(self) -> None:
         if self._process and self._process.is_alive():
             self._stop_event.set()
@@ -109,8 +426,70 @@ class BaseWorker(
 
             self._process = None
 
+        self._stop_dispatcher()
+        self._close_shared_memory()
+        self._fail_pending_requests(WorkerNotRunningError())
+
     def is_alive(self) -> bool:
         return self._process is not None and self._process.is_alive()
 
     def is_processing(self) -> bool:
-        return bool(self._is_processing.value)
+        # A single byte is read atomically, so the flag is read without the lock the worker holds to update it.
+        return bool(self._is_processing.get_obj().value)
+
+    def get_load_seconds(self) -> Optional[float]:
+        # Time the running process needed to load its model, unknown until it has loaded.
+        load_seconds = float(self._load_seconds.value)
+
+        return load_seconds if self.is_alive() and load_seconds > 0 else None
+
+    def get_pid(self) -> Optional[int]:
+        return self._process.pid if self.is_alive() else None  # type: ignore
+
+    def get_memory_usage(self) -> Optional[ProcessMemoryUsage]:
+        pid = self.get_pid()
+
+        if pid is None:
+            return None
+
+        try:
+            # Only Linux exposes the per-process split of shared and private pages.
+            with open(f"/proc/{pid}/smaps_rollup") as smaps_rollup:
+                lines = smaps_rollup.readlines()
+
+        except OSError:
+            return None
+
+        sizes: Dict[str, int] = {}
+
+        # The first line is the address range of the rollup, the others are sizes in kB.
+        for line in lines[1:]:
+            name, value = line.split(":", 1)
+            sizes[name] = int(value.split()[0]) * 1024
+
+        return ProcessMemoryUsage(
+            resident_bytes=sizes.get("Rss", 0),
+            proportional_bytes=sizes.get("Pss", 0),
+            unique_bytes=sizes.get("Private_Clean", 0) + sizes.get("Private_Dirty", 0),
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Parent-side request routing state is not needed (nor picklable) in the worker process.
+        state = self.__dict__.copy()
+
+        for name in (
+            "_request_ids",
+            "_connection",
+            "_shared_memory_rings",
+            "_pending_requests",
+            "_partial_callbacks",
+            "_metrics_callbacks",
+            "_pending_requests_lock",
+            "_send_lock",
+            "_cancel_lock",
+            "_dispatcher_thread",
+            "_dispatcher_stop_event",
+        ):
+            state.pop(name, None)
+
+        return state
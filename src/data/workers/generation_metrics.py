@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from typing import Dict
+
+from core.metrics.histogram import (
+    LATENCY_BUCKETS,
+    TOKEN_COUNT_BUCKETS,
+    TOKEN_RATE_BUCKETS,
+    Histogram,
+)
+
+# Preparing builds the input tensors: it pads the token ids tokenized by the API process, or tokenizes raw texts.
+GENERATION_STAGES = ("prepare", "generate", "decode")
+
+
+# Measured by a worker process for one summarized text and sent back with the reply of its request. Texts generated
+# in the same tensor batch share the durations of that batch.
+@dataclass
+class GenerationMetrics:
+    prepare_seconds: float
+    generate_seconds: float
+    decode_seconds: float
+    input_tokens: int
+    output_tokens: int
+
+    def get_stage_seconds(self) -> Dict[str, float]:
+        return {
+            "prepare": self.prepare_seconds,
+            "generate": self.generate_seconds,
+            "decode": self.decode_seconds,
+        }
+
+
+class GenerationHistograms:
+    # Observed only by the reply dispatcher thread of a single worker.
+    def __init__(self) -> None:
+        self.stage_seconds = {stage: Histogram(LATENCY_BUCKETS) for stage in GENERATION_STAGES}
+        self.input_tokens = Histogram(TOKEN_COUNT_BUCKETS)
+        self.output_tokens = Histogram(TOKEN_COUNT_BUCKETS)
+        self.tokens_per_second = Histogram(TOKEN_RATE_BUCKETS)
+
+    def observe(self, metrics: GenerationMetrics) -> None:
+        for stage, seconds in metrics.get_stage_seconds().items():
+            self.stage_seconds[stage].observe(seconds)
+
+        self.input_tokens.observe(metrics.input_tokens)
+        self.output_tokens.observe(metrics.output_tokens)
+
+        if metrics.generate_seconds > 0:
+            self.tokens_per_second.observe(metrics.output_tokens / metrics.generate_seconds)
@@ -0,0 +1,22 @@
+from typing import Any
+
+from transformers import TextStreamer
+
+from data.workers.base_worker import PartialResult
+from data.workers.shared_memory_transport import SharedMemoryConnection
+
+
+class PipeTextStreamer(TextStreamer):
+    def __init__(
+        self,
+        tokenizer: Any,
+        pipe: SharedMemoryConnection,
+        request_id: int,
+    ) -> None:
+        super().__init__(tokenizer, skip_prompt=True, skip_special_tokens=True, clean_up_tokenization_spaces=False)
+        self.pipe = pipe
+        self.request_id = request_id
+
+    def on_finalized_text(self, text: str, stream_end: bool = False) -> None:
+        if text:
+            self.pipe.send((self.request_id, PartialResult(text)))
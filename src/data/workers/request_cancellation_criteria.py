@@ -0,0 +1,27 @@
+from typing import Any, Callable, List, cast
+
+import torch
+from transformers import StoppingCriteria
+
+
+# Finishes the rows of cancelled requests at the next decoding step, so their output stops growing while the rest
+# of the batch finishes undisturbed. Generate only returns once every row is finished, so the finished rows still
+# take part in the decoding steps of the batch; the worker is only freed early once all of its requests are cancelled.
+class RequestCancellationCriteria(StoppingCriteria):
+    def __init__(
+        self,
+        request_ids: List[int],
+        is_request_cancelled: Callable[[int], bool],
+    ) -> None:
+        self.request_ids = request_ids
+        self.is_request_cancelled = is_request_cancelled
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs: Any) -> torch.BoolTensor:
+        is_cancelled = torch.tensor(
+            [self.is_request_cancelled(request_id) for request_id in self.request_ids],
+            dtype=torch.bool,
+            device=input_ids.device,
+        )
+
+        # Beams and returned sequences of an input are contiguous rows, so each input expands to its own rows.
+        return cast(torch.BoolTensor, is_cancelled.repeat_interleave(input_ids.shape[0] // len(self.request_ids)))
@@ -0,0 +1,58 @@
+import glob
+import json
+import mmap
+import os
+import struct
+from typing import Dict
+
+import torch
+
+from domain.exceptions.model_snapshot_not_found_error import ModelSnapshotNotFoundError
+
+_HEADER_SIZE = struct.Struct("<Q")
+
+_DTYPES = {
+    "F64": torch.float64,
+    "F32": torch.float32,
+    "F16": torch.float16,
+    "BF16": torch.bfloat16,
+    "I64": torch.int64,
+    "I32": torch.int32,
+    "I16": torch.int16,
+    "I8": torch.int8,
+    "U8": torch.uint8,
+    "BOOL": torch.bool,
+}
+
+
+def load_safetensors_mmap(directory: str) -> Dict[str, torch.Tensor]:
+    state_dict: Dict[str, torch.Tensor] = {}
+    paths = sorted(glob.glob(os.path.join(directory, "*.safetensors")))
+
+    if not paths:
+        raise ModelSnapshotNotFoundError(directory)
+
+    for path in paths:
+        with open(path, "rb") as file:
+            # A private mapping shares the page cache of the file with every other process that maps it, as long as
+            # the tensors are only read.
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        header_size = _HEADER_SIZE.unpack_from(buffer, 0)[0]
+        start = _HEADER_SIZE.size
+        end = start + header_size
+        header = json.loads(buffer[start:end])
+        header.pop("__metadata__", None)
+
+        for name, entry in header.items():
+            dtype = _DTYPES[entry["dtype"]]
+            data_start, data_end = entry["data_offsets"]
+            # The tensors keep the mapping alive, so it is closed once the last of them is released.
+            state_dict[name] = torch.frombuffer(
+                buffer,
+                dtype=dtype,
+                count=(data_end - data_start) // dtype.itemsize,
+                offset=end + data_start,
+            ).reshape(entry["shape"])
+
+    return state_dict
@@ -0,0 +1,600 @@
+import asyncio
+import itertools
+import json
+import multiprocessing
+import multiprocessing.synchronize
+import os
+import shutil
+import time
+from array import array
+from dataclasses import dataclass, field
+from multiprocessing.sharedctypes import Synchronized
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
+
+import torch
+from transformers import (
+    AutoConfig,
+    AutoModelForSeq2SeqLM,
+    AutoTokenizer,
+    GenerationConfig,
+    PreTrainedModel,
+    StoppingCriteriaList,
+)
+from transformers.tokenization_utils_base import VERY_LARGE_INTEGER
+
+from core.logger.logger import Logger
+from core.metrics.request_timings import current_request_timings
+from data.workers.base_worker import BaseWorker
+from data.workers.generation_metrics import GenerationHistograms, GenerationMetrics
+from data.workers.pipe_text_streamer import PipeTextStreamer
+from data.workers.request_cancellation_criteria import RequestCancellationCriteria
+from data.workers.safetensors_mmap import load_safetensors_mmap
+from data.workers.shared_memory_transport import SharedMemoryConnection
+from domain.exceptions.incomplete_model_snapshot_error import (
+    IncompleteModelSnapshotError,
+)
+from domain.exceptions.request_cancelled_error import RequestCancelledError
+
+# Raw texts are tokenized by the worker, while token ids arrive already truncated from the API process.
+SummarizationInput = Union[str, "array[int]"]
+
+
+@dataclass
+class Seq2SeqSummarizationConfig:
+    device: str
+    model_name: str
+    model_download_path: str
+    log_level: str
+    batch_max_size: int = 1
+    batch_max_wait_ms: int = 0
+    shared_memory_size_mb: int = 0
+    shared_memory_threshold_kb: int = 64
+    model_snapshot_path: str = ""
+    shared_weights: bool = False
+    quantization: str = ""
+    num_threads: int = 0
+    cpu_cores: List[int] = field(default_factory=list)
+
+
+class Seq2SeqSummarizationWorker(
+    BaseWorker[  # type: ignore
+        Tuple[SummarizationInput, Dict[str, Any]],
+        str,
+        Seq2SeqSummarizationConfig,
+        Tuple[PreTrainedModel, AutoTokenizer],
+    ],
+):
+    def __init__(
+        self,
+        config: Seq2SeqSummarizationConfig,
+        logger: Logger,
+    ) -> None:
+        super().__init__(config, logger)
+        self.generation_histograms = GenerationHistograms()
+
+    def record_metrics(self, metrics: List[GenerationMetrics]) -> None:
+        for generation_metrics in metrics:
+            self.generation_histograms.observe(generation_metrics)
+
+    def _get_request_metrics_callback(self) -> Optional[Callable[[List[GenerationMetrics]], None]]:
+        # Replies are dispatched on another thread, so the timings of the request are taken from the caller's context.
+        request_timings = current_request_timings.get()
+
+        if request_timings is None:
+            return None
+
+        def record_stages(metrics: List[GenerationMetrics]) -> None:
+            for generation_metrics in metrics:
+                for stage, seconds in generation_metrics.get_stage_seconds().items():
+                    request_timings.record(stage, seconds)
+
+        return record_stages
+
+    def summarize(
+        self,
+        summarization_input: SummarizationInput,
+        generation_parameters: Dict[str, Any],
+    ) -> str:
+        future = self._send_request(
+            "summarize",
+            (
+                summarization_input,
+                generation_parameters,
+            ),
+        )
+
+        return str(future.result())
+
+    async def summarize_async(
+        self,
+        summarization_input: SummarizationInput,
+        generation_parameters: Dict[str, Any],
+    ) -> str:
+        # Sending a large payload can block until the worker drains the pipe, so keep it off the event loop.
+        future = await asyncio.to_thread(
+            self._send_request,
+            "summarize",
+            (
+                summarization_input,
+                generation_parameters,
+            ),
+            None,
+            self._get_request_metrics_callback(),
+        )
+
+        return str(await self._wait_async(future))
+
+    async def summarize_batch_async(
+        self,
+        summarization_inputs: List[SummarizationInput],
+        generation_parameters: List[Dict[str, Any]],
+    ) -> List[Union[str, Exception]]:
+        future = await asyncio.to_thread(
+            self._send_request,
+            "summarize_batch",
+            (
+                summarization_inputs,
+                generation_parameters,
+            ),
+            None,
+            self._get_request_metrics_callback(),
+        )
+
+        return list(await self._wait_async(future))
+
+    async def summarize_stream_async(
+        self,
+        summarization_input: SummarizationInput,
+        generation_parameters: Dict[str, Any],
+    ) -> AsyncIterator[str]:
+        loop = asyncio.get_running_loop()
+        partial_summaries: asyncio.Queue[Optional[str]] = asyncio.Queue()
+
+        future = await asyncio.to_thread(
+            self._send_request,
+            "summarize_stream",
+            (
+                summarization_input,
+                generation_parameters,
+            ),
+            lambda partial_summary: loop.call_soon_threadsafe(partial_summaries.put_nowait, partial_summary),
+            self._get_request_metrics_callback(),
+        )
+        # Partial replies are queued in arrival order, so the end marker always follows the last of them.
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(partial_summaries.put_nowait, None))
+
+        try:
+            while (partial_summary := await partial_summaries.get()) is not None:
+                yield partial_summary
+
+        finally:
+            # Also runs when the consumer stops iterating early, e.g. because its client disconnected.
+            if not future.done():
+                self.cancel_request(future)
+
+        future.result()
+
+    def _load_shared_model(
+        self,
+        snapshot_path: str,
+    ) -> PreTrainedModel:
+        with torch.device("meta"):
+            model: PreTrainedModel = AutoModelForSeq2SeqLM.from_config(  # type: ignore
+                AutoConfig.from_pretrained(snapshot_path, local_files_only=True),
+            )
+
+        # The weights are assigned without a copy, so they stay backed by the page cache of the snapshot files,
+        # which every worker maps into its own address space.
+        model.load_state_dict(load_safetensors_mmap(snapshot_path), strict=False, assign=True)
+        # Tied weights such as the output embeddings are saved only once, so they are restored by tying them again.
+        model.tie_weights()
+        model.generation_config = GenerationConfig.from_pretrained(snapshot_path, local_files_only=True)
+
+        if any(tensor.is_meta for tensor in itertools.chain(model.parameters(), model.buffers())):
+            raise IncompleteModelSnapshotError(snapshot_path)
+
+        # Mapped weights are only read, so the model is never trained.
+        model.requires_grad_(False)
+        model.train(False)
+
+        return model
+
+    def _load_snapshot(
+        self,
+        config: Seq2SeqSummarizationConfig,
+    ) -> Optional[Tuple[PreTrainedModel, AutoTokenizer]]:
+        snapshot_path = config.model_snapshot_path
+
+        if not snapshot_path or not os.path.isdir(snapshot_path):
+            return None
+
+        try:
+            if config.shared_weights:
+                model = self._load_shared_model(snapshot_path)
+            else:
+                # Safetensors are memory-mapped, so a restart reads the weights from the page cache without any
+                # hub lookups or randomly initialized weights that are overwritten right away.
+                model = AutoModelForSeq2SeqLM.from_pretrained(
+                    snapshot_path,
+                    local_files_only=True,
+                    use_safetensors=True,
+                    low_cpu_mem_usage=True,
+                )
+
+            tokenizer = AutoTokenizer.from_pretrained(snapshot_path, local_files_only=True)
+
+        except (OSError, ValueError) as e:
+            self._logger.warning(f"Model snapshot {snapshot_path} could not be loaded: {e}")
+            return None
+
+        return model, tokenizer
+
+    def _save_snapshot(
+        self,
+        model: PreTrainedModel,
+        tokenizer: AutoTokenizer,
+        snapshot_path: str,
+    ) -> None:
+        # Written next to the target and renamed, so a partially written snapshot is never loaded.
+        temporary_path = f"{snapshot_path}.{os.getpid()}.tmp"
+
+        try:
+            model.save_pretrained(temporary_path, safe_serialization=True)
+            tokenizer.save_pretrained(temporary_path)
+            os.rename(temporary_path, snapshot_path)
+            self._logger.info(f"Model snapshot saved to {snapshot_path}")
+
+        except OSError as e:
+            # Another worker may have saved the same snapshot first.
+            self._logger.warning(f"Model snapshot {snapshot_path} could not be saved: {e}")
+            shutil.rmtree(temporary_path, ignore_errors=True)
+
+    def configure_process(
+        self,
+        config: Seq2SeqSummarizationConfig,
+    ) -> None:
+        super().configure_process(config)
+
+        if config.num_threads > 0:
+            torch.set_num_threads(config.num_threads)
+            # The tokenizer sizes its own thread pool from this variable once it is first used.
+            os.environ["RAYON_NUM_THREADS"] = str(config.num_threads)
+
+        try:
+            # Generation runs its operators one after another, so inter-op threads would only compete for cores.
+            torch.set_num_interop_threads(1)
+
+        except RuntimeError as e:
+            # A forked process inherits the thread pool of a parent that has already used it.
+            self._logger.debug(f"{self.get_worker_name()} kept the inherited inter-op threads: {e}")
+
+        cpu_cores = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else "all"
+        self._logger.info(
+            f"{self.get_worker_name()} uses {torch.get_num_threads()} intra-op and "
+            f"{torch.get_num_interop_threads()} inter-op thread(s) on CPU cores: {cpu_cores}",
+        )
+
+    def initialize_shared_object(
+        self,
+        config: Seq2SeqSummarizationConfig,
+    ) -> Tuple[PreTrainedModel, AutoTokenizer]:
+        snapshot = self._load_snapshot(config)
+
+        if snapshot is not None:
+            model, tokenizer = snapshot
+        else:
+            model = AutoModelForSeq2SeqLM.from_pretrained(
+                config.model_name,
+                cache_dir=config.model_download_path,
+                low_cpu_mem_usage=True,
+            )
+            tokenizer = AutoTokenizer.from_pretrained(
+                config.model_name,
+                cache_dir=config.model_download_path,
+            )
+
+            if config.model_snapshot_path:
+                self._save_snapshot(model, tokenizer, config.model_snapshot_path)
+
+                # Reloading replaces the private copy of the weights with the mapping shared by all workers.
+                if config.shared_weights and (snapshot := self._load_snapshot(config)) is not None:
+                    model, tokenizer = snapshot
+
+        # Some tokenizers do not know the input window of their model, so it is read from the position embeddings.
+        if tokenizer.model_max_length >= VERY_LARGE_INTEGER:
+            tokenizer.model_max_length = model.config.max_position_embeddings
+
+        model = model.to(config.device)
+
+        if config.quantization == "int8-dynamic":
+            # Linear layers dominate inference cost, so their weights are converted to int8 once while activations
+            # are quantized on the fly. In place, as a copy would first duplicate the shared fp32 weights.
+            model = torch.ao.quantization.quantize_dynamic(  # type: ignore
+                model,
+                {torch.nn.Linear},
+                dtype=torch.qint8,
+                inplace=True,
+            )
+
+        return model, tokenizer
+
+    def handle_command(
+        self,
+        request_id: int,
+        command: str,
+        args: Tuple[SummarizationInput, Dict[str, Any]],
+        shared_object: Tuple[PreTrainedModel, AutoTokenizer],
+        config: Seq2SeqSummarizationConfig,
+        pipe: SharedMemoryConnection,
+        is_processing: Synchronized,  # type: ignore
+        processing_lock: multiprocessing.synchronize.Lock,
+    ) -> None:
+        if command in ("summarize", "summarize_batch", "summarize_stream"):
+            self.handle_batch(
+                [(request_id, command, args)],
+                shared_object,
+                config,
+                pipe,
+                is_processing,
+                processing_lock,
+            )
+
+    def _group_compatible_commands(
+        self,
+        commands: List[Tuple[int, str, Tuple[SummarizationInput, Dict[str, Any]]]],
+        batch_max_size: int,
+    ) -> List[List[int]]:
+        groups: Dict[str, List[List[int]]] = {}
+
+        for index, (_, command, args) in enumerate(commands):
+            if command == "summarize":
+                key = json.dumps(args[1], sort_keys=True, default=str)
+                key_groups = groups.setdefault(key, [[]])
+
+                if len(key_groups[-1]) >= batch_max_size:
+                    key_groups.append([])
+
+                key_groups[-1].append(index)
+
+        return [group for key_groups in groups.values() for group in key_groups]
+
+    def _expand_batch_commands(
+        self,
+        commands: List[Tuple[int, str, Any]],
+    ) -> Tuple[List[Tuple[int, str, Tuple[SummarizationInput, Dict[str, Any]]]], List[Optional[int]]]:
+        # Items of a batch request become regular summarize commands so they share tensor batches with other requests.
+        expanded_commands: List[Tuple[int, str, Tuple[SummarizationInput, Dict[str, Any]]]] = []
+        positions: List[Optional[int]] = []
+
+        for request_id, command, args in commands:
+            if command == "summarize_batch":
+                for position, item in enumerate(zip(*args)):
+                    expanded_commands.append((request_id, "summarize", item))
+                    positions.append(position)
+            else:
+                expanded_commands.append((request_id, command, args))
+                positions.append(None)
+
+        return expanded_commands, positions
+
+    def _prepare_inputs(
+        self,
+        summarization_inputs: List[SummarizationInput],
+        tokenizer: AutoTokenizer,
+        config: Seq2SeqSummarizationConfig,
+    ) -> Any:
+        if all(isinstance(summarization_input, str) for summarization_input in summarization_inputs):
+            return tokenizer(
+                summarization_inputs,
+                max_length=tokenizer.model_max_length,
+                truncation=True,
+                padding=True,
+                return_tensors="pt",
+            ).to(config.device)
+
+        token_ids = [
+            (
+                array(
+                    "i",
+                    tokenizer(summarization_input, max_length=tokenizer.model_max_length, truncation=True)["input_ids"],
+                )
+                if isinstance(summarization_input, str)
+                else summarization_input
+            )
+            for summarization_input in summarization_inputs
+        ]
+        input_ids = torch.full((len(token_ids), max(map(len, token_ids))), tokenizer.pad_token_id, dtype=torch.long)
+        attention_mask = torch.zeros_like(input_ids)
+
+        for index, ids in enumerate(token_ids):
+            length = len(ids)
+            input_ids[index, :length] = torch.frombuffer(ids, dtype=torch.int32)
+            attention_mask[index, :length] = 1
+
+        return {"input_ids": input_ids.to(config.device), "attention_mask": attention_mask.to(config.device)}
+
+    def _generate(
+        self,
+        summarization_inputs: List[SummarizationInput],
+        generation_parameters: Dict[str, Any],
+        shared_object: Tuple[PreTrainedModel, AutoTokenizer],
+        config: Seq2SeqSummarizationConfig,
+        request_ids: List[int],
+    ) -> List[Tuple[str, GenerationMetrics]]:
+        model, tokenizer = shared_object
+
+        start_time = time.perf_counter()
+        inputs = self._prepare_inputs(summarization_inputs, tokenizer, config)
+        prepare_end_time = time.perf_counter()
+
+        summary_ids = model.generate(
+            inputs["input_ids"],
+            **{
+                **generation_parameters,
+                "attention_mask": inputs["attention_mask"],
+                "stopping_criteria": StoppingCriteriaList(
+                    [RequestCancellationCriteria(request_ids, self.is_request_cancelled)],
+                ),
+            },
+        )
+
+        generate_end_time = time.perf_counter()
+        outputs = tokenizer.batch_decode(
+            summary_ids,
+            skip_special_tokens=True,
+            clean_up_tokenization_spaces=False,
+        )
+        decode_end_time = time.perf_counter()
+        num_return_sequences = int(generation_parameters.get("num_return_sequences", 1))
+        input_token_counts = inputs["attention_mask"].sum(dim=1).tolist()
+        output_token_counts = summary_ids.ne(tokenizer.pad_token_id).sum(dim=1).tolist()  # type: ignore
+
+        return [
+            (
+                str(outputs[index * num_return_sequences]),
+                GenerationMetrics(
+                    prepare_seconds=prepare_end_time - start_time,
+                    generate_seconds=generate_end_time - prepare_end_time,
+                    decode_seconds=decode_end_time - generate_end_time,
+                    input_tokens=int(input_token_counts[index]),
+                    output_tokens=int(output_token_counts[index * num_return_sequences]),
+                ),
+            )
+            for index in range(len(summarization_inputs))
+        ]
+
+    def _check_not_cancelled(self, request_id: int) -> None:
+        if self.is_request_cancelled(request_id):
+            raise RequestCancelledError()
+
+    def _summarize_stream(
+        self,
+        request_id: int,
+        args: Tuple[SummarizationInput, Dict[str, Any]],
+        shared_object: Tuple[PreTrainedModel, AutoTokenizer],
+        config: Seq2SeqSummarizationConfig,
+        pipe: SharedMemoryConnection,
+    ) -> None:
+        try:
+            self._check_not_cancelled(request_id)
+            summarization_input, generation_parameters = args
+            # Streaming is per request, so it never joins a tensor batch. Models such as bart-large-cnn default to beam
+            # search, which cannot be streamed, so greedy decoding is the default here.
+            streamer = PipeTextStreamer(shared_object[1], pipe, request_id)
+            ((summary, metrics),) = self._generate(
+                [summarization_input],
+                {"num_beams": 1, **generation_parameters, "streamer": streamer},
+                shared_object,
+                config,
+                [request_id],
+            )
+
+            self._check_not_cancelled(request_id)
+            pipe.send((request_id, summary, [metrics]))
+
+        except Exception as e:
+            pipe.send((request_id, e))
+
+    def _summarize_group(
+        self,
+        summarization_inputs: List[SummarizationInput],
+        generation_parameters: Dict[str, Any],
+        shared_object: Tuple[PreTrainedModel, AutoTokenizer],
+        config: Seq2SeqSummarizationConfig,
+        request_ids: List[int],
+    ) -> List[Any]:
+        try:
+            return self._generate(summarization_inputs, generation_parameters, shared_object, config, request_ids)
+
+        except Exception as e:
+            if len(summarization_inputs) == 1:
+                return [e]
+
+            # A single invalid input must not fail the whole batch, so retry each input on its own.
+            return [
+                result
+                for summarization_input, request_id in zip(summarization_inputs, request_ids)
+                for result in self._summarize_group(
+                    [summarization_input], generation_parameters, shared_object, config, [request_id]
+                )
+            ]
+
+    def handle_batch(
+        self,
+        commands: List[Tuple[int, str, Tuple[SummarizationInput, Dict[str, Any]]]],
+        shared_object: Tuple[PreTrainedModel, AutoTokenizer],
+        config: Seq2SeqSummarizationConfig,
+        pipe: SharedMemoryConnection,
+        is_processing: Synchronized,  # type: ignore
+        processing_lock: multiprocessing.synchronize.Lock,
+    ) -> None:
+        try:
+            with processing_lock:
+                is_processing.value = True
+
+            for request_id, command, args in commands:
+                if command == "summarize_stream":
+                    self._summarize_stream(request_id, args, shared_object, config, pipe)
+                elif command not in ("summarize", "summarize_batch"):
+                    self.handle_command(
+                        request_id,
+                        command,
+                        args,
+                        shared_object,
+                        config,
+                        pipe,
+                        is_processing,
+                        processing_lock,
+                    )
+
+            expanded_commands, positions = self._expand_batch_commands(commands)
+            batch_results: Dict[int, List[Any]] = {
+                request_id: [None] * len(args[0])
+                for request_id, command, args in commands
+                if command == "summarize_batch"
+            }
+            batch_metrics: Dict[int, List[GenerationMetrics]] = {request_id: [] for request_id in batch_results}
+
+            for indices in self._group_compatible_commands(expanded_commands, max(config.batch_max_size, 1)):
+                # Requests cancelled while they waited in the pipe are not generated at all.
+                active_indices = [
+                    index for index in indices if not self.is_request_cancelled(expanded_commands[index][0])
+                ]
+                request_ids = [expanded_commands[index][0] for index in active_indices]
+                summarization_inputs = [expanded_commands[index][2][0] for index in active_indices]
+                generation_parameters = expanded_commands[indices[0]][2][1]
+                results_by_index: Dict[int, Any] = {}
+
+                if active_indices:
+                    group_results = self._summarize_group(
+                        summarization_inputs, generation_parameters, shared_object, config, request_ids
+                    )
+                    results_by_index = dict(zip(active_indices, group_results))
+
+                for index in indices:
+                    request_id = expanded_commands[index][0]
+                    position = positions[index]
+                    # Generation of a cancelled request stopped early, so its summary is incomplete.
+                    result = (
+                        RequestCancelledError()
+                        if index not in results_by_index or self.is_request_cancelled(request_id)
+                        else results_by_index[index]
+                    )
+                    # Replies carry the metrics of the texts that were generated, so failures carry none.
+                    summary, metrics = (result, []) if isinstance(result, Exception) else (result[0], [result[1]])
+
+                    if position is None:
+                        pipe.send((request_id, summary, metrics))
+                    else:
+                        batch_results[request_id][position] = summary
+                        batch_metrics[request_id].extend(metrics)
+
+            for request_id, results in batch_results.items():
+                pipe.send((request_id, results, batch_metrics[request_id]))
+
+        finally:
+            with processing_lock:
+                is_processing.value = False
+
+    def get_worker_name(self) -> str:
+        return type(self).__name__
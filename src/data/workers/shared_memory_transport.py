@@ -0,0 +1,167 @@
+import multiprocessing.connection
+import struct
+from array import array
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Optional, Tuple, Union
+
+from domain.exceptions.shared_memory_ring_closed_error import (
+    SharedMemoryRingClosedError,
+)
+
+_HEAD = struct.Struct("<Q")
+
+
+# Reference to a payload stored in a shared memory ring; only this descriptor crosses the pipe.
+@dataclass
+class SharedMemoryPayload:
+    position: int
+    length: int
+    typecode: Optional[str] = None
+
+
+class SharedMemoryRing:
+    def __init__(
+        self,
+        capacity: int,
+        name: Optional[str] = None,
+    ) -> None:
+        self.capacity = capacity
+        self._shared_memory = shared_memory.SharedMemory(
+            name=name,
+            create=name is None,
+            size=_HEAD.size + capacity if name is None else 0,
+        )
+        # Only the producing process advances the tail; the consumer publishes its head in the shared header.
+        self._tail = 0
+
+    def _get_buffer(self) -> memoryview:
+        buffer = self._shared_memory.buf
+
+        if buffer is None:
+            raise SharedMemoryRingClosedError()
+
+        return buffer
+
+    def _get_head(self) -> int:
+        head: int = _HEAD.unpack_from(self._get_buffer(), 0)[0]
+
+        return head
+
+    def write(self, data: Union[bytes, "array[int]"]) -> Optional[SharedMemoryPayload]:
+        typecode = data.typecode if isinstance(data, array) else None
+        data_bytes = memoryview(data).cast("B")
+        position = self._tail
+        offset = position % self.capacity
+
+        if offset + len(data_bytes) > self.capacity:
+            # Payloads are kept contiguous, so the unused end of the ring is skipped.
+            position += self.capacity - offset
+            offset = 0
+
+        if position + len(data_bytes) - self._get_head() > self.capacity:
+            return None
+
+        start = _HEAD.size + offset
+        end = start + len(data_bytes)
+        self._get_buffer()[start:end] = data_bytes
+        self._tail = position + len(data_bytes)
+
+        return SharedMemoryPayload(position=position, length=len(data_bytes), typecode=typecode)
+
+    def read(self, payload: SharedMemoryPayload) -> Union[str, "array[int]"]:
+        start = _HEAD.size + payload.position % self.capacity
+        end = start + payload.length
+        buffer = self._get_buffer()
+        value: Union[str, array[int]]
+
+        if payload.typecode is None:
+            value = str(buffer[start:end], "utf-8")
+        else:
+            value = array(payload.typecode)
+            value.frombytes(buffer[start:end])
+
+        # Payloads are read in the order they were written, so releasing one also releases any skipped space.
+        _HEAD.pack_into(buffer, 0, payload.position + payload.length)
+
+        return value
+
+    def close(self) -> None:
+        self._shared_memory.close()
+
+    def unlink(self) -> None:
+        self._shared_memory.close()
+        self._shared_memory.unlink()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # A spawned process attaches to the existing segment instead of copying it.
+        return SharedMemoryRing, (self.capacity, self._shared_memory.name)
+
+
+class SharedMemoryConnection:
+    def __init__(
+        self,
+        connection: multiprocessing.connection.Connection,
+        send_ring: Optional[SharedMemoryRing] = None,
+        receive_ring: Optional[SharedMemoryRing] = None,
+        threshold_bytes: int = 0,
+    ) -> None:
+        self.connection = connection
+        self.send_ring = send_ring
+        self.receive_ring = receive_ring
+        self.threshold_bytes = threshold_bytes
+
+    def _encode(self, obj: Any) -> Any:
+        if isinstance(obj, str):
+            # The character count is a lower bound of the encoded size, so short texts are never encoded here.
+            if self.send_ring is None or len(obj) < self.threshold_bytes:
+                return obj
+
+            payload = self.send_ring.write(obj.encode("utf-8"))
+
+            # A full ring falls back to sending the text through the pipe.
+            return payload if payload is not None else obj
+
+        if isinstance(obj, array):
+            if self.send_ring is None or len(obj) * obj.itemsize < self.threshold_bytes:
+                return obj
+
+            payload = self.send_ring.write(obj)
+
+            return payload if payload is not None else obj
+
+        if isinstance(obj, tuple):
+            return tuple(self._encode(item) for item in obj)
+
+        if isinstance(obj, list):
+            return [self._encode(item) for item in obj]
+
+        return obj
+
+    def _decode(self, obj: Any) -> Any:
+        if isinstance(obj, SharedMemoryPayload) and self.receive_ring is not None:
+            return self.receive_ring.read(obj)
+
+        if isinstance(obj, tuple):
+            return tuple(self._decode(item) for item in obj)
+
+        if isinstance(obj, list):
+            return [self._decode(item) for item in obj]
+
+        return obj
+
+    def send(self, obj: Any) -> None:
+        self.connection.send(self._encode(obj))
+
+    def recv(self) -> Any:
+        return self._decode(self.connection.recv())
+
+    def poll(self, timeout: Optional[float] = 0.0) -> bool:
+        return self.connection.poll(timeout)
+
+    def close(self) -> None:
+        self.connection.close()
+
+        for ring in (self.send_ring, self.receive_ring):
+            if ring is not None:
+                ring.close()
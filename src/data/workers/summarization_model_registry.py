@@ -0,0 +1,212 @@
+import dataclasses
+import glob
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+from core.logger.logger import Logger
+from data.workers.generation_metrics import GENERATION_STAGES
+from data.workers.summarization_worker_pool import SummarizationWorkerPool
+from domain.exceptions.unsupported_model_configuration_error import (
+    UnsupportedModelConfigurationError,
+)
+from domain.models.model_metrics import ModelMetrics
+from domain.models.model_status import ModelStatus
+from domain.models.summarization_priority import SummarizationPriority
+from domain.models.worker_status import WorkerStatus
+
+_MB = 1024 * 1024
+
+
+class SummarizationModelRegistry:
+    def __init__(
+        self,
+        pools: Dict[str, SummarizationWorkerPool],
+        default_model_name: str,
+        memory_budget_bytes: int,
+        model_download_path: str,
+        logger: Logger,
+    ) -> None:
+        self.pools = pools
+        self.default_model_name = default_model_name
+        self.memory_budget_bytes = memory_budget_bytes
+        self.model_download_path = model_download_path
+        self.logger = logger
+        self.loads = dict.fromkeys(pools, 0)
+        self.evictions = dict.fromkeys(pools, 0)
+        # Least recently used first.
+        self._recently_used: OrderedDict[str, None] = OrderedDict.fromkeys(pools)
+        self._memory_bytes: Dict[str, int] = {}
+        # Models being loaded or evicted outside the lock, which are neither loaded nor evicted again meanwhile.
+        self._pending_model_names: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def _get_weights_size_bytes(self, model_name: str) -> int:
+        model_key = model_name.replace("/", "--")
+        sizes: List[int] = []
+
+        # The hub cache and the local snapshot hold the same weights, so only the larger of the two is counted.
+        for directory in (
+            os.path.join(self.model_download_path, f"models--{model_key}", "snapshots", "*"),
+            os.path.join(self.model_download_path, "snapshots", model_key),
+        ):
+            paths = glob.glob(os.path.join(directory, "*.safetensors")) + glob.glob(os.path.join(directory, "*.bin"))
+            sizes.append(sum(os.path.getsize(path) for path in paths))
+
+        return max(sizes)
+
+    def _measure_memory_bytes(self, model_name: str) -> int:
+        # Workers that have only just started have not mapped the weights yet, so the largest measurement is kept.
+        memory_bytes: int = max(self.pools[model_name].get_memory_bytes(), self._memory_bytes.get(model_name, 0))
+        self._memory_bytes[model_name] = memory_bytes
+
+        return memory_bytes
+
+    def _choose_evictions(self, model_name: str) -> List[str]:
+        # Called with the lock held; only chooses the models to evict, which are unloaded after it is released.
+        # A model that has never been loaded is estimated by its weights, which dominate its memory.
+        required_bytes = self._memory_bytes.get(model_name) or self._get_weights_size_bytes(model_name)
+        loaded_model_names = [
+            name
+            for name in self._recently_used
+            if name != model_name and name not in self._pending_model_names and self.pools[name].is_loaded()
+        ]
+        used_bytes = sum(self._measure_memory_bytes(name) for name in loaded_model_names)
+        evicted_model_names: List[str] = []
+
+        for name in loaded_model_names:
+            if used_bytes + required_bytes <= self.memory_budget_bytes:
+                break
+
+            # Models with requests in flight are skipped; the next least recently used one is evicted instead.
+            if self.pools[name].is_idle():
+                used_bytes -= self._memory_bytes[name]
+                evicted_model_names.append(name)
+
+        if used_bytes + required_bytes > self.memory_budget_bytes:
+            self.logger.warning(
+                f"Loading model {model_name} exceeds the memory budget: {used_bytes / _MB:.0f} MB in use, "
+                f"{required_bytes / _MB:.0f} MB required, {self.memory_budget_bytes / _MB:.0f} MB budget",
+            )
+
+        return evicted_model_names
+
+    def _evict(self, name: str, model_name: str) -> None:
+        # Stopping the workers of a model takes a while, so it is done without the lock.
+        if self.pools[name].unload_if_idle():
+            with self._lock:
+                self.evictions[name] += 1
+
+            self.logger.info(
+                f"Evicted model {name} ({self._memory_bytes[name] / _MB:.0f} MB) to load model {model_name}",
+            )
+
+        else:
+            self.logger.info(f"Model {name} received a request before it was evicted and stays loaded")
+
+    def get_pool(self, model_name: Optional[str] = None) -> SummarizationWorkerPool:
+        model_name = model_name or self.default_model_name
+        pool = self.pools.get(model_name)
+
+        if pool is None:
+            raise UnsupportedModelConfigurationError(model_name)
+
+        with self._lock:
+            self._recently_used.move_to_end(model_name)
+
+            # A model being loaded by a concurrent request counts as a single load; requests start its workers anyway.
+            if pool.is_loaded() or model_name in self._pending_model_names:
+                return pool
+
+            evicted_model_names = self._choose_evictions(model_name) if self.memory_budget_bytes > 0 else []
+            self._pending_model_names.update([model_name, *evicted_model_names])
+            self.loads[model_name] += 1
+
+        # Workers are stopped and started without the lock, so requests for loaded models are never held up by them.
+        try:
+            for name in evicted_model_names:
+                self._evict(name, model_name)
+
+            self.logger.info(f"Loading model {model_name}")
+            pool.load()
+
+        finally:
+            with self._lock:
+                self._pending_model_names.difference_update([model_name, *evicted_model_names])
+
+        return pool
+
+    def get_worker_statuses(self) -> List[WorkerStatus]:
+        return [
+            dataclasses.replace(worker_status, model_name=model_name)
+            for model_name, pool in self.pools.items()
+            for worker_status in pool.get_statuses()
+        ]
+
+    def _get_model_statuses(self, worker_statuses: List[WorkerStatus]) -> List[ModelStatus]:
+        model_statuses: List[ModelStatus] = []
+        memory_bytes: Dict[Optional[str], int] = {}
+
+        for worker_status in worker_statuses:
+            memory_bytes[worker_status.model_name] = memory_bytes.get(worker_status.model_name, 0) + (
+                worker_status.proportional_memory_bytes or 0
+            )
+
+        for model_name, pool in self.pools.items():
+            is_loaded = pool.is_loaded()
+            model_statuses.append(
+                ModelStatus(
+                    name=model_name,
+                    is_default=model_name == self.default_model_name,
+                    is_loaded=is_loaded,
+                    memory_bytes=memory_bytes.get(model_name, 0) if is_loaded else None,
+                    requests=pool.request_count,
+                    mean_latency_seconds=pool.total_latency / pool.request_count if pool.request_count else None,
+                    loads=self.loads[model_name],
+                    evictions=self.evictions[model_name],
+                    queue_depth=pool.get_queue_depth(),
+                    rejected_requests=pool.rejected_requests,
+                    cancelled_requests=pool.cancelled_requests,
+                    deadline_exceeded_requests=pool.deadline_exceeded_requests,
+                    mean_queue_wait_seconds={
+                        priority.value: histogram.sum / histogram.count if histogram.count else None
+                        for priority, histogram in pool.queue_wait_histograms.items()
+                    },
+                ),
+            )
+
+        return model_statuses
+
+    def get_statuses(self) -> Tuple[List[WorkerStatus], List[ModelStatus]]:
+        # Memory is read from /proc for every worker, so the memory of each model is summed from its worker statuses.
+        worker_statuses = self.get_worker_statuses()
+
+        return worker_statuses, self._get_model_statuses(worker_statuses)
+
+    def get_model_metrics(self) -> List[ModelMetrics]:
+        return [
+            ModelMetrics(
+                name=model_name,
+                queue_wait_seconds={
+                    priority.value: pool.queue_wait_histograms[priority].snapshot()
+                    for priority in SummarizationPriority
+                },
+                stage_seconds={
+                    "tokenize": pool.tokenize_histogram.snapshot(),
+                    **{
+                        stage: pool.get_generation_histogram(lambda histograms: histograms.stage_seconds[stage])
+                        for stage in GENERATION_STAGES
+                    },
+                },
+                input_tokens=pool.get_generation_histogram(lambda histograms: histograms.input_tokens),
+                output_tokens=pool.get_generation_histogram(lambda histograms: histograms.output_tokens),
+                tokens_per_second=pool.get_generation_histogram(lambda histograms: histograms.tokens_per_second),
+                time_to_first_token_seconds=pool.time_to_first_token_histogram.snapshot(),
+            )
+            for model_name, pool in self.pools.items()
+        ]
+
+    def stop(self) -> None:
+        for pool in self.pools.values():
+            pool.stop()
@@ -0,0 +1,713 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from core.logger.logger import Logger
+from core.metrics.histogram import LATENCY_BUCKETS, Histogram
+from core.metrics.request_timings import record_request_stage
+from data.workers.generation_metrics import GenerationHistograms
+from data.workers.seq2seq_summarization_worker import (
+    Seq2SeqSummarizationWorker,
+    SummarizationInput,
+)
+from domain.exceptions.deadline_exceeded_error import DeadlineExceededError
+from domain.exceptions.queue_full_error import QueueFullError
+from domain.models.histogram_snapshot import HistogramSnapshot
+from domain.models.summarization_priority import SummarizationPriority
+from domain.models.worker_status import WorkerStatus
+
+ResultType = TypeVar("ResultType")
+
+_SERVICE_TIME_SMOOTHING = 0.2
+
+
+# A request waiting in the pool for a worker; its future resolves to the index of the worker it was dispatched to.
+@dataclass(eq=False)
+class QueuedRequest:
+    size: int
+    priority: SummarizationPriority
+    enqueue_time: float
+    future: "concurrent.futures.Future[int]" = field(default_factory=concurrent.futures.Future)
+    queue_position: int = 0
+    dispatch_time: float = 0.0
+
+
+class SummarizationWorkerPool:
+    def __init__(
+        self,
+        workers: List[Seq2SeqSummarizationWorker],
+        idle_timeout: int,
+        logger: Logger,
+        keep_alive: bool = False,
+        max_queue_size: int = 0,
+        max_queue_wait: float = 0,
+        worker_capacity: int = 0,
+        bulk_max_wait: float = 0,
+    ) -> None:
+        self.workers = workers
+        self.idle_timeout = idle_timeout
+        self.logger = logger
+        self.keep_alive = keep_alive
+        self.max_queue_size = max_queue_size
+        self.max_queue_wait = max_queue_wait
+        self.worker_capacity = worker_capacity
+        self.bulk_max_wait = bulk_max_wait
+        # Outstanding requests are the leases of a worker: taken before texts are sent, returned after their reply.
+        # A lease counts the texts it carries, so a batch slice weighs as much as the requests it replaces.
+        self.outstanding_requests = [0] * len(workers)
+        self.last_access_times = [0.0] * len(workers)
+        # Time of the first reply of each worker process, before which requests also waited for the model to load.
+        self.ready_times: List[Optional[float]] = [None] * len(workers)
+        self.request_count = 0
+        self.total_latency = 0.0
+        self.rejected_requests = 0
+        self.cancelled_requests = 0
+        self.deadline_exceeded_requests = 0
+        # Requests beyond the capacity of the workers wait here instead of in the worker pipes, which are served in
+        # arrival order, so that interactive requests can be dispatched ahead of bulk ones.
+        self.queues: Dict[SummarizationPriority, Deque[QueuedRequest]] = {
+            priority: deque() for priority in SummarizationPriority
+        }
+        # Texts in each queue, kept up to date with the queues so that reading them never walks a queue in use.
+        self.queued_texts = dict.fromkeys(SummarizationPriority, 0)
+        self.queue_wait_histograms = {priority: Histogram(LATENCY_BUCKETS) for priority in SummarizationPriority}
+        # Measured in the API process, which tokenizes the texts of the model before they are queued.
+        self.tokenize_histogram = Histogram(LATENCY_BUCKETS)
+        self.time_to_first_token_histogram = Histogram(LATENCY_BUCKETS)
+        # Smoothed time a worker needs per text, including the share of batched generations, once known.
+        self.service_time: Optional[float] = None
+        # Idle workers being stopped outside the lock; nothing is dispatched to them until they have stopped.
+        self._stopping_workers: Set[int] = set()
+        # Held while a worker process starts or stops, which can take seconds, so the pool lock never is.
+        self._worker_locks = [threading.Lock() for _ in workers]
+        self._lock = threading.Lock()
+        self._reaper_condition = threading.Condition(self._lock)
+        self._reaper_thread: Optional[threading.Thread] = None
+        self._reaper_deadline: Optional[float] = None
+        self._reaper_stopped = False
+
+    def _lease(self, index: int, size: int = 1) -> None:
+        # Called with the lock held; a leased worker is never reaped, and it is started by the holder of the lease.
+        self.outstanding_requests[index] += size
+        self.last_access_times[index] = time.monotonic()
+
+    def _start_worker(self, index: int) -> None:
+        # Called without the pool lock by the holder of a lease, off the event loop, as a process is slow to start.
+        with self._worker_locks[index]:
+            if self.workers[index].is_alive():
+                return
+
+            self.logger.info(f"Starting summarization worker {index}")
+
+            with self._lock:
+                self.ready_times[index] = None
+
+            self.workers[index].start()
+
+    async def _start_worker_async(self, index: int) -> None:
+        if not self.workers[index].is_alive():
+            await asyncio.to_thread(self._start_worker, index)
+
+    def _find_worker(self, size: int) -> Optional[int]:
+        # Called with the lock held; if the least loaded worker has no room for the texts, no other worker has either.
+        indices = [index for index in range(len(self.workers)) if index not in self._stopping_workers]
+
+        if not indices:
+            return None
+
+        index = min(indices, key=lambda i: (self.outstanding_requests[i], not self.workers[i].is_alive(), i))
+        has_capacity = (
+            self.worker_capacity <= 0
+            or self.outstanding_requests[index] == 0
+            or self.outstanding_requests[index] + size <= self.worker_capacity
+        )
+
+        return index if has_capacity else None
+
+    def _get_next_queued_request(self, now: float) -> Optional[QueuedRequest]:
+        interactive_requests = self.queues[SummarizationPriority.INTERACTIVE]
+        bulk_requests = self.queues[SummarizationPriority.BULK]
+
+        # A bulk request that waited too long goes first, so a steady stream of interactive requests cannot starve it.
+        if bulk_requests and (
+            not interactive_requests
+            or (self.bulk_max_wait > 0 and now - bulk_requests[0].enqueue_time >= self.bulk_max_wait)
+        ):
+            return bulk_requests[0]
+
+        return interactive_requests[0] if interactive_requests else None
+
+    def _dispatch(self) -> None:
+        # Called with the lock held whenever a request is queued or a lease is returned.
+        now = time.perf_counter()
+
+        while (queued_request := self._get_next_queued_request(now)) is not None:
+            index = self._find_worker(queued_request.size)
+
+            # The head of the queue is never overtaken, so a large batch slice still gets an empty worker eventually.
+            if index is None:
+                return
+
+            self.queues[queued_request.priority].popleft()
+            self.queued_texts[queued_request.priority] -= queued_request.size
+
+            # Callers that stopped waiting have cancelled their future and are dropped.
+            if not queued_request.future.set_running_or_notify_cancel():
+                continue
+
+            self.queue_wait_histograms[queued_request.priority].observe(now - queued_request.enqueue_time)
+            queued_request.queue_position = self.outstanding_requests[index]
+            queued_request.dispatch_time = now
+            self._lease(index, queued_request.size)
+            queued_request.future.set_result(index)
+
+    def _stop_workers(self, indices: List[int]) -> None:
+        # Called without the pool lock for workers marked as stopping, so requests are released meanwhile.
+        try:
+            for index in indices:
+                with self._worker_locks[index]:
+                    self.workers[index].stop()
+
+        finally:
+            with self._lock:
+                self._stopping_workers.difference_update(indices)
+                # Requests that waited for these workers are dispatched to them again.
+                self._dispatch()
+
+    def get_queued_texts(self, priority: Optional[SummarizationPriority] = None) -> int:
+        return self.queued_texts[priority] if priority is not None else sum(self.queued_texts.values())
+
+    def get_queue_depth(self) -> int:
+        return sum(self.outstanding_requests) + self.get_queued_texts()
+
+    def _admit(self, size: int, priority: SummarizationPriority) -> None:
+        # Called with the lock held; a rejected request never reaches a worker, so it costs no generation time.
+        queue_depth = self.get_queue_depth()
+        # Interactive requests only wait for the interactive requests queued ahead of them.
+        queued_texts_ahead = self.get_queued_texts(
+            SummarizationPriority.INTERACTIVE if priority == SummarizationPriority.INTERACTIVE else None,
+        )
+        estimated_wait = (min(self.outstanding_requests) + queued_texts_ahead / len(self.workers)) * (
+            self.service_time or 0.0
+        )
+        # An empty queue always admits, so a batch larger than the queue can still run on its own.
+        is_full = self.max_queue_size > 0 and queue_depth > 0 and queue_depth + size > self.max_queue_size
+        is_too_slow = self.max_queue_wait > 0 and estimated_wait > self.max_queue_wait
+
+        if is_full or is_too_slow:
+            self.rejected_requests += 1
+
+            raise QueueFullError(queue_depth, max(math.ceil(estimated_wait), 1))
+
+    def _enqueue(self, sizes: List[int], priority: SummarizationPriority) -> List[QueuedRequest]:
+        with self._lock:
+            # The slices of a batch are admitted together, so a batch is never rejected halfway.
+            self._admit(sum(sizes), priority)
+            now = time.perf_counter()
+            queued_requests = [QueuedRequest(size=size, priority=priority, enqueue_time=now) for size in sizes]
+            self.queues[priority].extend(queued_requests)
+            self.queued_texts[priority] += sum(sizes)
+            self._dispatch()
+
+        return queued_requests
+
+    def _reap_idle_workers(self, now: float) -> Tuple[List[int], Optional[float]]:
+        # Called with the lock held; marks the idle workers as stopping and returns them, to be stopped after the lock
+        # is released, together with when the next running worker without leases becomes idle, if any.
+        idle_indices: List[int] = []
+        next_deadline: Optional[float] = None
+
+        for index, worker in enumerate(self.workers):
+            if self.outstanding_requests[index] > 0 or index in self._stopping_workers or not worker.is_alive():
+                continue
+
+            deadline = self.last_access_times[index] + self.idle_timeout
+
+            if deadline <= now:
+                self._stopping_workers.add(index)
+                idle_indices.append(index)
+            elif next_deadline is None or deadline < next_deadline:
+                next_deadline = deadline
+
+        return idle_indices, next_deadline
+
+    def _run_reaper(self) -> None:
+        while True:
+            with self._reaper_condition:
+                if self._reaper_stopped:
+                    return
+
+                now = time.monotonic()
+                idle_indices, self._reaper_deadline = self._reap_idle_workers(now)
+
+                if not idle_indices:
+                    self.logger.debug(f"Summarization worker reaper next deadline: {self._reaper_deadline}")
+                    self._reaper_condition.wait(
+                        self._reaper_deadline - now if self._reaper_deadline is not None else None,
+                    )
+                    continue
+
+            self._stop_workers(idle_indices)
+
+            for index in idle_indices:
+                self.logger.info(f"Summarization worker {index} stopped due to idle timeout")
+
+    def _release(
+        self,
+        index: int,
+        start_time: Optional[float] = None,
+        size: int = 1,
+        queue_position: int = 0,
+        dispatch_time: Optional[float] = None,
+    ) -> None:
+        with self._lock:
+            self.outstanding_requests[index] -= size
+            self.last_access_times[index] = time.monotonic()
+            self._dispatch()
+
+            now = time.perf_counter()
+            ready_time = self.ready_times[index]
+            # The time spent queued in the pool is part of the latency but not of the service time.
+            dispatch_time = dispatch_time if dispatch_time is not None else start_time
+
+            # Warm-up requests and unused leases are released without a start time, so they neither skew the latency
+            # nor mark a worker as ready that may not have replied yet.
+            if start_time is not None:
+                self.request_count += 1
+                self.total_latency += now - start_time
+
+                if ready_time is None:
+                    self.ready_times[index] = now
+
+            if dispatch_time is not None and ready_time is not None and dispatch_time >= ready_time:
+                # The texts queued ahead were served within the same latency, so the time per text stays comparable
+                # whether the worker ran them one by one or batched them.
+                service_time = (now - dispatch_time) / (queue_position + size)
+                self.service_time = (
+                    service_time
+                    if self.service_time is None
+                    else self.service_time + _SERVICE_TIME_SMOOTHING * (service_time - self.service_time)
+                )
+
+            # Preloaded workers stay resident, so an idle period never brings back a cold first request.
+            if self.keep_alive:
+                return
+
+            if self._reaper_thread is None or not self._reaper_thread.is_alive():
+                self._reaper_stopped = False
+                self._reaper_thread = threading.Thread(
+                    target=self._run_reaper,
+                    name="summarization-worker-reaper",
+                    daemon=True,
+                )
+                self._reaper_thread.start()
+
+            # A pending deadline can only move later, so the reaper is woken up only when it has none.
+            elif self._reaper_deadline is None:
+                self._reaper_condition.notify()
+
+    def _cancel(self, queued_request: QueuedRequest) -> None:
+        with self._lock:
+            if queued_request.future.cancel():
+                if queued_request in self.queues[queued_request.priority]:
+                    self.queues[queued_request.priority].remove(queued_request)
+                    self.queued_texts[queued_request.priority] -= queued_request.size
+
+                return
+
+        # The request was dispatched before its caller stopped waiting, so its lease is returned unused.
+        if queued_request.future.exception() is None:
+            self._release(queued_request.future.result(), size=queued_request.size)
+
+    def _cancel_enqueued(self, enqueue: "asyncio.Future[List[QueuedRequest]]") -> None:
+        if enqueue.cancelled() or enqueue.exception() is not None:
+            return
+
+        for queued_request in enqueue.result():
+            self._cancel(queued_request)
+
+    async def _enqueue_async(self, sizes: List[int], priority: SummarizationPriority) -> List[QueuedRequest]:
+        # Dispatching may start a worker process or wait for an idle worker to be stopped.
+        enqueue = asyncio.ensure_future(asyncio.to_thread(self._enqueue, sizes, priority))
+
+        try:
+            return await asyncio.shield(enqueue)
+
+        except asyncio.CancelledError:
+            # The thread queues the requests anyway, so they give back their places or leases once it is done.
+            enqueue.add_done_callback(self._cancel_enqueued)
+            raise
+
+    @contextlib.asynccontextmanager
+    async def _cancellable(self, deadline: Optional[float]) -> AsyncIterator[None]:
+        # Leaving the block early returns the place or lease of the request and stops its generation in the worker.
+        # Deadlines are monotonic times, which is also the clock of the event loop.
+        timeout = asyncio.timeout_at(deadline)
+
+        try:
+            async with timeout:
+                yield
+
+        except TimeoutError as e:
+            if not timeout.expired():
+                raise
+
+            with self._lock:
+                self.deadline_exceeded_requests += 1
+
+            raise DeadlineExceededError() from e
+
+        except asyncio.CancelledError:
+            with self._lock:
+                self.cancelled_requests += 1
+
+            raise
+
+    def observe_tokenize(self, seconds: float, text_count: int = 1) -> None:
+        # Texts tokenized together share the duration of their call, as texts generated together share theirs.
+        with self._lock:
+            for _ in range(text_count):
+                self.tokenize_histogram.observe(seconds)
+
+    def observe_time_to_first_token(self, seconds: float) -> None:
+        with self._lock:
+            self.time_to_first_token_histogram.observe(seconds)
+
+    def record_deadline_exceeded(self) -> None:
+        # For requests that stopped waiting for work shared with other requests, which itself runs without a deadline.
+        with self._lock:
+            self.deadline_exceeded_requests += 1
+
+    async def _wait_async(self, queued_request: QueuedRequest) -> int:
+        try:
+            return await asyncio.wrap_future(queued_request.future)
+
+        except asyncio.CancelledError:
+            self._cancel(queued_request)
+            raise
+
+    def summarize(
+        self,
+        summarization_input: SummarizationInput,
+        generation_parameters: Dict[str, Any],
+        priority: SummarizationPriority = SummarizationPriority.INTERACTIVE,
+    ) -> str:
+        start_time = time.perf_counter()
+        (queued_request,) = self._enqueue([1], priority)
+        index = queued_request.future.result()
+
+        try:
+            self._start_worker(index)
+            self.logger.debug(f"Summarization dispatched to worker {index}")
+
+            summary: str = self.workers[index].summarize(summarization_input, generation_parameters)
+
+            return summary
+
+        finally:
+            self._release(
+                index,
+                start_time,
+                queue_position=queued_request.queue_position,
+                dispatch_time=queued_request.dispatch_time,
+            )
+
+    async def _run_async(
+        self,
+        operation: Callable[[Seq2SeqSummarizationWorker], Awaitable[ResultType]],
+        queued_request: QueuedRequest,
+        start_time: float,
+    ) -> ResultType:
+        index = await self._wait_async(queued_request)
+        record_request_stage("queue", queued_request.dispatch_time - queued_request.enqueue_time)
+
+        try:
+            await self._start_worker_async(index)
+            self.logger.debug(f"Request dispatched to worker {index}")
+
+            return await operation(self.workers[index])
+
+        finally:
+            self._release(
+                index,
+                start_time,
+                queued_request.size,
+                queued_request.queue_position,
+                queued_request.dispatch_time,
+            )
+
+    async def summarize_async(
+        self,
+        summarization_input: SummarizationInput,
+        generation_parameters: Dict[str, Any],
+        priority: SummarizationPriority = SummarizationPriority.INTERACTIVE,
+        deadline: Optional[float] = None,
+    ) -> str:
+        start_time = time.perf_counter()
+
+        async with self._cancellable(deadline):
+            (queued_request,) = await self._enqueue_async([1], priority)
+            summary: str = await self._run_async(
+                lambda worker: worker.summarize_async(summarization_input, generation_parameters),
+                queued_request,
+                start_time,
+            )
+
+        return summary
+
+    async def _summarize_batch_slice(
+        self,
+        summarization_inputs: List[SummarizationInput],
+        generation_parameters: List[Dict[str, Any]],
+        worker: Seq2SeqSummarizationWorker,
+    ) -> List[Union[str, Exception]]:
+        results: List[Union[str, Exception]] = await worker.summarize_batch_async(
+            summarization_inputs, generation_parameters
+        )
+
+        return results
+
+    async def summarize_batch_async(
+        self,
+        summarization_inputs: List[SummarizationInput],
+        generation_parameters: List[Dict[str, Any]],
+        priority: SummarizationPriority = SummarizationPriority.INTERACTIVE,
+        deadline: Optional[float] = None,
+    ) -> List[Union[str, Exception]]:
+        # One contiguous slice per worker keeps every worker busy while each slice still runs as tensor batches.
+        slice_size = max(math.ceil(len(summarization_inputs) / len(self.workers)), 1)
+
+        # Slices never exceed the capacity of a worker, so other requests can be dispatched between them.
+        if self.worker_capacity > 0:
+            slice_size = min(slice_size, self.worker_capacity)
+
+        slices: List[range] = []
+
+        for start in range(0, len(summarization_inputs), slice_size):
+            end = min(start + slice_size, len(summarization_inputs))
+            slices.append(range(start, end))
+
+        start_time = time.perf_counter()
+
+        async with self._cancellable(deadline):
+            queued_requests = await self._enqueue_async([len(indices) for indices in slices], priority)
+            slice_results = await asyncio.gather(
+                *(
+                    self._run_async(
+                        functools.partial(
+                            self._summarize_batch_slice,
+                            [summarization_inputs[index] for index in indices],
+                            [generation_parameters[index] for index in indices],
+                        ),
+                        queued_request,
+                        start_time,
+                    )
+                    for indices, queued_request in zip(slices, queued_requests)
+                ),
+                return_exceptions=True,
+            )
+
+        results: List[Union[str, Exception]] = []
+
+        for indices, slice_result in zip(slices, slice_results):
+            if isinstance(slice_result, Exception):
+                # The whole slice failed (e.g. its worker died), so every item in it reports that error.
+                results.extend([slice_result] * len(indices))
+            elif isinstance(slice_result, BaseException):
+                raise slice_result
+            else:
+                results.extend(slice_result)
+
+        return results
+
+    async def summarize_stream_async(
+        self,
+        summarization_input: SummarizationInput,
+        generation_parameters: Dict[str, Any],
+        priority: SummarizationPriority = SummarizationPriority.INTERACTIVE,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        start_time = time.perf_counter()
+
+        async with self._cancellable(deadline):
+            (queued_request,) = await self._enqueue_async([1], priority)
+            index = await self._wait_async(queued_request)
+
+        record_request_stage("queue", queued_request.dispatch_time - queued_request.enqueue_time)
+        partial_summaries = self.workers[index].summarize_stream_async(summarization_input, generation_parameters)
+
+        try:
+            await self._start_worker_async(index)
+            self.logger.debug(f"Streaming summarization dispatched to worker {index}")
+
+            while True:
+                # A timeout cannot span the yields of a generator, so the deadline applies to each wait for the worker.
+                async with self._cancellable(deadline):
+                    partial_summary = await anext(partial_summaries, None)
+
+                if partial_summary is None:
+                    break
+
+                yield partial_summary
+
+        except GeneratorExit:
+            with self._lock:
+                self.cancelled_requests += 1
+
+            raise
+
+        finally:
+            await partial_summaries.aclose()
+            # Also runs when the consumer stops iterating early, so the worker is never leaked as busy.
+            self._release(
+                index,
+                start_time,
+                queue_position=queued_request.queue_position,
+                dispatch_time=queued_request.dispatch_time,
+            )
+
+    async def _warm_up_worker_async(
+        self,
+        index: int,
+        summarization_inputs: List[SummarizationInput],
+        generation_parameters: Dict[str, Any],
+    ) -> None:
+        with self._lock:
+            self._lease(index)
+
+        try:
+            await self._start_worker_async(index)
+            durations: List[float] = []
+
+            for summarization_input in summarization_inputs:
+                start_time = time.perf_counter()
+                await self.workers[index].summarize_async(summarization_input, generation_parameters)
+                durations.append(time.perf_counter() - start_time)
+
+            # The first generation of a fresh process also pays for loading the model.
+            start_time = time.perf_counter()
+            await self.workers[index].summarize_async(summarization_inputs[0], generation_parameters)
+            warm_duration = time.perf_counter() - start_time
+
+        finally:
+            self._release(index)
+
+        self.logger.info(
+            f"Summarization worker {index} warmed up in {sum(durations):.2f}s: "
+            f"cold first request {durations[0]:.2f}s, warm {warm_duration:.2f}s",
+        )
+
+    async def warm_up_async(
+        self,
+        summarization_inputs: List[SummarizationInput],
+        generation_parameters: Dict[str, Any],
+    ) -> None:
+        # Every worker is warmed up, not just the least loaded one, so none of them serves a cold request later.
+        await asyncio.gather(
+            *(
+                self._warm_up_worker_async(index, summarization_inputs, generation_parameters)
+                for index in range(len(self.workers))
+            ),
+        )
+
+    def is_loaded(self) -> bool:
+        return any(worker.is_alive() for worker in self.workers)
+
+    def load(self) -> None:
+        with self._lock:
+            if any(worker.is_alive() for worker in self.workers):
+                return
+
+            # Counts as an access, so the reaper does not stop the worker before its first request.
+            self.last_access_times[0] = time.monotonic()
+
+        self._start_worker(0)
+
+    def is_idle(self) -> bool:
+        return not any(self.outstanding_requests) and not self.get_queued_texts()
+
+    def unload_if_idle(self) -> bool:
+        with self._lock:
+            if not self.is_idle():
+                return False
+
+            # Requests that arrive meanwhile wait in the queue and start the workers again once they have stopped.
+            indices = [index for index in range(len(self.workers)) if index not in self._stopping_workers]
+            self._stopping_workers.update(indices)
+
+        self._stop_workers(indices)
+
+        return True
+
+    def get_memory_bytes(self) -> int:
+        memory_bytes = 0
+
+        # Proportional memory splits pages shared between processes, such as mapped weights, so they count once.
+        for worker in self.workers:
+            memory_usage = worker.get_memory_usage()
+
+            if memory_usage is not None:
+                memory_bytes += memory_usage.proportional_bytes
+
+        return memory_bytes
+
+    def get_generation_histogram(self, select: Callable[[GenerationHistograms], Histogram]) -> HistogramSnapshot:
+        # Every worker records the metrics of its own replies, so those of the model are merged when they are read.
+        histograms = [select(worker.generation_histograms) for worker in self.workers]
+
+        return Histogram.merge(histograms[0].bucket_bounds, histograms)
+
+    def get_statuses(self) -> List[WorkerStatus]:
+        statuses: List[WorkerStatus] = []
+
+        for index, worker in enumerate(self.workers):
+            memory_usage = worker.get_memory_usage()
+            statuses.append(
+                WorkerStatus(
+                    index=index,
+                    pid=worker.get_pid(),
+                    is_alive=worker.is_alive(),
+                    is_busy=self.outstanding_requests[index] > 0 or worker.is_processing(),
+                    queue_depth=self.outstanding_requests[index],
+                    resident_memory_bytes=memory_usage.resident_bytes if memory_usage else None,
+                    proportional_memory_bytes=memory_usage.proportional_bytes if memory_usage else None,
+                    unique_memory_bytes=memory_usage.unique_bytes if memory_usage else None,
+                    restarts=worker.restarts,
+                    load_seconds=worker.get_load_seconds(),
+                ),
+            )
+
+        return statuses
+
+    def stop(self) -> None:
+        with self._reaper_condition:
+            self._reaper_stopped = True
+            self._reaper_condition.notify()
+
+        for index, worker in enumerate(self.workers):
+            with self._worker_locks[index]:
+                worker.stop()
+
+        if self._reaper_thread is not None:
+            self._reaper_thread.join(timeout=1)
+            self._reaper_thread = None
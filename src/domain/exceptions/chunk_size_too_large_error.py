@@ -0,0 +1,3 @@
+class ChunkSizeTooLargeError(ValueError):
+    def __init__(self, chunk_size: int, max_chunk_size: int) -> None:
+        super().__init__(f"chunk_size {chunk_size} exceeds the model input window of {max_chunk_size} tokens")
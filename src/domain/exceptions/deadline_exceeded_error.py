@@ -0,0 +1,3 @@
+class DeadlineExceededError(RuntimeError):
+    def __init__(self) -> None:
+        super().__init__("Summarization request exceeded its deadline")
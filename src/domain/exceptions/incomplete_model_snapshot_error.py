@@ -0,0 +1,3 @@
+class IncompleteModelSnapshotError(ValueError):
+    def __init__(self, snapshot_path: str) -> None:
+        super().__init__(f"Model snapshot in {snapshot_path} is missing weights")
@@ -0,0 +1,3 @@
+class InvalidChunkOverlapError(ValueError):
+    def __init__(self) -> None:
+        super().__init__("chunk_overlap must be smaller than chunk_size")
@@ -0,0 +1,3 @@
+class ModelSnapshotNotFoundError(FileNotFoundError):
+    def __init__(self, snapshot_path: str) -> None:
+        super().__init__(f"No safetensors files in {snapshot_path}")
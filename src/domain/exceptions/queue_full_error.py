@@ -0,0 +1,5 @@
+class QueueFullError(RuntimeError):
+    def __init__(self, queue_depth: int, retry_after: int) -> None:
+        super().__init__(f"Summarization queue is full with {queue_depth} queued texts, retry after {retry_after}s")
+        self.queue_depth = queue_depth
+        self.retry_after = retry_after
@@ -0,0 +1,10 @@
+from typing import Any, Tuple
+
+
+class RequestCancelledError(RuntimeError):
+    def __init__(self) -> None:
+        super().__init__("Summarization request was cancelled")
+
+    # Replied by worker processes, so it is unpickled without the message that its constructor adds.
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), ()
@@ -0,0 +1,3 @@
+class SharedMemoryRingClosedError(ValueError):
+    def __init__(self) -> None:
+        super().__init__("Shared memory ring is closed")
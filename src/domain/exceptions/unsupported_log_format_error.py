@@ -0,0 +1,3 @@
+class UnsupportedLogFormatError(ValueError):
+    def __init__(self, log_format: str) -> None:
+        super().__init__(f"Unsupported log format: {log_format}")
@@ -0,0 +1,3 @@
+class UnsupportedQuantizationError(ValueError):
+    def __init__(self, quantization: str, device: str) -> None:
+        super().__init__(f"Unsupported model quantization: {quantization} on device {device}")
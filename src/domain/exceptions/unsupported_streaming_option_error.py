@@ -0,0 +1,8 @@
+from typing import Any
+
+
+class UnsupportedStreamingOptionError(ValueError):
+    def __init__(self, option: str, value: Any = None) -> None:
+        super().__init__(
+            f"Streaming summarization does not support {option}" + (f" = {value}" if value is not None else ""),
+        )
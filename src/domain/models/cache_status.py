@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class CacheStatus:
+    entries: int
+    size_bytes: int
+    max_size_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
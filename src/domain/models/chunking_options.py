@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ChunkingOptions:
+    chunk_size: int
+    chunk_overlap: int
+    max_reduce_depth: int
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class HistogramSnapshot:
+    # Upper bounds of the buckets, without the implicit +Inf bucket.
+    bucket_bounds: List[float]
+    # Cumulative observation counts, one per bound plus the +Inf bucket, whose count equals the total count.
+    bucket_counts: List[int]
+    sum: float
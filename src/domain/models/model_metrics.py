@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Dict
+
+from domain.models.histogram_snapshot import HistogramSnapshot
+
+
+@dataclass
+class ModelMetrics:
+    name: str
+    # Keyed by priority class.
+    queue_wait_seconds: Dict[str, HistogramSnapshot]
+    # Keyed by generation stage: tokenize in the API process, then prepare, generate and decode in the workers.
+    stage_seconds: Dict[str, HistogramSnapshot]
+    input_tokens: HistogramSnapshot
+    output_tokens: HistogramSnapshot
+    tokens_per_second: HistogramSnapshot
+    # Of streamed summaries, from the start of the summarization until the first partial summary.
+    time_to_first_token_seconds: HistogramSnapshot
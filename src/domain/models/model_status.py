@@ -0,0 +1,19 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class ModelStatus:
+    name: str
+    is_default: bool
+    is_loaded: bool
+    memory_bytes: Optional[int]
+    requests: int
+    mean_latency_seconds: Optional[float]
+    loads: int
+    evictions: int
+    queue_depth: int = 0
+    rejected_requests: int = 0
+    cancelled_requests: int = 0
+    deadline_exceeded_requests: int = 0
+    mean_queue_wait_seconds: Dict[str, Optional[float]] = field(default_factory=dict)
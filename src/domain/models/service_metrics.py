@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import List
+
+from domain.models.model_metrics import ModelMetrics
+from domain.models.service_status import ServiceStatus
+
+
+@dataclass
+class ServiceMetrics:
+    status: ServiceStatus
+    models: List[ModelMetrics]
@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from domain.models.cache_status import CacheStatus
+from domain.models.model_status import ModelStatus
+from domain.models.worker_status import WorkerStatus
+
+
+@dataclass
+class ServiceStatus:
+    workers: List[WorkerStatus]
+    cache: Optional[CacheStatus]
+    coalesced_requests: int
+    models: List[ModelStatus] = field(default_factory=list)
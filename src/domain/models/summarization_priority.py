@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class SummarizationPriority(str, Enum):
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
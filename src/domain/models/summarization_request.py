@@ -0,0 +1,17 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from domain.models.chunking_options import ChunkingOptions
+from domain.models.summarization_priority import SummarizationPriority
+
+
+@dataclass
+class SummarizationRequest:
+    text_to_summarize: str
+    generation_parameters: Dict[str, Any] = field(default_factory=dict)
+    chunking_options: Optional[ChunkingOptions] = None
+    bypass_cache: bool = False
+    model_name: Optional[str] = None
+    priority: SummarizationPriority = SummarizationPriority.INTERACTIVE
+    # Monotonic time after which the summary is no longer needed.
+    deadline: Optional[float] = None
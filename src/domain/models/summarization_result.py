@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class SummarizationResult:
+    summary: Optional[str] = None
+    error: Optional[Exception] = None
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class SummaryStreamEvent:
+    text: str
+    is_final: bool = False
+    time_to_first_token: Optional[float] = None
+    total_time: Optional[float] = None
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class TokenizationResult:
+    token_count: int
+    max_input_tokens: int
+    is_truncated: bool
+    chunk_count: Optional[int] = None
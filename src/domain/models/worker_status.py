@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class WorkerStatus:
+    index: int
+    pid: Optional[int]
+    is_alive: bool
+    is_busy: bool
+    queue_depth: int
+    resident_memory_bytes: Optional[int] = None
+    proportional_memory_bytes: Optional[int] = None
+    unique_memory_bytes: Optional[int] = None
+    model_name: Optional[str] = None
+    restarts: int = 0
+    load_seconds: Optional[float] = None
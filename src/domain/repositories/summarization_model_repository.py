@@ -1,5 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from domain.models.cache_status import CacheStatus
+from domain.models.model_metrics import ModelMetrics
+from domain.models.model_status import ModelStatus
+from domain.models.summarization_priority import SummarizationPriority
+from domain.models.worker_status import WorkerStatus
 
 
 class SummarizationModelRepository(ABC):
@@ -8,5 +14,96 @@ class SummarizationModelRepository(ABC):
         self,
         text_to_summarize: str,
         generation_parameters: Dict[str, Any],
+        bypass_cache: bool = False,
+        model_name: Optional[str] = None,
+        priority: SummarizationPriority = SummarizationPriority.INTERACTIVE,
     ) -> str:
         pass
+
+    @abstractmethod
+    async def summarize_async(
+        self,
+        text_to_summarize: str,
+        generation_parameters: Dict[str, Any],
+        bypass_cache: bool = False,
+        model_name: Optional[str] = None,
+        priority: SummarizationPriority = SummarizationPriority.INTERACTIVE,
+        deadline: Optional[float] = None,
+    ) -> str:
+        pass
+
+    @abstractmethod
+    async def summarize_batch_async(
+        self,
+        texts_to_summarize: List[str],
+        generation_parameters: List[Dict[str, Any]],
+        bypass_cache: Optional[List[bool]] = None,
+        model_name: Optional[str] = None,
+        priority: SummarizationPriority = SummarizationPriority.INTERACTIVE,
+        deadline: Optional[float] = None,
+    ) -> List[Union[str, Exception]]:
+        pass
+
+    @abstractmethod
+    def summarize_stream_async(
+        self,
+        text_to_summarize: str,
+        generation_parameters: Dict[str, Any],
+        model_name: Optional[str] = None,
+        priority: SummarizationPriority = SummarizationPriority.INTERACTIVE,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        pass
+
+    @abstractmethod
+    async def split_text_async(
+        self,
+        text: str,
+        chunk_size: int,
+        chunk_overlap: int,
+        model_name: Optional[str] = None,
+    ) -> List[str]:
+        pass
+
+    @abstractmethod
+    async def count_tokens_async(
+        self,
+        text: str,
+        model_name: Optional[str] = None,
+    ) -> int:
+        pass
+
+    @abstractmethod
+    def get_max_input_tokens(
+        self,
+        model_name: Optional[str] = None,
+    ) -> int:
+        pass
+
+    @abstractmethod
+    async def preload_async(self) -> None:
+        pass
+
+    @abstractmethod
+    async def stop_async(self) -> None:
+        pass
+
+    @abstractmethod
+    def is_ready(self) -> bool:
+        pass
+
+    @abstractmethod
+    async def get_statuses_async(self) -> Tuple[List[WorkerStatus], List[ModelStatus]]:
+        pass
+
+    @abstractmethod
+    def get_models_metrics(self) -> List[ModelMetrics]:
+        pass
+
+    @abstractmethod
+    def get_cache_status(self) -> Optional[CacheStatus]:
+        pass
+
+    @abstractmethod
+    def get_coalesced_requests_count(self) -> int:
+        pass
@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from array import array
+from typing import List, Optional
+
+
+class SummarizationTokenizerRepository(ABC):
+    @abstractmethod
+    def tokenize(
+        self,
+        text: str,
+        model_name: Optional[str] = None,
+    ) -> "array[int]":
+        pass
+
+    @abstractmethod
+    def tokenize_batch(
+        self,
+        texts: List[str],
+        model_name: Optional[str] = None,
+    ) -> List["array[int]"]:
+        pass
+
+    @abstractmethod
+    def count_tokens(
+        self,
+        text: str,
+        model_name: Optional[str] = None,
+    ) -> int:
+        pass
+
+    @abstractmethod
+    def split_text(
+        self,
+        text: str,
+        chunk_size: int,
+        chunk_overlap: int,
+        model_name: Optional[str] = None,
+    ) -> List[str]:
+        pass
+
+    @abstractmethod
+    def get_max_input_tokens(
+        self,
+        model_name: Optional[str] = None,
+    ) -> int:
+        pass
@@ -1,4 +1,5 @@
-from typing import Annotated, Any, Dict
+import asyncio
+from typing import Annotated, Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 from fastapi import Depends
 
@@ -7,6 +8,15 @@ from core.logger.logger import Logger
 from data.repositories.summarization_model_repository_impl import (
     SummarizationModelRepositoryImpl,
 )
+from domain.models.cache_status import CacheStatus
+from domain.models.chunking_options import ChunkingOptions
+from domain.models.model_metrics import ModelMetrics
+from domain.models.model_status import ModelStatus
+from domain.models.summarization_priority import SummarizationPriority
+from domain.models.summarization_request import SummarizationRequest
+from domain.models.summarization_result import SummarizationResult
+from domain.models.tokenization_result import TokenizationResult
+from domain.models.worker_status import WorkerStatus
 from domain.repositories.summarization_model_repository import (
     SummarizationModelRepository,
 )
@@ -26,18 +36,266 @@ class SummarizationService:
         self.summarization_model_repository = summarization_model_repository
         self.logger = logger
 
-    def summarize_text(
+    async def _summarize_long_text(
         self,
         text_to_summarize: str,
         generation_parameters: Dict[str, Any],
+        chunking_options: ChunkingOptions,
+        bypass_cache: bool = False,
+        model_name: Optional[str] = None,
+        priority: SummarizationPriority = SummarizationPriority.INTERACTIVE,
+        deadline: Optional[float] = None,
+        depth: int = 0,
     ) -> str:
-        self.logger.debug("Starting summarization of text")
-
-        summary: str = self.summarization_model_repository.summarize(
+        chunks: List[str] = await self.summarization_model_repository.split_text_async(
             text_to_summarize,
+            chunking_options.chunk_size,
+            chunking_options.chunk_overlap,
+            model_name,
+        )
+
+        if len(chunks) == 1 or depth >= chunking_options.max_reduce_depth:
+            # Either the text fits the model window or the reduce budget is spent and the model truncates the rest.
+            summary: str = await self.summarization_model_repository.summarize_async(
+                text_to_summarize,
+                generation_parameters,
+                bypass_cache,
+                model_name,
+                priority,
+                deadline,
+            )
+
+            return summary
+
+        self.logger.debug(f"Summarizing {len(chunks)} chunks at reduce depth {depth}")
+
+        # The chunks are admitted to the queue together, so a document is never rejected for its own chunks, and
+        # waiting for all of them leaves no chunk running once the document has failed.
+        chunk_summaries = await self.summarization_model_repository.summarize_batch_async(
+            chunks,
+            [generation_parameters] * len(chunks),
+            [bypass_cache] * len(chunks),
+            model_name,
+            priority,
+            deadline,
+        )
+
+        for chunk_summary in chunk_summaries:
+            if isinstance(chunk_summary, Exception):
+                raise chunk_summary
+
+        return await self._summarize_long_text(
+            " ".join(chunk_summaries),
             generation_parameters,
+            chunking_options,
+            bypass_cache,
+            model_name,
+            priority,
+            deadline,
+            depth + 1,
         )
 
+    async def summarize_text(
+        self,
+        text_to_summarize: str,
+        generation_parameters: Dict[str, Any],
+        chunking_options: Optional[ChunkingOptions] = None,
+        bypass_cache: bool = False,
+        model_name: Optional[str] = None,
+        priority: SummarizationPriority = SummarizationPriority.INTERACTIVE,
+        deadline: Optional[float] = None,
+    ) -> str:
+        self.logger.debug("Starting summarization of text")
+
+        if chunking_options is None:
+            summary: str = await self.summarization_model_repository.summarize_async(
+                text_to_summarize,
+                generation_parameters,
+                bypass_cache,
+                model_name,
+                priority,
+                deadline,
+            )
+        else:
+            summary = await self._summarize_long_text(
+                text_to_summarize,
+                generation_parameters,
+                chunking_options,
+                bypass_cache,
+                model_name,
+                priority,
+                deadline,
+            )
+
         self.logger.debug("Completed summarization of text")
 
         return summary
+
+    async def _summarize_batch(
+        self,
+        requests: List[SummarizationRequest],
+    ) -> List[Union[str, Exception]]:
+        if not requests:
+            return []
+
+        model_name = requests[0].model_name
+        priority = requests[0].priority
+        deadline = requests[0].deadline
+
+        try:
+            results: List[Union[str, Exception]] = await self.summarization_model_repository.summarize_batch_async(
+                [request.text_to_summarize for request in requests],
+                [request.generation_parameters for request in requests],
+                [request.bypass_cache for request in requests],
+                model_name,
+                priority,
+                deadline,
+            )
+
+        except Exception as e:
+            results = [e] * len(requests)
+
+        return results
+
+    async def _summarize_long_text_or_error(
+        self,
+        request: SummarizationRequest,
+        chunking_options: ChunkingOptions,
+    ) -> Union[str, Exception]:
+        try:
+            return await self._summarize_long_text(
+                request.text_to_summarize,
+                request.generation_parameters,
+                chunking_options,
+                request.bypass_cache,
+                request.model_name,
+                request.priority,
+                request.deadline,
+            )
+
+        except Exception as e:
+            return e
+
+    async def summarize_texts(
+        self,
+        requests: List[SummarizationRequest],
+    ) -> List[SummarizationResult]:
+        self.logger.debug(f"Starting summarization of {len(requests)} texts")
+
+        # Plain texts go to the workers as one batch per model, priority and deadline; long documents need their own
+        # map-reduce round trips.
+        batch_indices: Dict[Tuple[Optional[str], SummarizationPriority, Optional[float]], List[int]] = {}
+        long_text_indices = [index for index, request in enumerate(requests) if request.chunking_options is not None]
+
+        for index, request in enumerate(requests):
+            if request.chunking_options is None:
+                batch_indices.setdefault((request.model_name, request.priority, request.deadline), []).append(index)
+
+        batch_results, long_text_results = await asyncio.gather(
+            asyncio.gather(
+                *(self._summarize_batch([requests[index] for index in indices]) for indices in batch_indices.values()),
+            ),
+            asyncio.gather(
+                *(
+                    self._summarize_long_text_or_error(request, request.chunking_options)
+                    for request in requests
+                    if request.chunking_options is not None
+                ),
+            ),
+        )
+
+        results: List[Union[str, Exception]] = [""] * len(requests)
+
+        for index, result in zip(
+            [index for indices in batch_indices.values() for index in indices] + long_text_indices,
+            [result for model_results in batch_results for result in model_results] + list(long_text_results),
+        ):
+            results[index] = result
+
+        self.logger.debug(f"Completed summarization of {len(requests)} texts")
+
+        return [
+            SummarizationResult(error=result) if isinstance(result, Exception) else SummarizationResult(summary=result)
+            for result in results
+        ]
+
+    async def summarize_text_stream(
+        self,
+        text_to_summarize: str,
+        generation_parameters: Dict[str, Any],
+        model_name: Optional[str] = None,
+        priority: SummarizationPriority = SummarizationPriority.INTERACTIVE,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        self.logger.debug("Starting streaming summarization of text")
+
+        async for partial_summary in self.summarization_model_repository.summarize_stream_async(
+            text_to_summarize,
+            generation_parameters,
+            model_name,
+            priority,
+            deadline,
+        ):
+            yield partial_summary
+
+        self.logger.debug("Completed streaming summarization of text")
+
+    async def tokenize_text(
+        self,
+        text_to_summarize: str,
+        chunking_options: Optional[ChunkingOptions] = None,
+        model_name: Optional[str] = None,
+    ) -> TokenizationResult:
+        token_count: int = await self.summarization_model_repository.count_tokens_async(text_to_summarize, model_name)
+        max_input_tokens: int = self.summarization_model_repository.get_max_input_tokens(model_name)
+        chunk_count: Optional[int] = None
+
+        if chunking_options is not None:
+            chunks: List[str] = await self.summarization_model_repository.split_text_async(
+                text_to_summarize,
+                chunking_options.chunk_size,
+                chunking_options.chunk_overlap,
+                model_name,
+            )
+            chunk_count = len(chunks)
+
+        return TokenizationResult(
+            token_count=token_count,
+            max_input_tokens=max_input_tokens,
+            # Chunked texts are summarized piecewise, so only the plain mode cuts off the end of the text.
+            is_truncated=chunking_options is None and token_count > max_input_tokens,
+            chunk_count=chunk_count,
+        )
+
+    async def preload_model(self) -> None:
+        await self.summarization_model_repository.preload_async()
+
+    async def stop_model(self) -> None:
+        await self.summarization_model_repository.stop_async()
+
+    def is_model_ready(self) -> bool:
+        is_ready: bool = self.summarization_model_repository.is_ready()
+
+        return is_ready
+
+    async def get_statuses(self) -> Tuple[List[WorkerStatus], List[ModelStatus]]:
+        statuses: Tuple[List[WorkerStatus], List[ModelStatus]] = (
+            await self.summarization_model_repository.get_statuses_async()
+        )
+
+        return statuses
+
+    def get_models_metrics(self) -> List[ModelMetrics]:
+        models_metrics: List[ModelMetrics] = self.summarization_model_repository.get_models_metrics()
+
+        return models_metrics
+
+    def get_cache_status(self) -> Optional[CacheStatus]:
+        cache_status: Optional[CacheStatus] = self.summarization_model_repository.get_cache_status()
+
+        return cache_status
+
+    def get_coalesced_requests_count(self) -> int:
+        coalesced_requests: int = self.summarization_model_repository.get_coalesced_requests_count()
+
+        return coalesced_requests
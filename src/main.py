@@ -13,6 +13,8 @@ def main(
     logger.info("Starting the summarization-api server...")
     config.initialize(logger)
     logger.set_level(config.log_level)
+    logger.set_format(config.log_format)
+    logger.set_max_message_length(config.log_max_message_length)
     server.start()
 
 
@@ -0,0 +1,108 @@
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.handlers.global_exception_handler import GlobalExceptionHandler
+from core.logger.logger import Logger
+from domain.exceptions.deadline_exceeded_error import DeadlineExceededError
+from domain.exceptions.queue_full_error import QueueFullError
+from domain.exceptions.request_cancelled_error import RequestCancelledError
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def client(mock_logger: Logger) -> TestClient:
+    app = FastAPI()
+    GlobalExceptionHandler(app, mock_logger)
+    value_error_instance = ValueError("Invalid value")
+
+    @app.get("/queue-full")
+    async def queue_full() -> None:
+        raise QueueFullError(queue_depth=64, retry_after=12)
+
+    @app.get("/deadline-exceeded")
+    async def deadline_exceeded() -> None:
+        raise DeadlineExceededError()
+
+    @app.get("/request-cancelled")
+    async def request_cancelled() -> None:
+        raise RequestCancelledError()
+
+    @app.get("/value-error")
+    async def value_error() -> None:
+        raise value_error_instance
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_queue_full_error_returns_too_many_requests_with_retry_after(
+    client: TestClient,
+    mock_logger: Mock,
+) -> None:
+    # When
+    response = client.get("/queue-full")
+
+    # Then
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "12"
+    assert response.json() == {
+        "status_code": 429,
+        "message": "Too many requests",
+        "details": {
+            "error_type": "QueueFullError",
+            "error_message": "Summarization queue is full with 64 queued texts, retry after 12s",
+        },
+    }
+    mock_logger.warning.assert_called_once()
+    mock_logger.error.assert_not_called()
+
+
+def test_value_error_returns_unprocessable_entity(client: TestClient) -> None:
+    # When
+    response = client.get("/value-error")
+
+    # Then
+    assert response.status_code == 422
+    assert response.json()["details"] == {"error_type": "ValueError", "error_message": "Invalid value"}
+
+
+def test_deadline_exceeded_error_returns_gateway_timeout(
+    client: TestClient,
+    mock_logger: Mock,
+) -> None:
+    # When
+    response = client.get("/deadline-exceeded")
+
+    # Then
+    assert response.status_code == 504
+    assert response.json() == {
+        "status_code": 504,
+        "message": "Deadline exceeded",
+        "details": {
+            "error_type": "DeadlineExceededError",
+            "error_message": "Summarization request exceeded its deadline",
+        },
+    }
+    mock_logger.error.assert_not_called()
+
+
+def test_request_cancelled_error_returns_client_closed_request(
+    client: TestClient,
+    mock_logger: Mock,
+) -> None:
+    # When
+    response = client.get("/request-cancelled")
+
+    # Then
+    assert response.status_code == 499
+    assert response.json()["details"] == {
+        "error_type": "RequestCancelledError",
+        "error_message": "Summarization request was cancelled",
+    }
+    mock_logger.error.assert_not_called()
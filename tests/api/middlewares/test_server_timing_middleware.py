@@ -0,0 +1,141 @@
+from typing import Any, Dict, List
+from unittest.mock import Mock
+
+import pytest
+from starlette.types import Message, Receive, Scope, Send
+
+from api.middlewares.server_timing_middleware import ServerTimingMiddleware
+from core.logger.logger import Logger
+from core.metrics.request_timings import current_request_timings
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+def create_scope(headers: List[Any]) -> Scope:
+    return {"type": "http", "method": "POST", "path": "/summarize", "headers": headers}
+
+
+async def receive() -> Message:
+    return {"type": "http.request", "body": b""}
+
+
+async def respond_after_queue(scope: Scope, receive: Receive, send: Send) -> None:
+    request_timings = current_request_timings.get()
+    assert request_timings is not None
+    request_timings.record("validate", 0.001)
+    request_timings.record("queue", 0.25)
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def call_middleware(middleware: ServerTimingMiddleware, scope: Scope) -> List[Message]:
+    messages: List[Message] = []
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+
+    return messages
+
+
+def get_headers(message: Message) -> Dict[bytes, bytes]:
+    return dict(message["headers"])
+
+
+@pytest.mark.asyncio
+async def test_server_timing_middleware_adds_stage_durations_and_request_id(mock_logger: Logger) -> None:
+    # Given
+    middleware = ServerTimingMiddleware(respond_after_queue, logger=mock_logger)
+
+    # When
+    response_start, response_body = await call_middleware(middleware, create_scope([]))
+
+    # Then
+    headers = get_headers(response_start)
+    server_timing = headers[b"server-timing"].decode().split(", ")
+    assert server_timing[:2] == ["validate;dur=1.000", "queue;dur=250.000"]
+    assert server_timing[2].startswith("total;dur=")
+    assert headers[b"content-type"] == b"application/json"
+    assert headers[b"x-request-id"]
+    assert float(headers[b"x-process-time"]) >= 0
+    assert response_body == {"type": "http.response.body", "body": b"{}"}
+    assert current_request_timings.get() is None
+
+
+@pytest.mark.asyncio
+async def test_server_timing_middleware_generates_unique_request_ids(mock_logger: Logger) -> None:
+    # Given
+    middleware = ServerTimingMiddleware(respond_after_queue, logger=mock_logger)
+
+    # When
+    first, _ = await call_middleware(middleware, create_scope([]))
+    second, _ = await call_middleware(middleware, create_scope([]))
+
+    # Then
+    assert get_headers(first)[b"x-request-id"] != get_headers(second)[b"x-request-id"]
+
+
+@pytest.mark.asyncio
+async def test_server_timing_middleware_echoes_request_id_of_client(mock_logger: Logger) -> None:
+    # Given
+    middleware = ServerTimingMiddleware(respond_after_queue, logger=mock_logger)
+
+    # When
+    response_start, _ = await call_middleware(middleware, create_scope([(b"x-request-id", b"client-request-1")]))
+
+    # Then
+    assert get_headers(response_start)[b"x-request-id"] == b"client-request-1"
+
+
+@pytest.mark.asyncio
+async def test_server_timing_middleware_replaces_invalid_request_id_of_client(mock_logger: Logger) -> None:
+    # Given
+    middleware = ServerTimingMiddleware(respond_after_queue, logger=mock_logger)
+
+    # When
+    response_start, _ = await call_middleware(middleware, create_scope([(b"x-request-id", b"a" * 129)]))
+
+    # Then
+    request_id = get_headers(response_start)[b"x-request-id"]
+    assert request_id != b"a" * 129
+    assert len(request_id) <= 128
+
+
+@pytest.mark.asyncio
+async def test_server_timing_middleware_propagates_exception(mock_logger: Logger) -> None:
+    # Given
+    error = RuntimeError("test exception")
+
+    async def fail(scope: Scope, receive: Receive, send: Send) -> None:
+        raise error
+
+    middleware = ServerTimingMiddleware(fail, logger=mock_logger)
+
+    # When / Then
+    with pytest.raises(Exception, match="test exception"):
+        await call_middleware(middleware, create_scope([]))
+
+    assert current_request_timings.get() is None
+
+
+@pytest.mark.asyncio
+async def test_server_timing_middleware_passes_through_lifespan_scope(mock_logger: Logger) -> None:
+    # Given
+    app = Mock()
+
+    async def call_app(scope: Scope, receive: Receive, send: Send) -> None:
+        app(scope)
+
+    middleware = ServerTimingMiddleware(call_app, logger=mock_logger)
+    scope = {"type": "lifespan"}
+
+    # When
+    messages = await call_middleware(middleware, scope)
+
+    # Then
+    assert messages == []
+    app.assert_called_once_with(scope)
@@ -1,15 +1,24 @@
+from unittest.mock import AsyncMock, Mock
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from api.routers.health_check_router import HealthCheckRouter
+from application.usecases.get_readiness_usecase import GetReadinessUseCase
 
 
 @pytest.fixture
-def client() -> TestClient:
+def mock_get_readiness_usecase() -> GetReadinessUseCase:
+    return Mock(GetReadinessUseCase)
+
+
+@pytest.fixture
+def client(mock_get_readiness_usecase: GetReadinessUseCase) -> TestClient:
     router = HealthCheckRouter()
     app = FastAPI()
     app.include_router(router.router)
+    app.dependency_overrides[GetReadinessUseCase] = lambda: mock_get_readiness_usecase
     return TestClient(app)
 
 
@@ -20,3 +29,33 @@ def test_healthcheck_success(client: TestClient) -> None:
     # Then
     assert response.status_code == 200
     assert response.json() == {"status": "OK"}
+
+
+def test_readiness_when_ready(
+    client: TestClient,
+    mock_get_readiness_usecase: GetReadinessUseCase,
+) -> None:
+    # Given
+    mock_get_readiness_usecase.execute = AsyncMock(return_value=True)
+
+    # When
+    response = client.get("/readiness")
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {"status": "READY"}
+
+
+def test_readiness_while_warming_up(
+    client: TestClient,
+    mock_get_readiness_usecase: GetReadinessUseCase,
+) -> None:
+    # Given
+    mock_get_readiness_usecase.execute = AsyncMock(return_value=False)
+
+    # When
+    response = client.get("/readiness")
+
+    # Then
+    assert response.status_code == 503
+    assert response.json() == {"status": "WARMING_UP"}
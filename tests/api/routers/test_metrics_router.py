@@ -0,0 +1,112 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routers.metrics_router import MetricsRouter
+from application.usecases.get_metrics_usecase import GetMetricsUseCase
+from domain.models.cache_status import CacheStatus
+from domain.models.histogram_snapshot import HistogramSnapshot
+from domain.models.model_metrics import ModelMetrics
+from domain.models.model_status import ModelStatus
+from domain.models.service_metrics import ServiceMetrics
+from domain.models.service_status import ServiceStatus
+from domain.models.worker_status import WorkerStatus
+
+
+@pytest.fixture
+def mock_get_metrics_usecase() -> GetMetricsUseCase:
+    return Mock(GetMetricsUseCase)
+
+
+@pytest.fixture
+def client(
+    mock_get_metrics_usecase: GetMetricsUseCase,
+) -> TestClient:
+    router = MetricsRouter()
+    app = FastAPI()
+    app.include_router(router.router)
+    app.dependency_overrides[GetMetricsUseCase] = lambda: mock_get_metrics_usecase
+    return TestClient(app)
+
+
+def test_metrics_success(
+    client: TestClient,
+    mock_get_metrics_usecase: GetMetricsUseCase,
+) -> None:
+    # Given
+    histogram = HistogramSnapshot(bucket_bounds=[0.5], bucket_counts=[1, 2], sum=1.25)
+    mock_get_metrics_usecase.execute = AsyncMock(
+        return_value=ServiceMetrics(
+            status=ServiceStatus(
+                workers=[
+                    WorkerStatus(
+                        index=0,
+                        pid=1234,
+                        is_alive=True,
+                        is_busy=False,
+                        queue_depth=0,
+                        model_name="facebook/bart-large-cnn",
+                        restarts=1,
+                        load_seconds=3.5,
+                    ),
+                ],
+                models=[
+                    ModelStatus(
+                        name="facebook/bart-large-cnn",
+                        is_default=True,
+                        is_loaded=True,
+                        memory_bytes=None,
+                        requests=4,
+                        mean_latency_seconds=0.5,
+                        loads=1,
+                        evictions=0,
+                        rejected_requests=2,
+                    ),
+                ],
+                cache=CacheStatus(
+                    entries=1,
+                    size_bytes=200,
+                    max_size_bytes=1024,
+                    hits=2,
+                    misses=1,
+                    evictions=0,
+                    expirations=0,
+                ),
+                coalesced_requests=3,
+            ),
+            models=[
+                ModelMetrics(
+                    name="facebook/bart-large-cnn",
+                    queue_wait_seconds={"interactive": histogram},
+                    stage_seconds={"generate": histogram},
+                    input_tokens=histogram,
+                    output_tokens=histogram,
+                    tokens_per_second=histogram,
+                    time_to_first_token_seconds=histogram,
+                ),
+            ],
+        ),
+    )
+
+    # When
+    response = client.get("/metrics")
+
+    # Then
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/plain; version=0.0.4; charset=utf-8"
+    lines = response.text.splitlines()
+    assert 'summarization_requests_total{model="facebook/bart-large-cnn"} 4' in lines
+    assert 'summarization_rejected_requests_total{model="facebook/bart-large-cnn"} 2' in lines
+    assert (
+        'summarization_stage_duration_seconds_bucket{model="facebook/bart-large-cnn",stage="generate",le="+Inf"} 2'
+        in lines
+    )
+    assert 'summarization_queue_wait_seconds_sum{model="facebook/bart-large-cnn",priority="interactive"} 1.25' in lines
+    assert 'summarization_time_to_first_token_seconds_count{model="facebook/bart-large-cnn"} 2' in lines
+    assert 'summarization_worker_restarts_total{model="facebook/bart-large-cnn",worker="0"} 1' in lines
+    assert 'summarization_worker_load_seconds{model="facebook/bart-large-cnn",worker="0"} 3.5' in lines
+    assert "summarization_cache_hits_total 2" in lines
+    assert "summarization_coalesced_requests_total 3" in lines
+    assert not any(line.startswith("summarization_model_memory_bytes") for line in lines)
@@ -0,0 +1,160 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routers.status_router import StatusRouter
+from application.usecases.get_status_usecase import GetStatusUseCase
+from domain.models.cache_status import CacheStatus
+from domain.models.model_status import ModelStatus
+from domain.models.service_status import ServiceStatus
+from domain.models.worker_status import WorkerStatus
+
+
+@pytest.fixture
+def mock_get_status_usecase() -> GetStatusUseCase:
+    return Mock(GetStatusUseCase)
+
+
+@pytest.fixture
+def client(
+    mock_get_status_usecase: GetStatusUseCase,
+) -> TestClient:
+    router = StatusRouter()
+    app = FastAPI()
+    app.include_router(router.router)
+    app.dependency_overrides[GetStatusUseCase] = lambda: mock_get_status_usecase
+    return TestClient(app)
+
+
+def test_status_success(
+    client: TestClient,
+    mock_get_status_usecase: GetStatusUseCase,
+) -> None:
+    # Given
+    mock_get_status_usecase.execute = AsyncMock(
+        return_value=ServiceStatus(
+            workers=[
+                WorkerStatus(
+                    index=0,
+                    pid=1234,
+                    is_alive=True,
+                    is_busy=True,
+                    queue_depth=2,
+                    resident_memory_bytes=2048,
+                    proportional_memory_bytes=1024,
+                    unique_memory_bytes=512,
+                    model_name="facebook/bart-large-cnn",
+                ),
+                WorkerStatus(index=1, pid=None, is_alive=False, is_busy=False, queue_depth=0),
+            ],
+            models=[
+                ModelStatus(
+                    name="facebook/bart-large-cnn",
+                    is_default=True,
+                    is_loaded=True,
+                    memory_bytes=1024,
+                    requests=4,
+                    mean_latency_seconds=0.5,
+                    loads=1,
+                    evictions=0,
+                    queue_depth=2,
+                    rejected_requests=5,
+                    cancelled_requests=2,
+                    deadline_exceeded_requests=1,
+                    mean_queue_wait_seconds={"interactive": 0.25, "bulk": None},
+                ),
+            ],
+            cache=CacheStatus(
+                entries=1,
+                size_bytes=200,
+                max_size_bytes=1024,
+                hits=2,
+                misses=1,
+                evictions=0,
+                expirations=0,
+            ),
+            coalesced_requests=3,
+        ),
+    )
+
+    # When
+    response = client.get("/status")
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {
+        "workers": [
+            {
+                "index": 0,
+                "pid": 1234,
+                "is_alive": True,
+                "is_busy": True,
+                "queue_depth": 2,
+                "resident_memory_bytes": 2048,
+                "proportional_memory_bytes": 1024,
+                "unique_memory_bytes": 512,
+                "model_name": "facebook/bart-large-cnn",
+                "restarts": 0,
+                "load_seconds": None,
+            },
+            {
+                "index": 1,
+                "pid": None,
+                "is_alive": False,
+                "is_busy": False,
+                "queue_depth": 0,
+                "resident_memory_bytes": None,
+                "proportional_memory_bytes": None,
+                "unique_memory_bytes": None,
+                "model_name": None,
+                "restarts": 0,
+                "load_seconds": None,
+            },
+        ],
+        "models": [
+            {
+                "name": "facebook/bart-large-cnn",
+                "is_default": True,
+                "is_loaded": True,
+                "memory_bytes": 1024,
+                "requests": 4,
+                "mean_latency_seconds": 0.5,
+                "loads": 1,
+                "evictions": 0,
+                "queue_depth": 2,
+                "rejected_requests": 5,
+                "cancelled_requests": 2,
+                "deadline_exceeded_requests": 1,
+                "mean_queue_wait_seconds": {"interactive": 0.25, "bulk": None},
+            },
+        ],
+        "cache": {
+            "entries": 1,
+            "size_bytes": 200,
+            "max_size_bytes": 1024,
+            "hits": 2,
+            "misses": 1,
+            "evictions": 0,
+            "expirations": 0,
+        },
+        "coalesced_requests": 3,
+    }
+
+
+def test_status_without_cache(
+    client: TestClient,
+    mock_get_status_usecase: GetStatusUseCase,
+) -> None:
+    # Given
+    mock_get_status_usecase.execute = AsyncMock(
+        return_value=ServiceStatus(workers=[], cache=None, coalesced_requests=0)
+    )
+
+    # When
+    response = client.get("/status")
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {"workers": [], "models": [], "cache": None, "coalesced_requests": 0}
@@ -1,11 +1,29 @@
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from unittest.mock import AsyncMock, Mock
 
 import pytest
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
 
+from api.dtos.summarize_dto import SummarizeDTO
 from api.routers.summarize_router import SummarizeRouter
+from application.usecases.summarize_text_batch_usecase import SummarizeTextBatchUseCase
+from application.usecases.summarize_text_stream_usecase import (
+    SummarizeTextStreamUseCase,
+)
 from application.usecases.summarize_text_usecase import SummarizeTextUseCase
+from core.logger.logger import Logger
+from domain.exceptions.deadline_exceeded_error import DeadlineExceededError
+from domain.exceptions.queue_full_error import QueueFullError
+from domain.exceptions.request_cancelled_error import RequestCancelledError
+from domain.models.chunking_options import ChunkingOptions
+from domain.models.summarization_priority import SummarizationPriority
+from domain.models.summarization_request import SummarizationRequest
+from domain.models.summarization_result import SummarizationResult
+from domain.models.summary_stream_event import SummaryStreamEvent
 
 
 @pytest.fixture
@@ -13,17 +31,58 @@ def mock_summarize_text_usecase() -> SummarizeTextUseCase:
     return Mock(SummarizeTextUseCase)
 
 
+@pytest.fixture
+def mock_summarize_text_stream_usecase() -> SummarizeTextStreamUseCase:
+    return Mock(SummarizeTextStreamUseCase)
+
+
+@pytest.fixture
+def mock_summarize_text_batch_usecase() -> SummarizeTextBatchUseCase:
+    return Mock(SummarizeTextBatchUseCase)
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
 @pytest.fixture
 def client(
     mock_summarize_text_usecase: SummarizeTextUseCase,
+    mock_summarize_text_stream_usecase: SummarizeTextStreamUseCase,
+    mock_summarize_text_batch_usecase: SummarizeTextBatchUseCase,
+    mock_logger: Logger,
 ) -> TestClient:
     router = SummarizeRouter()
     app = FastAPI()
     app.include_router(router.router)
     app.dependency_overrides[SummarizeTextUseCase] = lambda: mock_summarize_text_usecase
+    app.dependency_overrides[SummarizeTextStreamUseCase] = lambda: mock_summarize_text_stream_usecase
+    app.dependency_overrides[SummarizeTextBatchUseCase] = lambda: mock_summarize_text_batch_usecase
+    app.dependency_overrides[Logger] = lambda: mock_logger
     return TestClient(app)
 
 
+async def stream_events(
+    *events: SummaryStreamEvent, error: Optional[Exception] = None
+) -> AsyncIterator[SummaryStreamEvent]:
+    for event in events:
+        yield event
+
+    if error is not None:
+        raise error
+
+
+def parse_events(body: str) -> List[Tuple[str, Dict[str, Any]]]:
+    events = []
+
+    for block in body.strip().split("\n\n"):
+        event_line, data_line = block.split("\n")
+        events.append((event_line.removeprefix("event: "), json.loads(data_line.removeprefix("data: "))))
+
+    return events
+
+
 def test_summarize_success(
     client: TestClient,
     mock_summarize_text_usecase: SummarizeTextUseCase,
@@ -58,3 +117,394 @@ def test_summarize_missing_source_language(client: TestClient) -> None:
 
     # Then
     assert response.status_code == 422  # Unprocessable Entity
+
+
+def test_summarize_with_long_document_options(
+    client: TestClient,
+    mock_summarize_text_usecase: SummarizeTextUseCase,
+) -> None:
+    # Given
+    mock_summarize_text_usecase.execute = AsyncMock(return_value="summarize_result")
+
+    # When
+    response = client.post(
+        "/summarize",
+        json={
+            "text_to_summarize": "Long report",
+            "long_document_options": {"chunk_size": 512, "chunk_overlap": 64, "max_reduce_depth": 2},
+        },
+    )
+
+    # Then
+    assert response.status_code == 200
+    mock_summarize_text_usecase.execute.assert_awaited_once_with(
+        "Long report",
+        {},
+        ChunkingOptions(chunk_size=512, chunk_overlap=64, max_reduce_depth=2),
+        False,
+        None,
+        SummarizationPriority.INTERACTIVE,
+        None,
+    )
+
+
+def test_summarize_passes_bypass_cache_flag(
+    client: TestClient,
+    mock_summarize_text_usecase: SummarizeTextUseCase,
+) -> None:
+    # Given
+    mock_summarize_text_usecase.execute = AsyncMock(return_value="summarize_result")
+
+    # When
+    response = client.post("/summarize", json={"text_to_summarize": "Breaking news", "bypass_cache": True})
+
+    # Then
+    assert response.status_code == 200
+    mock_summarize_text_usecase.execute.assert_awaited_once_with(
+        "Breaking news",
+        {},
+        None,
+        True,
+        None,
+        SummarizationPriority.INTERACTIVE,
+        None,
+    )
+
+
+def test_summarize_passes_selected_model(
+    client: TestClient,
+    mock_summarize_text_usecase: SummarizeTextUseCase,
+) -> None:
+    # Given
+    mock_summarize_text_usecase.execute = AsyncMock(return_value="summarize_result")
+
+    # When
+    response = client.post(
+        "/summarize", json={"text_to_summarize": "Breaking news", "model": "facebook/bart-large-xsum"}
+    )
+
+    # Then
+    assert response.status_code == 200
+    mock_summarize_text_usecase.execute.assert_awaited_once_with(
+        "Breaking news",
+        {},
+        None,
+        False,
+        "facebook/bart-large-xsum",
+        SummarizationPriority.INTERACTIVE,
+        None,
+    )
+
+
+def test_summarize_passes_selected_priority(
+    client: TestClient,
+    mock_summarize_text_usecase: SummarizeTextUseCase,
+) -> None:
+    # Given
+    mock_summarize_text_usecase.execute = AsyncMock(return_value="summarize_result")
+
+    # When
+    response = client.post("/summarize", json={"text_to_summarize": "Breaking news", "priority": "bulk"})
+
+    # Then
+    assert response.status_code == 200
+    mock_summarize_text_usecase.execute.assert_awaited_once_with(
+        "Breaking news",
+        {},
+        None,
+        False,
+        None,
+        SummarizationPriority.BULK,
+        None,
+    )
+
+
+def test_summarize_passes_deadline_of_request_timeout_header(
+    client: TestClient,
+    mock_summarize_text_usecase: SummarizeTextUseCase,
+) -> None:
+    # Given
+    mock_summarize_text_usecase.execute = AsyncMock(return_value="summarize_result")
+    start_time = time.monotonic()
+
+    # When
+    response = client.post(
+        "/summarize",
+        json={"text_to_summarize": "Breaking news"},
+        headers={"X-Request-Timeout": "2.5"},
+    )
+
+    # Then
+    assert response.status_code == 200
+    deadline = mock_summarize_text_usecase.execute.await_args.args[6]
+    assert start_time + 2.5 <= deadline <= time.monotonic() + 2.5
+
+
+def test_summarize_rejects_non_positive_request_timeout(client: TestClient) -> None:
+    # When
+    response = client.post(
+        "/summarize",
+        json={"text_to_summarize": "Breaking news"},
+        headers={"X-Request-Timeout": "0"},
+    )
+
+    # Then
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_summarize_cancels_summarization_when_client_disconnects(
+    mock_summarize_text_usecase: SummarizeTextUseCase,
+) -> None:
+    # Given
+    is_cancelled = asyncio.Event()
+
+    async def summarize_slowly(*_: object) -> str:
+        try:
+            await asyncio.sleep(10)
+
+        except asyncio.CancelledError:
+            is_cancelled.set()
+            raise
+
+        return "summarize_result"
+
+    mock_summarize_text_usecase.execute = AsyncMock(side_effect=summarize_slowly)
+    request = Mock(Request)
+    request.is_disconnected = AsyncMock(return_value=True)
+
+    # When
+    with pytest.raises(RequestCancelledError):
+        await SummarizeRouter().summarize(
+            request,
+            mock_summarize_text_usecase,
+            SummarizeDTO(text_to_summarize="Breaking news"),
+        )
+
+    # Then
+    assert is_cancelled.is_set()
+
+
+def test_summarize_rejects_unknown_priority(client: TestClient) -> None:
+    # When
+    response = client.post("/summarize", json={"text_to_summarize": "Breaking news", "priority": "urgent"})
+
+    # Then
+    assert response.status_code == 422
+
+
+def test_summarize_with_invalid_long_document_options(client: TestClient) -> None:
+    # When
+    response = client.post(
+        "/summarize",
+        json={
+            "text_to_summarize": "Long report",
+            "long_document_options": {"chunk_size": 64, "chunk_overlap": 64},
+        },
+    )
+
+    # Then
+    assert response.status_code == 422
+
+
+def test_summarize_batch_reports_rejected_item_as_too_many_requests(
+    client: TestClient,
+    mock_summarize_text_batch_usecase: Mock,
+) -> None:
+    # Given
+    mock_summarize_text_batch_usecase.execute = AsyncMock(
+        return_value=[SummarizationResult(error=QueueFullError(queue_depth=64, retry_after=3))],
+    )
+
+    # When
+    response = client.post("/summarize/batch", json={"items": [{"text_to_summarize": "first"}]})
+
+    # Then
+    assert response.status_code == 200
+    assert response.json()["results"][0]["error"]["status_code"] == 429
+    assert response.json()["results"][0]["error"]["message"] == "Too many requests"
+
+
+def test_summarize_batch_reports_item_past_deadline_as_gateway_timeout(
+    client: TestClient,
+    mock_summarize_text_batch_usecase: Mock,
+) -> None:
+    # Given
+    mock_summarize_text_batch_usecase.execute = AsyncMock(
+        return_value=[SummarizationResult(error=DeadlineExceededError())],
+    )
+
+    # When
+    response = client.post(
+        "/summarize/batch",
+        json={"items": [{"text_to_summarize": "first"}]},
+        headers={"X-Request-Timeout": "5"},
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.json()["results"][0]["error"]["status_code"] == 504
+    assert response.json()["results"][0]["error"]["message"] == "Deadline exceeded"
+    (requests,) = mock_summarize_text_batch_usecase.execute.await_args.args
+    assert requests[0].deadline is not None
+
+
+def test_summarize_stream_sends_token_and_done_events(
+    client: TestClient,
+    mock_summarize_text_stream_usecase: Mock,
+) -> None:
+    # Given
+    mock_summarize_text_stream_usecase.execute.return_value = stream_events(
+        SummaryStreamEvent(text="Hello "),
+        SummaryStreamEvent(text="world"),
+        SummaryStreamEvent(text="Hello world", is_final=True, time_to_first_token=0.25, total_time=1.5),
+    )
+
+    # When
+    response = client.post("/summarize/stream", json={"text_to_summarize": "Hello, world!"})
+
+    # Then
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert parse_events(response.text) == [
+        ("token", {"text": "Hello "}),
+        ("token", {"text": "world"}),
+        ("done", {"summary": "Hello world", "time_to_first_token": 0.25, "total_time": 1.5}),
+    ]
+    mock_summarize_text_stream_usecase.execute.assert_called_once_with(
+        "Hello, world!",
+        {},
+        None,
+        SummarizationPriority.INTERACTIVE,
+        None,
+    )
+
+
+def test_summarize_stream_reports_error_event(
+    client: TestClient,
+    mock_summarize_text_stream_usecase: Mock,
+    mock_logger: Mock,
+) -> None:
+    # Given
+    mock_summarize_text_stream_usecase.execute.return_value = stream_events(
+        SummaryStreamEvent(text="Hello "),
+        error=ValueError("`streamer` cannot be used with beam search"),
+    )
+
+    # When
+    response = client.post("/summarize/stream", json={"text_to_summarize": "Hello, world!"})
+
+    # Then
+    assert response.status_code == 200
+    assert parse_events(response.text) == [
+        ("token", {"text": "Hello "}),
+        (
+            "error",
+            {
+                "status_code": 422,
+                "message": "Value error",
+                "details": {
+                    "error_type": "ValueError",
+                    "error_message": "`streamer` cannot be used with beam search",
+                },
+            },
+        ),
+    ]
+    mock_logger.exception.assert_called_once()
+
+
+def test_summarize_stream_rejects_long_document_options(client: TestClient) -> None:
+    # When / Then
+    with pytest.raises(ValueError, match="does not support long_document_options"):
+        client.post(
+            "/summarize/stream",
+            json={"text_to_summarize": "Long report", "long_document_options": {"chunk_size": 512}},
+        )
+
+
+def test_summarize_stream_rejects_beam_search(client: TestClient) -> None:
+    # When / Then
+    with pytest.raises(ValueError, match="does not support num_beams = 4"):
+        client.post(
+            "/summarize/stream",
+            json={"text_to_summarize": "Hello, world!", "generation_parameters": {"num_beams": 4}},
+        )
+
+
+def test_summarize_batch_returns_results_in_input_order(
+    client: TestClient,
+    mock_summarize_text_batch_usecase: Mock,
+) -> None:
+    # Given
+    mock_summarize_text_batch_usecase.execute = AsyncMock(
+        return_value=[
+            SummarizationResult(summary="first summary"),
+            SummarizationResult(error=ValueError("Invalid generation parameters")),
+            SummarizationResult(error=RuntimeError("Worker process is not running")),
+        ],
+    )
+
+    # When
+    response = client.post(
+        "/summarize/batch",
+        json={
+            "items": [
+                {"text_to_summarize": "first"},
+                {
+                    "text_to_summarize": "second",
+                    "generation_parameters": {"num_beams": -1},
+                    "model": "t5-small",
+                    "priority": "interactive",
+                },
+                {"text_to_summarize": "third", "long_document_options": {"chunk_size": 512, "chunk_overlap": 64}},
+            ],
+            "generation_parameters": {"num_beams": 2, "max_length": 50},
+        },
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {
+        "results": [
+            {"result": {"summary": "first summary"}},
+            {
+                "error": {
+                    "status_code": 422,
+                    "message": "Value error",
+                    "details": {"error_type": "ValueError", "error_message": "Invalid generation parameters"},
+                },
+            },
+            {
+                "error": {
+                    "status_code": 500,
+                    "message": "Internal server error",
+                    "details": {"error_type": "RuntimeError", "error_message": "Worker process is not running"},
+                },
+            },
+        ],
+    }
+    mock_summarize_text_batch_usecase.execute.assert_awaited_once_with(
+        [
+            SummarizationRequest("first", {"num_beams": 2, "max_length": 50}, priority=SummarizationPriority.BULK),
+            SummarizationRequest(
+                "second",
+                {"num_beams": -1, "max_length": 50},
+                model_name="t5-small",
+                priority=SummarizationPriority.INTERACTIVE,
+            ),
+            SummarizationRequest(
+                "third",
+                {"num_beams": 2, "max_length": 50},
+                ChunkingOptions(chunk_size=512, chunk_overlap=64, max_reduce_depth=3),
+                priority=SummarizationPriority.BULK,
+            ),
+        ],
+    )
+
+
+def test_summarize_batch_rejects_empty_items(client: TestClient) -> None:
+    # When
+    response = client.post("/summarize/batch", json={"items": []})
+
+    # Then
+    assert response.status_code == 422
@@ -0,0 +1,87 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routers.tokenize_router import TokenizeRouter
+from application.usecases.tokenize_text_usecase import TokenizeTextUseCase
+from domain.models.chunking_options import ChunkingOptions
+from domain.models.tokenization_result import TokenizationResult
+
+
+@pytest.fixture
+def mock_tokenize_text_usecase() -> TokenizeTextUseCase:
+    return Mock(TokenizeTextUseCase)
+
+
+@pytest.fixture
+def client(
+    mock_tokenize_text_usecase: TokenizeTextUseCase,
+) -> TestClient:
+    router = TokenizeRouter()
+    app = FastAPI()
+    app.include_router(router.router)
+    app.dependency_overrides[TokenizeTextUseCase] = lambda: mock_tokenize_text_usecase
+    return TestClient(app)
+
+
+def test_tokenize_success(
+    client: TestClient,
+    mock_tokenize_text_usecase: TokenizeTextUseCase,
+) -> None:
+    # Given
+    mock_tokenize_text_usecase.execute = AsyncMock(
+        return_value=TokenizationResult(token_count=2048, max_input_tokens=1024, is_truncated=True),
+    )
+
+    # When
+    response = client.post("/tokenize", json={"text_to_summarize": "Hello, world!"})
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {"token_count": 2048, "max_input_tokens": 1024, "is_truncated": True}
+    mock_tokenize_text_usecase.execute.assert_awaited_once_with("Hello, world!", None, None)
+
+
+def test_tokenize_with_long_document_options(
+    client: TestClient,
+    mock_tokenize_text_usecase: TokenizeTextUseCase,
+) -> None:
+    # Given
+    mock_tokenize_text_usecase.execute = AsyncMock(
+        return_value=TokenizationResult(token_count=2048, max_input_tokens=1024, is_truncated=False, chunk_count=3),
+    )
+
+    # When
+    response = client.post(
+        "/tokenize",
+        json={"text_to_summarize": "Hello, world!", "long_document_options": {"chunk_size": 900}},
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {"token_count": 2048, "max_input_tokens": 1024, "is_truncated": False, "chunk_count": 3}
+    mock_tokenize_text_usecase.execute.assert_awaited_once_with(
+        "Hello, world!",
+        ChunkingOptions(chunk_size=900, chunk_overlap=100, max_reduce_depth=3),
+        None,
+    )
+
+
+def test_tokenize_with_selected_model(
+    client: TestClient,
+    mock_tokenize_text_usecase: TokenizeTextUseCase,
+) -> None:
+    # Given
+    mock_tokenize_text_usecase.execute = AsyncMock(
+        return_value=TokenizationResult(token_count=2048, max_input_tokens=16384, is_truncated=False),
+    )
+
+    # When
+    response = client.post("/tokenize", json={"text_to_summarize": "Hello, world!", "model": "allenai/led-base-16384"})
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {"token_count": 2048, "max_input_tokens": 16384, "is_truncated": False}
+    mock_tokenize_text_usecase.execute.assert_awaited_once_with("Hello, world!", None, "allenai/led-base-16384")
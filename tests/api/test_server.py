@@ -1,12 +1,32 @@
-from unittest.mock import Mock, patch
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, List
+from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
 import uvicorn
 from fastapi import FastAPI
+from fastapi.testclient import TestClient
 
 from api.server import APIServer
+from application.usecases.preload_model_usecase import PreloadModelUseCase
+from application.usecases.stop_model_usecase import StopModelUseCase
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
+from data.factories.summarization_worker_factory import SummarizationWorkerFactory
+from data.repositories.summarization_model_repository_impl import (
+    SummarizationModelRepositoryImpl,
+)
+from data.workers.seq2seq_summarization_worker import (
+    Seq2SeqSummarizationConfig,
+    Seq2SeqSummarizationWorker,
+)
+from domain.repositories.directory_repository import DirectoryRepository
+from domain.repositories.summarization_tokenizer_repository import (
+    SummarizationTokenizerRepository,
+)
 
 
 @pytest.fixture
@@ -20,8 +40,17 @@ def mock_config() -> AppConfig:
 
 
 @pytest.fixture
-def api_server(mock_config: AppConfig, mock_logger: Logger) -> APIServer:
-    return APIServer(config=mock_config, logger=mock_logger)
+def mock_stop_model_usecase() -> StopModelUseCase:
+    stop_model_usecase = Mock(StopModelUseCase)
+    stop_model_usecase.execute = AsyncMock()
+    return stop_model_usecase
+
+
+@pytest.fixture
+def api_server(mock_config: AppConfig, mock_logger: Logger, mock_stop_model_usecase: StopModelUseCase) -> APIServer:
+    api_server = APIServer(config=mock_config, logger=mock_logger)
+    api_server.app.dependency_overrides[StopModelUseCase] = lambda: mock_stop_model_usecase
+    return api_server
 
 
 def test_api_server_initialization(
@@ -35,7 +64,11 @@ def test_api_server_initialization(
     assert isinstance(app, FastAPI)
     assert any(isinstance(middleware, type(api_server.app.user_middleware[0])) for middleware in app.user_middleware)
     assert any(getattr(route, "path", None) == "/healthcheck" for route in app.routes)
+    assert any(getattr(route, "path", None) == "/readiness" for route in app.routes)
     assert any(getattr(route, "path", None) == "/summarize" for route in app.routes)
+    assert any(getattr(route, "path", None) == "/summarize/stream" for route in app.routes)
+    assert any(getattr(route, "path", None) == "/summarize/batch" for route in app.routes)
+    assert any(getattr(route, "path", None) == "/status" for route in app.routes)
 
 
 def test_api_server_start(
@@ -58,3 +91,213 @@ def test_api_server_start(
             server_header=False,
             log_config=None,
         )
+
+
+def test_api_server_preloads_model_in_background_on_startup(
+    api_server: APIServer,
+    mock_config: AppConfig,
+) -> None:
+    # Given
+    mock_config.model_preload = True
+    preload_started = threading.Event()
+    preload_model_usecase = Mock(PreloadModelUseCase)
+
+    async def preload() -> None:
+        preload_started.set()
+
+    preload_model_usecase.execute = AsyncMock(side_effect=preload)
+    api_server.app.dependency_overrides[PreloadModelUseCase] = lambda: preload_model_usecase
+
+    # When
+    with TestClient(api_server.app) as client:
+        health_response = client.get("/healthcheck")
+        is_preload_started = preload_started.wait(timeout=1)
+
+    # Then
+    assert health_response.status_code == 200
+    assert is_preload_started
+    preload_model_usecase.execute.assert_awaited_once_with()
+
+
+def test_api_server_skips_preload_by_default(
+    api_server: APIServer,
+    mock_config: AppConfig,
+) -> None:
+    # Given
+    mock_config.model_preload = False
+    preload_model_usecase = Mock(PreloadModelUseCase)
+    api_server.app.dependency_overrides[PreloadModelUseCase] = lambda: preload_model_usecase
+
+    # When
+    with TestClient(api_server.app) as client:
+        client.get("/healthcheck")
+
+    # Then
+    preload_model_usecase.execute.assert_not_called()
+
+
+def test_api_server_stops_model_on_shutdown(
+    api_server: APIServer,
+    mock_config: AppConfig,
+    mock_stop_model_usecase: Mock,
+) -> None:
+    # Given
+    mock_config.model_preload = False
+    client = TestClient(api_server.app)
+    client.__enter__()
+    is_stopped_while_running = mock_stop_model_usecase.execute.called
+
+    # When
+    client.__exit__(None, None, None)
+
+    # Then
+    assert is_stopped_while_running is False
+    mock_stop_model_usecase.execute.assert_awaited_once_with()
+
+
+def test_api_server_waits_for_cancelled_preload_before_stopping_model(
+    api_server: APIServer,
+    mock_config: AppConfig,
+    mock_stop_model_usecase: Mock,
+) -> None:
+    # Given
+    mock_config.model_preload = True
+    preload_started = threading.Event()
+    events: List[str] = []
+    preload_model_usecase = Mock(PreloadModelUseCase)
+
+    async def preload() -> None:
+        preload_started.set()
+
+        try:
+            await asyncio.Event().wait()
+
+        finally:
+            events.append("preload cancelled")
+
+    preload_model_usecase.execute = AsyncMock(side_effect=preload)
+    mock_stop_model_usecase.execute.side_effect = lambda: events.append("model stopped")
+    api_server.app.dependency_overrides[PreloadModelUseCase] = lambda: preload_model_usecase
+
+    # When
+    with TestClient(api_server.app):
+        preload_started.wait(timeout=1)
+
+    # Then
+    assert events == ["preload cancelled", "model stopped"]
+
+
+def test_api_server_does_not_create_model_repository_to_stop_it(
+    api_server: APIServer,
+    mock_config: AppConfig,
+    mock_logger: Mock,
+) -> None:
+    # Given
+    mock_config.model_preload = False
+    del api_server.app.dependency_overrides[StopModelUseCase]
+
+    with patch.object(SummarizationModelRepositoryImpl, "_instance", None):
+        # When
+        with TestClient(api_server.app):
+            pass
+
+        # Then
+        assert SummarizationModelRepositoryImpl._instance is None
+
+    mock_logger.exception.assert_not_called()
+
+
+def test_api_server_stops_existing_model_repository_on_shutdown(
+    api_server: APIServer,
+    mock_config: AppConfig,
+) -> None:
+    # Given
+    mock_config.model_preload = False
+    del api_server.app.dependency_overrides[StopModelUseCase]
+    repository = Mock(SummarizationModelRepositoryImpl)
+    repository.stop_async = AsyncMock()
+
+    # When
+    with patch.object(SummarizationModelRepositoryImpl, "_instance", repository), TestClient(api_server.app):
+        pass
+
+    # Then
+    repository.stop_async.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_api_server_serves_health_checks_during_slow_summarization(
+    api_server: APIServer,
+    mock_config: AppConfig,
+    mock_logger: Logger,
+) -> None:
+    # Given
+    mock_config.summarization_model_download_path = "/models"
+    mock_config.summarization_worker_pool_size = 1
+    mock_config.model_idle_timeout = 60
+    mock_config.model_preload = False
+    mock_config.summary_cache_max_size_mb = 0
+    mock_config.summary_store_path = ""
+    mock_config.summarization_model_name = "facebook/bart-large-cnn"
+    mock_config.summarization_models = ["facebook/bart-large-cnn"]
+    mock_config.model_memory_budget_mb = 0
+    mock_config.summarization_queue_max_size = 0
+    mock_config.summarization_queue_max_wait = 0
+    mock_config.summarization_batch_max_size = 8
+    mock_config.summarization_bulk_max_wait = 0
+    mock_config.summary_cache_include_sampling = False
+    worker = Seq2SeqSummarizationWorker(Mock(Seq2SeqSummarizationConfig), mock_logger)
+    worker_factory = Mock(SummarizationWorkerFactory)
+    worker_factory.create.return_value = worker
+
+    def slow_generation(command: str, args: Any, *callbacks: Any) -> Future[str]:
+        future: Future[str] = Future()
+        threading.Timer(1.0, future.set_result, ["summary"]).start()
+        return future
+
+    with patch.object(SummarizationModelRepositoryImpl, "_instance", None):
+        repository = SummarizationModelRepositoryImpl(
+            config=mock_config,
+            directory_repository=Mock(DirectoryRepository),
+            logger=mock_logger,
+            worker_factory=worker_factory,
+            tokenizer_repository=Mock(SummarizationTokenizerRepository),
+        )
+
+    api_server.app.dependency_overrides[SummarizationModelRepositoryImpl] = lambda: repository
+    completed: List[str] = []
+
+    async def request(client: httpx.AsyncClient, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        response = await client.request(method, url, **kwargs)
+        completed.append(url)
+        return response
+
+    with (
+        patch.object(worker, "is_alive", return_value=True),
+        patch.object(worker, "_send_request", side_effect=slow_generation),
+    ):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=api_server.app),
+            base_url="http://test",
+        ) as client:
+            # When
+            summarize_task = asyncio.create_task(
+                request(client, "POST", "/summarize", json={"text_to_summarize": "Hello, world!"}),
+            )
+            await asyncio.sleep(0.1)
+            health_responses = await asyncio.wait_for(
+                asyncio.gather(*(request(client, "GET", "/healthcheck") for _ in range(5))),
+                timeout=0.5,
+            )
+            summarize_response = await summarize_task
+
+    # Then
+    assert all(response.status_code == 200 for response in health_responses)
+    assert summarize_response.json() == {"summary": "summary"}
+    assert [metric.split(";")[0] for metric in summarize_response.headers["Server-Timing"].split(", ")] == [
+        "validate",
+        "tokenize",
+        "queue",
+        "total",
+    ]
+    assert completed == ["/healthcheck"] * 5 + ["/summarize"]
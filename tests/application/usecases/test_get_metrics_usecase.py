@@ -0,0 +1,69 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from application.usecases.get_metrics_usecase import GetMetricsUseCase
+from core.logger.logger import Logger
+from domain.models.histogram_snapshot import HistogramSnapshot
+from domain.models.model_metrics import ModelMetrics
+from domain.models.service_metrics import ServiceMetrics
+from domain.models.service_status import ServiceStatus
+from domain.models.worker_status import WorkerStatus
+from domain.services.summarization_service import SummarizationService
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def mock_summarization_service() -> SummarizationService:
+    return Mock(SummarizationService)
+
+
+@pytest.fixture
+def use_case(
+    mock_logger: Logger,
+    mock_summarization_service: SummarizationService,
+) -> GetMetricsUseCase:
+    return GetMetricsUseCase(
+        logger=mock_logger,
+        summarization_service=mock_summarization_service,
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_success(
+    use_case: GetMetricsUseCase,
+    mock_summarization_service: Mock,
+) -> None:
+    # Given
+    statuses = [WorkerStatus(index=0, pid=None, is_alive=False, is_busy=False, queue_depth=0)]
+    histogram = HistogramSnapshot(bucket_bounds=[1.0], bucket_counts=[0, 0], sum=0.0)
+    model_metrics = [
+        ModelMetrics(
+            name="facebook/bart-large-cnn",
+            queue_wait_seconds={"interactive": histogram, "bulk": histogram},
+            stage_seconds={"generate": histogram},
+            input_tokens=histogram,
+            output_tokens=histogram,
+            tokens_per_second=histogram,
+            time_to_first_token_seconds=histogram,
+        ),
+    ]
+    mock_summarization_service.get_statuses = AsyncMock(return_value=(statuses, []))
+    mock_summarization_service.get_cache_status = Mock(return_value=None)
+    mock_summarization_service.get_coalesced_requests_count = Mock(return_value=3)
+    mock_summarization_service.get_models_metrics = Mock(return_value=model_metrics)
+
+    # When
+    result = await use_case.execute()
+
+    # Then
+    assert result == ServiceMetrics(
+        status=ServiceStatus(workers=statuses, cache=None, coalesced_requests=3, models=[]),
+        models=model_metrics,
+    )
+    mock_summarization_service.get_statuses.assert_awaited_once_with()
+    mock_summarization_service.get_models_metrics.assert_called_once()
@@ -0,0 +1,43 @@
+from unittest.mock import Mock
+
+import pytest
+
+from application.usecases.get_readiness_usecase import GetReadinessUseCase
+from core.logger.logger import Logger
+from domain.services.summarization_service import SummarizationService
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def mock_summarization_service() -> SummarizationService:
+    return Mock(SummarizationService)
+
+
+@pytest.fixture
+def use_case(
+    mock_logger: Logger,
+    mock_summarization_service: SummarizationService,
+) -> GetReadinessUseCase:
+    return GetReadinessUseCase(
+        logger=mock_logger,
+        summarization_service=mock_summarization_service,
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_success(
+    use_case: GetReadinessUseCase,
+    mock_summarization_service: Mock,
+) -> None:
+    # Given
+    mock_summarization_service.is_model_ready.return_value = False
+
+    # When
+    result = await use_case.execute()
+
+    # Then
+    assert result is False
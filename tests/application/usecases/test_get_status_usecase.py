@@ -0,0 +1,79 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from application.usecases.get_status_usecase import GetStatusUseCase
+from core.logger.logger import Logger
+from domain.models.cache_status import CacheStatus
+from domain.models.model_status import ModelStatus
+from domain.models.service_status import ServiceStatus
+from domain.models.worker_status import WorkerStatus
+from domain.services.summarization_service import SummarizationService
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def mock_summarization_service() -> SummarizationService:
+    return Mock(SummarizationService)
+
+
+@pytest.fixture
+def use_case(
+    mock_logger: Logger,
+    mock_summarization_service: SummarizationService,
+) -> GetStatusUseCase:
+    return GetStatusUseCase(
+        logger=mock_logger,
+        summarization_service=mock_summarization_service,
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_success(
+    use_case: GetStatusUseCase,
+    mock_summarization_service: Mock,
+) -> None:
+    # Given
+    statuses = [WorkerStatus(index=0, pid=None, is_alive=False, is_busy=False, queue_depth=0)]
+    model_statuses = [
+        ModelStatus(
+            name="facebook/bart-large-cnn",
+            is_default=True,
+            is_loaded=False,
+            memory_bytes=None,
+            requests=0,
+            mean_latency_seconds=None,
+            loads=0,
+            evictions=0,
+        ),
+    ]
+    cache_status = CacheStatus(
+        entries=1,
+        size_bytes=200,
+        max_size_bytes=1024,
+        hits=2,
+        misses=1,
+        evictions=0,
+        expirations=0,
+    )
+    mock_summarization_service.get_statuses = AsyncMock(return_value=(statuses, model_statuses))
+    mock_summarization_service.get_cache_status = Mock(return_value=cache_status)
+    mock_summarization_service.get_coalesced_requests_count = Mock(return_value=3)
+
+    # When
+    result = await use_case.execute()
+
+    # Then
+    assert result == ServiceStatus(
+        workers=statuses,
+        cache=cache_status,
+        coalesced_requests=3,
+        models=model_statuses,
+    )
+    mock_summarization_service.get_statuses.assert_awaited_once_with()
+    mock_summarization_service.get_cache_status.assert_called_once()
+    mock_summarization_service.get_coalesced_requests_count.assert_called_once()
@@ -0,0 +1,43 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from application.usecases.preload_model_usecase import PreloadModelUseCase
+from core.logger.logger import Logger
+from domain.services.summarization_service import SummarizationService
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def mock_summarization_service() -> SummarizationService:
+    return Mock(SummarizationService)
+
+
+@pytest.fixture
+def use_case(
+    mock_logger: Logger,
+    mock_summarization_service: SummarizationService,
+) -> PreloadModelUseCase:
+    return PreloadModelUseCase(
+        logger=mock_logger,
+        summarization_service=mock_summarization_service,
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_success(
+    use_case: PreloadModelUseCase,
+    mock_summarization_service: Mock,
+) -> None:
+    # Given
+    mock_summarization_service.preload_model = AsyncMock()
+
+    # When
+    await use_case.execute()
+
+    # Then
+    mock_summarization_service.preload_model.assert_awaited_once_with()
@@ -0,0 +1,74 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from application.usecases.summarize_text_batch_usecase import SummarizeTextBatchUseCase
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.models.summarization_request import SummarizationRequest
+from domain.models.summarization_result import SummarizationResult
+from domain.services.summarization_service import SummarizationService
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def mock_config() -> AppConfig:
+    return Mock(AppConfig)
+
+
+@pytest.fixture
+def mock_summarization_service() -> SummarizationService:
+    return Mock(SummarizationService)
+
+
+@pytest.fixture
+def use_case(
+    mock_config: AppConfig,
+    mock_logger: Logger,
+    mock_summarization_service: SummarizationService,
+) -> SummarizeTextBatchUseCase:
+    return SummarizeTextBatchUseCase(
+        config=mock_config,
+        logger=mock_logger,
+        summarization_service=mock_summarization_service,
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_success(
+    use_case: SummarizeTextBatchUseCase,
+    mock_summarization_service: Mock,
+) -> None:
+    # Given
+    requests = [SummarizationRequest("Hello"), SummarizationRequest("World")]
+    results = [SummarizationResult(summary="Hello"), SummarizationResult(error=ValueError("Invalid"))]
+    mock_summarization_service.summarize_texts = AsyncMock(return_value=results)
+
+    # When
+    result = await use_case.execute(requests)
+
+    # Then
+    assert result == results
+    mock_summarization_service.summarize_texts.assert_awaited_once_with(requests)
+
+
+@pytest.mark.asyncio
+async def test_execute_logs_failed_item_count(
+    use_case: SummarizeTextBatchUseCase,
+    mock_summarization_service: Mock,
+    mock_logger: Mock,
+) -> None:
+    # Given
+    mock_summarization_service.summarize_texts = AsyncMock(
+        return_value=[SummarizationResult(summary="Hello"), SummarizationResult(error=ValueError("Invalid"))],
+    )
+
+    # When
+    await use_case.execute([SummarizationRequest("Hello"), SummarizationRequest("World")])
+
+    # Then
+    mock_logger.info.assert_called_with("Returning batch summarization results (1 of 2 failed)")
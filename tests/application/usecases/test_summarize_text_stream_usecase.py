@@ -0,0 +1,107 @@
+from typing import AsyncIterator
+from unittest.mock import Mock
+
+import pytest
+
+from application.usecases.summarize_text_stream_usecase import (
+    SummarizeTextStreamUseCase,
+)
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.models.summarization_priority import SummarizationPriority
+from domain.models.summary_stream_event import SummaryStreamEvent
+from domain.services.summarization_service import SummarizationService
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def mock_config() -> AppConfig:
+    return Mock(AppConfig)
+
+
+@pytest.fixture
+def mock_summarization_service() -> SummarizationService:
+    return Mock(SummarizationService)
+
+
+@pytest.fixture
+def use_case(
+    mock_config: AppConfig,
+    mock_logger: Logger,
+    mock_summarization_service: SummarizationService,
+) -> SummarizeTextStreamUseCase:
+    return SummarizeTextStreamUseCase(
+        config=mock_config,
+        logger=mock_logger,
+        summarization_service=mock_summarization_service,
+    )
+
+
+async def stream_partial_summaries(*partial_summaries: str) -> AsyncIterator[str]:
+    for partial_summary in partial_summaries:
+        yield partial_summary
+
+
+@pytest.mark.asyncio
+async def test_execute_yields_tokens_and_final_summary(
+    use_case: SummarizeTextStreamUseCase,
+    mock_summarization_service: Mock,
+) -> None:
+    # Given
+    mock_summarization_service.summarize_text_stream.return_value = stream_partial_summaries("Hello ", "world")
+
+    # When
+    events = [event async for event in use_case.execute("Hello", {})]
+
+    # Then
+    assert events[:2] == [SummaryStreamEvent(text="Hello "), SummaryStreamEvent(text="world")]
+    assert events[2].text == "Hello world"
+    assert events[2].is_final
+    assert events[2].time_to_first_token is not None
+    assert events[2].total_time is not None
+    assert events[2].time_to_first_token <= events[2].total_time
+    mock_summarization_service.summarize_text_stream.assert_called_once_with(
+        "Hello",
+        {},
+        None,
+        SummarizationPriority.INTERACTIVE,
+        None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_logs_time_to_first_token(
+    use_case: SummarizeTextStreamUseCase,
+    mock_summarization_service: Mock,
+    mock_logger: Mock,
+) -> None:
+    # Given
+    mock_summarization_service.summarize_text_stream.return_value = stream_partial_summaries("Hello")
+
+    # When
+    [event async for event in use_case.execute("Hello", {})]
+
+    # Then
+    assert any("Time to first token" in call[0][0] for call in mock_logger.info.call_args_list)
+
+
+@pytest.mark.asyncio
+async def test_execute_reports_no_time_to_first_token_for_empty_summary(
+    use_case: SummarizeTextStreamUseCase,
+    mock_summarization_service: Mock,
+) -> None:
+    # Given
+    mock_summarization_service.summarize_text_stream.return_value = stream_partial_summaries()
+
+    # When
+    events = [event async for event in use_case.execute("Hello", {})]
+
+    # Then
+    assert len(events) == 1
+    assert events[0].is_final
+    assert events[0].text == ""
+    assert events[0].time_to_first_token is None
@@ -1,10 +1,11 @@
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from application.usecases.summarize_text_usecase import SummarizeTextUseCase
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
+from domain.models.summarization_priority import SummarizationPriority
 from domain.services.summarization_service import SummarizationService
 
 
@@ -42,11 +43,19 @@ async def test_execute_success(
     mock_summarization_service: Mock,
 ) -> None:
     # Given
-    mock_summarization_service.summarize_text = Mock(return_value="result")
+    mock_summarization_service.summarize_text = AsyncMock(return_value="result")
 
     # When
     result = await use_case.execute("Hello", {})
 
     # Then
     assert result == "result"
-    mock_summarization_service.summarize_text.assert_called_once_with("Hello", {})
+    mock_summarization_service.summarize_text.assert_awaited_once_with(
+        "Hello",
+        {},
+        None,
+        False,
+        None,
+        SummarizationPriority.INTERACTIVE,
+        None,
+    )
@@ -0,0 +1,71 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from application.usecases.tokenize_text_usecase import TokenizeTextUseCase
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.models.tokenization_result import TokenizationResult
+from domain.services.summarization_service import SummarizationService
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def mock_config() -> AppConfig:
+    return Mock(AppConfig)
+
+
+@pytest.fixture
+def mock_summarization_service() -> SummarizationService:
+    return Mock(SummarizationService)
+
+
+@pytest.fixture
+def use_case(
+    mock_config: AppConfig,
+    mock_logger: Logger,
+    mock_summarization_service: SummarizationService,
+) -> TokenizeTextUseCase:
+    return TokenizeTextUseCase(
+        config=mock_config,
+        logger=mock_logger,
+        summarization_service=mock_summarization_service,
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_success(
+    use_case: TokenizeTextUseCase,
+    mock_summarization_service: Mock,
+) -> None:
+    # Given
+    tokenization_result = TokenizationResult(token_count=5, max_input_tokens=1024, is_truncated=False)
+    mock_summarization_service.tokenize_text = AsyncMock(return_value=tokenization_result)
+
+    # When
+    result = await use_case.execute("Hello")
+
+    # Then
+    assert result == tokenization_result
+    mock_summarization_service.tokenize_text.assert_awaited_once_with("Hello", None, None)
+
+
+@pytest.mark.asyncio
+async def test_execute_with_selected_model(
+    use_case: TokenizeTextUseCase,
+    mock_summarization_service: Mock,
+) -> None:
+    # Given
+    tokenization_result = TokenizationResult(token_count=5, max_input_tokens=16384, is_truncated=False)
+    mock_summarization_service.tokenize_text = AsyncMock(return_value=tokenization_result)
+
+    # When
+    result = await use_case.execute("Hello", model_name="allenai/led-base-16384")
+
+    # Then
+    assert result == tokenization_result
+    mock_summarization_service.tokenize_text.assert_awaited_once_with("Hello", None, "allenai/led-base-16384")
@@ -0,0 +1,98 @@
+import sys
+from unittest.mock import patch
+
+from core.cache.lru_cache import LruCache
+
+
+def entry_size(key: str, value: str) -> int:
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+def test_get_returns_cached_value_and_counts_hits_and_misses() -> None:
+    # Given
+    cache = LruCache(max_size_bytes=1024, ttl=60)
+    cache.put("key", "value")
+
+    # When
+    hit = cache.get("key")
+    miss = cache.get("other")
+
+    # Then
+    assert hit == "value"
+    assert miss is None
+    status = cache.get_status()
+    assert (status.hits, status.misses, status.entries) == (1, 1, 1)
+    assert status.size_bytes == entry_size("key", "value")
+
+
+def test_put_evicts_least_recently_used_entries() -> None:
+    # Given
+    cache = LruCache(max_size_bytes=entry_size("a", "value") * 2, ttl=60)
+    cache.put("a", "value")
+    cache.put("b", "value")
+    cache.get("a")
+
+    # When
+    cache.put("c", "value")
+
+    # Then
+    assert cache.get("a") == "value"
+    assert cache.get("b") is None
+    assert cache.get("c") == "value"
+    assert cache.get_status().evictions == 1
+
+
+def test_put_skips_values_larger_than_cache() -> None:
+    # Given
+    cache = LruCache(max_size_bytes=10, ttl=60)
+
+    # When
+    cache.put("key", "value")
+
+    # Then
+    assert cache.get_status().entries == 0
+
+
+def test_put_replaces_existing_value() -> None:
+    # Given
+    cache = LruCache(max_size_bytes=1024, ttl=60)
+    cache.put("key", "old")
+
+    # When
+    cache.put("key", "new value")
+
+    # Then
+    assert cache.get("key") == "new value"
+    assert cache.get_status().size_bytes == entry_size("key", "new value")
+
+
+def test_get_expires_entries_after_ttl() -> None:
+    # Given
+    cache = LruCache(max_size_bytes=1024, ttl=60)
+
+    with patch("core.cache.lru_cache.time.monotonic", return_value=100.0):
+        cache.put("key", "value")
+
+    # When
+    with patch("core.cache.lru_cache.time.monotonic", return_value=161.0):
+        result = cache.get("key")
+
+    # Then
+    assert result is None
+    status = cache.get_status()
+    assert (status.expirations, status.misses, status.entries, status.size_bytes) == (1, 1, 0, 0)
+
+
+def test_zero_ttl_keeps_entries_until_evicted() -> None:
+    # Given
+    cache = LruCache(max_size_bytes=1024, ttl=0)
+
+    with patch("core.cache.lru_cache.time.monotonic", return_value=100.0):
+        cache.put("key", "value")
+
+    # When
+    with patch("core.cache.lru_cache.time.monotonic", return_value=1e9):
+        result = cache.get("key")
+
+    # Then
+    assert result == "value"
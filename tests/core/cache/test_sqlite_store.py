@@ -0,0 +1,202 @@
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional
+from unittest.mock import Mock, patch
+
+from core.cache.sqlite_store import SqliteStore
+from core.logger.logger import Logger
+
+
+def create_store(path: Path, max_size_bytes: int = 1024 * 1024, ttl: float = 0) -> SqliteStore:
+    return SqliteStore(str(path / "store.sqlite3"), max_size_bytes, ttl, Mock(Logger))
+
+
+def test_put_persists_values_across_restarts(tmp_path: Path) -> None:
+    # Given
+    store = create_store(tmp_path)
+    store.put("key", "value")
+    store.close()
+
+    # When
+    result = create_store(tmp_path).get("key")
+
+    # Then
+    assert result == "value"
+
+
+def test_get_returns_none_for_missing_key(tmp_path: Path) -> None:
+    # Given
+    store = create_store(tmp_path)
+
+    # When
+    result = store.get("missing")
+
+    # Then
+    assert result is None
+
+
+def test_get_ignores_expired_values(tmp_path: Path) -> None:
+    # Given
+    store = create_store(tmp_path, ttl=60)
+
+    with patch("core.cache.sqlite_store.time.time", return_value=1000.0):
+        store.put("key", "value")
+        store.close()
+
+    # When
+    with patch("core.cache.sqlite_store.time.time", return_value=1061.0):
+        result = create_store(tmp_path, ttl=60).get("key")
+
+    # Then
+    assert result is None
+
+
+def test_writes_are_visible_to_other_stores_on_the_same_file(tmp_path: Path) -> None:
+    # Given
+    reader = create_store(tmp_path)
+    writer = create_store(tmp_path)
+
+    # When
+    writer.put("key", "value")
+    writer.close()
+
+    # Then
+    assert reader.get("key") == "value"
+
+
+def test_compaction_evicts_least_recently_accessed_values(tmp_path: Path) -> None:
+    # Given
+    writer = create_store(tmp_path, max_size_bytes=1024 * 1024)
+    reader = create_store(tmp_path, max_size_bytes=1024 * 1024)
+
+    with patch("core.cache.sqlite_store.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+        writer.put("first", "a" * 400)
+        writer.put("second", "b" * 400)
+        writer.put("third", "c" * 400)
+        writer.close()
+        reader.get("first")
+        reader.close()
+
+    store = create_store(tmp_path, max_size_bytes=1000)
+
+    # When
+    store.compact()
+
+    # Then
+    assert store.get("first") == "a" * 400
+    assert store.get("second") is None
+    assert store.get("third") == "c" * 400
+
+
+def test_writer_compacts_when_store_exceeds_max_size(tmp_path: Path) -> None:
+    # Given
+    store = create_store(tmp_path, max_size_bytes=1000)
+
+    # When
+    for index in range(10):
+        store.put(f"key {index}", "x" * 200)
+
+    store.close()
+
+    # Then
+    stored_values = [create_store(tmp_path).get(f"key {index}") for index in range(10)]
+    assert 0 < sum(value is not None for value in stored_values) <= 4
+    assert stored_values[-1] is not None
+
+
+def test_compaction_shrinks_database_file(tmp_path: Path) -> None:
+    # Given
+    store = create_store(tmp_path, max_size_bytes=100 * 1024 * 1024)
+
+    for index in range(200):
+        store.put(f"key {index}", "x" * 4096)
+
+    store.close()
+    store = create_store(tmp_path, max_size_bytes=4096)
+    store._get_connection().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    size_before_compaction = (tmp_path / "store.sqlite3").stat().st_size
+
+    # When
+    store.compact()
+    store._get_connection().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    # Then
+    assert store._get_connection().execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    assert (tmp_path / "store.sqlite3").stat().st_size < size_before_compaction / 10
+
+
+def test_store_converts_database_created_without_incremental_vacuum(tmp_path: Path) -> None:
+    # Given
+    connection = sqlite3.connect(tmp_path / "store.sqlite3")
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.close()
+
+    # When
+    store = create_store(tmp_path)
+
+    # Then
+    assert store._get_connection().execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+
+def test_put_replacing_value_tracks_size_of_new_value_only(tmp_path: Path) -> None:
+    # Given
+    store = create_store(tmp_path)
+    store.put("key", "a" * 400)
+
+    # When
+    store.put("key", "b" * 100)
+    store.close()
+
+    # Then
+    assert store._size_bytes == store._get_size_bytes() == len("key") + 100
+
+
+def test_load_recent_returns_most_recent_values_within_budget(tmp_path: Path) -> None:
+    # Given
+    store = create_store(tmp_path)
+
+    with patch("core.cache.sqlite_store.time.time", side_effect=[1.0, 2.0, 3.0]):
+        store.put("old", "a" * 100)
+        store.put("middle", "b" * 100)
+        store.put("new", "c" * 100)
+
+    store.close()
+
+    # When
+    result = create_store(tmp_path).load_recent(250)
+
+    # Then
+    assert result == [("new", "c" * 100), ("middle", "b" * 100)]
+
+
+def test_concurrent_reads_while_writing(tmp_path: Path) -> None:
+    # Given
+    store = create_store(tmp_path)
+    store.put("key", "value")
+    errors: List[Exception] = []
+    results: List[Optional[str]] = []
+
+    def read() -> None:
+        try:
+            for _ in range(50):
+                results.append(store.get("key"))
+        except Exception as e:
+            errors.append(e)
+
+    # When
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+
+    for index in range(100):
+        store.put(f"other {index}", "value")
+
+    for thread in threads:
+        thread.join()
+
+    store.close()
+
+    # Then
+    assert errors == []
+    assert len(results) == 200
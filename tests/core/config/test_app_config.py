@@ -22,22 +22,70 @@ def test_initialize(app_config: AppConfig, mock_logger: Logger) -> None:
     with patch.dict(
         os.environ,
         {
+            "LOG_FORMAT": "JSON",
+            "LOG_MAX_MESSAGE_LENGTH": "1024",
             "FASTAPI_HOST": "localhost",
             "FASTAPI_PORT": "8000",
             "SUMMARIZATION_MODEL_NAME": "test_summarization_model",
+            "SUMMARIZATION_MODELS": "small_model, test_summarization_model,large_model",
             "SUMMARIZATION_MODEL_DOWNLOAD_PATH": "summarization_model_path",
+            "SUMMARIZATION_MODEL_SNAPSHOT": "false",
+            "SUMMARIZATION_SHARED_WEIGHTS": "false",
             "MODEL_IDLE_TIMEOUT": "150",
+            "MODEL_PRELOAD": "true",
+            "MODEL_WARMUP_TOKEN_LENGTHS": "32, 256",
+            "MODEL_QUANTIZATION": "INT8-Dynamic",
+            "MODEL_MEMORY_BUDGET_MB": "4096",
+            "SUMMARIZATION_BATCH_MAX_SIZE": "4",
+            "SUMMARIZATION_BATCH_MAX_WAIT_MS": "25",
+            "SUMMARIZATION_WORKER_POOL_SIZE": "4",
+            "SUMMARIZATION_WORKER_THREADS": "2",
+            "SUMMARIZATION_WORKER_CPU_AFFINITY": "true",
+            "SUMMARIZATION_SHARED_MEMORY_SIZE_MB": "16",
+            "SUMMARIZATION_SHARED_MEMORY_THRESHOLD_KB": "128",
+            "SUMMARIZATION_QUEUE_MAX_SIZE": "32",
+            "SUMMARIZATION_QUEUE_MAX_WAIT": "15",
+            "SUMMARIZATION_BULK_MAX_WAIT": "5",
+            "SUMMARY_CACHE_MAX_SIZE_MB": "16",
+            "SUMMARY_CACHE_TTL": "120",
+            "SUMMARY_CACHE_INCLUDE_SAMPLING": "true",
+            "SUMMARY_STORE_PATH": "summary_store",
+            "SUMMARY_STORE_MAX_SIZE_MB": "128",
         },
     ):
         # When
         app_config.initialize(mock_logger)
 
         # Then
+        assert app_config.log_format == "json"
+        assert app_config.log_max_message_length == 1024
         assert app_config.fastapi_host == "localhost"
         assert app_config.fastapi_port == 8000
         assert app_config.summarization_model_name == "test_summarization_model"
         assert app_config.summarization_model_download_path == "summarization_model_path"
+        assert app_config.summarization_model_snapshot is False
+        assert app_config.summarization_shared_weights is False
         assert app_config.model_idle_timeout == 150
+        assert app_config.model_preload is True
+        assert app_config.model_warmup_token_lengths == [32, 256]
+        assert app_config.model_quantization == "int8-dynamic"
+        assert app_config.model_memory_budget_mb == 4096
+        assert app_config.summarization_models == ["test_summarization_model", "small_model", "large_model"]
+        assert app_config.summarization_batch_max_size == 4
+        assert app_config.summarization_batch_max_wait_ms == 25
+        assert app_config.summarization_worker_pool_size == 4
+        assert app_config.summarization_worker_threads == 2
+        assert app_config.summarization_worker_cpu_affinity is True
+        assert app_config.summarization_shared_memory_size_mb == 16
+        assert app_config.summarization_shared_memory_threshold_kb == 128
+        assert app_config.summarization_queue_max_size == 32
+        assert app_config.summarization_queue_max_wait == 15
+        assert app_config.summarization_bulk_max_wait == 5
+        assert app_config.summary_cache_max_size_mb == 16
+        assert app_config.summary_cache_ttl == 120
+        assert app_config.summary_cache_include_sampling is True
+        assert app_config.summary_store_path == "summary_store"
+        assert app_config.summary_store_max_size_mb == 128
 
 
 def test_initialize_invalid_port(app_config: AppConfig, mock_logger: Logger) -> None:
@@ -60,10 +108,34 @@ def test_initialize_log_parameters(app_config: AppConfig, mock_logger: Logger) -
     assert mock_logger.info.call_args_list[0][0][0] == "Initializing configuration..."
     assert mock_logger.info.call_args_list[1][0][0].startswith("Configuration loaded:")
     assert "LOG_LEVEL" in mock_logger.info.call_args_list[1][0][0]
+    assert "LOG_FORMAT" in mock_logger.info.call_args_list[1][0][0]
+    assert "LOG_MAX_MESSAGE_LENGTH" in mock_logger.info.call_args_list[1][0][0]
     assert "DEVICE" in mock_logger.info.call_args_list[1][0][0]
     assert "FASTAPI_HOST" in mock_logger.info.call_args_list[1][0][0]
     assert "FASTAPI_PORT" in mock_logger.info.call_args_list[1][0][0]
     assert "SUMMARIZATION_MODEL_NAME" in mock_logger.info.call_args_list[1][0][0]
     assert "SUMMARIZATION_MODEL_DOWNLOAD_PATH" in mock_logger.info.call_args_list[1][0][0]
+    assert "SUMMARIZATION_MODEL_SNAPSHOT" in mock_logger.info.call_args_list[1][0][0]
+    assert "SUMMARIZATION_SHARED_WEIGHTS" in mock_logger.info.call_args_list[1][0][0]
     assert "MODEL_IDLE_TIMEOUT" in mock_logger.info.call_args_list[1][0][0]
+    assert "MODEL_PRELOAD" in mock_logger.info.call_args_list[1][0][0]
+    assert "MODEL_WARMUP_TOKEN_LENGTHS" in mock_logger.info.call_args_list[1][0][0]
+    assert "MODEL_QUANTIZATION" in mock_logger.info.call_args_list[1][0][0]
+    assert "MODEL_MEMORY_BUDGET_MB" in mock_logger.info.call_args_list[1][0][0]
+    assert "SUMMARIZATION_MODELS" in mock_logger.info.call_args_list[1][0][0]
+    assert "SUMMARIZATION_BATCH_MAX_SIZE" in mock_logger.info.call_args_list[1][0][0]
+    assert "SUMMARIZATION_BATCH_MAX_WAIT_MS" in mock_logger.info.call_args_list[1][0][0]
+    assert "SUMMARIZATION_WORKER_POOL_SIZE" in mock_logger.info.call_args_list[1][0][0]
+    assert "SUMMARIZATION_WORKER_THREADS" in mock_logger.info.call_args_list[1][0][0]
+    assert "SUMMARIZATION_WORKER_CPU_AFFINITY" in mock_logger.info.call_args_list[1][0][0]
+    assert "SUMMARIZATION_SHARED_MEMORY_SIZE_MB" in mock_logger.info.call_args_list[1][0][0]
+    assert "SUMMARIZATION_SHARED_MEMORY_THRESHOLD_KB" in mock_logger.info.call_args_list[1][0][0]
+    assert "SUMMARIZATION_QUEUE_MAX_SIZE" in mock_logger.info.call_args_list[1][0][0]
+    assert "SUMMARIZATION_QUEUE_MAX_WAIT" in mock_logger.info.call_args_list[1][0][0]
+    assert "SUMMARIZATION_BULK_MAX_WAIT" in mock_logger.info.call_args_list[1][0][0]
+    assert "SUMMARY_CACHE_MAX_SIZE_MB" in mock_logger.info.call_args_list[1][0][0]
+    assert "SUMMARY_CACHE_TTL" in mock_logger.info.call_args_list[1][0][0]
+    assert "SUMMARY_CACHE_INCLUDE_SAMPLING" in mock_logger.info.call_args_list[1][0][0]
+    assert "SUMMARY_STORE_PATH" in mock_logger.info.call_args_list[1][0][0]
+    assert "SUMMARY_STORE_MAX_SIZE_MB" in mock_logger.info.call_args_list[1][0][0]
     assert mock_logger.info.call_args_list[2][0][0] == "Configuration initialized successfully."
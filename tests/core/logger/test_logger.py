@@ -1,8 +1,14 @@
+import json
 import logging
-from unittest.mock import patch
+import logging.handlers
+import pickle
+import time
+from typing import List
+from unittest.mock import Mock, patch
 
 import pytest
 
+from src.core.logger.json_formatter import JsonFormatter
 from src.core.logger.logger import Logger
 
 
@@ -20,10 +26,7 @@ def test_info_logs_message(logger_instance: Logger) -> None:
         logger_instance.info(message)
 
         # Then
-        mock_info.assert_called_once_with(
-            logging.INFO,
-            f"tests.core.logger.test_logger.test_info_logs_message - {message}",
-        )
+        mock_info.assert_called_once_with(logging.INFO, message, stacklevel=3)
 
 
 def test_error_logs_message(logger_instance: Logger) -> None:
@@ -35,10 +38,19 @@ def test_error_logs_message(logger_instance: Logger) -> None:
         logger_instance.error(message)
 
         # Then
-        mock_error.assert_called_once_with(
-            logging.ERROR,
-            f"tests.core.logger.test_logger.test_error_logs_message - {message}",
-        )
+        mock_error.assert_called_once_with(logging.ERROR, message, stacklevel=3)
+
+
+def test_exception_logs_message_with_traceback(logger_instance: Logger) -> None:
+    # Given
+    message = "Test exception message"
+
+    with patch.object(logger_instance.logger, "log") as mock_exception:
+        # When
+        logger_instance.exception(message)
+
+        # Then
+        mock_exception.assert_called_once_with(logging.ERROR, message, stacklevel=3, exc_info=True)
 
 
 def test_warning_logs_message(logger_instance: Logger) -> None:
@@ -50,25 +62,24 @@ def test_warning_logs_message(logger_instance: Logger) -> None:
         logger_instance.warning(message)
 
         # Then
-        mock_warning.assert_called_once_with(
-            logging.WARNING,
-            f"tests.core.logger.test_logger.test_warning_logs_message - {message}",
-        )
+        mock_warning.assert_called_once_with(logging.WARNING, message, stacklevel=3)
 
 
 def test_debug_logs_message(logger_instance: Logger) -> None:
     # Given
     message = "Test debug message"
+    logger_instance.logger.setLevel(logging.DEBUG)
 
-    with patch.object(logger_instance.logger, "log") as mock_debug:
-        # When
-        logger_instance.debug(message)
+    try:
+        with patch.object(logger_instance.logger, "log") as mock_debug:
+            # When
+            logger_instance.debug(message)
 
-        # Then
-        mock_debug.assert_called_once_with(
-            logging.DEBUG,
-            f"tests.core.logger.test_logger.test_debug_logs_message - {message}",
-        )
+            # Then
+            mock_debug.assert_called_once_with(logging.DEBUG, message, stacklevel=3)
+
+    finally:
+        logger_instance.logger.setLevel(logging.INFO)
 
 
 def test_logger_is_singleton() -> None:
@@ -88,7 +99,7 @@ def test_logger_initialization() -> None:
     assert logger_instance.logger.name == "summarization-api"
     assert logger_instance.logger.level == logging.INFO
     assert len(logger_instance.logger.handlers) > 0
-    assert isinstance(logger_instance.logger.handlers[0], logging.StreamHandler)
+    assert isinstance(logger_instance.logger.handlers[0], logging.handlers.QueueHandler)
 
 
 def test_set_level(logger_instance: Logger) -> None:
@@ -101,3 +112,113 @@ def test_set_level(logger_instance: Logger) -> None:
 
         # Then
         mock_set_level.assert_called_once_with(log_level)
+
+
+def test_debug_skips_disabled_message(logger_instance: Logger) -> None:
+    # Given
+    logger_instance.logger.setLevel(logging.INFO)
+
+    with patch.object(logger_instance.logger, "log") as mock_log:
+        # When
+        logger_instance.debug("Test debug message")
+
+        # Then
+        mock_log.assert_not_called()
+
+
+def test_info_truncates_long_message(logger_instance: Logger) -> None:
+    # Given
+    logger_instance.set_max_message_length(10)
+
+    try:
+        with patch.object(logger_instance.logger, "log") as mock_log:
+            # When
+            logger_instance.info("x" * 25)
+
+            # Then
+            mock_log.assert_called_once_with(logging.INFO, "xxxxxxxxxx... (15 characters truncated)", stacklevel=3)
+
+    finally:
+        logger_instance.set_max_message_length(4096)
+
+
+def test_info_writes_record_of_caller_on_listener_thread(logger_instance: Logger) -> None:
+    # Given
+    records: List[logging.LogRecord] = []
+    emit = Mock(side_effect=records.append)
+
+    with patch.object(logger_instance._output_handler, "emit", emit):
+        # When
+        logger_instance.info("Test queued message")
+
+        deadline = time.monotonic() + 5
+        while not records and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    # Then
+    (record,) = records
+    assert record.getMessage() == "Test queued message"
+    assert record.funcName == "test_info_writes_record_of_caller_on_listener_thread"
+    assert record.module == "test_logger"
+
+
+def test_exception_writes_traceback_as_json_field_on_listener_thread(logger_instance: Logger) -> None:
+    # Given
+    lines: List[str] = []
+    emit = Mock(side_effect=lambda record: lines.append(logger_instance._output_handler.format(record)))
+    logger_instance.set_format("json")
+
+    try:
+        with patch.object(logger_instance._output_handler, "emit", emit):
+            # When
+            try:
+                int("not a number")
+
+            except ValueError:
+                logger_instance.exception("Test queued exception")
+
+            deadline = time.monotonic() + 5
+            while not lines and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+    finally:
+        logger_instance.set_format("text")
+
+    # Then
+    (line,) = lines
+    fields = json.loads(line)
+    assert fields["message"] == "Test queued exception"
+    assert fields["exception"].startswith("Traceback (most recent call last):")
+    assert fields["exception"].endswith("ValueError: invalid literal for int() with base 10: 'not a number'")
+
+
+def test_set_format_rejects_unknown_format(logger_instance: Logger) -> None:
+    # When / Then
+    with pytest.raises(ValueError, match="Unsupported log format: xml"):
+        logger_instance.set_format("xml")
+
+
+def test_json_formatter_formats_record_as_json() -> None:
+    # Given
+    record = logging.LogRecord(
+        "summarization-api", logging.INFO, "/src/module.py", 12, "Test message", None, None, "run"
+    )
+
+    # When
+    fields = json.loads(JsonFormatter().format(record))
+
+    # Then
+    assert fields["level"] == "INFO"
+    assert fields["logger"] == "summarization-api"
+    assert fields["module"] == "module"
+    assert fields["function"] == "run"
+    assert fields["line"] == 12
+    assert fields["message"] == "Test message"
+
+
+def test_logger_is_restored_as_singleton_when_unpickled(logger_instance: Logger) -> None:
+    # When
+    restored = pickle.loads(pickle.dumps(logger_instance))
+
+    # Then
+    assert restored is logger_instance
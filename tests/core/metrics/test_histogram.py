@@ -0,0 +1,33 @@
+from core.metrics.histogram import Histogram
+
+
+def test_observe_counts_values_into_cumulative_buckets() -> None:
+    # Given
+    histogram = Histogram([0.1, 1.0])
+
+    # When
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    # Then
+    snapshot = histogram.snapshot()
+    assert snapshot.bucket_bounds == [0.1, 1.0]
+    assert snapshot.bucket_counts == [2, 3, 4]
+    assert snapshot.sum == 3.65
+    assert histogram.count == 4
+
+
+def test_merge_adds_up_histograms() -> None:
+    # Given
+    first = Histogram([1, 10])
+    second = Histogram([1, 10])
+    first.observe(5)
+    second.observe(20)
+    second.observe(1)
+
+    # When
+    snapshot = Histogram.merge([1, 10], [first, second])
+
+    # Then
+    assert snapshot.bucket_counts == [1, 2, 3]
+    assert snapshot.sum == 26
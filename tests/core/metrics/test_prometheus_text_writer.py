@@ -0,0 +1,58 @@
+from core.metrics.prometheus_text_writer import PrometheusTextWriter
+from domain.models.histogram_snapshot import HistogramSnapshot
+
+
+def test_render_groups_samples_of_each_metric_family() -> None:
+    # Given
+    writer = PrometheusTextWriter()
+    writer.add_gauge("worker_alive", "Whether the worker runs.", True, {"worker": "0"})
+    writer.add_counter("restarts_total", "Restarts.", 2, {"worker": "0"})
+    writer.add_gauge("worker_alive", "Whether the worker runs.", False, {"worker": "1"})
+
+    # When
+    text = writer.render()
+
+    # Then
+    assert text == (
+        "# HELP worker_alive Whether the worker runs.\n"
+        "# TYPE worker_alive gauge\n"
+        'worker_alive{worker="0"} 1\n'
+        'worker_alive{worker="1"} 0\n'
+        "# HELP restarts_total Restarts.\n"
+        "# TYPE restarts_total counter\n"
+        'restarts_total{worker="0"} 2\n'
+    )
+
+
+def test_render_writes_histogram_buckets_sum_and_count() -> None:
+    # Given
+    writer = PrometheusTextWriter()
+    histogram = HistogramSnapshot(bucket_bounds=[0.5, 1], bucket_counts=[1, 1, 3], sum=4.25)
+
+    # When
+    writer.add_histogram("wait_seconds", "Wait.", histogram, {"model": "t5-small"})
+
+    # Then
+    assert writer.render() == (
+        "# HELP wait_seconds Wait.\n"
+        "# TYPE wait_seconds histogram\n"
+        'wait_seconds_bucket{model="t5-small",le="0.5"} 1\n'
+        'wait_seconds_bucket{model="t5-small",le="1.0"} 1\n'
+        'wait_seconds_bucket{model="t5-small",le="+Inf"} 3\n'
+        'wait_seconds_sum{model="t5-small"} 4.25\n'
+        'wait_seconds_count{model="t5-small"} 3\n'
+    )
+
+
+def test_render_escapes_label_values_and_skips_unknown_gauges() -> None:
+    # Given
+    writer = PrometheusTextWriter()
+    writer.add_gauge("memory_bytes", "Memory.", None, {"model": "a"})
+    writer.add_gauge("memory_bytes", "Memory.", 1024, {"model": 'say "hi"\\n'})
+
+    # When
+    text = writer.render()
+
+    # Then
+    assert text.splitlines()[2] == 'memory_bytes{model="say \\"hi\\"\\\\n"} 1024'
+    assert len(text.splitlines()) == 3
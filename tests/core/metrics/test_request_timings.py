@@ -0,0 +1,65 @@
+import contextvars
+
+from core.metrics.request_timings import (
+    RequestTimings,
+    current_request_timings,
+    record_request_stage,
+)
+
+
+def test_record_keeps_longest_duration_of_stage() -> None:
+    # Given
+    request_timings = RequestTimings(0.0)
+
+    # When
+    request_timings.record("generate", 0.2)
+    request_timings.record("generate", 0.5)
+    request_timings.record("generate", 0.3)
+
+    # Then
+    assert request_timings.durations == {"generate": 0.5}
+
+
+def test_format_server_timing_lists_stages_in_milliseconds_followed_by_total() -> None:
+    # Given
+    request_timings = RequestTimings(0.0)
+    request_timings.record("validate", 0.0012)
+    request_timings.record("queue", 0.25)
+
+    # When
+    server_timing = request_timings.format_server_timing(1.5)
+
+    # Then
+    assert server_timing == "validate;dur=1.200, queue;dur=250.000, total;dur=1500.000"
+
+
+def test_record_request_stage_records_into_timings_of_current_request() -> None:
+    # Given
+    request_timings = RequestTimings(0.0)
+
+    def record_in_request() -> None:
+        current_request_timings.set(request_timings)
+        record_request_stage("queue", 0.1)
+
+    # When
+    contextvars.copy_context().run(record_in_request)
+    record_request_stage("queue", 0.2)
+
+    # Then
+    assert request_timings.durations == {"queue": 0.1}
+
+
+def test_merge_copies_stages_keeping_longest_duration() -> None:
+    # Given
+    request_timings = RequestTimings(0.0)
+    request_timings.record("validate", 0.01)
+    request_timings.record("queue", 0.3)
+    shared_timings = RequestTimings(0.0)
+    shared_timings.record("queue", 0.1)
+    shared_timings.record("generate", 0.5)
+
+    # When
+    request_timings.merge(shared_timings)
+
+    # Then
+    assert request_timings.durations == {"validate": 0.01, "queue": 0.3, "generate": 0.5}
@@ -1,16 +1,19 @@
-from unittest.mock import Mock
+import os
+from typing import List
+from unittest.mock import Mock, patch
 
 import pytest
 
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
 from data.factories.summarization_worker_factory import SummarizationWorkerFactory
-from data.workers.bart_large_cnn_summarization_worker import (
-    BartLargeCnnSummarizationWorker,
-)
+from data.workers.seq2seq_summarization_worker import Seq2SeqSummarizationWorker
 from domain.exceptions.unsupported_model_configuration_error import (
     UnsupportedModelConfigurationError,
 )
+from domain.exceptions.unsupported_quantization_error import (
+    UnsupportedQuantizationError,
+)
 
 
 @pytest.fixture
@@ -20,27 +23,119 @@ def mock_logger() -> Logger:
 
 @pytest.fixture
 def mock_config() -> AppConfig:
-    return Mock(AppConfig)
+    config = Mock(AppConfig)
+    config.model_quantization = ""
+    config.summarization_models = ["facebook/bart-large-cnn", "sshleifer/distilbart-cnn-12-6"]
+    config.summarization_worker_pool_size = 1
+    config.summarization_worker_threads = 0
+    config.summarization_worker_cpu_affinity = False
+    return config
 
 
-def test_create_mbart(mock_config: AppConfig, mock_logger: Logger) -> None:
+def test_create_default_model(mock_config: AppConfig, mock_logger: Logger) -> None:
     # Given
     mock_config.summarization_model_name = "facebook/bart-large-cnn"
     mock_config.device = "cpu"
     mock_config.summarization_model_download_path = "/path/to/bart"
     mock_config.log_level = "INFO"
+    mock_config.summarization_batch_max_size = 8
+    mock_config.summarization_batch_max_wait_ms = 10
+    mock_config.summarization_shared_memory_size_mb = 32
+    mock_config.summarization_shared_memory_threshold_kb = 64
+    mock_config.summarization_model_snapshot = True
+    mock_config.summarization_shared_weights = True
+    mock_config.model_quantization = "int8-dynamic"
+    mock_config.summarization_worker_threads = 2
+    mock_config.summarization_worker_cpu_affinity = True
 
     factory = SummarizationWorkerFactory(config=mock_config, logger=mock_logger)
 
     # When
-    worker = factory.create()
+    with patch(
+        "data.factories.summarization_worker_factory.os.sched_getaffinity",
+        create=True,
+        return_value={0, 1, 2, 3},
+    ):
+        worker = factory.create()
 
     # Then
-    assert isinstance(worker, BartLargeCnnSummarizationWorker)
+    assert isinstance(worker, Seq2SeqSummarizationWorker)
     assert worker._config.device == "cpu"
     assert worker._config.model_name == "facebook/bart-large-cnn"
     assert worker._config.model_download_path == "/path/to/bart"
     assert worker._config.log_level == "INFO"
+    assert worker._config.batch_max_size == 8
+    assert worker._config.batch_max_wait_ms == 10
+    assert worker._config.shared_memory_size_mb == 32
+    assert worker._config.shared_memory_threshold_kb == 64
+    assert worker._config.shared_weights is True
+    assert worker._config.quantization == "int8-dynamic"
+    assert worker._config.num_threads == 2
+    assert worker._config.cpu_cores == [0, 1]
+    assert worker._config.model_snapshot_path == os.path.join("/path/to/bart", "snapshots", "facebook--bart-large-cnn")
+
+
+def test_create_selected_model(mock_config: AppConfig, mock_logger: Logger) -> None:
+    # Given
+    mock_config.summarization_model_name = "facebook/bart-large-cnn"
+    mock_config.device = "cpu"
+    mock_config.summarization_model_download_path = "/path/to/models"
+    mock_config.log_level = "INFO"
+    mock_config.summarization_batch_max_size = 8
+    mock_config.summarization_batch_max_wait_ms = 10
+    mock_config.summarization_shared_memory_size_mb = 32
+    mock_config.summarization_shared_memory_threshold_kb = 64
+    mock_config.summarization_model_snapshot = True
+    mock_config.summarization_shared_weights = True
+    factory = SummarizationWorkerFactory(config=mock_config, logger=mock_logger)
+
+    # When
+    worker = factory.create(0, "sshleifer/distilbart-cnn-12-6")
+
+    # Then
+    assert worker._config.model_name == "sshleifer/distilbart-cnn-12-6"
+    assert worker._config.model_snapshot_path == os.path.join(
+        "/path/to/models",
+        "snapshots",
+        "sshleifer--distilbart-cnn-12-6",
+    )
+
+
+@pytest.mark.parametrize(
+    "worker_threads, cpu_affinity, index, expected_num_threads, expected_cpu_cores",
+    [
+        (0, False, 1, 4, []),
+        (0, True, 0, 4, [0, 1, 2, 3]),
+        (0, True, 1, 4, [4, 5, 6, 7]),
+        (3, True, 2, 3, [6, 7, 0]),
+    ],
+)
+def test_get_cpu_topology_splits_cpu_cores_across_workers(
+    mock_config: AppConfig,
+    mock_logger: Logger,
+    worker_threads: int,
+    cpu_affinity: bool,
+    index: int,
+    expected_num_threads: int,
+    expected_cpu_cores: List[int],
+) -> None:
+    # Given
+    mock_config.summarization_worker_pool_size = 2
+    mock_config.summarization_worker_threads = worker_threads
+    mock_config.summarization_worker_cpu_affinity = cpu_affinity
+    factory = SummarizationWorkerFactory(config=mock_config, logger=mock_logger)
+
+    with patch(
+        "data.factories.summarization_worker_factory.os.sched_getaffinity",
+        create=True,
+        return_value=set(range(8)),
+    ):
+        # When
+        num_threads, cpu_cores = factory._get_cpu_topology(index)
+
+    # Then
+    assert num_threads == expected_num_threads
+    assert cpu_cores == expected_cpu_cores
 
 
 def test_create_unsupported_model(mock_config: AppConfig, mock_logger: Logger) -> None:
@@ -51,3 +146,27 @@ def test_create_unsupported_model(mock_config: AppConfig, mock_logger: Logger) -
     # When / Then
     with pytest.raises(UnsupportedModelConfigurationError, match="Unsupported model name: unsupported-model"):
         factory.create()
+
+
+@pytest.mark.parametrize(
+    "quantization, device",
+    [
+        ("int4", "cpu"),
+        ("int8-dynamic", "cuda"),
+    ],
+)
+def test_create_unsupported_quantization(
+    mock_config: AppConfig,
+    mock_logger: Logger,
+    quantization: str,
+    device: str,
+) -> None:
+    # Given
+    mock_config.summarization_model_name = "facebook/bart-large-cnn"
+    mock_config.model_quantization = quantization
+    mock_config.device = device
+    factory = SummarizationWorkerFactory(config=mock_config, logger=mock_logger)
+
+    # When / Then
+    with pytest.raises(UnsupportedQuantizationError, match=f"Unsupported model quantization: {quantization}"):
+        factory.create()
@@ -1,15 +1,40 @@
-from unittest.mock import Mock, patch
+import asyncio
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import AsyncIterator, Optional
+from unittest.mock import AsyncMock, Mock, call, patch
 
 import pytest
 
+from core.cache.sqlite_store import SqliteStore
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
-from core.timer.timer import Timer, TimerFactory
+from core.metrics.request_timings import (
+    RequestTimings,
+    current_request_timings,
+    record_request_stage,
+)
 from data.factories.summarization_worker_factory import SummarizationWorkerFactory
 from data.repositories.summarization_model_repository_impl import (
     SummarizationModelRepositoryImpl,
 )
+from data.workers.base_worker import ProcessMemoryUsage
+from data.workers.summarization_worker_pool import SummarizationWorkerPool
+from domain.exceptions.deadline_exceeded_error import DeadlineExceededError
+from domain.exceptions.unsupported_model_configuration_error import (
+    UnsupportedModelConfigurationError,
+)
+from domain.models.summarization_priority import SummarizationPriority
 from domain.repositories.directory_repository import DirectoryRepository
+from domain.repositories.summarization_tokenizer_repository import (
+    SummarizationTokenizerRepository,
+)
+
+
+def token_ids(text: str) -> "array[int]":
+    return array("i", map(ord, text))
 
 
 @pytest.fixture
@@ -18,7 +43,21 @@ def mock_config() -> AppConfig:
     config.summarization_model_download_path = "/models"
     config.device = "cpu"
     config.summarization_model_name = "facebook/bart"
+    config.summarization_models = ["facebook/bart"]
+    config.model_memory_budget_mb = 0
+    config.summarization_queue_max_size = 0
+    config.summarization_queue_max_wait = 0
+    config.summarization_batch_max_size = 8
+    config.summarization_bulk_max_wait = 0
     config.model_idle_timeout = 60
+    config.model_preload = False
+    config.model_warmup_token_lengths = [4, 512]
+    config.summarization_worker_pool_size = 1
+    config.summary_cache_max_size_mb = 1
+    config.summary_cache_ttl = 60
+    config.summary_cache_include_sampling = False
+    config.summary_store_path = ""
+    config.summary_store_max_size_mb = 1
     return config
 
 
@@ -27,18 +66,6 @@ def mock_directory_repository() -> Mock:
     return Mock(spec=DirectoryRepository)
 
 
-@pytest.fixture
-def mock_timer() -> Mock:
-    return Mock(spec=Timer)
-
-
-@pytest.fixture
-def mock_timer_factory(mock_timer: Mock) -> Mock:
-    factory = Mock(spec=TimerFactory)
-    factory.create.return_value = mock_timer
-    return factory
-
-
 @pytest.fixture
 def mock_logger() -> Mock:
     return Mock(spec=Logger)
@@ -56,31 +83,39 @@ def mock_worker_factory(mock_worker: Mock) -> Mock:
     return factory
 
 
+@pytest.fixture
+def mock_tokenizer_repository() -> Mock:
+    tokenizer_repository = Mock(spec=SummarizationTokenizerRepository)
+    tokenizer_repository.tokenize.side_effect = lambda text, model_name=None: token_ids(text)
+    tokenizer_repository.tokenize_batch.side_effect = lambda texts, model_name=None: [token_ids(text) for text in texts]
+    return tokenizer_repository
+
+
 @pytest.fixture
 def summarize_model_repository_impl(
     mock_config: Mock,
     mock_directory_repository: Mock,
-    mock_timer_factory: Mock,
     mock_logger: Mock,
     mock_worker_factory: Mock,
+    mock_tokenizer_repository: Mock,
 ) -> SummarizationModelRepositoryImpl:
     with patch.object(SummarizationModelRepositoryImpl, "_instance", None):
         return SummarizationModelRepositoryImpl(
             config=mock_config,
             directory_repository=mock_directory_repository,
-            timer_factory=mock_timer_factory,
             logger=mock_logger,
             worker_factory=mock_worker_factory,
+            tokenizer_repository=mock_tokenizer_repository,
         )
 
 
 def test_summarize_success(
     summarize_model_repository_impl: SummarizationModelRepositoryImpl,
     mock_worker: Mock,
-    mock_timer: Mock,
 ) -> None:
     # Given
     mock_worker.is_alive.return_value = False
+    mock_worker.start.side_effect = lambda: setattr(mock_worker.is_alive, "return_value", True)
     mock_worker.summarize.return_value = "text"
 
     # When
@@ -89,25 +124,1091 @@ def test_summarize_success(
     # Then
     assert result == "text"
     mock_worker.start.assert_called_once()
-    mock_worker.summarize.assert_called_once_with("text to summarize", {})
-    mock_timer.start.assert_called_once_with(60, summarize_model_repository_impl._check_idle_timeout)
+    mock_worker.summarize.assert_called_once_with(token_ids("text to summarize"), {})
+    assert summarize_model_repository_impl.model_registry.pools["facebook/bart"]._reaper_thread is not None
+
 
+@pytest.mark.asyncio
+async def test_summarize_async_success(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(return_value="text")
+
+    # When
+    result = await summarize_model_repository_impl.summarize_async("text to summarize", {})
+
+    # Then
+    assert result == "text"
+    mock_worker.start.assert_not_called()
+    mock_worker.summarize_async.assert_awaited_once_with(token_ids("text to summarize"), {})
+    assert summarize_model_repository_impl.model_registry.pools["facebook/bart"]._reaper_thread is not None
 
-def test_check_idle_timeout_stops_worker(
+
+@pytest.mark.asyncio
+async def test_summarize_async_loads_model_off_the_event_loop(
     summarize_model_repository_impl: SummarizationModelRepositoryImpl,
     mock_worker: Mock,
-    mock_timer: Mock,
+) -> None:
+    # Given
+    mock_worker.summarize_async = AsyncMock(return_value="text")
+    mock_worker.summarize_batch_async = AsyncMock(return_value=["other summary"])
+    model_registry = summarize_model_repository_impl.model_registry
+    get_pool = model_registry.get_pool
+    load_threads = []
+
+    def get_pool_in_thread(model_name: Optional[str] = None) -> SummarizationWorkerPool:
+        load_threads.append(threading.get_ident())
+        return get_pool(model_name)
+
+    # When
+    with patch.object(model_registry, "get_pool", side_effect=get_pool_in_thread):
+        await summarize_model_repository_impl.summarize_async("text to summarize", {})
+        await summarize_model_repository_impl.summarize_batch_async(["other text"], [{}])
+
+    # Then
+    assert len(load_threads) == 2
+    assert threading.get_ident() not in load_threads
+
+
+@pytest.mark.asyncio
+async def test_preload_async_warms_up_worker_before_reporting_ready(
+    mock_config: Mock,
+    mock_directory_repository: Mock,
     mock_logger: Mock,
+    mock_worker_factory: Mock,
+    mock_tokenizer_repository: Mock,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    mock_config.model_preload = True
+    mock_tokenizer_repository.get_max_input_tokens.return_value = 8
+    mock_tokenizer_repository.tokenize.side_effect = lambda text, model_name=None: array("i", range(8))
+    mock_worker.is_alive.return_value = False
+    mock_worker.start.side_effect = lambda: setattr(mock_worker.is_alive, "return_value", True)
+    mock_worker.summarize_async = AsyncMock(return_value="summary")
+
+    with patch.object(SummarizationModelRepositoryImpl, "_instance", None):
+        repository = SummarizationModelRepositoryImpl(
+            config=mock_config,
+            directory_repository=mock_directory_repository,
+            logger=mock_logger,
+            worker_factory=mock_worker_factory,
+            tokenizer_repository=mock_tokenizer_repository,
+        )
+
+    is_ready_before_preload = repository.is_ready()
+
+    # When
+    await repository.preload_async()
+
+    # Then
+    assert is_ready_before_preload is False
+    assert repository.is_ready() is True
+    mock_worker.start.assert_called_once()
+    assert [call.args[0] for call in mock_worker.summarize_async.await_args_list] == [
+        array("i", [0, 1, 2, 7]),
+        array("i", range(8)),
+        array("i", [0, 1, 2, 7]),
+    ]
+    assert repository.model_registry.pools["facebook/bart"]._reaper_thread is None
+
+
+def test_is_ready_without_preload(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # When
+    is_ready = summarize_model_repository_impl.is_ready()
+
+    # Then
+    assert is_ready is True
+    mock_worker.start.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_split_text_async_uses_tokenizer_without_starting_worker(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_tokenizer_repository: Mock,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    mock_tokenizer_repository.split_text.return_value = ["first", "second"]
+
+    # When
+    result = await summarize_model_repository_impl.split_text_async("long text", 512, 64)
+
+    # Then
+    assert result == ["first", "second"]
+    mock_tokenizer_repository.split_text.assert_called_once_with("long text", 512, 64, None)
+    mock_worker.start.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_count_tokens_async_uses_tokenizer(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_tokenizer_repository: Mock,
+) -> None:
+    # Given
+    mock_tokenizer_repository.count_tokens.return_value = 2048
+    mock_tokenizer_repository.get_max_input_tokens.return_value = 1024
+
+    # When
+    token_count = await summarize_model_repository_impl.count_tokens_async("long text")
+    max_input_tokens = summarize_model_repository_impl.get_max_input_tokens()
+
+    # Then
+    assert token_count == 2048
+    assert max_input_tokens == 1024
+    mock_tokenizer_repository.count_tokens.assert_called_once_with("long text", None)
+
+
+@pytest.mark.asyncio
+async def test_count_tokens_async_uses_tokenizer_of_selected_model(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_config: Mock,
+    mock_tokenizer_repository: Mock,
+) -> None:
+    # Given
+    mock_config.summarization_models = ["facebook/bart", "allenai/led-base-16384"]
+    mock_tokenizer_repository.count_tokens.return_value = 2048
+    mock_tokenizer_repository.get_max_input_tokens.return_value = 16384
+
+    with patch.object(SummarizationModelRepositoryImpl, "_instance", None):
+        repository = SummarizationModelRepositoryImpl(
+            config=mock_config,
+            directory_repository=Mock(DirectoryRepository),
+            logger=Mock(Logger),
+            worker_factory=Mock(SummarizationWorkerFactory),
+            tokenizer_repository=mock_tokenizer_repository,
+        )
+
+    # When
+    token_count = await repository.count_tokens_async("long text", "allenai/led-base-16384")
+    max_input_tokens = repository.get_max_input_tokens("allenai/led-base-16384")
+
+    # Then
+    assert token_count == 2048
+    assert max_input_tokens == 16384
+    mock_tokenizer_repository.count_tokens.assert_called_once_with("long text", "allenai/led-base-16384")
+    mock_tokenizer_repository.get_max_input_tokens.assert_called_once_with("allenai/led-base-16384")
+
+
+@pytest.mark.asyncio
+async def test_count_tokens_async_rejects_unknown_model(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_tokenizer_repository: Mock,
+) -> None:
+    # When
+    with pytest.raises(UnsupportedModelConfigurationError):
+        await summarize_model_repository_impl.count_tokens_async("text", "unknown/model")
+
+    # Then
+    mock_tokenizer_repository.count_tokens.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_summarize_batch_async_success(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
 ) -> None:
     # Given
     mock_worker.is_alive.return_value = True
-    mock_worker.is_processing.return_value = False
+    mock_worker.summarize_batch_async = AsyncMock(return_value=["first", "second"])
 
     # When
-    summarize_model_repository_impl._check_idle_timeout()
+    result = await summarize_model_repository_impl.summarize_batch_async(["text 1", "text 2"], [{}, {}])
 
     # Then
-    mock_worker.stop.assert_called_once()
-    mock_timer.cancel.assert_called_once()
-    mock_logger.debug.assert_any_call("Checking summarization model idle timeout")
-    mock_logger.info.assert_any_call("Summarization model stopped due to idle timeout")
+    assert result == ["first", "second"]
+    mock_worker.summarize_batch_async.assert_awaited_once_with(
+        [token_ids("text 1"), token_ids("text 2")],
+        [{}, {}],
+    )
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_serves_repeated_text_from_cache(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(return_value="summary")
+    await summarize_model_repository_impl.summarize_async("Breaking  news\n", {"num_beams": 2, "max_length": 50})
+
+    # When
+    result = await summarize_model_repository_impl.summarize_async(
+        " Breaking news",
+        {"max_length": 50, "num_beams": 2},
+    )
+
+    # Then
+    assert result == "summary"
+    mock_worker.summarize_async.assert_awaited_once()
+    cache_status = summarize_model_repository_impl.get_cache_status()
+    assert cache_status is not None
+    assert (cache_status.hits, cache_status.misses, cache_status.entries) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_bypass_cache_refreshes_cached_summary(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(side_effect=["old summary", "new summary"])
+    await summarize_model_repository_impl.summarize_async("text", {})
+
+    # When
+    bypassed_result = await summarize_model_repository_impl.summarize_async("text", {}, bypass_cache=True)
+    cached_result = await summarize_model_repository_impl.summarize_async("text", {})
+
+    # Then
+    assert bypassed_result == "new summary"
+    assert cached_result == "new summary"
+    assert mock_worker.summarize_async.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_does_not_cache_sampling_requests(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(side_effect=["first sample", "second sample"])
+
+    # When
+    first_result = await summarize_model_repository_impl.summarize_async("text", {"do_sample": True})
+    second_result = await summarize_model_repository_impl.summarize_async("text", {"do_sample": True})
+
+    # Then
+    assert (first_result, second_result) == ("first sample", "second sample")
+    cache_status = summarize_model_repository_impl.get_cache_status()
+    assert cache_status is not None
+    assert cache_status.entries == 0
+
+
+def test_summarize_caches_per_model_and_parameters(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+    mock_config: Mock,
+) -> None:
+    # Given
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize.return_value = "summary"
+    summarize_model_repository_impl.summarize("text", {"num_beams": 2})
+
+    # When
+    summarize_model_repository_impl.summarize("text", {"num_beams": 4})
+    mock_config.summarization_model_name = "facebook/bart-large-xsum"
+    summarize_model_repository_impl.summarize("text", {"num_beams": 2})
+
+    # Then
+    assert mock_worker.summarize.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_summarize_batch_async_only_sends_cache_misses(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(return_value="cached")
+    await summarize_model_repository_impl.summarize_async("text 2", {})
+    error = ValueError("Invalid input")
+    mock_worker.summarize_batch_async = AsyncMock(return_value=["first", error])
+
+    # When
+    result = await summarize_model_repository_impl.summarize_batch_async(
+        ["text 1", "text 2", "text 3"],
+        [{}, {}, {}],
+    )
+
+    # Then
+    assert result == ["first", "cached", error]
+    mock_worker.summarize_batch_async.assert_awaited_once_with(
+        [token_ids("text 1"), token_ids("text 3")],
+        [{}, {}],
+    )
+    cache_status = summarize_model_repository_impl.get_cache_status()
+    assert cache_status is not None
+    assert cache_status.entries == 2
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_coalesces_identical_in_flight_requests(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    release = asyncio.Event()
+
+    async def summarize_async(*_: object) -> str:
+        await release.wait()
+        return "summary"
+
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(side_effect=summarize_async)
+    requests = [
+        asyncio.create_task(summarize_model_repository_impl.summarize_async("text", {"num_beams": 2})) for _ in range(5)
+    ]
+    await asyncio.sleep(0.1)
+
+    # When
+    release.set()
+    results = await asyncio.gather(*requests)
+
+    # Then
+    assert results == ["summary"] * 5
+    mock_worker.summarize_async.assert_awaited_once()
+    assert summarize_model_repository_impl.get_coalesced_requests_count() == 4
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_shares_error_with_coalesced_requests(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    release = asyncio.Event()
+    error = ValueError("Invalid input")
+
+    async def summarize_async(*_: object) -> str:
+        await release.wait()
+        raise error
+
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(side_effect=summarize_async)
+    requests = [asyncio.create_task(summarize_model_repository_impl.summarize_async("text", {})) for _ in range(3)]
+    await asyncio.sleep(0.1)
+
+    # When
+    release.set()
+    results = await asyncio.gather(*requests, return_exceptions=True)
+
+    # Then
+    assert all(isinstance(result, ValueError) for result in results)
+    mock_worker.summarize_async.assert_awaited_once()
+    assert summarize_model_repository_impl.get_coalesced_requests_count() == 2
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_coalesced_request_stops_waiting_at_its_deadline(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    release = asyncio.Event()
+
+    async def summarize_async(*_: object) -> str:
+        await release.wait()
+        return "summary"
+
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(side_effect=summarize_async)
+    owner = asyncio.create_task(summarize_model_repository_impl.summarize_async("text", {}))
+    await asyncio.sleep(0.1)
+
+    # When
+    with pytest.raises(DeadlineExceededError):
+        await summarize_model_repository_impl.summarize_async("text", {}, deadline=time.monotonic() + 0.1)
+
+    release.set()
+
+    # Then
+    assert await owner == "summary"
+    mock_worker.summarize_async.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_coalesced_request_outlives_deadline_of_first_request(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    release = asyncio.Event()
+
+    async def summarize_async(*_: object) -> str:
+        await release.wait()
+        return "summary"
+
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(side_effect=summarize_async)
+    owner = asyncio.create_task(
+        summarize_model_repository_impl.summarize_async("text", {}, deadline=time.monotonic() + 0.2),
+    )
+    await asyncio.sleep(0.05)
+    waiter = asyncio.create_task(
+        summarize_model_repository_impl.summarize_async("text", {}, deadline=time.monotonic() + 10),
+    )
+
+    # When
+    with pytest.raises(DeadlineExceededError):
+        await owner
+
+    await asyncio.sleep(0.1)
+    release.set()
+
+    # Then
+    assert await waiter == "summary"
+    mock_worker.summarize_async.assert_awaited_once()
+    assert summarize_model_repository_impl.model_registry.pools["facebook/bart"].deadline_exceeded_requests == 1
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_coalesced_request_gets_summary_when_first_request_disconnects(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    release = asyncio.Event()
+
+    async def summarize_async(*_: object) -> str:
+        await release.wait()
+        return "summary"
+
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(side_effect=summarize_async)
+    owner = asyncio.create_task(summarize_model_repository_impl.summarize_async("text", {}))
+    await asyncio.sleep(0.1)
+    waiter = asyncio.create_task(summarize_model_repository_impl.summarize_async("text", {}))
+    await asyncio.sleep(0.1)
+
+    # When
+    owner.cancel()
+    await asyncio.sleep(0.1)
+    release.set()
+
+    # Then
+    assert await waiter == "summary"
+    assert owner.cancelled()
+    mock_worker.summarize_async.assert_awaited_once()
+    assert summarize_model_repository_impl.get_coalesced_requests_count() == 1
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_cancels_shared_summarization_when_every_request_disconnects(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    cancelled = asyncio.Event()
+
+    async def summarize_async(*_: object) -> str:
+        try:
+            await asyncio.sleep(10)
+
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+        return "summary"
+
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(side_effect=summarize_async)
+    requests = [asyncio.create_task(summarize_model_repository_impl.summarize_async("text", {})) for _ in range(2)]
+    await asyncio.sleep(0.1)
+
+    # When
+    requests[0].cancel()
+    await asyncio.sleep(0.1)
+    cancelled_with_waiter_left = cancelled.is_set()
+    requests[1].cancel()
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    await asyncio.sleep(0.1)
+
+    # Then
+    assert not cancelled_with_waiter_left
+    assert all(request.cancelled() for request in requests)
+    assert summarize_model_repository_impl._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_interactive_request_does_not_wait_for_bulk_request(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    release = asyncio.Event()
+
+    async def summarize_async(*_: object) -> str:
+        await release.wait()
+        return "summary"
+
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(side_effect=summarize_async)
+    bulk = asyncio.create_task(
+        summarize_model_repository_impl.summarize_async("text", {}, priority=SummarizationPriority.BULK),
+    )
+    await asyncio.sleep(0.1)
+
+    # When
+    interactive = asyncio.create_task(summarize_model_repository_impl.summarize_async("text", {}))
+    await asyncio.sleep(0.1)
+    requests = [
+        asyncio.create_task(summarize_model_repository_impl.summarize_async("text", {}, priority=priority))
+        for priority in SummarizationPriority
+    ]
+    await asyncio.sleep(0.1)
+    release.set()
+    results = await asyncio.gather(bulk, interactive, *requests)
+
+    # Then
+    assert results == ["summary"] * 4
+    assert mock_worker.summarize_async.await_count == 2
+    assert summarize_model_repository_impl.get_coalesced_requests_count() == 2
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_does_not_coalesce_sampling_requests(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(return_value="summary")
+
+    # When
+    await asyncio.gather(
+        summarize_model_repository_impl.summarize_async("text", {"do_sample": True}),
+        summarize_model_repository_impl.summarize_async("text", {"do_sample": True}),
+    )
+
+    # Then
+    assert mock_worker.summarize_async.await_count == 2
+    assert summarize_model_repository_impl.get_coalesced_requests_count() == 0
+
+
+def test_summarize_coalesces_identical_requests_across_threads(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    release = threading.Event()
+    results: list[str] = []
+
+    def summarize(*_: object) -> str:
+        release.wait()
+        return "summary"
+
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize.side_effect = summarize
+    threads = [
+        threading.Thread(target=lambda: results.append(summarize_model_repository_impl.summarize("text", {})))
+        for _ in range(3)
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    while summarize_model_repository_impl.get_coalesced_requests_count() < 2:
+        time.sleep(0.01)
+
+    # When
+    release.set()
+
+    for thread in threads:
+        thread.join()
+
+    # Then
+    assert results == ["summary"] * 3
+    mock_worker.summarize.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_summarize_batch_async_coalesces_duplicate_items(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_batch_async = AsyncMock(return_value=["first", "second"])
+
+    # When
+    result = await summarize_model_repository_impl.summarize_batch_async(
+        ["text 1", "text 1", "text 2"],
+        [{}, {}, {}],
+    )
+
+    # Then
+    assert result == ["first", "first", "second"]
+    mock_worker.summarize_batch_async.assert_awaited_once_with(
+        [token_ids("text 1"), token_ids("text 2")],
+        [{}, {}],
+    )
+    assert summarize_model_repository_impl.get_coalesced_requests_count() == 1
+
+
+def test_get_cache_status_returns_none_when_cache_is_disabled(
+    mock_config: Mock,
+    mock_directory_repository: Mock,
+    mock_logger: Mock,
+    mock_worker_factory: Mock,
+    mock_tokenizer_repository: Mock,
+) -> None:
+    # Given
+    mock_config.summary_cache_max_size_mb = 0
+
+    with patch.object(SummarizationModelRepositoryImpl, "_instance", None):
+        repository = SummarizationModelRepositoryImpl(
+            config=mock_config,
+            directory_repository=mock_directory_repository,
+            logger=mock_logger,
+            worker_factory=mock_worker_factory,
+            tokenizer_repository=mock_tokenizer_repository,
+        )
+
+    # When
+    result = repository.get_cache_status()
+
+    # Then
+    assert result is None
+
+
+def create_repository(
+    mock_config: Mock,
+    mock_directory_repository: Mock,
+    mock_logger: Mock,
+    mock_worker_factory: Mock,
+    mock_tokenizer_repository: Mock,
+) -> SummarizationModelRepositoryImpl:
+    with patch.object(SummarizationModelRepositoryImpl, "_instance", None):
+        return SummarizationModelRepositoryImpl(
+            config=mock_config,
+            directory_repository=mock_directory_repository,
+            logger=mock_logger,
+            worker_factory=mock_worker_factory,
+            tokenizer_repository=mock_tokenizer_repository,
+        )
+
+
+@pytest.mark.asyncio
+async def test_summary_store_warm_loads_cache_after_restart(
+    tmp_path: Path,
+    mock_config: Mock,
+    mock_directory_repository: Mock,
+    mock_logger: Mock,
+    mock_worker_factory: Mock,
+    mock_tokenizer_repository: Mock,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    mock_config.summary_store_path = str(tmp_path)
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(return_value="summary")
+    repository = create_repository(
+        mock_config,
+        mock_directory_repository,
+        mock_logger,
+        mock_worker_factory,
+        mock_tokenizer_repository,
+    )
+    await repository.summarize_async("text", {})
+    repository.summary_store.close()
+
+    # When
+    restarted_repository = create_repository(
+        mock_config,
+        mock_directory_repository,
+        mock_logger,
+        mock_worker_factory,
+        mock_tokenizer_repository,
+    )
+    result = await restarted_repository.summarize_async("text", {})
+
+    # Then
+    assert result == "summary"
+    mock_worker.summarize_async.assert_awaited_once()
+    mock_directory_repository.create_directory.assert_any_call(str(tmp_path))
+    mock_logger.info.assert_any_call("Warm-loaded 1 summaries from the summary store")
+
+
+@pytest.mark.asyncio
+async def test_stop_async_stops_workers_and_flushes_summary_store(
+    tmp_path: Path,
+    mock_config: Mock,
+    mock_directory_repository: Mock,
+    mock_logger: Mock,
+    mock_worker_factory: Mock,
+    mock_tokenizer_repository: Mock,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    mock_config.summary_store_path = str(tmp_path)
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(return_value="summary")
+    repository = create_repository(
+        mock_config,
+        mock_directory_repository,
+        mock_logger,
+        mock_worker_factory,
+        mock_tokenizer_repository,
+    )
+    await repository.summarize_async("text", {})
+
+    # When
+    await repository.stop_async()
+
+    # Then
+    mock_worker.stop.assert_called_once_with()
+    summary_store = SqliteStore(str(tmp_path / "summaries.sqlite3"), 1024 * 1024, 60, mock_logger)
+    stored_summaries = summary_store.load_recent(1024)
+    assert [summary for _, summary in stored_summaries] == ["summary"]
+
+
+@pytest.mark.asyncio
+async def test_summary_store_serves_summaries_without_memory_cache(
+    tmp_path: Path,
+    mock_config: Mock,
+    mock_directory_repository: Mock,
+    mock_logger: Mock,
+    mock_worker_factory: Mock,
+    mock_tokenizer_repository: Mock,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    mock_config.summary_store_path = str(tmp_path)
+    mock_config.summary_cache_max_size_mb = 0
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(return_value="summary")
+    repository = create_repository(
+        mock_config,
+        mock_directory_repository,
+        mock_logger,
+        mock_worker_factory,
+        mock_tokenizer_repository,
+    )
+    await repository.summarize_async("text", {})
+    repository.summary_store.close()
+
+    # When
+    result = await repository.summarize_async("text", {})
+
+    # Then
+    assert result == "summary"
+    mock_worker.summarize_async.assert_awaited_once()
+    assert repository.get_cache_status() is None
+
+
+@pytest.mark.asyncio
+async def test_summary_store_is_read_off_the_event_loop(
+    tmp_path: Path,
+    mock_config: Mock,
+    mock_directory_repository: Mock,
+    mock_logger: Mock,
+    mock_worker_factory: Mock,
+    mock_tokenizer_repository: Mock,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    mock_config.summary_store_path = str(tmp_path)
+    mock_worker.summarize_async = AsyncMock()
+    repository = create_repository(
+        mock_config,
+        mock_directory_repository,
+        mock_logger,
+        mock_worker_factory,
+        mock_tokenizer_repository,
+    )
+    lookup_threads = []
+
+    def get_stored_summary(cache_key: str) -> str:
+        lookup_threads.append(threading.get_ident())
+        return "stored summary"
+
+    # When
+    with patch.object(repository.summary_store, "get", side_effect=get_stored_summary):
+        result = await repository.summarize_async("text", {})
+        batch_results = await repository.summarize_batch_async(["other text", "third text"], [{}, {}])
+
+    repository.summary_store.close()
+
+    # Then
+    assert result == "stored summary"
+    assert batch_results == ["stored summary", "stored summary"]
+    assert len(lookup_threads) == 3
+    assert threading.get_ident() not in lookup_threads
+    mock_worker.summarize_async.assert_not_awaited()
+
+
+async def stream_partial_summaries(*partial_summaries: str) -> AsyncIterator[str]:
+    for partial_summary in partial_summaries:
+        yield partial_summary
+
+
+@pytest.mark.asyncio
+async def test_summarize_stream_async_success(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_stream_async.return_value = stream_partial_summaries("Hello ", "world")
+
+    # When
+    result = [
+        partial_summary
+        async for partial_summary in summarize_model_repository_impl.summarize_stream_async("text to summarize", {})
+    ]
+
+    # Then
+    assert result == ["Hello ", "world"]
+    mock_worker.summarize_stream_async.assert_called_once_with(token_ids("text to summarize"), {})
+    worker_pool = summarize_model_repository_impl.model_registry.pools["facebook/bart"]
+    assert worker_pool._reaper_thread is not None
+    assert worker_pool.time_to_first_token_histogram.count == 1
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_observes_tokenization_in_api_process(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+    mock_tokenizer_repository: Mock,
+) -> None:
+    # Given
+    def tokenize(text: str, model_name: Optional[str] = None) -> "array[int]":
+        time.sleep(0.05)
+        return token_ids(text)
+
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(return_value="summary")
+    mock_worker.summarize_batch_async = AsyncMock(return_value=["first", "second"])
+    mock_tokenizer_repository.tokenize.side_effect = tokenize
+
+    # When
+    await summarize_model_repository_impl.summarize_async("text", {})
+    await summarize_model_repository_impl.summarize_batch_async(["text 1", "text 2"], [{}, {}])
+
+    # Then
+    tokenize_histogram = summarize_model_repository_impl.model_registry.pools["facebook/bart"].tokenize_histogram
+    assert tokenize_histogram.count == 3
+    assert tokenize_histogram.sum >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_records_tokenization_in_request_timings(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+    mock_tokenizer_repository: Mock,
+) -> None:
+    # Given
+    def tokenize(text: str, model_name: Optional[str] = None) -> "array[int]":
+        time.sleep(0.05)
+        return token_ids(text)
+
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(return_value="summary")
+    mock_tokenizer_repository.tokenize.side_effect = tokenize
+    request_timings = RequestTimings(time.perf_counter())
+    current_request_timings.set(request_timings)
+
+    # When
+    await summarize_model_repository_impl.summarize_async("text", {})
+
+    # Then
+    assert request_timings.durations["tokenize"] >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_coalesced_request_records_stages_of_shared_summarization(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    release = asyncio.Event()
+
+    async def summarize_async(*_: object) -> str:
+        await release.wait()
+        record_request_stage("generate", 0.5)
+        return "summary"
+
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(side_effect=summarize_async)
+    owner_timings = RequestTimings(time.perf_counter())
+    waiter_timings = RequestTimings(time.perf_counter())
+    current_request_timings.set(owner_timings)
+    owner = asyncio.create_task(summarize_model_repository_impl.summarize_async("text", {}))
+    await asyncio.sleep(0.1)
+    current_request_timings.set(waiter_timings)
+    waiter = asyncio.create_task(summarize_model_repository_impl.summarize_async("text", {}))
+    await asyncio.sleep(0.1)
+
+    # When
+    release.set()
+    await asyncio.gather(owner, waiter)
+
+    # Then
+    assert summarize_model_repository_impl.get_coalesced_requests_count() == 1
+    assert owner_timings.durations.keys() == {"tokenize", "queue", "generate"}
+    assert waiter_timings.durations == owner_timings.durations
+
+
+@pytest.mark.asyncio
+async def test_summarize_batch_async_duplicate_item_records_stages_of_request_it_joined(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    release = asyncio.Event()
+
+    async def summarize_async(*_: object) -> str:
+        await release.wait()
+        record_request_stage("generate", 0.5)
+        return "summary"
+
+    mock_worker.is_alive.return_value = True
+    mock_worker.summarize_async = AsyncMock(side_effect=summarize_async)
+    owner = asyncio.create_task(summarize_model_repository_impl.summarize_async("text", {}))
+    await asyncio.sleep(0.1)
+    request_timings = RequestTimings(time.perf_counter())
+    current_request_timings.set(request_timings)
+    batch = asyncio.create_task(summarize_model_repository_impl.summarize_batch_async(["text"], [{}]))
+    await asyncio.sleep(0.1)
+
+    # When
+    release.set()
+    results = await batch
+    await owner
+
+    # Then
+    assert results == ["summary"]
+    assert request_timings.durations["generate"] == 0.5
+    assert "queue" in request_timings.durations
+
+
+def test_reap_idle_workers_stops_worker(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+    mock_logger: Mock,
+) -> None:
+    # Given
+    mock_worker.is_alive.return_value = True
+    worker_pool = summarize_model_repository_impl.model_registry.pools["facebook/bart"]
+
+    # When
+    with worker_pool._lock:
+        idle_indices, next_deadline = worker_pool._reap_idle_workers(worker_pool.last_access_times[0] + 60)
+
+    worker_pool._stop_workers(idle_indices)
+
+    # Then
+    assert idle_indices == [0]
+    assert next_deadline is None
+    mock_worker.stop.assert_called_once()
+
+
+def test_initialize_creates_worker_pool_of_configured_size(
+    mock_config: Mock,
+    mock_directory_repository: Mock,
+    mock_logger: Mock,
+    mock_worker_factory: Mock,
+    mock_tokenizer_repository: Mock,
+) -> None:
+    # Given
+    mock_config.summarization_worker_pool_size = 3
+
+    with patch.object(SummarizationModelRepositoryImpl, "_instance", None):
+        # When
+        repository = SummarizationModelRepositoryImpl(
+            config=mock_config,
+            directory_repository=mock_directory_repository,
+            logger=mock_logger,
+            worker_factory=mock_worker_factory,
+            tokenizer_repository=mock_tokenizer_repository,
+        )
+
+    # Then
+    assert len(repository.model_registry.pools["facebook/bart"].workers) == 3
+    assert mock_worker_factory.create.call_args_list == [
+        call(0, "facebook/bart"),
+        call(1, "facebook/bart"),
+        call(2, "facebook/bart"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_statuses_async_reads_worker_memory_once(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    mock_worker.is_alive.return_value = True
+    mock_worker.is_processing.return_value = False
+    mock_worker.get_pid.return_value = 42
+    mock_worker.get_memory_usage.return_value = ProcessMemoryUsage(
+        resident_bytes=300,
+        proportional_bytes=200,
+        unique_bytes=100,
+    )
+
+    # When
+    worker_statuses, model_statuses = await summarize_model_repository_impl.get_statuses_async()
+
+    # Then
+    assert len(worker_statuses) == 1
+    assert worker_statuses[0].pid == 42
+    assert worker_statuses[0].is_alive
+    assert not worker_statuses[0].is_busy
+    assert worker_statuses[0].proportional_memory_bytes == 200
+    assert model_statuses[0].memory_bytes == 200
+    mock_worker.get_memory_usage.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_routes_request_to_selected_model(
+    mock_config: Mock,
+    mock_directory_repository: Mock,
+    mock_logger: Mock,
+    mock_worker_factory: Mock,
+    mock_tokenizer_repository: Mock,
+) -> None:
+    # Given
+    mock_config.summarization_models = ["facebook/bart", "facebook/bart-large-xsum"]
+    workers = {"facebook/bart": Mock(), "facebook/bart-large-xsum": Mock()}
+    mock_worker_factory.create.side_effect = lambda index, model_name: workers[model_name]
+
+    for worker in workers.values():
+        worker.is_alive.return_value = True
+        worker.get_memory_usage.return_value = None
+
+    workers["facebook/bart"].summarize_async = AsyncMock(return_value="default summary")
+    workers["facebook/bart-large-xsum"].summarize_async = AsyncMock(return_value="selected summary")
+
+    with patch.object(SummarizationModelRepositoryImpl, "_instance", None):
+        repository = SummarizationModelRepositoryImpl(
+            config=mock_config,
+            directory_repository=mock_directory_repository,
+            logger=mock_logger,
+            worker_factory=mock_worker_factory,
+            tokenizer_repository=mock_tokenizer_repository,
+        )
+
+    # When
+    default_summary = await repository.summarize_async("text", {})
+    selected_summary = await repository.summarize_async("text", {}, model_name="facebook/bart-large-xsum")
+
+    # Then
+    assert default_summary == "default summary"
+    assert selected_summary == "selected summary"
+    mock_tokenizer_repository.tokenize.assert_called_with("text", "facebook/bart-large-xsum")
+    _, model_statuses = await repository.get_statuses_async()
+    assert [model_status.requests for model_status in model_statuses] == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_rejects_unknown_model(
+    summarize_model_repository_impl: SummarizationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # When
+    with pytest.raises(UnsupportedModelConfigurationError):
+        await summarize_model_repository_impl.summarize_async("text", {}, model_name="unknown/model")
+
+    # Then
+    mock_worker.start.assert_not_called()
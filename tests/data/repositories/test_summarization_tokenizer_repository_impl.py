@@ -0,0 +1,223 @@
+from array import array
+from typing import Generator
+from unittest.mock import MagicMock, Mock, call, patch
+
+import pytest
+from transformers.tokenization_utils_base import VERY_LARGE_INTEGER
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from data.repositories.summarization_tokenizer_repository_impl import (
+    SummarizationTokenizerRepositoryImpl,
+)
+from domain.exceptions.chunk_size_too_large_error import ChunkSizeTooLargeError
+
+
+@pytest.fixture
+def mock_config() -> AppConfig:
+    config = Mock(AppConfig)
+    config.summarization_model_name = "facebook/bart-large-cnn"
+    config.summarization_model_download_path = "/models"
+    return config
+
+
+@pytest.fixture
+def mock_tokenizer() -> MagicMock:
+    tokenizer = MagicMock()
+    tokenizer.model_max_length = 1024
+    tokenizer.num_special_tokens_to_add.return_value = 2
+    return tokenizer
+
+
+@pytest.fixture
+def tokenizer_repository(
+    mock_config: AppConfig,
+    mock_tokenizer: MagicMock,
+) -> Generator[SummarizationTokenizerRepositoryImpl, None, None]:
+    with (
+        patch.object(SummarizationTokenizerRepositoryImpl, "_instance", None),
+        patch(
+            "data.repositories.summarization_tokenizer_repository_impl.AutoTokenizer.from_pretrained",
+            return_value=mock_tokenizer,
+        ),
+    ):
+        yield SummarizationTokenizerRepositoryImpl(config=mock_config, logger=Mock(Logger))
+
+
+def test_tokenize_returns_truncated_int32_token_ids(
+    tokenizer_repository: SummarizationTokenizerRepositoryImpl,
+    mock_tokenizer: MagicMock,
+) -> None:
+    # Given
+    mock_tokenizer.return_value = {"input_ids": [0, 31414, 2]}
+
+    # When
+    token_ids = tokenizer_repository.tokenize("Hello")
+
+    # Then
+    assert token_ids == array("i", [0, 31414, 2])
+    mock_tokenizer.assert_called_once_with("Hello", max_length=1024, truncation=True)
+
+
+def test_tokenize_batch_tokenizes_texts_together(
+    tokenizer_repository: SummarizationTokenizerRepositoryImpl,
+    mock_tokenizer: MagicMock,
+) -> None:
+    # Given
+    mock_tokenizer.return_value = {"input_ids": [[0, 1, 2], [0, 2]]}
+
+    # When
+    batch_token_ids = tokenizer_repository.tokenize_batch(["first", "second"])
+
+    # Then
+    assert batch_token_ids == [array("i", [0, 1, 2]), array("i", [0, 2])]
+    mock_tokenizer.assert_called_once_with(["first", "second"], max_length=1024, truncation=True)
+
+
+def test_tokenizer_is_loaded_once_on_first_use(
+    tokenizer_repository: SummarizationTokenizerRepositoryImpl,
+    mock_config: AppConfig,
+    mock_tokenizer: MagicMock,
+) -> None:
+    # Given
+    mock_tokenizer.return_value = {"input_ids": list(range(2000))}
+
+    with patch(
+        "data.repositories.summarization_tokenizer_repository_impl.AutoTokenizer.from_pretrained",
+        return_value=mock_tokenizer,
+    ) as mock_load_tokenizer:
+        # When
+        first_count = tokenizer_repository.count_tokens("long text")
+        second_count = tokenizer_repository.count_tokens("long text")
+
+    # Then
+    assert first_count == second_count == 2000
+    mock_load_tokenizer.assert_called_once_with("facebook/bart-large-cnn", cache_dir="/models")
+
+
+def test_count_tokens_uses_tokenizer_of_selected_model(
+    tokenizer_repository: SummarizationTokenizerRepositoryImpl,
+    mock_tokenizer: MagicMock,
+) -> None:
+    # Given
+    mock_tokenizer.return_value = {"input_ids": list(range(5000))}
+
+    with patch(
+        "data.repositories.summarization_tokenizer_repository_impl.AutoTokenizer.from_pretrained",
+        return_value=mock_tokenizer,
+    ) as mock_load_tokenizer:
+        # When
+        token_count = tokenizer_repository.count_tokens("long text", "allenai/led-base-16384")
+
+    # Then
+    assert token_count == 5000
+    mock_load_tokenizer.assert_called_once_with("allenai/led-base-16384", cache_dir="/models")
+
+
+def test_split_text_returns_text_when_it_fits(
+    tokenizer_repository: SummarizationTokenizerRepositoryImpl,
+    mock_tokenizer: MagicMock,
+) -> None:
+    # Given
+    mock_tokenizer.return_value = {"input_ids": list(range(10))}
+
+    # When
+    chunks = tokenizer_repository.split_text("short text", chunk_size=10, chunk_overlap=2)
+
+    # Then
+    assert chunks == ["short text"]
+    mock_tokenizer.assert_called_once_with("short text", add_special_tokens=False)
+    mock_tokenizer.batch_decode.assert_not_called()
+
+
+def test_split_text_returns_overlapping_chunks(
+    tokenizer_repository: SummarizationTokenizerRepositoryImpl,
+    mock_tokenizer: MagicMock,
+) -> None:
+    # Given
+    mock_tokenizer.return_value = {"input_ids": list(range(10))}
+    mock_tokenizer.batch_decode.return_value = ["first", "second", "third"]
+
+    # When
+    chunks = tokenizer_repository.split_text("long text", chunk_size=4, chunk_overlap=1)
+
+    # Then
+    assert chunks == ["first", "second", "third"]
+    mock_tokenizer.batch_decode.assert_called_once_with(
+        [[0, 1, 2, 3], [3, 4, 5, 6], [6, 7, 8, 9]],
+        skip_special_tokens=True,
+        clean_up_tokenization_spaces=False,
+    )
+
+
+def test_tokenize_loads_tokenizer_of_selected_model(
+    tokenizer_repository: SummarizationTokenizerRepositoryImpl,
+    mock_tokenizer: MagicMock,
+) -> None:
+    # Given
+    mock_tokenizer.return_value = {"input_ids": [0, 2]}
+
+    with patch(
+        "data.repositories.summarization_tokenizer_repository_impl.AutoTokenizer.from_pretrained",
+        return_value=mock_tokenizer,
+    ) as mock_load_tokenizer:
+        # When
+        tokenizer_repository.tokenize("Hello")
+        tokenizer_repository.tokenize("Hello", "facebook/bart-large-xsum")
+        tokenizer_repository.tokenize("Hello", "facebook/bart-large-xsum")
+
+    # Then
+    assert mock_load_tokenizer.call_args_list == [
+        call("facebook/bart-large-cnn", cache_dir="/models"),
+        call("facebook/bart-large-xsum", cache_dir="/models"),
+    ]
+
+
+def test_tokenize_truncates_to_window_of_selected_model(
+    tokenizer_repository: SummarizationTokenizerRepositoryImpl,
+    mock_tokenizer: MagicMock,
+) -> None:
+    # Given
+    mock_tokenizer.model_max_length = 512
+    mock_tokenizer.return_value = {"input_ids": [0, 2]}
+
+    # When
+    tokenizer_repository.tokenize("Hello", "google/pegasus-xsum")
+
+    # Then
+    mock_tokenizer.assert_called_once_with("Hello", max_length=512, truncation=True)
+
+
+def test_get_max_input_tokens_reads_model_config_when_tokenizer_has_no_window(
+    tokenizer_repository: SummarizationTokenizerRepositoryImpl,
+    mock_tokenizer: MagicMock,
+) -> None:
+    # Given
+    mock_tokenizer.model_max_length = VERY_LARGE_INTEGER
+
+    with patch(
+        "data.repositories.summarization_tokenizer_repository_impl.AutoConfig.from_pretrained",
+        return_value=Mock(max_position_embeddings=4096),
+    ) as mock_load_config:
+        # When
+        max_input_tokens = tokenizer_repository.get_max_input_tokens("allenai/led-base-16384")
+
+    # Then
+    assert max_input_tokens == 4096
+    mock_load_config.assert_called_once_with("allenai/led-base-16384", cache_dir="/models")
+
+
+def test_split_text_rejects_chunks_larger_than_model_window(
+    tokenizer_repository: SummarizationTokenizerRepositoryImpl,
+    mock_tokenizer: MagicMock,
+) -> None:
+    # Given
+    mock_tokenizer.model_max_length = 512
+
+    # When
+    with pytest.raises(ChunkSizeTooLargeError) as error:
+        tokenizer_repository.split_text("long text", chunk_size=511, chunk_overlap=0)
+
+    # Then
+    assert str(error.value) == "chunk_size 511 exceeds the model input window of 510 tokens"
+    mock_tokenizer.assert_not_called()
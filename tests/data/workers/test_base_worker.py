@@ -1,12 +1,15 @@
+import asyncio
 import multiprocessing
+import pickle
 from multiprocessing.sharedctypes import Synchronized
-from typing import Generator
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from typing import Any, Dict, Generator, List, cast
+from unittest.mock import Mock, mock_open, patch
 
 import pytest
 
 from core.logger.logger import Logger
-from data.workers.base_worker import BaseWorker
+from data.workers.base_worker import BaseWorker, PartialResult, ProcessMemoryUsage
 
 
 class MockBaseWorker(BaseWorker[str, str, dict, None]):  # type: ignore
@@ -28,6 +31,7 @@ class MockBaseWorker(BaseWorker[str, str, dict, None]):  # type: ignore
 
     def handle_command(
         self,
+        request_id: int,
         command: str,
         args: str,
         shared_object: None,
@@ -133,3 +137,427 @@ def test_is_processing_returns_correct_status(base_worker: MockBaseWorker) -> No
 
     # Then
     assert not processing_status
+
+
+def test_receive_batch_collects_queued_commands_up_to_max_size(base_worker: MockBaseWorker) -> None:
+    # Given
+    config = Mock(batch_max_size=2, batch_max_wait_ms=0)
+    pipe = Mock()
+    pipe.recv.side_effect = [(0, "summarize", "first"), (1, "summarize", "second")]
+    pipe.poll.return_value = True
+
+    # When
+    batch = base_worker._receive_batch(config, pipe)
+
+    # Then
+    assert batch == [(0, "summarize", "first"), (1, "summarize", "second")]
+    pipe.poll.assert_called_once()
+
+
+def test_receive_batch_stops_when_wait_window_expires(base_worker: MockBaseWorker) -> None:
+    # Given
+    config = Mock(batch_max_size=8, batch_max_wait_ms=5)
+    pipe = Mock()
+    pipe.recv.return_value = (0, "summarize", "first")
+    pipe.poll.return_value = False
+
+    # When
+    batch = base_worker._receive_batch(config, pipe)
+
+    # Then
+    assert batch == [(0, "summarize", "first")]
+    assert 0 <= pipe.poll.call_args.kwargs["timeout"] <= 0.005
+
+
+def test_handle_batch_delegates_each_command(base_worker: MockBaseWorker) -> None:
+    # Given
+    pipe = Mock()
+    is_processing = multiprocessing.Value("b", False)
+    processing_lock = multiprocessing.Lock()
+
+    with patch.object(base_worker, "handle_command") as mock_handle_command:
+        # When
+        base_worker.handle_batch(
+            [(0, "summarize", "first"), (1, "summarize", "second")],
+            None,
+            "cpu",
+            pipe,
+            is_processing,
+            processing_lock,
+        )
+
+        # Then
+        assert mock_handle_command.call_count == 2
+        mock_handle_command.assert_any_call(0, "summarize", "first", None, "cpu", pipe, is_processing, processing_lock)
+
+
+def test_configure_process_pins_process_to_cpu_cores(base_worker: MockBaseWorker) -> None:
+    # Given
+    config = SimpleNamespace(cpu_cores=[2, 3])
+
+    with patch("data.workers.base_worker.os.sched_setaffinity", create=True) as mock_sched_setaffinity:
+        # When
+        base_worker.configure_process(config)
+
+    # Then
+    mock_sched_setaffinity.assert_called_once_with(0, [2, 3])
+
+
+def test_configure_process_keeps_affinity_without_cpu_cores(base_worker: MockBaseWorker) -> None:
+    # Given
+    with patch("data.workers.base_worker.os.sched_setaffinity", create=True) as mock_sched_setaffinity:
+        # When
+        base_worker.configure_process(SimpleNamespace())
+
+    # Then
+    mock_sched_setaffinity.assert_not_called()
+
+
+def test_configure_process_logs_warning_when_pinning_fails(base_worker: MockBaseWorker, mock_logger: Mock) -> None:
+    # Given
+    config = SimpleNamespace(cpu_cores=[64])
+
+    with patch(
+        "data.workers.base_worker.os.sched_setaffinity",
+        create=True,
+        side_effect=OSError("Invalid argument"),
+    ):
+        # When
+        base_worker.configure_process(config)
+
+    # Then
+    mock_logger.warning.assert_called_once_with(
+        "MockBaseWorker could not be pinned to CPU cores [64]: Invalid argument",
+    )
+
+
+def test_get_pid_returns_process_pid_when_alive(base_worker: MockBaseWorker) -> None:
+    # Given
+    assert base_worker.get_pid() is None
+
+    with patch("multiprocessing.Process") as MockProcess:
+        mock_process = Mock(pid=1234)
+        MockProcess.return_value = mock_process
+
+        # When
+        base_worker.start()
+
+        # Then
+        assert base_worker.get_pid() == 1234
+
+
+def test_get_memory_usage_reads_smaps_rollup(base_worker: MockBaseWorker) -> None:
+    # Given
+    smaps_rollup = (
+        "5649cb659000-7ffe1208f000 ---p 00000000 00:00 0                          [rollup]\n"
+        "Rss:                1448 kB\n"
+        "Pss:                 436 kB\n"
+        "Shared_Clean:       1304 kB\n"
+        "Private_Clean:        40 kB\n"
+        "Private_Dirty:       104 kB\n"
+    )
+
+    with (
+        patch.object(base_worker, "get_pid", return_value=1234),
+        patch("builtins.open", mock_open(read_data=smaps_rollup)) as mock_file,
+    ):
+        # When
+        memory_usage = base_worker.get_memory_usage()
+
+    # Then
+    mock_file.assert_called_once_with("/proc/1234/smaps_rollup")
+    assert memory_usage == ProcessMemoryUsage(
+        resident_bytes=1448 * 1024,
+        proportional_bytes=436 * 1024,
+        unique_bytes=144 * 1024,
+    )
+
+
+def test_get_memory_usage_returns_none_when_not_running(base_worker: MockBaseWorker) -> None:
+    # When
+    memory_usage = base_worker.get_memory_usage()
+
+    # Then
+    assert memory_usage is None
+
+
+def test_send_request_raises_error_if_worker_not_running(base_worker: MockBaseWorker) -> None:
+    # When / Then
+    with pytest.raises(RuntimeError, match="Worker process is not running"):
+        base_worker._send_request("summarize", "text")
+
+
+def test_dispatcher_routes_replies_to_matching_requests(base_worker: MockBaseWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        MockProcess.return_value = Mock()
+
+        # Given
+        base_worker.start()
+
+        with patch.object(base_worker._pipe_parent, "send"):
+            first = base_worker._send_request("summarize", "first")
+            second = base_worker._send_request("summarize", "second")
+
+        # When
+        base_worker._pipe_child.send((1, "second summary"))
+        base_worker._pipe_child.send((0, ValueError("first error")))
+
+        # Then
+        assert second.result(timeout=5) == "second summary"
+        with pytest.raises(ValueError, match="first error"):
+            first.result(timeout=5)
+
+        assert base_worker._pending_requests == {}
+
+
+def test_dispatcher_records_metrics_sent_with_replies(base_worker: MockBaseWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess, patch.object(base_worker, "record_metrics") as mock_record:
+        MockProcess.return_value = Mock()
+
+        # Given
+        base_worker.start()
+
+        with patch.object(base_worker._pipe_parent, "send"):
+            future = base_worker._send_request("summarize", "text")
+
+        # When
+        base_worker._pipe_child.send((0, "summary", ["metrics"]))
+
+        # Then
+        assert future.result(timeout=5) == "summary"
+        mock_record.assert_called_once_with(["metrics"])
+
+
+def test_dispatcher_passes_metrics_to_callback_of_request(base_worker: MockBaseWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        MockProcess.return_value = Mock()
+
+        # Given
+        base_worker.start()
+        on_metrics = Mock()
+
+        with patch.object(base_worker._pipe_parent, "send"):
+            future = base_worker._send_request("summarize", "text", None, on_metrics)
+
+        # When
+        base_worker._pipe_child.send((0, "summary", ["metrics"]))
+
+        # Then
+        assert future.result(timeout=5) == "summary"
+        on_metrics.assert_called_once_with(["metrics"])
+        assert base_worker._metrics_callbacks == {}
+
+
+def test_start_counts_restart_of_exited_process_only(base_worker: MockBaseWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        mock_process = Mock()
+        mock_process.is_alive.return_value = True
+        MockProcess.return_value = mock_process
+
+        # Given
+        base_worker.start()
+        base_worker.stop()
+        base_worker.start()
+        mock_process.is_alive.return_value = False
+
+        # When
+        base_worker.start()
+
+        # Then
+        assert base_worker.restarts == 1
+
+
+def test_get_load_seconds_reports_load_time_of_running_process(base_worker: MockBaseWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        mock_process = Mock()
+        mock_process.is_alive.return_value = True
+        MockProcess.return_value = mock_process
+
+        # Given
+        base_worker.start()
+        load_seconds_before_load = base_worker.get_load_seconds()
+        base_worker._load_seconds.value = 2.5
+
+        # When
+        load_seconds = base_worker.get_load_seconds()
+
+        # Then
+        assert load_seconds_before_load is None
+        assert load_seconds == 2.5
+
+
+def test_dispatcher_routes_partial_results_to_callback(base_worker: MockBaseWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        MockProcess.return_value = Mock()
+
+        # Given
+        base_worker.start()
+        partial_results: List[str] = []
+
+        with patch.object(base_worker._pipe_parent, "send"):
+            future = base_worker._send_request("summarize_stream", "text", partial_results.append)
+
+        # When
+        base_worker._pipe_child.send((0, PartialResult("Hello ")))
+        base_worker._pipe_child.send((0, PartialResult("world")))
+        base_worker._pipe_child.send((0, "Hello world"))
+
+        # Then
+        assert future.result(timeout=5) == "Hello world"
+        assert partial_results == ["Hello ", "world"]
+        assert base_worker._partial_callbacks == {}
+
+
+def test_dispatcher_survives_failing_partial_result_callback(base_worker: MockBaseWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        MockProcess.return_value = Mock()
+
+        # Given
+        base_worker.start()
+
+        with patch.object(base_worker._pipe_parent, "send"):
+            future = base_worker._send_request("summarize_stream", "text", Mock(side_effect=RuntimeError("Closed")))
+
+        # When
+        base_worker._pipe_child.send((0, PartialResult("Hello")))
+        base_worker._pipe_child.send((0, "Hello"))
+
+        # Then
+        assert future.result(timeout=5) == "Hello"
+
+
+def test_replies_are_passed_through_shared_memory(mock_logger: Logger) -> None:
+    # Given
+    config = SimpleNamespace(shared_memory_size_mb=1, shared_memory_threshold_kb=1)
+    worker = MockBaseWorker(config, mock_logger)
+    large_text = "x" * 4096
+
+    with patch("multiprocessing.Process") as MockProcess:
+        MockProcess.return_value = Mock()
+        worker.start()
+        child_connection = MockProcess.call_args.kwargs["args"][1]
+
+        with patch.object(worker._pipe_parent, "send"):
+            future = worker._send_request("summarize", "text")
+
+        # When
+        child_connection.send((0, large_text))
+
+        # Then
+        assert future.result(timeout=5) == large_text
+        assert child_connection.send_ring is worker._shared_memory_rings[1]
+
+        worker.stop()
+        assert worker._shared_memory_rings == []
+
+
+def test_stop_fails_pending_requests(base_worker: MockBaseWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        MockProcess.return_value = Mock()
+
+        # Given
+        base_worker.start()
+
+        with patch.object(base_worker._pipe_parent, "send"):
+            future = base_worker._send_request("summarize", "text")
+
+        # When
+        base_worker.stop()
+
+        # Then
+        with pytest.raises(RuntimeError, match="Worker process is not running"):
+            future.result(timeout=5)
+
+        assert base_worker._dispatcher_thread is None
+
+
+def test_send_request_forgets_request_when_send_fails(base_worker: MockBaseWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        MockProcess.return_value = Mock()
+
+        # Given
+        base_worker.start()
+
+        # When
+        with (
+            patch.object(base_worker._pipe_parent, "send", side_effect=pickle.PicklingError("Cannot pickle")),
+            pytest.raises(pickle.PicklingError),
+        ):
+            base_worker._send_request("summarize", "text")
+
+        # Then
+        assert base_worker._pending_requests == {}
+
+
+def test_cancel_request_notifies_worker_of_pending_request(base_worker: MockBaseWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        MockProcess.return_value = Mock()
+
+        # Given
+        base_worker.start()
+
+        with patch.object(base_worker._pipe_parent, "send"):
+            base_worker._send_request("summarize", "first")
+            second = base_worker._send_request("summarize", "second")
+
+        # When
+        base_worker.cancel_request(second)
+
+        # Then
+        assert base_worker.is_request_cancelled(1)
+        assert not base_worker.is_request_cancelled(0)
+        assert not second.done()
+
+
+def test_cancel_request_ignores_answered_request(base_worker: MockBaseWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        MockProcess.return_value = Mock()
+
+        # Given
+        base_worker.start()
+
+        with patch.object(base_worker._pipe_parent, "send"):
+            future = base_worker._send_request("summarize", "text")
+
+        base_worker._pipe_child.send((0, "summary"))
+        future.result(timeout=5)
+
+        # When
+        base_worker.cancel_request(future)
+
+        # Then
+        assert not base_worker._cancel_pipe_child.poll()
+
+
+@pytest.mark.asyncio
+async def test_wait_async_cancels_request_when_caller_stops_waiting(base_worker: MockBaseWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        MockProcess.return_value = Mock()
+
+        # Given
+        base_worker.start()
+
+        with patch.object(base_worker._pipe_parent, "send"):
+            future = base_worker._send_request("summarize", "text")
+
+        # When
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.01):
+                await base_worker._wait_async(future)
+
+        # Then
+        assert base_worker.is_request_cancelled(0)
+
+
+def test_getstate_excludes_parent_only_state(base_worker: MockBaseWorker) -> None:
+    # When
+    state = cast(Dict[str, Any], base_worker.__getstate__())
+
+    # Then
+    assert "_pending_requests" not in state
+    assert "_partial_callbacks" not in state
+    assert "_send_lock" not in state
+    assert "_cancel_lock" not in state
+    assert "_dispatcher_thread" not in state
+    assert "_shared_memory_rings" not in state
+    assert "_pipe_child" in state
@@ -0,0 +1,28 @@
+from unittest.mock import MagicMock, Mock
+
+from data.workers.base_worker import PartialResult
+from data.workers.pipe_text_streamer import PipeTextStreamer
+
+
+def test_on_finalized_text_sends_partial_result() -> None:
+    # Given
+    pipe = Mock()
+    streamer = PipeTextStreamer(MagicMock(), pipe, 3)
+
+    # When
+    streamer.on_finalized_text("Hello ")
+
+    # Then
+    pipe.send.assert_called_once_with((3, PartialResult("Hello ")))
+
+
+def test_on_finalized_text_skips_empty_text() -> None:
+    # Given
+    pipe = Mock()
+    streamer = PipeTextStreamer(MagicMock(), pipe, 3)
+
+    # When
+    streamer.on_finalized_text("", stream_end=True)
+
+    # Then
+    pipe.send.assert_not_called()
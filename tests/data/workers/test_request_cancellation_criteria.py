@@ -0,0 +1,83 @@
+from typing import List
+
+import pytest
+import torch
+from transformers import (
+    BartConfig,
+    BartForConditionalGeneration,
+    GenerationConfig,
+    StoppingCriteriaList,
+)
+
+from data.workers.request_cancellation_criteria import RequestCancellationCriteria
+
+
+@pytest.fixture
+def model() -> BartForConditionalGeneration:
+    torch.manual_seed(0)
+    model = BartForConditionalGeneration(
+        BartConfig(
+            vocab_size=64,
+            d_model=16,
+            encoder_layers=1,
+            decoder_layers=1,
+            encoder_attention_heads=2,
+            decoder_attention_heads=2,
+            encoder_ffn_dim=32,
+            decoder_ffn_dim=32,
+            max_position_embeddings=32,
+        ),
+    )
+    model.train(False)
+    model.generation_config = GenerationConfig(
+        max_new_tokens=6,
+        min_new_tokens=6,
+        bos_token_id=0,
+        pad_token_id=1,
+        eos_token_id=2,
+        decoder_start_token_id=2,
+    )
+    return model
+
+
+def test_call_marks_rows_of_cancelled_request_only() -> None:
+    # Given
+    criteria = RequestCancellationCriteria([7, 8], lambda request_id: request_id == 8)
+    # Two requests with four beams each.
+    input_ids = torch.zeros((8, 3), dtype=torch.long)
+
+    # When
+    result = criteria(input_ids, torch.zeros((8, 64)))
+
+    # Then
+    assert result.tolist() == [False] * 4 + [True] * 4
+
+
+@pytest.mark.parametrize("num_beams", [1, 4])
+def test_generate_stops_cancelled_request_of_mixed_batch_and_finishes_the_other(
+    model: BartForConditionalGeneration,
+    num_beams: int,
+) -> None:
+    # Given
+    input_ids = torch.tensor([[0, 10, 11, 12, 2], [0, 20, 21, 22, 2]])
+    expected = model.generate(input_ids[:1], num_beams=num_beams)
+    checked_steps: List[int] = []
+
+    def is_request_cancelled(request_id: int) -> bool:
+        checked_steps.append(request_id)
+        return request_id == 8
+
+    # When
+    output = model.generate(
+        input_ids,
+        num_beams=num_beams,
+        stopping_criteria=StoppingCriteriaList([RequestCancellationCriteria([7, 8], is_request_cancelled)]),
+    )
+
+    # Then
+    # The request that was not cancelled gets the summary it gets on its own.
+    assert output[0].tolist() == expected[0].tolist()
+    # The cancelled request stops after its first token and is padded from there.
+    assert (output[1] != model.generation_config.pad_token_id).sum() <= 2
+    # The batch still runs every decoding step until the other request finishes.
+    assert checked_steps.count(7) == model.generation_config.max_new_tokens
@@ -0,0 +1,38 @@
+from pathlib import Path
+
+import pytest
+import torch
+from safetensors.torch import save_file
+
+from data.workers.safetensors_mmap import load_safetensors_mmap
+
+
+def test_load_safetensors_mmap_returns_tensors_of_all_files(tmp_path: Path) -> None:
+    # Given
+    save_file({"weight": torch.arange(6, dtype=torch.float32).reshape(2, 3)}, str(tmp_path / "model-1.safetensors"))
+    save_file({"bias": torch.tensor([1, 2], dtype=torch.int64)}, str(tmp_path / "model-2.safetensors"))
+
+    # When
+    state_dict = load_safetensors_mmap(str(tmp_path))
+
+    # Then
+    assert torch.equal(state_dict["weight"], torch.arange(6, dtype=torch.float32).reshape(2, 3))
+    assert torch.equal(state_dict["bias"], torch.tensor([1, 2], dtype=torch.int64))
+
+
+def test_load_safetensors_mmap_keeps_tensors_valid_after_loading(tmp_path: Path) -> None:
+    # Given
+    save_file({"weight": torch.ones(1024, dtype=torch.bfloat16)}, str(tmp_path / "model.safetensors"))
+
+    # When
+    weight = load_safetensors_mmap(str(tmp_path))["weight"]
+
+    # Then
+    assert weight.dtype == torch.bfloat16
+    assert float(weight.sum()) == 1024
+
+
+def test_load_safetensors_mmap_raises_without_safetensors_files(tmp_path: Path) -> None:
+    # When / Then
+    with pytest.raises(FileNotFoundError):
+        load_safetensors_mmap(str(tmp_path))
@@ -0,0 +1,1139 @@
+import asyncio
+import multiprocessing
+import os
+import pickle
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Generator, List, Optional
+from unittest.mock import ANY, MagicMock, Mock, patch
+
+import pytest
+import torch
+from transformers import (
+    BartConfig,
+    BartForConditionalGeneration,
+    GenerationConfig,
+    StoppingCriteriaList,
+)
+from transformers.tokenization_utils_base import VERY_LARGE_INTEGER
+
+from core.logger.logger import Logger
+from core.metrics.request_timings import RequestTimings, current_request_timings
+from data.workers.base_worker import PartialResult
+from data.workers.generation_metrics import GenerationMetrics
+from data.workers.pipe_text_streamer import PipeTextStreamer
+from data.workers.seq2seq_summarization_worker import (
+    Seq2SeqSummarizationConfig,
+    Seq2SeqSummarizationWorker,
+)
+from domain.exceptions.request_cancelled_error import RequestCancelledError
+
+
+@pytest.fixture
+def seq2seq_config() -> Seq2SeqSummarizationConfig:
+    return Seq2SeqSummarizationConfig(
+        device="cuda",
+        model_name="facebook/mbart-large-50",
+        model_download_path="/tmp",
+        log_level="INFO",
+        batch_max_size=8,
+    )
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def seq2seq_worker(
+    seq2seq_config: Seq2SeqSummarizationConfig,
+    mock_logger: Logger,
+) -> Generator[Seq2SeqSummarizationWorker, None, None]:
+    worker = Seq2SeqSummarizationWorker(seq2seq_config, mock_logger)
+    yield worker
+    worker.stop()
+
+
+# Generates one token per decoding step until its stopping criteria stop every row, like a slow real model.
+class SlowFakeModel:
+    def __init__(self, max_steps: int, on_step: Optional[Any] = None) -> None:
+        self.max_steps = max_steps
+        self.on_step = on_step or (lambda step: None)
+        self.generate_calls: List[int] = []
+
+    def generate(self, input_ids: torch.Tensor, stopping_criteria: StoppingCriteriaList, **kwargs: Any) -> torch.Tensor:
+        self.generate_calls.append(input_ids.shape[0])
+        sequences = torch.zeros((input_ids.shape[0], 1), dtype=torch.long)
+        is_unfinished = torch.ones(input_ids.shape[0], dtype=torch.bool)
+
+        for step in range(self.max_steps):
+            self.on_step(step)
+            next_tokens = torch.where(is_unfinished, 5, 1)
+            sequences = torch.cat([sequences, next_tokens[:, None]], dim=1)
+            is_unfinished &= ~stopping_criteria(sequences, torch.zeros(0))
+
+            if not is_unfinished.any():
+                break
+
+        return sequences
+
+
+def count_generated_tokens(summary_ids: torch.Tensor, **kwargs: Any) -> List[str]:
+    return [f"{int((row == 5).sum())} tokens" for row in summary_ids]
+
+
+class MockTensor:
+    def to(self, device: str) -> "MockTensor":
+        return self
+
+
+def test_summarize_sends_correct_command(seq2seq_worker: Seq2SeqSummarizationWorker) -> None:
+    with (
+        patch("multiprocessing.Process") as MockProcess,
+        patch(
+            "data.workers.seq2seq_summarization_worker.AutoModelForSeq2SeqLM.from_pretrained",
+        ) as mock_load_model,
+        patch(
+            "data.workers.seq2seq_summarization_worker.AutoTokenizer.from_pretrained",
+        ) as mock_load_tokenizer,
+    ):
+        mock_process = Mock()
+        MockProcess.return_value = mock_process
+        mock_model = Mock()
+        mock_tokenizer = Mock()
+        mock_tokenizer.model_max_length = 1024
+        mock_load_model.return_value = mock_model
+        mock_load_tokenizer.return_value = mock_tokenizer
+
+        # Given
+        seq2seq_worker.start()
+        text_to_summarize = "Hello, world!"
+
+        # When
+        with patch.object(seq2seq_worker._pipe_parent, "send") as mock_send:
+            mock_send.side_effect = lambda message: seq2seq_worker._pending_requests.pop(message[0]).set_result("Hello")
+            result = seq2seq_worker.summarize(text_to_summarize, {})
+
+            # Then
+            assert result == "Hello"
+            mock_send.assert_called_once_with((0, "summarize", (text_to_summarize, {})))
+
+
+def test_summarize_raises_error_returned_by_worker(seq2seq_worker: Seq2SeqSummarizationWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        MockProcess.return_value = Mock()
+
+        # Given
+        seq2seq_worker.start()
+
+        # When
+        with patch.object(seq2seq_worker._pipe_parent, "send") as mock_send:
+            mock_send.side_effect = lambda message: seq2seq_worker._pending_requests.pop(message[0]).set_exception(
+                ValueError("Invalid generation parameters"),
+            )
+
+            # Then
+            with pytest.raises(ValueError, match="Invalid generation parameters"):
+                seq2seq_worker.summarize("Hello, world!", {"num_beams": -1})
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_awaits_worker_reply(seq2seq_worker: Seq2SeqSummarizationWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        MockProcess.return_value = Mock()
+
+        # Given
+        seq2seq_worker.start()
+        text_to_summarize = "Hello, world!"
+
+        # When
+        with patch.object(seq2seq_worker._pipe_parent, "send") as mock_send:
+            pending_reply = asyncio.create_task(seq2seq_worker.summarize_async(text_to_summarize, {}))
+            while not seq2seq_worker._pending_requests:
+                await asyncio.sleep(0.01)
+
+            seq2seq_worker._pipe_child.send((0, "Hello"))
+            result = await asyncio.wait_for(pending_reply, timeout=5)
+
+            # Then
+            assert result == "Hello"
+            mock_send.assert_called_once_with((0, "summarize", (text_to_summarize, {})))
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_records_generation_stages_in_request_timings(
+    seq2seq_worker: Seq2SeqSummarizationWorker,
+) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        MockProcess.return_value = Mock()
+
+        # Given
+        seq2seq_worker.start()
+        request_timings = RequestTimings(time.perf_counter())
+        current_request_timings.set(request_timings)
+        metrics = GenerationMetrics(
+            prepare_seconds=0.01,
+            generate_seconds=2.0,
+            decode_seconds=0.02,
+            input_tokens=300,
+            output_tokens=60,
+        )
+
+        # When
+        with patch.object(seq2seq_worker._pipe_parent, "send"):
+            pending_reply = asyncio.create_task(seq2seq_worker.summarize_async("Hello, world!", {}))
+            while not seq2seq_worker._pending_requests:
+                await asyncio.sleep(0.01)
+
+            seq2seq_worker._pipe_child.send((0, "Hello", [metrics]))
+            await asyncio.wait_for(pending_reply, timeout=5)
+
+        # Then
+        assert request_timings.durations == {"prepare": 0.01, "generate": 2.0, "decode": 0.02}
+
+
+def test_summarize_raises_error_if_worker_not_running(seq2seq_worker: Seq2SeqSummarizationWorker) -> None:
+    # Given
+    text_to_summarize = "Hello, world!"
+
+    # When / Then
+    with pytest.raises(RuntimeError, match="Worker process is not running"):
+        seq2seq_worker.summarize(text_to_summarize, {})
+
+
+def test_configure_process_sets_thread_budget(seq2seq_config: Seq2SeqSummarizationConfig, mock_logger: Mock) -> None:
+    # Given
+    seq2seq_config.num_threads = 2
+    seq2seq_config.cpu_cores = [2, 3]
+    worker = Seq2SeqSummarizationWorker(seq2seq_config, mock_logger)
+
+    with (
+        patch("data.workers.base_worker.os.sched_setaffinity", create=True) as mock_sched_setaffinity,
+        patch("data.workers.seq2seq_summarization_worker.os.sched_getaffinity", create=True, return_value={3, 2}),
+        patch("data.workers.seq2seq_summarization_worker.torch.set_num_threads") as mock_set_num_threads,
+        patch("data.workers.seq2seq_summarization_worker.torch.set_num_interop_threads") as mock_set_interop,
+        patch("data.workers.seq2seq_summarization_worker.torch.get_num_threads", return_value=2),
+        patch("data.workers.seq2seq_summarization_worker.torch.get_num_interop_threads", return_value=1),
+        patch.dict(os.environ, {}),
+    ):
+        # When
+        worker.configure_process(seq2seq_config)
+        rayon_num_threads = os.environ.get("RAYON_NUM_THREADS")
+
+    # Then
+    mock_sched_setaffinity.assert_called_once_with(0, [2, 3])
+    mock_set_num_threads.assert_called_once_with(2)
+    mock_set_interop.assert_called_once_with(1)
+    assert rayon_num_threads == "2"
+    mock_logger.info.assert_called_once_with(
+        "Seq2SeqSummarizationWorker uses 2 intra-op and 1 inter-op thread(s) on CPU cores: [2, 3]",
+    )
+
+
+def test_initialize_shared_object(seq2seq_config: Seq2SeqSummarizationConfig, mock_logger: Logger) -> None:
+    worker = Seq2SeqSummarizationWorker(seq2seq_config, mock_logger)
+    with (
+        patch(
+            "data.workers.seq2seq_summarization_worker.AutoModelForSeq2SeqLM.from_pretrained",
+        ) as mock_load_model,
+        patch(
+            "data.workers.seq2seq_summarization_worker.AutoTokenizer.from_pretrained",
+        ) as mock_load_tokenizer,
+    ):
+        mock_model = Mock()
+        mock_tokenizer = Mock()
+        mock_tokenizer.model_max_length = 1024
+        mock_load_model.return_value = mock_model
+        mock_model.to.return_value = mock_model
+        mock_load_tokenizer.return_value = mock_tokenizer
+
+        # When
+        model, tokenizer = worker.initialize_shared_object(seq2seq_config)
+
+        # Then
+        mock_load_model.assert_called_once_with(
+            seq2seq_config.model_name,
+            cache_dir=seq2seq_config.model_download_path,
+            low_cpu_mem_usage=True,
+        )
+        mock_load_tokenizer.assert_called_once_with(
+            seq2seq_config.model_name,
+            cache_dir=seq2seq_config.model_download_path,
+        )
+        assert model == mock_model
+        assert tokenizer == mock_tokenizer
+
+
+def test_initialize_shared_object_saves_snapshot_after_first_load(
+    seq2seq_config: Seq2SeqSummarizationConfig,
+    mock_logger: Logger,
+    tmp_path: Path,
+) -> None:
+    # Given
+    seq2seq_config.model_snapshot_path = str(tmp_path / "snapshot")
+    worker = Seq2SeqSummarizationWorker(seq2seq_config, mock_logger)
+    mock_model = Mock()
+    mock_tokenizer = Mock()
+    mock_tokenizer.model_max_length = 1024
+    mock_model.save_pretrained.side_effect = lambda path, **kwargs: os.makedirs(path)
+
+    with (
+        patch(
+            "data.workers.seq2seq_summarization_worker.AutoModelForSeq2SeqLM.from_pretrained",
+            return_value=mock_model,
+        ) as mock_load_model,
+        patch(
+            "data.workers.seq2seq_summarization_worker.AutoTokenizer.from_pretrained",
+            return_value=mock_tokenizer,
+        ),
+    ):
+        # When
+        worker.initialize_shared_object(seq2seq_config)
+
+    # Then
+    mock_load_model.assert_called_once_with(
+        seq2seq_config.model_name,
+        cache_dir=seq2seq_config.model_download_path,
+        low_cpu_mem_usage=True,
+    )
+    temporary_path = mock_model.save_pretrained.call_args.args[0]
+    mock_model.save_pretrained.assert_called_once_with(temporary_path, safe_serialization=True)
+    mock_tokenizer.save_pretrained.assert_called_once_with(temporary_path)
+    assert os.listdir(tmp_path) == ["snapshot"]
+
+
+def test_initialize_shared_object_loads_existing_snapshot(
+    seq2seq_config: Seq2SeqSummarizationConfig,
+    mock_logger: Logger,
+    tmp_path: Path,
+) -> None:
+    # Given
+    seq2seq_config.model_snapshot_path = str(tmp_path)
+    worker = Seq2SeqSummarizationWorker(seq2seq_config, mock_logger)
+    mock_model = Mock()
+    mock_model.to.return_value = mock_model
+
+    with (
+        patch(
+            "data.workers.seq2seq_summarization_worker.AutoModelForSeq2SeqLM.from_pretrained",
+            return_value=mock_model,
+        ) as mock_load_model,
+        patch(
+            "data.workers.seq2seq_summarization_worker.AutoTokenizer.from_pretrained",
+            return_value=Mock(model_max_length=1024),
+        ) as mock_load_tokenizer,
+    ):
+        # When
+        model, _ = worker.initialize_shared_object(seq2seq_config)
+
+    # Then
+    assert model == mock_model
+    mock_load_model.assert_called_once_with(
+        str(tmp_path),
+        local_files_only=True,
+        use_safetensors=True,
+        low_cpu_mem_usage=True,
+    )
+    mock_load_tokenizer.assert_called_once_with(str(tmp_path), local_files_only=True)
+    mock_model.save_pretrained.assert_not_called()
+
+
+def test_initialize_shared_object_maps_shared_weights_of_snapshot(
+    seq2seq_config: Seq2SeqSummarizationConfig,
+    mock_logger: Logger,
+    tmp_path: Path,
+) -> None:
+    # Given
+    seq2seq_config.device = "cpu"
+    seq2seq_config.model_snapshot_path = str(tmp_path)
+    seq2seq_config.shared_weights = True
+    worker = Seq2SeqSummarizationWorker(seq2seq_config, mock_logger)
+    torch.manual_seed(0)
+    saved_model = BartForConditionalGeneration(
+        BartConfig(
+            vocab_size=64,
+            d_model=16,
+            encoder_layers=1,
+            decoder_layers=1,
+            encoder_attention_heads=2,
+            decoder_attention_heads=2,
+            encoder_ffn_dim=32,
+            decoder_ffn_dim=32,
+            max_position_embeddings=32,
+        ),
+    )
+    saved_model.train(False)
+    saved_model.save_pretrained(str(tmp_path), safe_serialization=True)
+
+    with patch(
+        "data.workers.seq2seq_summarization_worker.AutoTokenizer.from_pretrained",
+        return_value=Mock(model_max_length=1024),
+    ):
+        # When
+        model, _ = worker.initialize_shared_object(seq2seq_config)
+
+    # Then
+    assert model.lm_head.weight.data_ptr() == model.model.shared.weight.data_ptr()
+    saved_state_dict = saved_model.state_dict()
+    assert model.state_dict().keys() == saved_state_dict.keys()
+    assert all(torch.equal(tensor, saved_state_dict[name]) for name, tensor in model.state_dict().items())
+
+
+def test_initialize_shared_object_quantizes_linear_layers_to_int8(
+    seq2seq_config: Seq2SeqSummarizationConfig,
+    mock_logger: Logger,
+) -> None:
+    # Given
+    seq2seq_config.device = "cpu"
+    seq2seq_config.quantization = "int8-dynamic"
+    worker = Seq2SeqSummarizationWorker(seq2seq_config, mock_logger)
+    loaded_model = BartForConditionalGeneration(
+        BartConfig(
+            vocab_size=64,
+            d_model=16,
+            encoder_layers=1,
+            decoder_layers=1,
+            encoder_attention_heads=2,
+            decoder_attention_heads=2,
+            encoder_ffn_dim=32,
+            decoder_ffn_dim=32,
+            max_position_embeddings=32,
+        ),
+    )
+
+    with (
+        patch(
+            "data.workers.seq2seq_summarization_worker.AutoModelForSeq2SeqLM.from_pretrained",
+            return_value=loaded_model,
+        ),
+        patch(
+            "data.workers.seq2seq_summarization_worker.AutoTokenizer.from_pretrained",
+            return_value=Mock(model_max_length=1024),
+        ),
+    ):
+        # When
+        model, _ = worker.initialize_shared_object(seq2seq_config)
+
+    # Then
+    assert model is loaded_model
+    assert not any(type(module) is torch.nn.Linear for module in model.modules())
+    assert isinstance(model.model.encoder.layers[0].fc1, torch.ao.nn.quantized.dynamic.Linear)
+
+
+def test_initialize_shared_object_reads_input_window_from_model_config(
+    seq2seq_config: Seq2SeqSummarizationConfig,
+    mock_logger: Logger,
+) -> None:
+    # Given
+    worker = Seq2SeqSummarizationWorker(seq2seq_config, mock_logger)
+    mock_model = Mock()
+    mock_model.config.max_position_embeddings = 4096
+    mock_model.to.return_value = mock_model
+
+    with (
+        patch(
+            "data.workers.seq2seq_summarization_worker.AutoModelForSeq2SeqLM.from_pretrained",
+            return_value=mock_model,
+        ),
+        patch(
+            "data.workers.seq2seq_summarization_worker.AutoTokenizer.from_pretrained",
+            return_value=Mock(model_max_length=VERY_LARGE_INTEGER),
+        ),
+    ):
+        # When
+        _, tokenizer = worker.initialize_shared_object(seq2seq_config)
+
+    # Then
+    assert tokenizer.model_max_length == 4096
+
+
+def test_initialize_shared_object_falls_back_when_snapshot_is_unreadable(
+    seq2seq_config: Seq2SeqSummarizationConfig,
+    mock_logger: Logger,
+    tmp_path: Path,
+) -> None:
+    # Given
+    seq2seq_config.model_snapshot_path = str(tmp_path)
+    worker = Seq2SeqSummarizationWorker(seq2seq_config, mock_logger)
+    mock_model = Mock()
+
+    with (
+        patch(
+            "data.workers.seq2seq_summarization_worker.AutoModelForSeq2SeqLM.from_pretrained",
+            side_effect=[OSError("no safetensors file"), mock_model],
+        ) as mock_load_model,
+        patch(
+            "data.workers.seq2seq_summarization_worker.AutoTokenizer.from_pretrained",
+            return_value=Mock(model_max_length=1024),
+        ),
+    ):
+        # When
+        worker.initialize_shared_object(seq2seq_config)
+
+    # Then
+    assert mock_load_model.call_args_list[1].args == (seq2seq_config.model_name,)
+    mock_logger.warning.assert_called()
+
+
+def test_handle_command_summarize(
+    seq2seq_worker: Seq2SeqSummarizationWorker,
+    seq2seq_config: Seq2SeqSummarizationConfig,
+) -> None:
+    with (
+        patch(
+            "data.workers.seq2seq_summarization_worker.AutoModelForSeq2SeqLM.from_pretrained",
+        ) as mock_load_model,
+        patch(
+            "data.workers.seq2seq_summarization_worker.AutoTokenizer.from_pretrained",
+        ) as mock_load_tokenizer,
+        patch("torch.no_grad"),
+    ):
+        mock_model = MagicMock()
+        mock_tokenizer = MagicMock()
+        mock_tokenizer.model_max_length = 1024
+        mock_load_model.return_value = mock_model
+        mock_load_tokenizer.return_value = mock_tokenizer
+        mock_is_processing = multiprocessing.Value("b", False)
+        mock_processing_lock = multiprocessing.Lock()
+        pipe = Mock()
+
+        # When
+        seq2seq_worker.handle_command(
+            request_id=7,
+            command="summarize",
+            args=("Hello, world!", {}),
+            shared_object=(mock_model, mock_tokenizer),
+            config=seq2seq_config,
+            pipe=pipe,
+            is_processing=mock_is_processing,
+            processing_lock=mock_processing_lock,
+        )
+
+        # Then
+        assert not mock_is_processing.value
+        mock_tokenizer.assert_called_once_with(
+            ["Hello, world!"],
+            max_length=1024,
+            truncation=True,
+            padding=True,
+            return_tensors="pt",
+        )
+
+
+def test_handle_command_summarize_error(
+    seq2seq_worker: Seq2SeqSummarizationWorker,
+    seq2seq_config: Seq2SeqSummarizationConfig,
+) -> None:
+    with (
+        patch(
+            "data.workers.seq2seq_summarization_worker.AutoModelForSeq2SeqLM.from_pretrained",
+        ) as mock_load_model,
+        patch(
+            "data.workers.seq2seq_summarization_worker.AutoTokenizer.from_pretrained",
+        ) as mock_load_tokenizer,
+        patch("torch.no_grad"),
+    ):
+        mock_model = MagicMock()
+        mock_tokenizer = MagicMock()
+        mock_tokenizer.model_max_length = 1024
+        mock_load_model.return_value = mock_model
+        mock_load_tokenizer.return_value = mock_tokenizer
+        mock_is_processing = multiprocessing.Value("b", False)
+        mock_processing_lock = multiprocessing.Lock()
+        pipe = Mock()
+        mock_model.generate.side_effect = RuntimeError("Summarize error")
+
+        # When
+        seq2seq_worker.handle_command(
+            request_id=7,
+            command="summarize",
+            args=("Hello, world!", {}),
+            shared_object=(mock_model, mock_tokenizer),
+            config=seq2seq_config,
+            pipe=pipe,
+            is_processing=mock_is_processing,
+            processing_lock=mock_processing_lock,
+        )
+
+        # Then
+        assert not mock_is_processing.value
+        assert pipe.send.call_count == 1
+        request_id, error, metrics = pipe.send.call_args[0][0]
+        assert request_id == 7
+        assert isinstance(error, RuntimeError)
+        assert error.args[0] == "Summarize error"
+        assert metrics == []
+
+
+def test_handle_batch_generates_compatible_commands_together(
+    seq2seq_worker: Seq2SeqSummarizationWorker,
+    seq2seq_config: Seq2SeqSummarizationConfig,
+) -> None:
+    # Given
+    mock_model = MagicMock()
+    mock_tokenizer = MagicMock()
+    mock_tokenizer.model_max_length = 1024
+    mock_tokenizer.batch_decode.side_effect = [["first", "third"], ["second"]]
+    pipe = Mock()
+    commands = [
+        (1, "summarize", ("first text", {"num_beams": 2})),
+        (2, "summarize", ("second text", {"num_beams": 4})),
+        (3, "summarize", ("third text", {"num_beams": 2})),
+    ]
+
+    # When
+    seq2seq_worker.handle_batch(
+        commands=commands,
+        shared_object=(mock_model, mock_tokenizer),
+        config=seq2seq_config,
+        pipe=pipe,
+        is_processing=multiprocessing.Value("b", False),
+        processing_lock=multiprocessing.Lock(),
+    )
+
+    # Then
+    assert mock_model.generate.call_count == 2
+    mock_tokenizer.assert_any_call(
+        ["first text", "third text"], max_length=1024, truncation=True, padding=True, return_tensors="pt"
+    )
+    mock_tokenizer.assert_any_call(["second text"], max_length=1024, truncation=True, padding=True, return_tensors="pt")
+    assert [call[0][0] for call in pipe.send.call_args_list] == [
+        (1, "first", ANY),
+        (3, "third", ANY),
+        (2, "second", ANY),
+    ]
+
+
+def test_handle_batch_passes_attention_mask_and_picks_first_sequence(
+    seq2seq_worker: Seq2SeqSummarizationWorker,
+    seq2seq_config: Seq2SeqSummarizationConfig,
+) -> None:
+    # Given
+    mock_model = MagicMock()
+    mock_tokenizer = MagicMock()
+    mock_tokenizer.model_max_length = 1024
+    inputs = {"input_ids": Mock(), "attention_mask": MagicMock()}
+    mock_tokenizer.return_value.to.return_value = inputs
+    mock_tokenizer.batch_decode.return_value = ["a1", "a2", "b1", "b2"]
+    pipe = Mock()
+    generation_parameters = {"num_return_sequences": 2, "num_beams": 2}
+
+    # When
+    seq2seq_worker.handle_batch(
+        commands=[(1, "summarize", ("a", generation_parameters)), (2, "summarize", ("b", generation_parameters))],
+        shared_object=(mock_model, mock_tokenizer),
+        config=seq2seq_config,
+        pipe=pipe,
+        is_processing=multiprocessing.Value("b", False),
+        processing_lock=multiprocessing.Lock(),
+    )
+
+    # Then
+    mock_model.generate.assert_called_once_with(
+        inputs["input_ids"],
+        num_return_sequences=2,
+        num_beams=2,
+        attention_mask=inputs["attention_mask"],
+        stopping_criteria=ANY,
+    )
+    assert [call[0][0] for call in pipe.send.call_args_list] == [(1, "a1", ANY), (2, "b1", ANY)]
+
+
+def test_handle_batch_isolates_failing_command(
+    seq2seq_worker: Seq2SeqSummarizationWorker,
+    seq2seq_config: Seq2SeqSummarizationConfig,
+) -> None:
+    # Given
+    mock_model = MagicMock()
+    mock_tokenizer = MagicMock()
+    mock_tokenizer.model_max_length = 1024
+    mock_model.generate.side_effect = [RuntimeError("Batch error"), MagicMock(), RuntimeError("Item error")]
+    mock_tokenizer.batch_decode.return_value = ["ok"]
+    pipe = Mock()
+
+    # When
+    seq2seq_worker.handle_batch(
+        commands=[(1, "summarize", ("good", {})), (2, "summarize", ("bad", {}))],
+        shared_object=(mock_model, mock_tokenizer),
+        config=seq2seq_config,
+        pipe=pipe,
+        is_processing=multiprocessing.Value("b", False),
+        processing_lock=multiprocessing.Lock(),
+    )
+
+    # Then
+    assert pipe.send.call_count == 2
+    assert pipe.send.call_args_list[0][0][0] == (1, "ok", ANY)
+    request_id, error, metrics = pipe.send.call_args_list[1][0][0]
+    assert request_id == 2
+    assert isinstance(error, RuntimeError)
+    assert error.args[0] == "Item error"
+    assert metrics == []
+
+
+def test_handle_batch_pads_token_ids_into_input_tensors(
+    seq2seq_worker: Seq2SeqSummarizationWorker,
+    seq2seq_config: Seq2SeqSummarizationConfig,
+) -> None:
+    # Given
+    mock_model = MagicMock()
+    mock_tokenizer = MagicMock()
+    mock_tokenizer.model_max_length = 1024
+    mock_tokenizer.pad_token_id = 1
+    mock_tokenizer.batch_decode.return_value = ["first", "second"]
+    seq2seq_config.device = "cpu"
+    pipe = Mock()
+
+    # When
+    seq2seq_worker.handle_batch(
+        commands=[(1, "summarize", (array("i", [0, 5, 2]), {})), (2, "summarize", (array("i", [0, 2]), {}))],
+        shared_object=(mock_model, mock_tokenizer),
+        config=seq2seq_config,
+        pipe=pipe,
+        is_processing=multiprocessing.Value("b", False),
+        processing_lock=multiprocessing.Lock(),
+    )
+
+    # Then
+    mock_tokenizer.assert_not_called()
+    input_ids = mock_model.generate.call_args[0][0]
+    attention_mask = mock_model.generate.call_args.kwargs["attention_mask"]
+    assert input_ids.tolist() == [[0, 5, 2], [0, 2, 1]]
+    assert attention_mask.tolist() == [[1, 1, 1], [1, 1, 0]]
+    assert [call[0][0] for call in pipe.send.call_args_list] == [(1, "first", ANY), (2, "second", ANY)]
+
+
+def test_handle_batch_tokenizes_texts_batched_with_token_ids(
+    seq2seq_worker: Seq2SeqSummarizationWorker,
+    seq2seq_config: Seq2SeqSummarizationConfig,
+) -> None:
+    # Given
+    mock_model = MagicMock()
+    mock_tokenizer = MagicMock()
+    mock_tokenizer.model_max_length = 1024
+    mock_tokenizer.pad_token_id = 1
+    mock_tokenizer.return_value = {"input_ids": [0, 7, 8, 2]}
+    mock_tokenizer.batch_decode.return_value = ["first", "second"]
+    seq2seq_config.device = "cpu"
+
+    # When
+    seq2seq_worker.handle_batch(
+        commands=[(1, "summarize", (array("i", [0, 5, 2]), {})), (2, "summarize", ("text", {}))],
+        shared_object=(mock_model, mock_tokenizer),
+        config=seq2seq_config,
+        pipe=Mock(),
+        is_processing=multiprocessing.Value("b", False),
+        processing_lock=multiprocessing.Lock(),
+    )
+
+    # Then
+    mock_tokenizer.assert_called_once_with("text", max_length=1024, truncation=True)
+    assert mock_model.generate.call_args[0][0].tolist() == [[0, 5, 2, 1], [0, 7, 8, 2]]
+
+
+@pytest.mark.asyncio
+async def test_summarize_stream_async_yields_partial_summaries(seq2seq_worker: Seq2SeqSummarizationWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        MockProcess.return_value = Mock()
+
+        # Given
+        seq2seq_worker.start()
+
+        # When
+        with patch.object(seq2seq_worker._pipe_parent, "send") as mock_send:
+
+            def reply(message: Any) -> None:
+                for partial_summary in ("Hello ", "world"):
+                    seq2seq_worker._pipe_child.send((message[0], PartialResult(partial_summary)))
+
+                seq2seq_worker._pipe_child.send((message[0], "Hello world"))
+
+            mock_send.side_effect = reply
+            partial_summaries = [
+                partial_summary async for partial_summary in seq2seq_worker.summarize_stream_async("Hello, world!", {})
+            ]
+
+            # Then
+            assert partial_summaries == ["Hello ", "world"]
+            mock_send.assert_called_once_with((0, "summarize_stream", ("Hello, world!", {})))
+
+
+@pytest.mark.asyncio
+async def test_summarize_stream_async_raises_error_returned_by_worker(
+    seq2seq_worker: Seq2SeqSummarizationWorker,
+) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        MockProcess.return_value = Mock()
+
+        # Given
+        seq2seq_worker.start()
+
+        # When
+        with patch.object(seq2seq_worker._pipe_parent, "send") as mock_send:
+            mock_send.side_effect = lambda message: seq2seq_worker._pipe_child.send(
+                (message[0], ValueError("Beam search cannot be streamed")),
+            )
+
+            # Then
+            with pytest.raises(ValueError, match="Beam search cannot be streamed"):
+                [partial_summary async for partial_summary in seq2seq_worker.summarize_stream_async("Hello", {})]
+
+
+def test_handle_command_summarize_stream_generates_with_streamer(
+    seq2seq_worker: Seq2SeqSummarizationWorker,
+    seq2seq_config: Seq2SeqSummarizationConfig,
+) -> None:
+    # Given
+    mock_model = MagicMock()
+    mock_tokenizer = MagicMock()
+    mock_tokenizer.model_max_length = 1024
+    mock_tokenizer.batch_decode.return_value = ["Hello world"]
+    pipe = Mock()
+
+    # When
+    seq2seq_worker.handle_command(
+        request_id=7,
+        command="summarize_stream",
+        args=("Hello, world!", {"max_length": 10}),
+        shared_object=(mock_model, mock_tokenizer),
+        config=seq2seq_config,
+        pipe=pipe,
+        is_processing=multiprocessing.Value("b", False),
+        processing_lock=multiprocessing.Lock(),
+    )
+
+    # Then
+    streamer = mock_model.generate.call_args.kwargs["streamer"]
+    assert isinstance(streamer, PipeTextStreamer)
+    assert streamer.request_id == 7
+    assert mock_model.generate.call_args.kwargs["max_length"] == 10
+    pipe.send.assert_called_once_with((7, "Hello world", ANY))
+
+
+def test_handle_command_summarize_stream_overrides_beam_search_default_of_model(
+    seq2seq_worker: Seq2SeqSummarizationWorker,
+    seq2seq_config: Seq2SeqSummarizationConfig,
+) -> None:
+    # Given
+    seq2seq_config.device = "cpu"
+    model = BartForConditionalGeneration(
+        BartConfig(
+            vocab_size=64,
+            d_model=16,
+            encoder_layers=1,
+            decoder_layers=1,
+            encoder_attention_heads=2,
+            decoder_attention_heads=2,
+            encoder_ffn_dim=32,
+            decoder_ffn_dim=32,
+            max_position_embeddings=32,
+        ),
+    )
+    model.train(False)
+    # The generation defaults of facebook/bart-large-cnn, shortened to keep the test fast.
+    model.generation_config = GenerationConfig(
+        num_beams=4,
+        early_stopping=True,
+        length_penalty=2.0,
+        max_length=8,
+        min_length=2,
+        no_repeat_ngram_size=3,
+        bos_token_id=0,
+        pad_token_id=1,
+        eos_token_id=2,
+        decoder_start_token_id=2,
+        forced_bos_token_id=0,
+        forced_eos_token_id=2,
+    )
+    mock_tokenizer = MagicMock()
+    mock_tokenizer.model_max_length = 1024
+    mock_tokenizer.pad_token_id = 1
+    mock_tokenizer.decode.side_effect = lambda token_ids, **kwargs: " word" * len(token_ids)
+    mock_tokenizer.batch_decode.return_value = ["summary"]
+    pipe = Mock()
+
+    # When
+    seq2seq_worker.handle_command(
+        request_id=7,
+        command="summarize_stream",
+        args=(array("i", [0, 10, 11, 12, 2]), {}),
+        shared_object=(model, mock_tokenizer),
+        config=seq2seq_config,
+        pipe=pipe,
+        is_processing=multiprocessing.Value("b", False),
+        processing_lock=multiprocessing.Lock(),
+    )
+
+    # Then
+    replies = [reply.args[0] for reply in pipe.send.call_args_list]
+    assert any(isinstance(reply[1], PartialResult) for reply in replies)
+    assert replies[-1][:2] == (7, "summary")
+
+
+def test_handle_batch_summarizes_batch_request_items_with_other_commands(
+    seq2seq_worker: Seq2SeqSummarizationWorker,
+    seq2seq_config: Seq2SeqSummarizationConfig,
+) -> None:
+    # Given
+    mock_model = MagicMock()
+    mock_tokenizer = MagicMock()
+    mock_tokenizer.model_max_length = 1024
+    mock_tokenizer.batch_decode.side_effect = [["single", "first", "third"], ["second"]]
+    pipe = Mock()
+    commands = [
+        (1, "summarize", ("single text", {})),
+        (2, "summarize_batch", (["first text", "second text", "third text"], [{}, {"num_beams": 4}, {}])),
+    ]
+
+    # When
+    seq2seq_worker.handle_batch(
+        commands=commands,
+        shared_object=(mock_model, mock_tokenizer),
+        config=seq2seq_config,
+        pipe=pipe,
+        is_processing=multiprocessing.Value("b", False),
+        processing_lock=multiprocessing.Lock(),
+    )
+
+    # Then
+    assert mock_model.generate.call_count == 2
+    mock_tokenizer.assert_any_call(
+        ["single text", "first text", "third text"],
+        max_length=1024,
+        truncation=True,
+        padding=True,
+        return_tensors="pt",
+    )
+    assert [call[0][0] for call in pipe.send.call_args_list] == [
+        (1, "single", ANY),
+        (2, ["first", "second", "third"], ANY),
+    ]
+
+
+def test_handle_batch_limits_generate_calls_to_batch_max_size(
+    seq2seq_worker: Seq2SeqSummarizationWorker,
+    seq2seq_config: Seq2SeqSummarizationConfig,
+) -> None:
+    # Given
+    seq2seq_config.batch_max_size = 2
+    mock_model = MagicMock()
+    mock_tokenizer = MagicMock()
+    mock_tokenizer.model_max_length = 1024
+    mock_tokenizer.batch_decode.side_effect = [["a", "b"], ["c", "d"], ["e"]]
+    pipe = Mock()
+
+    # When
+    seq2seq_worker.handle_command(
+        request_id=1,
+        command="summarize_batch",
+        args=(["1", "2", "3", "4", "5"], [{}] * 5),
+        shared_object=(mock_model, mock_tokenizer),
+        config=seq2seq_config,
+        pipe=pipe,
+        is_processing=multiprocessing.Value("b", False),
+        processing_lock=multiprocessing.Lock(),
+    )
+
+    # Then
+    assert mock_model.generate.call_count == 3
+    pipe.send.assert_called_once_with((1, ["a", "b", "c", "d", "e"], ANY))
+
+
+@pytest.mark.asyncio
+async def test_summarize_batch_async_sends_batch_command(seq2seq_worker: Seq2SeqSummarizationWorker) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        MockProcess.return_value = Mock()
+
+        # Given
+        seq2seq_worker.start()
+        error = ValueError("Invalid input")
+
+        # When
+        with patch.object(seq2seq_worker._pipe_parent, "send") as mock_send:
+            mock_send.side_effect = lambda message: seq2seq_worker._pipe_child.send((message[0], ["first", error]))
+            result = await seq2seq_worker.summarize_batch_async(["first text", "second text"], [{}, {}])
+
+            # Then
+            assert result[0] == "first"
+            assert isinstance(result[1], ValueError)
+            mock_send.assert_called_once_with((0, "summarize_batch", (["first text", "second text"], [{}, {}])))
+
+
+def test_handle_batch_stops_generation_of_request_cancelled_mid_generation(
+    seq2seq_worker: Seq2SeqSummarizationWorker,
+    seq2seq_config: Seq2SeqSummarizationConfig,
+) -> None:
+    # Given
+    seq2seq_config.device = "cpu"
+    mock_model = SlowFakeModel(
+        max_steps=100,
+        on_step=lambda step: seq2seq_worker._cancel_pipe_parent.send(2) if step == 3 else None,
+    )
+    mock_tokenizer = MagicMock()
+    mock_tokenizer.model_max_length = 1024
+    mock_tokenizer.pad_token_id = 1
+    mock_tokenizer.batch_decode.side_effect = count_generated_tokens
+    pipe = Mock()
+
+    # When
+    seq2seq_worker.handle_batch(
+        commands=[(1, "summarize", (array("i", [0, 5, 2]), {})), (2, "summarize", (array("i", [0, 7, 2]), {}))],
+        shared_object=(mock_model, mock_tokenizer),
+        config=seq2seq_config,
+        pipe=pipe,
+        is_processing=multiprocessing.Value("b", False),
+        processing_lock=multiprocessing.Lock(),
+    )
+
+    # Then
+    assert pipe.send.call_args_list[0][0][0] == (1, "100 tokens", ANY)
+    request_id, error, _ = pipe.send.call_args_list[1][0][0]
+    assert request_id == 2
+    assert isinstance(error, RequestCancelledError)
+
+
+def test_handle_batch_sends_generation_metrics_with_replies(
+    seq2seq_worker: Seq2SeqSummarizationWorker,
+    seq2seq_config: Seq2SeqSummarizationConfig,
+) -> None:
+    # Given
+    seq2seq_config.device = "cpu"
+    mock_model = SlowFakeModel(max_steps=4)
+    mock_tokenizer = MagicMock()
+    mock_tokenizer.model_max_length = 1024
+    mock_tokenizer.pad_token_id = 1
+    mock_tokenizer.batch_decode.side_effect = count_generated_tokens
+    pipe = Mock()
+
+    # When
+    seq2seq_worker.handle_batch(
+        commands=[
+            (1, "summarize", (array("i", [0, 5, 6, 2]), {})),
+            (2, "summarize_batch", ([array("i", [0, 2])], [{}])),
+        ],
+        shared_object=(mock_model, mock_tokenizer),
+        config=seq2seq_config,
+        pipe=pipe,
+        is_processing=multiprocessing.Value("b", False),
+        processing_lock=multiprocessing.Lock(),
+    )
+
+    # Then
+    (_, _, (first_metrics,)), (_, _, (second_metrics,)) = [call[0][0] for call in pipe.send.call_args_list]
+    assert (first_metrics.input_tokens, first_metrics.output_tokens) == (4, 5)
+    assert (second_metrics.input_tokens, second_metrics.output_tokens) == (2, 5)
+    assert first_metrics.generate_seconds == second_metrics.generate_seconds > 0
+
+
+def test_record_metrics_observes_generation_histograms(seq2seq_worker: Seq2SeqSummarizationWorker) -> None:
+    # Given
+    metrics = GenerationMetrics(
+        prepare_seconds=0.01,
+        generate_seconds=2.0,
+        decode_seconds=0.02,
+        input_tokens=300,
+        output_tokens=60,
+    )
+
+    # When
+    seq2seq_worker.record_metrics([metrics, metrics])
+
+    # Then
+    histograms = seq2seq_worker.generation_histograms
+    assert histograms.stage_seconds["generate"].count == 2
+    assert histograms.stage_seconds["generate"].sum == 4.0
+    assert histograms.input_tokens.sum == 600
+    assert histograms.tokens_per_second.sum == 60.0
+
+
+def test_handle_batch_skips_request_cancelled_before_generation(
+    seq2seq_worker: Seq2SeqSummarizationWorker,
+    seq2seq_config: Seq2SeqSummarizationConfig,
+) -> None:
+    # Given
+    seq2seq_config.device = "cpu"
+    mock_model = SlowFakeModel(max_steps=3)
+    mock_tokenizer = MagicMock()
+    mock_tokenizer.model_max_length = 1024
+    mock_tokenizer.pad_token_id = 1
+    mock_tokenizer.batch_decode.side_effect = count_generated_tokens
+    pipe = Mock()
+    seq2seq_worker._cancel_pipe_parent.send(1)
+
+    # When
+    seq2seq_worker.handle_batch(
+        commands=[(1, "summarize", (array("i", [0, 5, 2]), {})), (2, "summarize", (array("i", [0, 7, 2]), {}))],
+        shared_object=(mock_model, mock_tokenizer),
+        config=seq2seq_config,
+        pipe=pipe,
+        is_processing=multiprocessing.Value("b", False),
+        processing_lock=multiprocessing.Lock(),
+    )
+
+    # Then
+    assert mock_model.generate_calls == [1]
+    request_id, error, _ = pipe.send.call_args_list[0][0][0]
+    assert request_id == 1
+    assert isinstance(error, RequestCancelledError)
+    assert isinstance(pickle.loads(pickle.dumps(error)), RequestCancelledError)
+    assert pipe.send.call_args_list[1][0][0] == (2, "3 tokens", ANY)
+
+
+def test_handle_command_summarize_stream_stops_when_cancelled(
+    seq2seq_worker: Seq2SeqSummarizationWorker,
+    seq2seq_config: Seq2SeqSummarizationConfig,
+) -> None:
+    # Given
+    seq2seq_config.device = "cpu"
+    mock_model = SlowFakeModel(
+        max_steps=100,
+        on_step=lambda step: seq2seq_worker._cancel_pipe_parent.send(7) if step == 3 else None,
+    )
+    mock_tokenizer = MagicMock()
+    mock_tokenizer.model_max_length = 1024
+    mock_tokenizer.pad_token_id = 1
+    mock_tokenizer.batch_decode.side_effect = count_generated_tokens
+    pipe = Mock()
+
+    # When
+    seq2seq_worker.handle_command(
+        request_id=7,
+        command="summarize_stream",
+        args=(array("i", [0, 5, 2]), {}),
+        shared_object=(mock_model, mock_tokenizer),
+        config=seq2seq_config,
+        pipe=pipe,
+        is_processing=multiprocessing.Value("b", False),
+        processing_lock=multiprocessing.Lock(),
+    )
+
+    # Then
+    request_id, error = pipe.send.call_args[0][0]
+    assert request_id == 7
+    assert isinstance(error, RequestCancelledError)
+
+
+@pytest.mark.asyncio
+async def test_summarize_stream_async_cancels_request_when_consumer_stops_early(
+    seq2seq_worker: Seq2SeqSummarizationWorker,
+) -> None:
+    with patch("multiprocessing.Process") as MockProcess:
+        MockProcess.return_value = Mock()
+
+        # Given
+        seq2seq_worker.start()
+
+        with patch.object(seq2seq_worker._pipe_parent, "send") as mock_send:
+            mock_send.side_effect = lambda message: seq2seq_worker._pipe_child.send(
+                (message[0], PartialResult("Hello ")),
+            )
+            partial_summaries = seq2seq_worker.summarize_stream_async("Hello, world!", {})
+
+            # When
+            assert await anext(partial_summaries) == "Hello "
+            await partial_summaries.aclose()
+
+        # Then
+        assert seq2seq_worker.is_request_cancelled(0)
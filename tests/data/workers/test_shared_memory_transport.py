@@ -0,0 +1,124 @@
+import multiprocessing
+import pickle
+from array import array
+from typing import Generator
+
+import pytest
+
+from data.workers.shared_memory_transport import (
+    SharedMemoryConnection,
+    SharedMemoryPayload,
+    SharedMemoryRing,
+)
+
+
+@pytest.fixture
+def ring() -> Generator[SharedMemoryRing, None, None]:
+    ring = SharedMemoryRing(100)
+    yield ring
+    ring.unlink()
+
+
+def test_write_and_read_text_round_trip(ring: SharedMemoryRing) -> None:
+    # Given
+    payload = ring.write("zażółć".encode("utf-8"))
+
+    # When
+    assert payload is not None
+    text = ring.read(payload)
+
+    # Then
+    assert text == "zażółć"
+
+
+def test_write_and_read_token_ids_round_trip(ring: SharedMemoryRing) -> None:
+    # Given
+    payload = ring.write(array("i", [0, 31414, 2]))
+
+    # When
+    assert payload is not None
+    token_ids = ring.read(payload)
+
+    # Then
+    assert payload.typecode == "i"
+    assert token_ids == array("i", [0, 31414, 2])
+
+
+def test_write_skips_end_of_ring_to_keep_payload_contiguous(ring: SharedMemoryRing) -> None:
+    # Given
+    first_payload = ring.write(b"a" * 60)
+    assert first_payload is not None
+    ring.read(first_payload)
+
+    # When
+    second_payload = ring.write(b"b" * 60)
+
+    # Then
+    assert second_payload == SharedMemoryPayload(position=100, length=60)
+    assert ring.read(second_payload) == "b" * 60
+
+
+def test_write_returns_none_until_space_is_released(ring: SharedMemoryRing) -> None:
+    # Given
+    first_payload = ring.write(b"a" * 60)
+    assert first_payload is not None
+
+    # When
+    rejected_payload = ring.write(b"b" * 60)
+    ring.read(first_payload)
+    accepted_payload = ring.write(b"b" * 60)
+
+    # Then
+    assert rejected_payload is None
+    assert accepted_payload is not None
+
+
+def test_pickled_ring_attaches_to_same_memory(ring: SharedMemoryRing) -> None:
+    # Given
+    payload = ring.write(b"shared")
+    assert payload is not None
+
+    # When
+    attached_ring = pickle.loads(pickle.dumps(ring))
+    text = attached_ring.read(payload)
+    attached_ring.close()
+
+    # Then
+    assert text == "shared"
+
+
+def test_connection_passes_large_texts_through_shared_memory(ring: SharedMemoryRing) -> None:
+    # Given
+    parent_pipe, child_pipe = multiprocessing.Pipe()
+    sender = SharedMemoryConnection(parent_pipe, send_ring=ring, threshold_bytes=10)
+    receiver = SharedMemoryConnection(child_pipe, receive_ring=ring, threshold_bytes=10)
+
+    # When
+    sender.send((0, "summarize", (["short", "a long enough text", array("i", [1, 2, 3])], [{}, {}, {}])))
+    raw_message = child_pipe.recv()
+    decoded_message = receiver._decode(raw_message)
+
+    # Then
+    assert raw_message == (
+        0,
+        "summarize",
+        (
+            ["short", SharedMemoryPayload(position=0, length=18), SharedMemoryPayload(18, 12, "i")],
+            [{}, {}, {}],
+        ),
+    )
+    assert decoded_message == (0, "summarize", (["short", "a long enough text", array("i", [1, 2, 3])], [{}, {}, {}]))
+
+
+def test_connection_falls_back_to_pipe_when_ring_is_full(ring: SharedMemoryRing) -> None:
+    # Given
+    parent_pipe, child_pipe = multiprocessing.Pipe()
+    sender = SharedMemoryConnection(parent_pipe, send_ring=ring, threshold_bytes=10)
+    receiver = SharedMemoryConnection(child_pipe, receive_ring=ring, threshold_bytes=10)
+
+    # When
+    sender.send((0, "x" * 200))
+    result = receiver.recv()
+
+    # Then
+    assert result == (0, "x" * 200)
@@ -0,0 +1,397 @@
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import Mock
+
+import pytest
+
+from core.logger.logger import Logger
+from core.metrics.histogram import LATENCY_BUCKETS, Histogram
+from data.workers.generation_metrics import GenerationHistograms
+from data.workers.summarization_model_registry import SummarizationModelRegistry
+from data.workers.summarization_worker_pool import SummarizationWorkerPool
+from domain.exceptions.unsupported_model_configuration_error import (
+    UnsupportedModelConfigurationError,
+)
+from domain.models.model_status import ModelStatus
+from domain.models.summarization_priority import SummarizationPriority
+from domain.models.worker_status import WorkerStatus
+
+_MB = 1024 * 1024
+
+
+def create_pool(memory_bytes: int) -> Mock:
+    pool = Mock(SummarizationWorkerPool)
+    pool.request_count = 0
+    pool.total_latency = 0.0
+    pool.get_queue_depth.return_value = 0
+    pool.rejected_requests = 0
+    pool.cancelled_requests = 0
+    pool.deadline_exceeded_requests = 0
+    pool.queue_wait_histograms = {priority: Histogram(LATENCY_BUCKETS) for priority in SummarizationPriority}
+    pool.tokenize_histogram = Histogram(LATENCY_BUCKETS)
+    pool.time_to_first_token_histogram = Histogram(LATENCY_BUCKETS)
+    pool.get_generation_histogram.side_effect = lambda select: select(GenerationHistograms()).snapshot()
+    pool.is_loaded.return_value = False
+    pool.is_idle.return_value = True
+    pool.get_memory_bytes.side_effect = lambda: memory_bytes if pool.is_loaded.return_value else 0
+    pool.load.side_effect = lambda: setattr(pool.is_loaded, "return_value", True)
+
+    def unload_if_idle() -> bool:
+        pool.is_loaded.return_value = False
+        return True
+
+    pool.unload_if_idle.side_effect = unload_if_idle
+    pool.get_statuses.return_value = []
+    return pool
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def pools() -> Dict[str, Mock]:
+    return {
+        "facebook/bart-large-cnn": create_pool(300 * _MB),
+        "facebook/bart-large-xsum": create_pool(300 * _MB),
+        "t5-small": create_pool(100 * _MB),
+    }
+
+
+@pytest.fixture
+def model_registry(pools: Dict[str, Mock], mock_logger: Logger, tmp_path: Path) -> SummarizationModelRegistry:
+    return SummarizationModelRegistry(
+        pools=pools,
+        default_model_name="facebook/bart-large-cnn",
+        memory_budget_bytes=500 * _MB,
+        model_download_path=str(tmp_path),
+        logger=mock_logger,
+    )
+
+
+def write_weights(download_path: Path, model_name: str, size_bytes: int) -> None:
+    snapshot_path = download_path / "snapshots" / model_name.replace("/", "--")
+    snapshot_path.mkdir(parents=True)
+    (snapshot_path / "model.safetensors").write_bytes(b"\0" * size_bytes)
+
+
+def test_get_pool_loads_default_model(
+    model_registry: SummarizationModelRegistry,
+    pools: Dict[str, Mock],
+) -> None:
+    # When
+    pool = model_registry.get_pool()
+
+    # Then
+    assert pool is pools["facebook/bart-large-cnn"]
+    pool.load.assert_called_once()
+    assert model_registry.loads["facebook/bart-large-cnn"] == 1
+
+
+def test_get_pool_does_not_reload_loaded_model(
+    model_registry: SummarizationModelRegistry,
+    pools: Dict[str, Mock],
+) -> None:
+    # Given
+    model_registry.get_pool("t5-small")
+
+    # When
+    model_registry.get_pool("t5-small")
+
+    # Then
+    pools["t5-small"].load.assert_called_once()
+    assert model_registry.loads["t5-small"] == 1
+
+
+def test_get_pool_rejects_unknown_model(model_registry: SummarizationModelRegistry) -> None:
+    # When
+    with pytest.raises(UnsupportedModelConfigurationError):
+        model_registry.get_pool("unknown/model")
+
+
+def test_get_pool_evicts_least_recently_used_model_over_budget(
+    model_registry: SummarizationModelRegistry,
+    pools: Dict[str, Mock],
+    mock_logger: Mock,
+) -> None:
+    # Given
+    model_registry.get_pool("facebook/bart-large-cnn")
+    model_registry.get_pool("facebook/bart-large-xsum")
+    model_registry.get_pool("facebook/bart-large-cnn")
+
+    # When
+    model_registry.get_pool("t5-small")
+
+    # Then
+    pools["facebook/bart-large-xsum"].unload_if_idle.assert_called_once()
+    pools["facebook/bart-large-cnn"].unload_if_idle.assert_not_called()
+    assert model_registry.evictions == {"facebook/bart-large-cnn": 0, "facebook/bart-large-xsum": 1, "t5-small": 0}
+    mock_logger.info.assert_any_call("Evicted model facebook/bart-large-xsum (300 MB) to load model t5-small")
+
+
+def test_get_pool_skips_models_with_requests_in_flight(
+    model_registry: SummarizationModelRegistry,
+    pools: Dict[str, Mock],
+) -> None:
+    # Given
+    model_registry.get_pool("facebook/bart-large-xsum")
+    model_registry.get_pool("facebook/bart-large-cnn")
+    pools["facebook/bart-large-xsum"].is_idle.return_value = False
+
+    # When
+    model_registry.get_pool("t5-small")
+
+    # Then
+    pools["facebook/bart-large-xsum"].unload_if_idle.assert_not_called()
+    pools["facebook/bart-large-cnn"].unload_if_idle.assert_called_once()
+    assert model_registry.evictions["facebook/bart-large-cnn"] == 1
+    assert model_registry.evictions["facebook/bart-large-xsum"] == 0
+
+
+def test_get_pool_keeps_model_that_received_request_before_eviction(
+    model_registry: SummarizationModelRegistry,
+    pools: Dict[str, Mock],
+    mock_logger: Mock,
+) -> None:
+    # Given
+    model_registry.get_pool("facebook/bart-large-xsum")
+    model_registry.get_pool("facebook/bart-large-cnn")
+    pools["facebook/bart-large-xsum"].unload_if_idle.side_effect = None
+    pools["facebook/bart-large-xsum"].unload_if_idle.return_value = False
+
+    # When
+    pool = model_registry.get_pool("t5-small")
+
+    # Then
+    pool.load.assert_called_once()
+    assert model_registry.evictions["facebook/bart-large-xsum"] == 0
+    assert model_registry._pending_model_names == set()
+    mock_logger.info.assert_any_call(
+        "Model facebook/bart-large-xsum received a request before it was evicted and stays loaded",
+    )
+
+
+def test_get_pool_stops_and_starts_workers_without_lock(
+    model_registry: SummarizationModelRegistry,
+    pools: Dict[str, Mock],
+) -> None:
+    # Given
+    lock_states: List[bool] = []
+    model_registry.get_pool("facebook/bart-large-xsum")
+    model_registry.get_pool("facebook/bart-large-cnn")
+    unload_if_idle = pools["facebook/bart-large-xsum"].unload_if_idle.side_effect
+    load = pools["t5-small"].load.side_effect
+
+    def unload_if_idle_without_lock() -> bool:
+        lock_states.append(model_registry._lock.locked())
+        return bool(unload_if_idle())
+
+    def load_without_lock() -> None:
+        lock_states.append(model_registry._lock.locked())
+        load()
+
+    pools["facebook/bart-large-xsum"].unload_if_idle.side_effect = unload_if_idle_without_lock
+    pools["t5-small"].load.side_effect = load_without_lock
+
+    # When
+    model_registry.get_pool("t5-small")
+
+    # Then
+    assert lock_states == [False, False]
+    assert model_registry.evictions["facebook/bart-large-xsum"] == 1
+
+
+def test_get_pool_estimates_never_loaded_model_by_weights_size(
+    model_registry: SummarizationModelRegistry,
+    pools: Dict[str, Mock],
+    mock_logger: Mock,
+    tmp_path: Path,
+) -> None:
+    # Given
+    model_registry.memory_budget_bytes = 400
+    pools["facebook/bart-large-cnn"].get_memory_bytes.side_effect = None
+    pools["facebook/bart-large-cnn"].get_memory_bytes.return_value = 300
+    model_registry.get_pool("facebook/bart-large-cnn")
+    write_weights(tmp_path, "t5-small", 50)
+
+    # When
+    model_registry.get_pool("t5-small")
+
+    # Then
+    pools["facebook/bart-large-cnn"].unload_if_idle.assert_not_called()
+    mock_logger.warning.assert_not_called()
+
+
+def test_get_pool_warns_when_budget_cannot_be_met(
+    model_registry: SummarizationModelRegistry,
+    pools: Dict[str, Mock],
+    mock_logger: Mock,
+) -> None:
+    # Given
+    model_registry.get_pool("facebook/bart-large-xsum")
+    pools["facebook/bart-large-xsum"].is_idle.return_value = False
+    model_registry._memory_bytes["facebook/bart-large-cnn"] = 300 * _MB
+
+    # When
+    pool = model_registry.get_pool("facebook/bart-large-cnn")
+
+    # Then
+    pool.load.assert_called_once()
+    mock_logger.warning.assert_called_once_with(
+        "Loading model facebook/bart-large-cnn exceeds the memory budget: 300 MB in use, 300 MB required, "
+        "500 MB budget",
+    )
+
+
+def test_get_pool_without_budget_never_evicts(
+    model_registry: SummarizationModelRegistry,
+    pools: Dict[str, Mock],
+) -> None:
+    # Given
+    model_registry.memory_budget_bytes = 0
+
+    # When
+    for model_name in pools:
+        model_registry.get_pool(model_name)
+
+    # Then
+    for pool in pools.values():
+        pool.unload_if_idle.assert_not_called()
+        assert pool.is_loaded()
+
+
+def test_get_worker_statuses_reports_model_of_each_worker(
+    model_registry: SummarizationModelRegistry,
+    pools: Dict[str, Mock],
+) -> None:
+    # Given
+    pools["facebook/bart-large-cnn"].get_statuses.return_value = [
+        WorkerStatus(index=0, pid=1234, is_alive=True, is_busy=False, queue_depth=0),
+    ]
+    pools["t5-small"].get_statuses.return_value = [
+        WorkerStatus(index=0, pid=None, is_alive=False, is_busy=False, queue_depth=0),
+    ]
+
+    # When
+    statuses = model_registry.get_worker_statuses()
+
+    # Then
+    assert statuses == [
+        WorkerStatus(
+            index=0,
+            pid=1234,
+            is_alive=True,
+            is_busy=False,
+            queue_depth=0,
+            model_name="facebook/bart-large-cnn",
+        ),
+        WorkerStatus(index=0, pid=None, is_alive=False, is_busy=False, queue_depth=0, model_name="t5-small"),
+    ]
+
+
+def test_get_model_statuses_reports_usage_of_each_model(
+    model_registry: SummarizationModelRegistry,
+    pools: Dict[str, Mock],
+) -> None:
+    # Given
+    model_registry.get_pool("t5-small")
+    pools["t5-small"].request_count = 4
+    pools["t5-small"].total_latency = 2.0
+    pools["t5-small"].get_queue_depth.return_value = 3
+    pools["t5-small"].rejected_requests = 2
+    pools["t5-small"].cancelled_requests = 3
+    pools["t5-small"].deadline_exceeded_requests = 1
+    pools["t5-small"].queue_wait_histograms[SummarizationPriority.BULK].observe(1.0)
+    pools["t5-small"].queue_wait_histograms[SummarizationPriority.BULK].observe(2.0)
+    pools["t5-small"].get_statuses.return_value = [
+        WorkerStatus(
+            index=0, pid=1234, is_alive=True, is_busy=False, queue_depth=3, proportional_memory_bytes=60 * _MB
+        ),
+        WorkerStatus(
+            index=1, pid=1235, is_alive=True, is_busy=False, queue_depth=0, proportional_memory_bytes=40 * _MB
+        ),
+    ]
+
+    # When
+    _, statuses = model_registry.get_statuses()
+
+    # Then
+    assert statuses == [
+        ModelStatus(
+            name="facebook/bart-large-cnn",
+            is_default=True,
+            is_loaded=False,
+            memory_bytes=None,
+            requests=0,
+            mean_latency_seconds=None,
+            loads=0,
+            evictions=0,
+            mean_queue_wait_seconds={"interactive": None, "bulk": None},
+        ),
+        ModelStatus(
+            name="facebook/bart-large-xsum",
+            is_default=False,
+            is_loaded=False,
+            memory_bytes=None,
+            requests=0,
+            mean_latency_seconds=None,
+            loads=0,
+            evictions=0,
+            mean_queue_wait_seconds={"interactive": None, "bulk": None},
+        ),
+        ModelStatus(
+            name="t5-small",
+            is_default=False,
+            is_loaded=True,
+            memory_bytes=100 * _MB,
+            requests=4,
+            mean_latency_seconds=0.5,
+            loads=1,
+            evictions=0,
+            queue_depth=3,
+            rejected_requests=2,
+            cancelled_requests=3,
+            deadline_exceeded_requests=1,
+            mean_queue_wait_seconds={"interactive": None, "bulk": 1.5},
+        ),
+    ]
+
+
+def test_get_model_metrics_reports_histograms_of_each_model(
+    model_registry: SummarizationModelRegistry,
+    pools: Dict[str, Mock],
+) -> None:
+    # Given
+    pools["t5-small"].queue_wait_histograms[SummarizationPriority.INTERACTIVE].observe(0.2)
+    pools["t5-small"].tokenize_histogram.observe(0.003)
+    pools["t5-small"].time_to_first_token_histogram.observe(0.4)
+
+    # When
+    metrics = model_registry.get_model_metrics()
+
+    # Then
+    assert [model_metrics.name for model_metrics in metrics] == [
+        "facebook/bart-large-cnn",
+        "facebook/bart-large-xsum",
+        "t5-small",
+    ]
+    assert metrics[2].queue_wait_seconds["interactive"].bucket_counts[-1] == 1
+    assert metrics[2].queue_wait_seconds["interactive"].sum == 0.2
+    assert metrics[2].queue_wait_seconds["bulk"].bucket_counts[-1] == 0
+    assert list(metrics[2].stage_seconds) == ["tokenize", "prepare", "generate", "decode"]
+    assert metrics[2].stage_seconds["tokenize"].sum == 0.003
+    assert metrics[2].time_to_first_token_seconds.sum == 0.4
+    assert metrics[2].output_tokens.bucket_bounds == [8, 16, 32, 64, 128, 256, 512, 1024, 2048]
+
+
+def test_stop_stops_every_pool(
+    model_registry: SummarizationModelRegistry,
+    pools: Dict[str, Mock],
+) -> None:
+    # When
+    model_registry.stop()
+
+    # Then
+    for pool in pools.values():
+        pool.stop.assert_called_once()
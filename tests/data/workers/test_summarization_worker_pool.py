@@ -0,0 +1,1027 @@
+import asyncio
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Generator, List, Tuple
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from core.logger.logger import Logger
+from core.metrics.request_timings import RequestTimings, current_request_timings
+from data.workers.base_worker import ProcessMemoryUsage
+from data.workers.generation_metrics import GenerationHistograms, GenerationMetrics
+from data.workers.seq2seq_summarization_worker import Seq2SeqSummarizationWorker
+from data.workers.summarization_worker_pool import SummarizationWorkerPool
+from domain.exceptions.deadline_exceeded_error import DeadlineExceededError
+from domain.exceptions.queue_full_error import QueueFullError
+from domain.models.summarization_priority import SummarizationPriority
+from domain.models.worker_status import WorkerStatus
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def mock_workers() -> List[Mock]:
+    workers = [Mock(Seq2SeqSummarizationWorker) for _ in range(3)]
+
+    for worker in workers:
+        worker.is_alive.return_value = False
+        worker.is_processing.return_value = False
+        worker.get_pid.return_value = None
+        worker.get_memory_usage.return_value = None
+        worker.restarts = 0
+        worker.get_load_seconds.return_value = None
+        worker.generation_histograms = GenerationHistograms()
+
+    return workers
+
+
+@pytest.fixture
+def worker_pool(mock_workers: List[Mock], mock_logger: Logger) -> Generator[SummarizationWorkerPool, None, None]:
+    worker_pool = SummarizationWorkerPool(
+        workers=mock_workers,
+        idle_timeout=60,
+        logger=mock_logger,
+    )
+    yield worker_pool
+    worker_pool.stop()
+
+
+def track_liveness(worker: Mock) -> None:
+    worker.start.side_effect = lambda: setattr(worker.is_alive, "return_value", True)
+    worker.stop.side_effect = lambda: setattr(worker.is_alive, "return_value", False)
+
+
+def enqueue(
+    worker_pool: SummarizationWorkerPool,
+    size: int = 1,
+    priority: SummarizationPriority = SummarizationPriority.INTERACTIVE,
+) -> Tuple[int, int]:
+    (queued_request,) = worker_pool._enqueue([size], priority)
+
+    return queued_request.future.result(timeout=1), queued_request.queue_position
+
+
+def wait_until(condition: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + 5
+
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_summarize_starts_worker_and_starts_idle_reaper(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    mock_workers[0].summarize.return_value = "summary"
+
+    # When
+    result = worker_pool.summarize("text", {"num_beams": 2})
+
+    # Then
+    assert result == "summary"
+    mock_workers[0].start.assert_called_once()
+    mock_workers[0].summarize.assert_called_once_with("text", {"num_beams": 2})
+    assert worker_pool._reaper_thread is not None and worker_pool._reaper_thread.is_alive()
+    assert worker_pool.outstanding_requests == [0, 0, 0]
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_dispatches_and_releases_worker(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    worker_pool.outstanding_requests = [1, 0, 1]
+    mock_workers[1].summarize_async = AsyncMock(return_value="summary")
+
+    # When
+    result = await worker_pool.summarize_async("text", {})
+
+    # Then
+    assert result == "summary"
+    mock_workers[1].start.assert_called_once()
+    mock_workers[1].summarize_async.assert_awaited_once_with("text", {})
+    assert worker_pool.outstanding_requests == [1, 0, 1]
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_records_queue_wait_in_request_timings(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    request_timings = RequestTimings(time.perf_counter())
+    current_request_timings.set(request_timings)
+    mock_workers[0].summarize_async = AsyncMock(return_value="summary")
+
+    # When
+    await worker_pool.summarize_async("text", {})
+
+    # Then
+    assert request_timings.durations["queue"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_summarize_batch_async_spreads_slices_across_workers(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    async def summarize_batch(texts: List[str], generation_parameters: List[Dict[str, Any]]) -> List[str]:
+        # Slices overlap like real generation, so an early finished slice never frees its worker for the next one.
+        await asyncio.sleep(0.1)
+        return [text.upper() for text in texts]
+
+    for worker in mock_workers:
+        worker.summarize_batch_async = AsyncMock(side_effect=summarize_batch)
+
+    # When
+    results = await worker_pool.summarize_batch_async(["a", "b", "c", "d", "e"], [{}] * 5)
+
+    # Then
+    assert results == ["A", "B", "C", "D", "E"]
+    assert sorted(len(worker.summarize_batch_async.await_args[0][0]) for worker in mock_workers) == [1, 2, 2]
+    assert worker_pool.outstanding_requests == [0, 0, 0]
+
+
+@pytest.mark.asyncio
+async def test_summarize_batch_async_reports_failed_slice_per_item(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    worker_pool.workers = mock_workers[:1]
+    worker_pool.outstanding_requests = [0]
+    error = RuntimeError("Worker process is not running")
+    mock_workers[0].summarize_batch_async = AsyncMock(side_effect=error)
+
+    # When
+    results = await worker_pool.summarize_batch_async(["a", "b"], [{}, {}])
+
+    # Then
+    assert results == [error, error]
+
+
+async def stream_partial_summaries(*partial_summaries: str) -> AsyncIterator[str]:
+    for partial_summary in partial_summaries:
+        yield partial_summary
+
+
+@pytest.mark.asyncio
+async def test_summarize_stream_async_holds_worker_until_stream_ends(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    mock_workers[0].summarize_stream_async.return_value = stream_partial_summaries("Hello ", "world")
+    partial_summaries = worker_pool.summarize_stream_async("text", {})
+
+    # When
+    first_partial_summary = await anext(partial_summaries)
+    outstanding_requests_while_streaming = list(worker_pool.outstanding_requests)
+    remaining_partial_summaries = [partial_summary async for partial_summary in partial_summaries]
+
+    # Then
+    assert [first_partial_summary, *remaining_partial_summaries] == ["Hello ", "world"]
+    assert outstanding_requests_while_streaming == [1, 0, 0]
+    assert worker_pool.outstanding_requests == [0, 0, 0]
+    mock_workers[0].summarize_stream_async.assert_called_once_with("text", {})
+
+
+@pytest.mark.asyncio
+async def test_summarize_stream_async_releases_worker_when_consumer_stops_early(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    mock_workers[0].summarize_stream_async.return_value = stream_partial_summaries("Hello ", "world")
+    partial_summaries = worker_pool.summarize_stream_async("text", {})
+    await anext(partial_summaries)
+
+    # When
+    await partial_summaries.aclose()
+
+    # Then
+    assert worker_pool.outstanding_requests == [0, 0, 0]
+    assert worker_pool.cancelled_requests == 1
+
+
+@pytest.mark.asyncio
+async def test_summarize_stream_async_raises_deadline_exceeded_while_waiting_for_worker(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    async def stream_slowly() -> AsyncIterator[str]:
+        yield "Hello "
+        await asyncio.sleep(10)
+        yield "world"
+
+    mock_workers[0].summarize_stream_async.return_value = stream_slowly()
+    partial_summaries = worker_pool.summarize_stream_async("text", {}, deadline=time.monotonic() + 0.1)
+    await anext(partial_summaries)
+
+    # When
+    with pytest.raises(DeadlineExceededError):
+        await anext(partial_summaries)
+
+    # Then
+    assert worker_pool.outstanding_requests == [0, 0, 0]
+    assert worker_pool.deadline_exceeded_requests == 1
+
+
+def test_enqueue_dispatches_to_least_loaded_worker(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    worker_pool.outstanding_requests = [2, 0, 1]
+
+    # When
+    index, queue_position = enqueue(worker_pool)
+
+    # Then
+    assert index == 1
+    assert queue_position == 0
+    assert worker_pool.outstanding_requests == [2, 1, 1]
+    mock_workers[1].start.assert_not_called()
+
+
+def test_enqueue_prefers_running_worker_on_tie(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    mock_workers[2].is_alive.return_value = True
+
+    # When
+    index, _ = enqueue(worker_pool)
+
+    # Then
+    assert index == 2
+    mock_workers[2].start.assert_not_called()
+
+
+def test_enqueue_rejects_request_when_queue_is_full(
+    mock_workers: List[Mock],
+    mock_logger: Logger,
+) -> None:
+    # Given
+    worker_pool = SummarizationWorkerPool(workers=mock_workers, idle_timeout=60, logger=mock_logger, max_queue_size=4)
+    worker_pool.outstanding_requests = [2, 1, 1]
+    worker_pool.service_time = 1.5
+
+    # When
+    with pytest.raises(QueueFullError) as error:
+        enqueue(worker_pool)
+
+    # Then
+    assert error.value.queue_depth == 4
+    assert error.value.retry_after == 2
+    assert worker_pool.rejected_requests == 1
+    assert worker_pool.outstanding_requests == [2, 1, 1]
+    for worker in mock_workers:
+        worker.start.assert_not_called()
+
+
+def test_enqueue_rejects_request_when_estimated_wait_is_too_long(
+    mock_workers: List[Mock],
+    mock_logger: Logger,
+) -> None:
+    # Given
+    worker_pool = SummarizationWorkerPool(workers=mock_workers, idle_timeout=60, logger=mock_logger, max_queue_wait=5)
+    worker_pool.outstanding_requests = [3, 3, 3]
+    worker_pool.service_time = 2.0
+
+    # When
+    with pytest.raises(QueueFullError) as error:
+        enqueue(worker_pool)
+
+    # Then
+    assert error.value.retry_after == 6
+    assert worker_pool.rejected_requests == 1
+
+
+def test_enqueue_admits_batch_larger_than_queue_when_queue_is_empty(
+    mock_workers: List[Mock],
+    mock_logger: Logger,
+) -> None:
+    # Given
+    worker_pool = SummarizationWorkerPool(workers=mock_workers, idle_timeout=60, logger=mock_logger, max_queue_size=4)
+
+    # When
+    index, queue_position = enqueue(worker_pool, 8)
+
+    # Then
+    assert (index, queue_position) == (0, 0)
+    assert worker_pool.outstanding_requests == [8, 0, 0]
+
+
+def test_release_estimates_service_time_per_text_once_worker_is_ready(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    track_liveness(mock_workers[0])
+
+    with patch("time.perf_counter", return_value=100.0):
+        index, _ = enqueue(worker_pool)
+        # The first request of a fresh worker also waited for the model to load.
+        worker_pool._release(index, 70.0)
+        cold_service_time = worker_pool.service_time
+        index, _ = enqueue(worker_pool, 2)
+
+    # When
+    with patch("time.perf_counter", return_value=104.0):
+        # The request was queued in the pool for ten seconds before it was dispatched.
+        worker_pool._release(index, 90.0, size=2, queue_position=2, dispatch_time=100.0)
+
+    # Then
+    assert cold_service_time is None
+    assert worker_pool.service_time == 1.0
+    assert worker_pool.request_count == 2
+    assert worker_pool.total_latency == 44.0
+
+
+def test_release_marks_worker_ready_only_when_request_completes(
+    worker_pool: SummarizationWorkerPool,
+) -> None:
+    # Given
+    index, _ = enqueue(worker_pool)
+
+    # When
+    # A lease returned unused, as by a cancelled request or a warm-up, says nothing about the model being loaded.
+    worker_pool._release(index)
+    ready_time_after_unused_lease = worker_pool.ready_times[index]
+    index, _ = enqueue(worker_pool)
+
+    with patch("time.perf_counter", return_value=100.0):
+        worker_pool._release(index, 90.0)
+
+    # Then
+    assert ready_time_after_unused_lease is None
+    assert worker_pool.ready_times[index] == 100.0
+
+
+def test_enqueue_estimates_wait_of_interactive_request_without_queued_bulk_requests(
+    mock_workers: List[Mock],
+    mock_logger: Logger,
+) -> None:
+    # Given
+    worker_pool = SummarizationWorkerPool(
+        workers=mock_workers[:1],
+        idle_timeout=60,
+        logger=mock_logger,
+        max_queue_wait=5,
+        worker_capacity=1,
+    )
+    worker_pool.outstanding_requests = [1]
+    worker_pool.service_time = 2.0
+    worker_pool._enqueue([1, 1, 1], SummarizationPriority.BULK)
+
+    # When
+    with pytest.raises(QueueFullError) as error:
+        worker_pool._enqueue([1], SummarizationPriority.BULK)
+
+    worker_pool._enqueue([1], SummarizationPriority.INTERACTIVE)
+
+    # Then
+    assert error.value.retry_after == 8
+    assert worker_pool.rejected_requests == 1
+    assert worker_pool.get_queue_depth() == 5
+
+
+def test_release_dispatches_queued_interactive_requests_before_bulk_requests(
+    mock_workers: List[Mock],
+    mock_logger: Logger,
+) -> None:
+    # Given
+    worker_pool = SummarizationWorkerPool(
+        workers=mock_workers[:1],
+        idle_timeout=60,
+        logger=mock_logger,
+        keep_alive=True,
+        worker_capacity=1,
+    )
+    index, _ = enqueue(worker_pool)
+    (bulk_request,) = worker_pool._enqueue([1], SummarizationPriority.BULK)
+    (interactive_request,) = worker_pool._enqueue([1], SummarizationPriority.INTERACTIVE)
+    queue_depth = worker_pool.get_queue_depth()
+
+    # When
+    worker_pool._release(index)
+    is_bulk_request_dispatched_first = bulk_request.future.done()
+    worker_pool._release(index)
+
+    # Then
+    assert queue_depth == 3
+    assert not is_bulk_request_dispatched_first
+    assert interactive_request.future.result(timeout=0) == 0
+    assert bulk_request.future.result(timeout=0) == 0
+    assert worker_pool.queue_wait_histograms[SummarizationPriority.INTERACTIVE].count == 2
+    assert worker_pool.queue_wait_histograms[SummarizationPriority.BULK].count == 1
+    assert worker_pool.get_queued_texts() == 0
+
+
+def test_release_dispatches_bulk_request_that_waited_too_long_first(
+    mock_workers: List[Mock],
+    mock_logger: Logger,
+) -> None:
+    # Given
+    worker_pool = SummarizationWorkerPool(
+        workers=mock_workers[:1],
+        idle_timeout=60,
+        logger=mock_logger,
+        keep_alive=True,
+        worker_capacity=1,
+        bulk_max_wait=5,
+    )
+    index, _ = enqueue(worker_pool)
+    (bulk_request,) = worker_pool._enqueue([1], SummarizationPriority.BULK)
+    (interactive_request,) = worker_pool._enqueue([1], SummarizationPriority.INTERACTIVE)
+    bulk_request.enqueue_time -= 10
+
+    # When
+    worker_pool._release(index)
+
+    # Then
+    assert bulk_request.future.result(timeout=0) == 0
+    assert not interactive_request.future.done()
+    assert worker_pool.queue_wait_histograms[SummarizationPriority.BULK].sum >= 10
+
+
+def test_release_does_not_let_smaller_requests_overtake_large_batch_slice(
+    mock_workers: List[Mock],
+    mock_logger: Logger,
+) -> None:
+    # Given
+    worker_pool = SummarizationWorkerPool(
+        workers=mock_workers[:1],
+        idle_timeout=60,
+        logger=mock_logger,
+        keep_alive=True,
+        worker_capacity=4,
+    )
+    enqueue(worker_pool, 3)
+    index, _ = enqueue(worker_pool)
+    (batch_slice,) = worker_pool._enqueue([8], SummarizationPriority.INTERACTIVE)
+    (single_request,) = worker_pool._enqueue([1], SummarizationPriority.INTERACTIVE)
+
+    # When
+    worker_pool._release(index)
+    is_single_request_dispatched_first = single_request.future.done()
+    worker_pool._release(index, size=3)
+
+    # Then
+    assert not is_single_request_dispatched_first
+    assert batch_slice.future.result(timeout=0) == 0
+    assert not single_request.future.done()
+    assert worker_pool.outstanding_requests == [8]
+
+
+def test_cancel_removes_queued_request(
+    mock_workers: List[Mock],
+    mock_logger: Logger,
+) -> None:
+    # Given
+    worker_pool = SummarizationWorkerPool(
+        workers=mock_workers[:1],
+        idle_timeout=60,
+        logger=mock_logger,
+        keep_alive=True,
+        worker_capacity=1,
+    )
+    index, _ = enqueue(worker_pool)
+    (queued_request,) = worker_pool._enqueue([1], SummarizationPriority.BULK)
+
+    # When
+    worker_pool._cancel(queued_request)
+    worker_pool._release(index)
+
+    # Then
+    assert queued_request.future.cancelled()
+    assert worker_pool.get_queue_depth() == 0
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_returns_lease_when_cancelled_while_queued(
+    mock_workers: List[Mock],
+    mock_logger: Logger,
+) -> None:
+    # Given
+    worker_pool = SummarizationWorkerPool(
+        workers=mock_workers[:1],
+        idle_timeout=60,
+        logger=mock_logger,
+        keep_alive=True,
+        worker_capacity=1,
+    )
+    index, _ = enqueue(worker_pool)
+    task = asyncio.create_task(worker_pool.summarize_async("text", {}, SummarizationPriority.BULK))
+
+    while not worker_pool.get_queued_texts():
+        await asyncio.sleep(0.01)
+
+    # When
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    worker_pool._release(index)
+
+    # Then
+    assert worker_pool.get_queue_depth() == 0
+    assert worker_pool.cancelled_requests == 1
+    mock_workers[0].summarize_async.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_raises_deadline_exceeded_while_queued(
+    mock_workers: List[Mock],
+    mock_logger: Logger,
+) -> None:
+    # Given
+    worker_pool = SummarizationWorkerPool(
+        workers=mock_workers[:1],
+        idle_timeout=60,
+        logger=mock_logger,
+        keep_alive=True,
+        worker_capacity=1,
+    )
+    index, _ = enqueue(worker_pool)
+
+    # When
+    with pytest.raises(DeadlineExceededError):
+        await worker_pool.summarize_async("text", {}, deadline=time.monotonic() + 0.1)
+
+    worker_pool._release(index)
+
+    # Then
+    assert worker_pool.get_queue_depth() == 0
+    assert worker_pool.deadline_exceeded_requests == 1
+    assert worker_pool.cancelled_requests == 0
+    mock_workers[0].summarize_async.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_summarize_async_stops_waiting_for_worker_when_deadline_passes(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    is_cancelled = asyncio.Event()
+
+    async def summarize_slowly(text: str, generation_parameters: Dict[str, Any]) -> str:
+        try:
+            await asyncio.sleep(10)
+
+        except asyncio.CancelledError:
+            is_cancelled.set()
+            raise
+
+        return text
+
+    mock_workers[0].summarize_async = AsyncMock(side_effect=summarize_slowly)
+
+    # When
+    with pytest.raises(DeadlineExceededError):
+        await worker_pool.summarize_async("text", {}, deadline=time.monotonic() + 0.1)
+
+    # Then
+    assert is_cancelled.is_set()
+    assert worker_pool.outstanding_requests == [0, 0, 0]
+    assert worker_pool.deadline_exceeded_requests == 1
+
+
+@pytest.mark.asyncio
+async def test_summarize_batch_async_limits_slices_to_worker_capacity(
+    mock_workers: List[Mock],
+    mock_logger: Logger,
+) -> None:
+    # Given
+    worker_pool = SummarizationWorkerPool(
+        workers=mock_workers[:1],
+        idle_timeout=60,
+        logger=mock_logger,
+        keep_alive=True,
+        worker_capacity=2,
+    )
+    mock_workers[0].summarize_batch_async = AsyncMock(side_effect=lambda texts, _: [text.upper() for text in texts])
+
+    # When
+    results = await worker_pool.summarize_batch_async(["a", "b", "c", "d", "e"], [{}] * 5, SummarizationPriority.BULK)
+
+    # Then
+    assert results == ["A", "B", "C", "D", "E"]
+    assert [call.args[0] for call in mock_workers[0].summarize_batch_async.await_args_list] == [
+        ["a", "b"],
+        ["c", "d"],
+        ["e"],
+    ]
+    assert worker_pool.get_queue_depth() == 0
+
+
+def test_summarize_releases_worker_on_error(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    mock_workers[0].summarize.side_effect = RuntimeError("Summarize error")
+
+    # When / Then
+    with pytest.raises(RuntimeError, match="Summarize error"):
+        worker_pool.summarize("text", {})
+
+    assert worker_pool.outstanding_requests == [0, 0, 0]
+
+
+def test_reap_idle_workers_stops_only_idle_workers(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    for worker in mock_workers:
+        worker.is_alive.return_value = True
+
+    worker_pool.outstanding_requests = [0, 1, 0]
+    worker_pool.last_access_times = [0.0, 0.0, 30.0]
+
+    # When
+    with worker_pool._lock:
+        idle_indices, next_deadline = worker_pool._reap_idle_workers(60.0)
+
+    # Then
+    assert idle_indices == [0]
+    assert next_deadline == 90.0
+    assert worker_pool._stopping_workers == {0}
+    for worker in mock_workers:
+        worker.stop.assert_not_called()
+
+
+def test_stop_workers_stops_marked_workers_and_dispatches_queued_requests(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    worker_pool.workers = mock_workers[:1]
+    worker_pool.outstanding_requests = [0]
+    worker_pool.last_access_times = [0.0]
+    worker_pool._worker_locks = worker_pool._worker_locks[:1]
+    mock_workers[0].is_alive.return_value = True
+    with worker_pool._lock:
+        idle_indices, _ = worker_pool._reap_idle_workers(60.0)
+
+    (queued_request,) = worker_pool._enqueue([1], SummarizationPriority.INTERACTIVE)
+
+    # When
+    dispatched_while_stopping = queued_request.future.done()
+    worker_pool._stop_workers(idle_indices)
+
+    # Then
+    assert not dispatched_while_stopping
+    mock_workers[0].stop.assert_called_once()
+    assert worker_pool._stopping_workers == set()
+    assert queued_request.future.result() == 0
+
+
+def test_release_is_not_blocked_by_worker_stopping(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    stopping = threading.Event()
+    stopped = threading.Event()
+
+    def stop() -> None:
+        stopping.set()
+        stopped.wait(timeout=5)
+
+    mock_workers[0].is_alive.return_value = True
+    mock_workers[0].stop.side_effect = stop
+    worker_pool.keep_alive = True
+    worker_pool.last_access_times = [0.0, 0.0, 0.0]
+    with worker_pool._lock:
+        idle_indices, _ = worker_pool._reap_idle_workers(60.0)
+
+    index, _ = enqueue(worker_pool)
+    stopper = threading.Thread(target=worker_pool._stop_workers, args=(idle_indices,))
+    stopper.start()
+    stopping.wait(timeout=5)
+
+    # When
+    worker_pool._release(index)
+    released_while_stopping = not stopped.is_set()
+    stopped.set()
+    stopper.join(timeout=5)
+
+    # Then
+    assert idle_indices == [0]
+    assert index == 1
+    assert released_while_stopping
+    assert worker_pool.outstanding_requests == [0, 0, 0]
+
+
+def test_reap_idle_workers_never_stops_worker_with_request_in_flight(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    mock_workers[0].is_alive.return_value = True
+    index, _ = enqueue(worker_pool)
+
+    # When
+    with worker_pool._lock:
+        idle_indices_during_request, _ = worker_pool._reap_idle_workers(time.monotonic() + 3600)
+
+    worker_pool._release(index)
+
+    with worker_pool._lock:
+        idle_indices_after_request, _ = worker_pool._reap_idle_workers(time.monotonic() + 3600)
+
+    # Then
+    assert index == 0
+    assert idle_indices_during_request == []
+    assert idle_indices_after_request == [0]
+
+
+def test_reaper_stops_worker_only_after_in_flight_request_completes(
+    mock_workers: List[Mock],
+    mock_logger: Logger,
+) -> None:
+    # Given
+    worker_pool = SummarizationWorkerPool(workers=mock_workers[:2], idle_timeout=0, logger=mock_logger)
+    reply = threading.Event()
+
+    def summarize(summarization_input: str, generation_parameters: Dict[str, Any]) -> str:
+        reply.wait(timeout=5)
+        return "slow summary"
+
+    for worker in mock_workers[:2]:
+        track_liveness(worker)
+
+    mock_workers[0].summarize.side_effect = summarize
+    mock_workers[1].summarize.return_value = "fast summary"
+    slow_request = threading.Thread(target=worker_pool.summarize, args=("slow", {}))
+    slow_request.start()
+    wait_until(lambda: mock_workers[0].summarize.called)
+
+    # When
+    worker_pool.summarize("fast", {})
+    wait_until(lambda: mock_workers[1].stop.called)
+    stopped_during_request = mock_workers[0].stop.called
+    reply.set()
+    slow_request.join()
+    wait_until(lambda: mock_workers[0].stop.called)
+    worker_pool.stop()
+
+    # Then
+    assert stopped_during_request is False
+    assert worker_pool.outstanding_requests == [0, 0]
+
+
+def test_reaper_waits_for_idle_timeout_since_last_access(
+    mock_workers: List[Mock],
+    mock_logger: Logger,
+) -> None:
+    # Given
+    worker_pool = SummarizationWorkerPool(workers=mock_workers[:1], idle_timeout=1, logger=mock_logger)
+    track_liveness(mock_workers[0])
+    mock_workers[0].summarize.return_value = "summary"
+
+    # When
+    worker_pool.summarize("text", {})
+    time.sleep(0.5)
+    worker_pool.summarize("text", {})
+    last_access_time = worker_pool.last_access_times[0]
+    wait_until(lambda: mock_workers[0].stop.called)
+    stopped_at = time.monotonic()
+    worker_pool.stop()
+
+    # Then
+    assert stopped_at - last_access_time >= 1
+    mock_workers[0].start.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_async_starts_and_warms_up_every_worker(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    for worker in mock_workers:
+        worker.summarize_async = AsyncMock(return_value="summary")
+
+    # When
+    await worker_pool.warm_up_async(["short", "long"], {})
+
+    # Then
+    for worker in mock_workers:
+        worker.start.assert_called_once()
+        assert [call.args for call in worker.summarize_async.await_args_list] == [
+            ("short", {}),
+            ("long", {}),
+            ("short", {}),
+        ]
+
+    assert worker_pool.outstanding_requests == [0, 0, 0]
+
+
+def test_release_keeps_preloaded_worker_alive(
+    mock_workers: List[Mock],
+    mock_logger: Logger,
+) -> None:
+    # Given
+    worker_pool = SummarizationWorkerPool(
+        workers=mock_workers,
+        idle_timeout=60,
+        logger=mock_logger,
+        keep_alive=True,
+    )
+    mock_workers[0].summarize.return_value = "summary"
+
+    # When
+    worker_pool.summarize("text", {})
+
+    # Then
+    assert worker_pool._reaper_thread is None
+    assert worker_pool.outstanding_requests == [0, 0, 0]
+
+
+@pytest.mark.asyncio
+async def test_warm_up_async_is_not_counted_as_requests(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    for worker in mock_workers:
+        worker.summarize_async = AsyncMock(return_value="summary")
+
+    # When
+    await worker_pool.warm_up_async(["short"], {})
+    await worker_pool.summarize_async("text", {})
+
+    # Then
+    assert worker_pool.request_count == 1
+    assert worker_pool.total_latency > 0
+
+
+def test_load_starts_first_worker_only_once(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    track_liveness(mock_workers[0])
+
+    # When
+    worker_pool.load()
+    worker_pool.load()
+
+    # Then
+    assert worker_pool.is_loaded()
+    mock_workers[0].start.assert_called_once()
+    mock_workers[1].start.assert_not_called()
+
+
+def test_unload_if_idle_stops_all_workers(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    for worker in mock_workers:
+        track_liveness(worker)
+
+    worker_pool.load()
+
+    # When
+    is_unloaded = worker_pool.unload_if_idle()
+
+    # Then
+    assert is_unloaded
+    assert not worker_pool.is_loaded()
+    for worker in mock_workers:
+        worker.stop.assert_called_once()
+
+
+def test_unload_if_idle_keeps_workers_with_request_in_flight(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    track_liveness(mock_workers[0])
+    worker_pool.load()
+    worker_pool.outstanding_requests = [0, 1, 0]
+
+    # When
+    is_unloaded = worker_pool.unload_if_idle()
+
+    # Then
+    assert not is_unloaded
+    assert worker_pool.is_loaded()
+    mock_workers[0].stop.assert_not_called()
+
+
+def test_get_memory_bytes_sums_proportional_memory_of_workers(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    for worker in mock_workers[:2]:
+        worker.get_memory_usage.return_value = ProcessMemoryUsage(
+            resident_bytes=2048,
+            proportional_bytes=1024,
+            unique_bytes=512,
+        )
+
+    # When
+    memory_bytes = worker_pool.get_memory_bytes()
+
+    # Then
+    assert memory_bytes == 2048
+
+
+def test_get_generation_histogram_merges_histograms_of_every_worker(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    mock_workers[0].generation_histograms.observe(
+        GenerationMetrics(
+            prepare_seconds=0.01, generate_seconds=2.0, decode_seconds=0.01, input_tokens=100, output_tokens=40
+        ),
+    )
+    mock_workers[2].generation_histograms.observe(
+        GenerationMetrics(
+            prepare_seconds=0.01, generate_seconds=0.5, decode_seconds=0.01, input_tokens=20, output_tokens=10
+        ),
+    )
+
+    # When
+    histogram = worker_pool.get_generation_histogram(lambda histograms: histograms.output_tokens)
+
+    # Then
+    assert histogram.bucket_bounds == [8, 16, 32, 64, 128, 256, 512, 1024, 2048]
+    assert histogram.bucket_counts == [0, 1, 1, 2, 2, 2, 2, 2, 2, 2]
+    assert histogram.sum == 50
+
+
+def test_get_statuses_reports_queue_depth_and_busy_state(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    mock_workers[0].is_alive.return_value = True
+    mock_workers[0].get_pid.return_value = 1234
+    mock_workers[0].get_memory_usage.return_value = ProcessMemoryUsage(
+        resident_bytes=2048,
+        proportional_bytes=1024,
+        unique_bytes=512,
+    )
+    mock_workers[0].get_load_seconds.return_value = 1.5
+    mock_workers[2].is_processing.return_value = True
+    mock_workers[2].restarts = 2
+    worker_pool.outstanding_requests = [3, 0, 0]
+
+    # When
+    statuses = worker_pool.get_statuses()
+
+    # Then
+    assert statuses == [
+        WorkerStatus(
+            index=0,
+            pid=1234,
+            is_alive=True,
+            is_busy=True,
+            queue_depth=3,
+            resident_memory_bytes=2048,
+            proportional_memory_bytes=1024,
+            unique_memory_bytes=512,
+            load_seconds=1.5,
+        ),
+        WorkerStatus(index=1, pid=None, is_alive=False, is_busy=False, queue_depth=0),
+        WorkerStatus(index=2, pid=None, is_alive=False, is_busy=True, queue_depth=0, restarts=2),
+    ]
+
+
+def test_stop_stops_all_workers_and_idle_reaper(
+    worker_pool: SummarizationWorkerPool,
+    mock_workers: List[Mock],
+) -> None:
+    # Given
+    mock_workers[0].summarize.return_value = "summary"
+    worker_pool.summarize("text", {})
+    reaper_thread = worker_pool._reaper_thread
+
+    # When
+    worker_pool.stop()
+
+    # Then
+    assert reaper_thread is not None and not reaper_thread.is_alive()
+    for worker in mock_workers:
+        worker.stop.assert_called_once()
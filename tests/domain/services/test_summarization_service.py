@@ -1,12 +1,31 @@
-from unittest.mock import Mock
+from array import array
+from typing import AsyncIterator
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
+from data.factories.summarization_worker_factory import SummarizationWorkerFactory
+from data.repositories.summarization_model_repository_impl import (
+    SummarizationModelRepositoryImpl,
+)
+from domain.models.chunking_options import ChunkingOptions
+from domain.models.histogram_snapshot import HistogramSnapshot
+from domain.models.model_metrics import ModelMetrics
+from domain.models.model_status import ModelStatus
+from domain.models.summarization_priority import SummarizationPriority
+from domain.models.summarization_request import SummarizationRequest
+from domain.models.summarization_result import SummarizationResult
+from domain.models.tokenization_result import TokenizationResult
+from domain.models.worker_status import WorkerStatus
+from domain.repositories.directory_repository import DirectoryRepository
 from domain.repositories.summarization_model_repository import (
     SummarizationModelRepository,
 )
+from domain.repositories.summarization_tokenizer_repository import (
+    SummarizationTokenizerRepository,
+)
 from domain.services.summarization_service import SummarizationService
 
 
@@ -40,30 +59,584 @@ def summarization_service(
     )
 
 
-def test_summarize_text_success(
+@pytest.mark.asyncio
+async def test_summarize_text_success(
     summarization_service: SummarizationService,
     mock_summarization_model_repository: SummarizationModelRepository,
 ) -> None:
     # Given
     text_to_summarize = "Hello World"
-    mock_summarization_model_repository.summarize.return_value = "Hello"
+    mock_summarization_model_repository.summarize_async.return_value = "Hello"
 
     # When
-    result = summarization_service.summarize_text(text_to_summarize, {})
+    result = await summarization_service.summarize_text(text_to_summarize, {})
 
     # Then
     assert result == "Hello"
-    mock_summarization_model_repository.summarize.assert_called_once_with(text_to_summarize, {})
+    mock_summarization_model_repository.summarize_async.assert_awaited_once_with(
+        text_to_summarize,
+        {},
+        False,
+        None,
+        SummarizationPriority.INTERACTIVE,
+        None,
+    )
 
 
-def test_summarize_text_exception(
+@pytest.mark.asyncio
+async def test_summarize_text_exception(
     summarization_service: SummarizationService,
     mock_summarization_model_repository: SummarizationModelRepository,
 ) -> None:
     # Given
     text_to_summarize = "Hello World"
-    mock_summarization_model_repository.summarize.side_effect = Exception("Summarization error")
+    mock_summarization_model_repository.summarize_async.side_effect = Exception("Summarization error")
 
     # When / Then
     with pytest.raises(Exception, match="Summarization error"):
-        summarization_service.summarize_text(text_to_summarize, {})
+        await summarization_service.summarize_text(text_to_summarize, {})
+
+
+async def stream_partial_summaries(*partial_summaries: str) -> AsyncIterator[str]:
+    for partial_summary in partial_summaries:
+        yield partial_summary
+
+
+@pytest.mark.asyncio
+async def test_summarize_text_stream_yields_partial_summaries(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # Given
+    mock_summarization_model_repository.summarize_stream_async.return_value = stream_partial_summaries(
+        "Hello ",
+        "world",
+    )
+
+    # When
+    result = [
+        partial_summary
+        async for partial_summary in summarization_service.summarize_text_stream("Hello World", {"num_beams": 1})
+    ]
+
+    # Then
+    assert result == ["Hello ", "world"]
+    mock_summarization_model_repository.summarize_stream_async.assert_called_once_with(
+        "Hello World",
+        {"num_beams": 1},
+        None,
+        SummarizationPriority.INTERACTIVE,
+        None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_statuses(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # Given
+    worker_statuses = [WorkerStatus(index=0, pid=1, is_alive=True, is_busy=False, queue_depth=0)]
+    model_statuses = [
+        ModelStatus(
+            name="facebook/bart-large-cnn",
+            is_default=True,
+            is_loaded=True,
+            memory_bytes=1024,
+            requests=2,
+            mean_latency_seconds=0.5,
+            loads=1,
+            evictions=0,
+        ),
+    ]
+    mock_summarization_model_repository.get_statuses_async.return_value = (worker_statuses, model_statuses)
+
+    # When
+    result = await summarization_service.get_statuses()
+
+    # Then
+    assert result == (worker_statuses, model_statuses)
+
+
+def test_get_models_metrics(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # Given
+    histogram = HistogramSnapshot(bucket_bounds=[1.0], bucket_counts=[1, 2], sum=2.5)
+    metrics = [
+        ModelMetrics(
+            name="facebook/bart-large-cnn",
+            queue_wait_seconds={"interactive": histogram},
+            stage_seconds={"generate": histogram},
+            input_tokens=histogram,
+            output_tokens=histogram,
+            tokens_per_second=histogram,
+            time_to_first_token_seconds=histogram,
+        ),
+    ]
+    mock_summarization_model_repository.get_models_metrics.return_value = metrics
+
+    # When
+    result = summarization_service.get_models_metrics()
+
+    # Then
+    assert result == metrics
+
+
+def test_get_coalesced_requests_count(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # Given
+    mock_summarization_model_repository.get_coalesced_requests_count.return_value = 3
+
+    # When
+    result = summarization_service.get_coalesced_requests_count()
+
+    # Then
+    assert result == 3
+
+
+@pytest.mark.asyncio
+async def test_preload_model(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # When
+    await summarization_service.preload_model()
+
+    # Then
+    mock_summarization_model_repository.preload_async.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_stop_model(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # When
+    await summarization_service.stop_model()
+
+    # Then
+    mock_summarization_model_repository.stop_async.assert_awaited_once_with()
+
+
+def test_is_model_ready(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # Given
+    mock_summarization_model_repository.is_ready.return_value = True
+
+    # When
+    result = summarization_service.is_model_ready()
+
+    # Then
+    assert result is True
+
+
+@pytest.mark.asyncio
+async def test_summarize_text_with_chunking_summarizes_short_text_directly(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # Given
+    mock_summarization_model_repository.split_text_async.return_value = ["short text"]
+    mock_summarization_model_repository.summarize_async.return_value = "summary"
+
+    # When
+    result = await summarization_service.summarize_text("short text", {}, ChunkingOptions(1000, 100, 3))
+
+    # Then
+    assert result == "summary"
+    mock_summarization_model_repository.split_text_async.assert_awaited_once_with("short text", 1000, 100, None)
+    mock_summarization_model_repository.summarize_async.assert_awaited_once_with(
+        "short text",
+        {},
+        False,
+        None,
+        SummarizationPriority.INTERACTIVE,
+        None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_summarize_text_with_chunking_reduces_chunk_summaries(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # Given
+    mock_summarization_model_repository.split_text_async.side_effect = [
+        ["chunk 1", "chunk 2", "chunk 3"],
+        ["summary 1 summary 2", "summary 3"],
+        ["reduced 1 reduced 2"],
+    ]
+    mock_summarization_model_repository.summarize_batch_async.side_effect = lambda texts, *_: [
+        {
+            "chunk 1": "summary 1",
+            "chunk 2": "summary 2",
+            "chunk 3": "summary 3",
+            "summary 1 summary 2": "reduced 1",
+            "summary 3": "reduced 2",
+        }[text]
+        for text in texts
+    ]
+    mock_summarization_model_repository.summarize_async.return_value = "final summary"
+
+    # When
+    result = await summarization_service.summarize_text("long text", {}, ChunkingOptions(4, 1, 3))
+
+    # Then
+    assert result == "final summary"
+    assert mock_summarization_model_repository.split_text_async.await_args_list[1].args[0] == (
+        "summary 1 summary 2 summary 3"
+    )
+    assert mock_summarization_model_repository.summarize_batch_async.await_args_list[0].args[:3] == (
+        ["chunk 1", "chunk 2", "chunk 3"],
+        [{}, {}, {}],
+        [False, False, False],
+    )
+    assert mock_summarization_model_repository.summarize_batch_async.await_count == 2
+    mock_summarization_model_repository.summarize_async.assert_awaited_once_with(
+        "reduced 1 reduced 2",
+        {},
+        False,
+        None,
+        SummarizationPriority.INTERACTIVE,
+        None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_summarize_text_with_chunking_raises_error_of_failed_chunk(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # Given
+    error = RuntimeError("Worker process is not running")
+    mock_summarization_model_repository.split_text_async.return_value = ["chunk 1", "chunk 2"]
+    mock_summarization_model_repository.summarize_batch_async.return_value = ["summary 1", error]
+
+    # When / Then
+    with pytest.raises(RuntimeError, match="Worker process is not running"):
+        await summarization_service.summarize_text("long text", {}, ChunkingOptions(4, 1, 3))
+
+    mock_summarization_model_repository.summarize_async.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_summarize_text_with_chunking_admits_document_larger_than_queue_on_idle_pool(
+    mock_logger: Logger,
+    mock_config: AppConfig,
+) -> None:
+    # Given
+    mock_config.summarization_model_download_path = "/models"
+    mock_config.summarization_models = ["test_model"]
+    mock_config.model_memory_budget_mb = 0
+    mock_config.summarization_queue_max_size = 2
+    mock_config.summarization_queue_max_wait = 0
+    mock_config.summarization_batch_max_size = 8
+    mock_config.summarization_bulk_max_wait = 0
+    mock_config.model_idle_timeout = 60
+    mock_config.model_preload = False
+    mock_config.summarization_worker_pool_size = 1
+    mock_config.summary_cache_max_size_mb = 0
+    mock_config.summary_store_path = ""
+    worker = Mock()
+    worker.is_alive.return_value = True
+    worker.summarize_batch_async = AsyncMock(side_effect=lambda texts, _: ["summary"] * len(texts))
+    worker.summarize_async = AsyncMock(return_value="final summary")
+    tokenizer_repository = Mock(SummarizationTokenizerRepository)
+    tokenizer_repository.split_text.side_effect = [["chunk 1", "chunk 2", "chunk 3", "chunk 4"], ["summaries"]]
+    tokenizer_repository.tokenize.side_effect = lambda text, model_name=None: array("i", map(ord, text))
+    tokenizer_repository.tokenize_batch.side_effect = lambda texts, model_name=None: [
+        array("i", map(ord, text)) for text in texts
+    ]
+
+    with patch.object(SummarizationModelRepositoryImpl, "_instance", None):
+        repository = SummarizationModelRepositoryImpl(
+            config=mock_config,
+            directory_repository=Mock(DirectoryRepository),
+            logger=mock_logger,
+            worker_factory=Mock(SummarizationWorkerFactory, create=Mock(return_value=worker)),
+            tokenizer_repository=tokenizer_repository,
+        )
+
+    summarization_service = SummarizationService(
+        config=mock_config,
+        summarization_model_repository=repository,
+        logger=mock_logger,
+    )
+
+    # When
+    result = await summarization_service.summarize_text("long text", {}, ChunkingOptions(4, 1, 3))
+
+    # Then
+    assert result == "final summary"
+    worker.summarize_batch_async.assert_awaited_once()
+    assert repository.model_registry.pools["test_model"].rejected_requests == 0
+
+
+@pytest.mark.asyncio
+async def test_summarize_text_with_chunking_stops_at_max_reduce_depth(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # Given
+    mock_summarization_model_repository.split_text_async.return_value = ["chunk 1", "chunk 2"]
+    mock_summarization_model_repository.summarize_batch_async.return_value = ["summary", "summary"]
+    mock_summarization_model_repository.summarize_async.return_value = "summary"
+
+    # When
+    result = await summarization_service.summarize_text("long text", {}, ChunkingOptions(4, 1, 1))
+
+    # Then
+    assert result == "summary"
+    assert mock_summarization_model_repository.split_text_async.await_count == 2
+    mock_summarization_model_repository.summarize_async.assert_awaited_with(
+        "summary summary",
+        {},
+        False,
+        None,
+        SummarizationPriority.INTERACTIVE,
+        None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_summarize_text_with_chunking_uses_selected_model_priority_and_deadline_for_every_chunk(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # Given
+    mock_summarization_model_repository.split_text_async.side_effect = [["chunk 1", "chunk 2"], ["summary summary"]]
+    mock_summarization_model_repository.summarize_batch_async.return_value = ["summary", "summary"]
+    mock_summarization_model_repository.summarize_async.return_value = "summary"
+
+    # When
+    await summarization_service.summarize_text(
+        "long text",
+        {},
+        ChunkingOptions(4, 1, 3),
+        model_name="t5-small",
+        priority=SummarizationPriority.BULK,
+        deadline=123.0,
+    )
+
+    # Then
+    assert [call.args[3] for call in mock_summarization_model_repository.split_text_async.await_args_list] == [
+        "t5-small",
+        "t5-small",
+    ]
+    mock_summarization_model_repository.summarize_batch_async.assert_awaited_once_with(
+        ["chunk 1", "chunk 2"],
+        [{}, {}],
+        [False, False],
+        "t5-small",
+        SummarizationPriority.BULK,
+        123.0,
+    )
+    mock_summarization_model_repository.summarize_async.assert_awaited_once_with(
+        "summary summary",
+        {},
+        False,
+        "t5-small",
+        SummarizationPriority.BULK,
+        123.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_summarize_texts_batches_plain_texts_and_keeps_input_order(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # Given
+    error = ValueError("Invalid generation parameters")
+    mock_summarization_model_repository.summarize_batch_async.return_value = ["first", error]
+    mock_summarization_model_repository.split_text_async.return_value = ["long"]
+    mock_summarization_model_repository.summarize_async.return_value = "long summary"
+    requests = [
+        SummarizationRequest("first text"),
+        SummarizationRequest("long text", {}, ChunkingOptions(chunk_size=512, chunk_overlap=64, max_reduce_depth=1)),
+        SummarizationRequest("second text", {"num_beams": -1}, bypass_cache=True),
+    ]
+
+    # When
+    results = await summarization_service.summarize_texts(requests)
+
+    # Then
+    assert results == [
+        SummarizationResult(summary="first"),
+        SummarizationResult(summary="long summary"),
+        SummarizationResult(error=error),
+    ]
+    mock_summarization_model_repository.summarize_batch_async.assert_awaited_once_with(
+        ["first text", "second text"],
+        [{}, {"num_beams": -1}],
+        [False, True],
+        None,
+        SummarizationPriority.INTERACTIVE,
+        None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_summarize_texts_batches_plain_texts_per_model(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # Given
+    mock_summarization_model_repository.summarize_batch_async.side_effect = (
+        lambda texts, generation_parameters, bypass_cache, model_name, priority, deadline: [
+            f"{model_name}: {text}" for text in texts
+        ]
+    )
+    requests = [
+        SummarizationRequest("first text"),
+        SummarizationRequest("second text", model_name="t5-small"),
+        SummarizationRequest("third text"),
+    ]
+
+    # When
+    results = await summarization_service.summarize_texts(requests)
+
+    # Then
+    assert results == [
+        SummarizationResult(summary="None: first text"),
+        SummarizationResult(summary="t5-small: second text"),
+        SummarizationResult(summary="None: third text"),
+    ]
+    assert mock_summarization_model_repository.summarize_batch_async.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_summarize_texts_batches_plain_texts_per_priority(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # Given
+    mock_summarization_model_repository.summarize_batch_async.side_effect = (
+        lambda texts, generation_parameters, bypass_cache, model_name, priority, deadline: [
+            f"{priority.value}: {text}" for text in texts
+        ]
+    )
+    requests = [
+        SummarizationRequest("first text", priority=SummarizationPriority.BULK),
+        SummarizationRequest("second text"),
+        SummarizationRequest("third text", priority=SummarizationPriority.BULK),
+    ]
+
+    # When
+    results = await summarization_service.summarize_texts(requests)
+
+    # Then
+    assert results == [
+        SummarizationResult(summary="bulk: first text"),
+        SummarizationResult(summary="interactive: second text"),
+        SummarizationResult(summary="bulk: third text"),
+    ]
+    assert mock_summarization_model_repository.summarize_batch_async.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_summarize_texts_reports_repository_failure_per_item(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # Given
+    error = RuntimeError("Worker process is not running")
+    mock_summarization_model_repository.summarize_batch_async.side_effect = error
+
+    # When
+    results = await summarization_service.summarize_texts([SummarizationRequest("a"), SummarizationRequest("b")])
+
+    # Then
+    assert results == [SummarizationResult(error=error), SummarizationResult(error=error)]
+
+
+@pytest.mark.asyncio
+async def test_summarize_texts_skips_batch_call_for_long_documents_only(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # Given
+    mock_summarization_model_repository.split_text_async.side_effect = Exception("Split error")
+
+    # When
+    results = await summarization_service.summarize_texts(
+        [SummarizationRequest("long text", {}, ChunkingOptions(chunk_size=512, chunk_overlap=64, max_reduce_depth=1))],
+    )
+
+    # Then
+    assert results[0].summary is None
+    assert str(results[0].error) == "Split error"
+    mock_summarization_model_repository.summarize_batch_async.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_tokenize_text_reports_truncation(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # Given
+    mock_summarization_model_repository.count_tokens_async.return_value = 2048
+    mock_summarization_model_repository.get_max_input_tokens.return_value = 1024
+
+    # When
+    result = await summarization_service.tokenize_text("long text")
+
+    # Then
+    assert result == TokenizationResult(token_count=2048, max_input_tokens=1024, is_truncated=True)
+    mock_summarization_model_repository.split_text_async.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_tokenize_text_with_chunking_reports_chunk_count(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # Given
+    mock_summarization_model_repository.count_tokens_async.return_value = 2048
+    mock_summarization_model_repository.get_max_input_tokens.return_value = 1024
+    mock_summarization_model_repository.split_text_async.return_value = ["first", "second", "third"]
+
+    # When
+    result = await summarization_service.tokenize_text("long text", ChunkingOptions(1000, 100, 3))
+
+    # Then
+    assert result == TokenizationResult(token_count=2048, max_input_tokens=1024, is_truncated=False, chunk_count=3)
+    mock_summarization_model_repository.split_text_async.assert_awaited_once_with("long text", 1000, 100, None)
+
+
+@pytest.mark.asyncio
+async def test_tokenize_text_uses_tokenizer_of_selected_model(
+    summarization_service: SummarizationService,
+    mock_summarization_model_repository: SummarizationModelRepository,
+) -> None:
+    # Given
+    mock_summarization_model_repository.count_tokens_async.return_value = 2048
+    mock_summarization_model_repository.get_max_input_tokens.return_value = 16384
+    mock_summarization_model_repository.split_text_async.return_value = ["long text"]
+
+    # When
+    result = await summarization_service.tokenize_text(
+        "long text",
+        ChunkingOptions(1000, 100, 3),
+        "allenai/led-base-16384",
+    )
+
+    # Then
+    assert result == TokenizationResult(token_count=2048, max_input_tokens=16384, is_truncated=False, chunk_count=1)
+    mock_summarization_model_repository.count_tokens_async.assert_awaited_once_with(
+        "long text",
+        "allenai/led-base-16384",
+    )
+    mock_summarization_model_repository.get_max_input_tokens.assert_called_once_with("allenai/led-base-16384")
+    mock_summarization_model_repository.split_text_async.assert_awaited_once_with(
+        "long text",
+        1000,
+        100,
+        "allenai/led-base-16384",
+    )
@@ -30,6 +30,8 @@ def test_main(
 ) -> None:
     # Given
     mock_config.log_level = "INFO"
+    mock_config.log_format = "json"
+    mock_config.log_max_message_length = 1024
     with patch.object(mock_config, "initialize") as mock_initialize, patch.object(mock_server, "start") as mock_start:
 
         # When
@@ -37,6 +39,8 @@ def test_main(
 
         # Then
         mock_initialize.assert_called_once()
+        mock_logger.set_format.assert_called_once_with("json")
+        mock_logger.set_max_message_length.assert_called_once_with(1024)
         mock_start.assert_called_once()
 
 
@@ -68,6 +72,8 @@ def test_main_start_exception(
 ) -> None:
     # Given
     mock_config.log_level = "INFO"
+    mock_config.log_format = "text"
+    mock_config.log_max_message_length = 4096
     with (
         patch.object(mock_config, "initialize") as mock_load_config,
         patch.object(